@@ -4,11 +4,15 @@ import json
 import logging
 import os
 from datetime import datetime as dt
+from typing import Optional
 from urllib.parse import urljoin
 
 import jwt
 import requests
 from jwt import ExpiredSignatureError, InvalidTokenError
+from requests.adapters import HTTPAdapter
+
+from ingest_api.helper.ttl_cache import TTLCache
 
 log = logging.getLogger("ingest")
 logformatter = logging.Formatter("%(asctime)s;%(levelname)s;%(funcName)s;%(message)s")
@@ -17,8 +21,33 @@ log.setLevel(logging.DEBUG)
 datahub_url = os.environ.get("DATAHUB_FRONTEND","")
 CLI_MODE = False if os.environ.get("RUNNING_IN_DOCKER") else True
 
+# Ownership verdicts and group memberships are cached so that a burst of edits
+# to one dataset does not re-run the same GraphQL queries. Entries never outlive
+# the token that was used to look them up.
+auth_cache_ttl_sec = float(os.environ.get("AUTH_CACHE_TTL_SEC", "300"))
+auth_cache_max_entries = int(os.environ.get("AUTH_CACHE_MAX_ENTRIES", "10000"))
+# (user, dataset_urn) -> bool
+ownership_cache = TTLCache(max_entries=auth_cache_max_entries, ttl_sec=auth_cache_ttl_sec)
+# user_urn -> list of group urns
+groups_cache = TTLCache(max_entries=auth_cache_max_entries, ttl_sec=auth_cache_ttl_sec)
 
-def verify_token(token: str, user: str):
+# Authorization queries reuse pooled keep-alive connections to the frontend instead
+# of opening a new one per request. They run in the worker's threadpool, so the pool
+# is sized to match its default of 40 threads.
+graphql_pool_size = int(os.environ.get("DATAHUB_GRAPHQL_POOL_SIZE", "40"))
+graphql_session = requests.Session()
+graphql_session.mount(
+    "http://", HTTPAdapter(pool_connections=1, pool_maxsize=graphql_pool_size)
+)
+graphql_session.mount(
+    "https://", HTTPAdapter(pool_connections=1, pool_maxsize=graphql_pool_size)
+)
+
+
+def decode_token(token: str, user: str) -> Optional[dict]:
+    """
+    Returns the token payload if the token is valid and belongs to user, else None.
+    """
     token_secret = os.environ["JWT_SECRET"]
     # log.debug(f"signature secret is {token_secret}")
     try:
@@ -31,20 +60,24 @@ def verify_token(token: str, user: str):
             log.info(
                 f"token verified for {user}, expires {exp_datetime.strftime('%Y:%m:%d %H:%M')}"
             )
-            return True
+            return payload
         log.error(f"user id does not match token payload user id! token:{token}")
-        return False
+        return None
     except ExpiredSignatureError:
         log.error(f"token has expired! token:{token}")
-        return False
+        return None
     except InvalidTokenError:
         log.error(f"Invalid token for {user} token:{token}")
-        return False
+        return None
     except Exception as e:
         log.error(
             f"I cant figure out this token for {user}, so its an error {e}. token:{token}"
         )
-        return False
+        return None
+
+
+def verify_token(token: str, user: str):
+    return decode_token(token, user) is not None
 
 
 def authenticate_action(token: str, user: str, dataset: str):
@@ -57,7 +90,10 @@ def authenticate_action(token: str, user: str, dataset: str):
     log.debug(f"Authenticate user setting is {must_authenticate_actions}")
     log.debug(f"Dataset being updated is {dataset}, requestor is {user}")
     if must_authenticate_actions:
-        if verify_token(token, user) and query_dataset_owner(token, dataset, user):
+        payload = decode_token(token, user)
+        if payload is not None and query_dataset_owner(
+            token, dataset, user, token_exp=int(payload["exp"])
+        ):
             log.debug(f"user {user} is authorized to do something")
             return True
         else:
@@ -67,9 +103,28 @@ def authenticate_action(token: str, user: str, dataset: str):
         return True
 
 
-def query_dataset_owner(token: str, dataset_urn: str, user: str):
+def query_dataset_owner(
+    token: str, dataset_urn: str, user: str, token_exp: Optional[float] = None
+):
     """
     Queries for owners of dataset. If there are group owners, then will fire another query to check if user is member of group.
+    The verdict is cached until token_exp or the cache TTL, whichever comes first.
+    """
+    cached = ownership_cache.get((user, dataset_urn))
+    if cached is not None:
+        log.debug(f"Ownership Step: {cached} (cached)")
+        return cached
+    verdict = _query_dataset_owner(token, dataset_urn, user, token_exp)
+    if verdict is not None:
+        ownership_cache.set((user, dataset_urn), verdict, expires_at=token_exp)
+    return bool(verdict)
+
+
+def _query_dataset_owner(
+    token: str, dataset_urn: str, user: str, token_exp: Optional[float]
+) -> Optional[bool]:
+    """
+    Returns None if a GraphQL query failed, so that the verdict is not cached.
     """
     # log.debug(f"UI endpoint is {datahub_url}")
     user_urn = f"urn:li:corpuser:{user}"
@@ -77,6 +132,8 @@ def query_dataset_owner(token: str, dataset_urn: str, user: str):
     log.debug(f"I will query {query_endpoint} as {user}")
 
     owners_list = query_dataset_ownership(token, dataset_urn, query_endpoint)
+    if owners_list is None:
+        return None
     log.debug(f"The list of owners for this dataset is {owners_list}")
     individual_owners = [
         item["owner"]["urn"]
@@ -92,9 +149,14 @@ def query_dataset_owner(token: str, dataset_urn: str, user: str):
         if item["owner"]["__typename"] == "CorpGroup"
     ]
     if len(group_owners) > 0:
-        groups = query_users_groups(token, query_endpoint, user_urn)
-        log.debug(f"The list of groups for this user is {groups}")
-        groups_urn = [item["entity"]["urn"] for item in groups]
+        groups_urn = groups_cache.get(user_urn)
+        if groups_urn is None:
+            groups = query_users_groups(token, query_endpoint, user_urn)
+            if groups is None:
+                return None
+            log.debug(f"The list of groups for this user is {groups}")
+            groups_urn = [item["entity"]["urn"] for item in groups]
+            groups_cache.set(user_urn, groups_urn, expires_at=token_exp)
         for item in groups_urn:
             if item in group_owners:
                 log.debug(f"Group Ownership Step: True for {item}.")
@@ -129,12 +191,12 @@ def query_dataset_ownership(token: str, dataset_urn: str, query_endpoint: str):
         }
     """
     variables = {"urn": dataset_urn}
-    resp = requests.post(
+    resp = graphql_session.post(
         query_endpoint, headers=headers, json={"query": query, "variables": variables}
     )
     log.debug(f"resp.status_code is {resp.status_code}")
     if resp.status_code != 200:
-        return []
+        return None
     data_received = json.loads(resp.text)
     log.error(f"received from graphql ownership info: {data_received}")
     owners_list = data_received["data"]["dataset"]["ownership"]["owners"]
@@ -164,12 +226,12 @@ def query_users_groups(token: str, query_endpoint: str, user_urn: str):
         }
     """
     variables = {"urn": user_urn}
-    resp = requests.post(
+    resp = graphql_session.post(
         query_endpoint, headers=headers, json={"query": query, "variables": variables}
     )
     log.debug(f"group membership resp.status_code is {resp.status_code}")
     if resp.status_code != 200:
-        return []
+        return None
     data_received = json.loads(resp.text)
     if data_received["data"]["corpUser"]["relationships"]["count"] > 0:
         groups_list = data_received["data"]["corpUser"]["relationships"][
@@ -178,3 +240,12 @@ def query_users_groups(token: str, query_endpoint: str, user_urn: str):
         return groups_list
     log.debug(f"group membership list is empty")
     return []
+
+
+def invalidate_dataset_authorization(dataset_urn: str):
+    """
+    Drops cached ownership verdicts for a dataset. Call after changing its ownership.
+    """
+    removed = ownership_cache.invalidate(lambda key: key[1] == dataset_urn)
+    log.debug(f"dropped {removed} cached ownership verdicts for {dataset_urn}")
+
@@ -13,8 +13,8 @@ from uuid import uuid4
 import requests
 import uvicorn
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
-from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
+from datahub.ingestion.graph.async_client import AsyncDataHubGraph
+from datahub.ingestion.graph.client import DatahubClientConfig
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import \
     DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
@@ -27,12 +27,15 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from starlette.concurrency import run_in_threadpool
 from starlette_exporter import PrometheusMiddleware, handle_metrics
 from urllib3.exceptions import InsecureRequestWarning
 
 from ingest_api.helper.mce_convenience import *
 from ingest_api.helper.models import *
-from ingest_api.helper.security import authenticate_action, verify_token
+from ingest_api.helper.security import (authenticate_action,
+                                        invalidate_dataset_authorization,
+                                        verify_token)
 
 CLI_MODE = False if environ.get("RUNNING_IN_DOCKER") else True
 
@@ -81,6 +84,11 @@ else:
 
 rest_endpoint = os.environ.get("DATAHUB_BACKEND","")
 api_emitting_port = 8001
+# Each worker keeps one pool of connections to GMS, shared by all requests.
+# The user's token is attached per request, not to the pool.
+gms_pool_size = int(os.environ.get("DATAHUB_GMS_POOL_SIZE", "50"))
+gms_keepalive_sec = float(os.environ.get("DATAHUB_GMS_KEEPALIVE_SEC", "60"))
+gms_warmup_connections = int(os.environ.get("DATAHUB_GMS_WARMUP_CONNECTIONS", "2"))
 # logging - 1 console logger showing info-level+, and 2 logger logging INFO+ AND DEBUG+ levels
 # --------------------------------------------------------------
 rootLogger = logging.getLogger("ingest")
@@ -131,6 +139,30 @@ app.add_middleware(PrometheusMiddleware)
 app.add_route("/custom/metrics", handle_metrics)
 
 
+gms_client = AsyncDataHubGraph(
+    DatahubClientConfig(server=rest_endpoint),
+    max_connections=gms_pool_size,
+    keepalive_timeout_sec=gms_keepalive_sec,
+)
+
+
+@app.on_event("startup")
+async def warm_up_gms_client():
+    try:
+        await gms_client.warm_up(gms_warmup_connections)
+        rootLogger.info(
+            f"GMS connection pool warmed up with {gms_warmup_connections} connections"
+        )
+    except Exception as e:
+        # not fatal, the connections will be opened on first use instead
+        rootLogger.error(f"unable to warm up GMS connection pool: {e}")
+
+
+@app.on_event("shutdown")
+async def close_gms_client():
+    await gms_client.close()
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exc):
     """
@@ -167,7 +199,9 @@ async def echo_announce() -> Response:
     """
     # verify = False cos accessing HTTPS page from container.
     try:
-        response = requests.get(os.environ["ANNOUNCEMENT_URL"], verify=False)
+        response = await run_in_threadpool(
+            requests.get, os.environ["ANNOUNCEMENT_URL"], verify=False
+        )
         received = response.json()
         return JSONResponse(
             content={
@@ -197,7 +231,10 @@ async def update_browsepath(item: browsepath_params) -> Response:
     datasetName = item.dataset_name
     token = item.user_token.get_secret_value()
     user = item.requestor
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    # authorization queries GraphQL with requests, which would block the event loop
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         dataset_snapshot = DatasetSnapshot(
             urn=item.dataset_name,
             aspects=[],
@@ -214,7 +251,7 @@ async def update_browsepath(item: browsepath_params) -> Response:
                 lastObserved=get_sys_time(),
             ),
         )
-        response = emit_mce_respond(
+        response = await emit_mce_respond(
             metadata_record=metadata_record,
             owner=item.requestor,
             event="UI Update Browsepath",
@@ -244,13 +281,15 @@ async def update_samples(item: add_sample_params) -> Response:
     datasetName = item.dataset_name
     token = item.user_token.get_secret_value()
     user = item.requestor
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         generated_mcp = make_profile_mcp(
             sample_values=item.samples,
             timestamp=item.timestamp,
             datasetName=datasetName,
         )
-        response = emit_mcp_respond(
+        response = await emit_mcp_respond(
             metadata_record=generated_mcp,
             owner=item.requestor,
             event="Update Dataset Profile",
@@ -290,12 +329,15 @@ async def delete_samples(item: delete_sample_params) -> Response:
         scheme, host = elastic_host.split("//")
         elastic_host = f"{scheme}//{elastic_username}:{elastic_password}@{host}"
     profile_index = os.environ["DATASET_PROFILE_INDEX"]
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         data = """{{"query":{{"bool":{{"must":[{{"match":{{"timestampMillis":{timestamp}}}}},
             {{"match":{{"urn":"{urn}"}}}}]}}}}}}""".format(
             urn=datasetName, timestamp=str(item.timestamp)
         )
-        response = requests.post(
+        response = await run_in_threadpool(
+            requests.post,
             "{es_host}/{profile_index}/_delete_by_query".format(
                 es_host=elastic_host, profile_index=profile_index
             ),
@@ -325,7 +367,9 @@ async def update_schema(item: schema_params) -> Response:
     datasetName = item.dataset_name
     token = item.user_token.get_secret_value()
     user = item.requestor
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         dataset_snapshot = DatasetSnapshot(
             urn=datasetName,
             aspects=[],
@@ -351,7 +395,7 @@ async def update_schema(item: schema_params) -> Response:
                 lastObserved=get_sys_time(),
             ),
         )
-        response = emit_mce_respond(
+        response = await emit_mce_respond(
             metadata_record=metadata_record,
             owner=item.requestor,
             event="UI Update Schema",
@@ -387,13 +431,14 @@ async def update_prop(item: prop_params) -> Response:
     datasetName = item.dataset_name
     token = item.user_token.get_secret_value()
     user = item.requestor
-    if authenticate_action(token=token, user=user, dataset=datasetName):
-        graph = build_datahub_graph(token)
-        existing_prop = graph.get_aspect_v2(
-            entity_urn=datasetName,
-            aspect="datasetProperties",
-            aspect_type=DatasetPropertiesClass,
-        )
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
+        async with build_datahub_graph(token) as graph:
+            existing_prop = await graph.get_aspect(
+                entity_urn=datasetName,
+                aspect_type=DatasetPropertiesClass,
+            )
         if not existing_prop:
             existing_prop = DatasetPropertiesClass()
 
@@ -423,7 +468,7 @@ async def update_prop(item: prop_params) -> Response:
                 lastObserved=get_sys_time(),
             ),
         )
-        response = emit_mcp_respond(
+        response = await emit_mcp_respond(
             metadata_record=mcp,
             owner=item.requestor,
             event="UI Update Properties",
@@ -445,12 +490,12 @@ async def update_prop(item: prop_params) -> Response:
         )
 
 
-def build_datahub_graph(token: str) -> DataHubGraph:
-    graph = DataHubGraph(DatahubClientConfig(server=rest_endpoint, token=token))
-    return graph
+def build_datahub_graph(token: str) -> AsyncDataHubGraph:
+    # closing the returned graph does not close the shared connection pool
+    return gms_client.with_token(token)
 
 
-def emit_mce_respond(
+async def emit_mce_respond(
     metadata_record: MetadataChangeEvent,
     owner: str,
     event: str,
@@ -473,9 +518,7 @@ def emit_mce_respond(
         generate_json_output_mce(metadata_record, "/var/log/ingest/json/")
     try:
         rootLogger.debug(f"{eventid} : {metadata_record}")
-        emitter = DatahubRestEmitter(rest_endpoint, token=token)
-        emitter.emit_mce(metadata_record)
-        emitter._session.close()
+        await gms_client.with_token(token).emit_mce(metadata_record)
     except Exception as e:
         rootLogger.error(f"{eventid} : {e}")
         return {
@@ -492,7 +535,7 @@ def emit_mce_respond(
     }
 
 
-def emit_mcp_respond(
+async def emit_mcp_respond(
     metadata_record: MetadataChangeProposalWrapper,
     owner: str,
     event: str,
@@ -506,9 +549,7 @@ def emit_mcp_respond(
         generate_json_output_mcp(metadata_record, "/var/log/ingest/json/")
     try:
         rootLogger.debug(f"{eventid} : {metadata_record}")
-        emitter = DatahubRestEmitter(rest_endpoint, token=token)
-        emitter.emit_mcp(metadata_record)
-        emitter._session.close()
+        await gms_client.with_token(token).emit_mcp(metadata_record)
     except Exception as e:
         rootLogger.error(f"{eventid} : {e}")
         return {
@@ -634,13 +675,15 @@ async def create_item(item: create_dataset_params) -> Response:
         )
         # i am emitting 2 times now, 1 for dataset and 1 for container MCP,
         # which unfortunately do not fit into MCE snapshot, as a new aspect
-        response1 = emit_mce_respond(
+        response1 = await emit_mce_respond(
             metadata_record=metadata_record,
             owner=requestor,
             event="Create Dataset",
             token=token,
             eventid=eventid,
         )
+        # the new ownership aspect makes any cached verdict for this urn stale
+        invalidate_dataset_authorization(datasetUrn)
         response2 = {}
         response2["status_code"] = 201
         if item.parentContainer != "":
@@ -657,7 +700,7 @@ async def create_item(item: create_dataset_params) -> Response:
                     lastObserved=get_sys_time(),
                 ),
             )
-            response2 = emit_mcp_respond(
+            response2 = await emit_mcp_respond(
                 metadata_record=container_mcp,
                 owner=requestor,
                 event=f"Make-Dataset: update_container:{item.parentContainer}",
@@ -690,11 +733,13 @@ async def delete_item(item: dataset_status_params) -> Response:
     datasetName = item.dataset_name
     token = item.user_token.get_secret_value()
     user = item.requestor
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         mce = make_status_mce(
             dataset_name=item.dataset_name, desired_status=item.desired_state
         )
-        response = emit_mce_respond(
+        response = await emit_mce_respond(
             metadata_record=mce,
             owner=item.requestor,
             event=f"Status Update removed:{item.desired_state}",
@@ -730,7 +775,9 @@ async def update_container(item: container_param) -> Response:
     token = item.user_token.get_secret_value()
     user = item.requestor
     container = item.container
-    if authenticate_action(token=token, user=user, dataset=datasetName):
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
         mcp = MetadataChangeProposalWrapper(
             aspect=make_container_aspect(container),
             entityType="dataset",
@@ -742,7 +789,7 @@ async def update_container(item: container_param) -> Response:
                 lastObserved=get_sys_time(),
             ),
         )
-        response = emit_mcp_respond(
+        response = await emit_mcp_respond(
             metadata_record=mcp,
             owner=item.requestor,
             event=f"Update container:{item.container}",
@@ -778,13 +825,14 @@ async def update_name(item: name_param) -> Response:
     token = item.user_token.get_secret_value()
     user = item.requestor
     displayName = item.displayName
-    if authenticate_action(token=token, user=user, dataset=datasetName):
-        graph = build_datahub_graph(token)
-        existing_prop = graph.get_aspect_v2(
-            entity_urn=datasetName,
-            aspect="datasetProperties",
-            aspect_type=DatasetPropertiesClass,
-        )
+    if await run_in_threadpool(
+        authenticate_action, token=token, user=user, dataset=datasetName
+    ):
+        async with build_datahub_graph(token) as graph:
+            existing_prop = await graph.get_aspect(
+                entity_urn=datasetName,
+                aspect_type=DatasetPropertiesClass,
+            )
         if not existing_prop:
             existing_prop = DatasetPropertiesClass()
         new_prop = DatasetPropertiesClass(
@@ -808,7 +856,7 @@ async def update_name(item: name_param) -> Response:
                 lastObserved=get_sys_time(),
             ),
         )
-        response = emit_mcp_respond(
+        response = await emit_mcp_respond(
             metadata_record=mcp,
             owner=item.requestor,
             event=f"Update dataset name:{item.displayName}",
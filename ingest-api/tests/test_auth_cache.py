@@ -0,0 +1,134 @@
+import time
+
+import jwt
+import pytest
+
+from ingest_api.helper import security
+from ingest_api.helper.ttl_cache import TTLCache
+
+SECRET = "ingest-api-test-secret-of-32-bytes"
+DATASET = "urn:li:dataset:(urn:li:dataPlatform:csv,my_dataset,PROD)"
+
+
+@pytest.fixture(autouse=True)
+def auth_env(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET", SECRET)
+    monkeypatch.setenv("DATAHUB_AUTHENTICATE_INGEST", "yes")
+    security.ownership_cache.clear()
+    security.groups_cache.clear()
+    yield
+    security.ownership_cache.clear()
+    security.groups_cache.clear()
+
+
+@pytest.fixture
+def graphql_calls(monkeypatch):
+    calls = {"ownership": 0, "groups": 0}
+    owners = [{"owner": {"__typename": "CorpGroup", "urn": "urn:li:corpGroup:team"}}]
+    groups = [{"entity": {"urn": "urn:li:corpGroup:team"}}]
+
+    def fake_ownership(token, dataset_urn, query_endpoint):
+        calls["ownership"] += 1
+        return owners
+
+    def fake_groups(token, query_endpoint, user_urn):
+        calls["groups"] += 1
+        return groups
+
+    monkeypatch.setattr(security, "query_dataset_ownership", fake_ownership)
+    monkeypatch.setattr(security, "query_users_groups", fake_groups)
+    return calls
+
+
+def make_token(user, exp):
+    return jwt.encode({"actorId": user, "exp": int(exp)}, SECRET, algorithm="HS256")
+
+
+def test_verdict_is_cached(graphql_calls):
+    token = make_token("alice", time.time() + 3600)
+    for _ in range(10):
+        assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert graphql_calls == {"ownership": 1, "groups": 1}
+
+
+def test_groups_are_shared_across_datasets(graphql_calls):
+    token = make_token("alice", time.time() + 3600)
+    assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert security.authenticate_action(token=token, user="alice", dataset="other")
+    assert graphql_calls == {"ownership": 2, "groups": 1}
+
+
+def test_invalid_token_is_never_served_from_cache(graphql_calls):
+    token = make_token("alice", time.time() + 3600)
+    assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert not security.authenticate_action(
+        token="garbage", user="alice", dataset=DATASET
+    )
+    assert not security.authenticate_action(token=token, user="bob", dataset=DATASET)
+
+
+def test_verdict_expires_with_token(graphql_calls):
+    exp = int(time.time()) + 10
+    token = make_token("alice", exp)
+    assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    deadline, _ = security.ownership_cache._entries[("alice", DATASET)]
+    assert deadline == exp
+
+
+def test_invalidate_dataset(graphql_calls):
+    token = make_token("alice", time.time() + 3600)
+    assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    security.invalidate_dataset_authorization(DATASET)
+    assert security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert graphql_calls["ownership"] == 2
+
+
+def test_failed_lookup_is_not_cached(monkeypatch):
+    calls = []
+
+    def failing_ownership(token, dataset_urn, query_endpoint):
+        calls.append(dataset_urn)
+        return None
+
+    monkeypatch.setattr(security, "query_dataset_ownership", failing_ownership)
+    token = make_token("alice", time.time() + 3600)
+    assert not security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert not security.authenticate_action(token=token, user="alice", dataset=DATASET)
+    assert len(calls) == 2
+
+
+def test_ttl_cache_expiry_and_eviction():
+    now = [1000.0]
+    cache = TTLCache(max_entries=2, ttl_sec=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2, expires_at=1005)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 1010
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_graphql_queries_share_a_session(monkeypatch):
+    class FakeResponse:
+        status_code = 200
+        text = '{"data": {"dataset": {"ownership": {"owners": []}}}}'
+
+    sessions = []
+
+    def fake_post(self, url, **kwargs):
+        sessions.append(self)
+        return FakeResponse()
+
+    monkeypatch.setattr(security.requests.Session, "post", fake_post)
+    monkeypatch.setattr(
+        security.requests,
+        "post",
+        lambda *args, **kwargs: pytest.fail("unpooled request"),
+    )
+    for _ in range(2):
+        assert security.query_dataset_ownership("token", DATASET, "http://x") == []
+    assert sessions == [security.graphql_session, security.graphql_session]
@@ -216,11 +216,10 @@ iceberg_common = {
 s3_base = {
     *aws_common,
     "more-itertools>=8.12.0",
+    "numpy>=1.17.0",
     "parse>=1.19.0",
     "pyarrow>=6.0.1",
     "tableschema>=1.20.2",
-    # ujson 5.2.0 has the JSONDecodeError exception type, which we need for error handling.
-    "ujson>=5.2.0",
     "smart-open[s3]>=5.2.1",
     "moto[s3]",
     *path_spec_common,
@@ -259,6 +258,8 @@ plugins: Dict[str, Set[str]] = {
         "fastapi",
         "uvicorn",
     },
+    # Compressed .jsonl.zst metadata files for the file source and sink.
+    "zstd": {"zstandard"},
     # Integrations.
     "airflow": {
         "apache-airflow >= 2.0.2",
@@ -408,7 +409,6 @@ mypy_stubs = {
     "types-pytz",
     "types-pyOpenSSL",
     "types-click-spinner>=0.1.13.1",
-    "types-ujson>=5.2.0",
     "types-termcolor>=1.0.0",
     "types-Deprecated",
     "types-protobuf>=4.21.0.1",
@@ -0,0 +1,335 @@
+import asyncio
+import copy
+import json
+import logging
+import ssl
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar, Union
+
+import aiohttp
+
+from datahub.cli.cli_utils import get_system_auth
+from datahub.configuration.common import ConfigurationError, OperationalError
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import (
+    _DEFAULT_CONNECT_TIMEOUT_SEC,
+    _DEFAULT_READ_TIMEOUT_SEC,
+    _DEFAULT_RETRY_MAX_TIMES,
+    _DEFAULT_RETRY_METHODS,
+    _DEFAULT_RETRY_STATUS_CODES,
+    DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    DEFAULT_BATCH_MAX_RECORDS,
+    _chunk_serialized_mcps,
+    _connection_error_message,
+    _make_emit_error,
+    _make_mce_payload,
+    _make_mcp_payload,
+    _validate_server_config,
+)
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
+
+logger = logging.getLogger(__name__)
+
+_Self = TypeVar("_Self", bound="AsyncDataHubRestEmitter")
+
+# Matches the backoff_factor used by the urllib3 Retry in DataHubRestEmitter.
+_RETRY_BACKOFF_FACTOR = 2
+
+
+class AsyncDataHubRestEmitter:
+    """An asyncio-native counterpart to DataHubRestEmitter.
+
+    Requests are sent over a pooled aiohttp session, using the same timeout and
+    retry semantics as the blocking emitter. The session is created lazily on
+    first use, so the emitter can be constructed outside of a running event loop,
+    but it must always be used from the same loop.
+    """
+
+    _gms_server: str
+    _token: Optional[str]
+    _connect_timeout_sec: float = _DEFAULT_CONNECT_TIMEOUT_SEC
+    _read_timeout_sec: float = _DEFAULT_READ_TIMEOUT_SEC
+    _retry_status_codes: List[int] = _DEFAULT_RETRY_STATUS_CODES
+    _retry_methods: List[str] = _DEFAULT_RETRY_METHODS
+    _retry_max_times: int = _DEFAULT_RETRY_MAX_TIMES
+
+    def __init__(
+        self,
+        gms_server: str,
+        token: Optional[str] = None,
+        connect_timeout_sec: Optional[float] = None,
+        read_timeout_sec: Optional[float] = None,
+        retry_status_codes: Optional[List[int]] = None,
+        retry_methods: Optional[List[str]] = None,
+        retry_max_times: Optional[int] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        ca_certificate_path: Optional[str] = None,
+        disable_ssl_verification: bool = False,
+        max_connections: int = 100,
+        keepalive_timeout_sec: Optional[float] = None,
+    ):
+        if not gms_server:
+            raise ConfigurationError("gms server is required")
+        self._gms_server = gms_server
+        self._token = token
+        self.server_config: Dict[str, Any] = {}
+
+        self._headers: Dict[str, str] = {
+            "X-RestLi-Protocol-Version": "2.0.0",
+            "Content-Type": "application/json",
+        }
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+        else:
+            system_auth = get_system_auth()
+            if system_auth is not None:
+                self._headers["Authorization"] = system_auth
+
+        if extra_headers:
+            self._headers.update(extra_headers)
+
+        self._ssl: Union[ssl.SSLContext, bool] = True
+        if disable_ssl_verification:
+            self._ssl = False
+        elif ca_certificate_path:
+            # Mirrors the `session.cert` setting of the blocking emitter.
+            ssl_context = ssl.create_default_context()
+            ssl_context.load_cert_chain(ca_certificate_path)
+            self._ssl = ssl_context
+
+        if connect_timeout_sec:
+            self._connect_timeout_sec = connect_timeout_sec
+
+        if read_timeout_sec:
+            self._read_timeout_sec = read_timeout_sec
+
+        if self._connect_timeout_sec < 1 or self._read_timeout_sec < 1:
+            logger.warning(
+                f"Setting timeout values lower than 1 second is not recommended. Your configuration is connect_timeout:{self._connect_timeout_sec}s, read_timeout:{self._read_timeout_sec}s"
+            )
+
+        if retry_status_codes is not None:  # Only if missing. Empty list is allowed
+            self._retry_status_codes = retry_status_codes
+
+        if retry_methods is not None:
+            self._retry_methods = retry_methods
+
+        if retry_max_times:
+            self._retry_max_times = retry_max_times
+
+        self._pool = _ConnectionPool(
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self._connect_timeout_sec,
+                sock_read=self._read_timeout_sec,
+            ),
+            ssl_context=self._ssl,
+            max_connections=max_connections,
+            keepalive_timeout_sec=keepalive_timeout_sec,
+        )
+        self._owns_pool = True
+
+    def with_token(self: _Self, token: str) -> _Self:
+        """Returns a client that authenticates with the given token, but shares
+        this client's connection pool.
+
+        This lets a long-lived client be reused across requests made on behalf of
+        different users. Closing the returned client does not close the pool.
+        """
+
+        client = copy.copy(self)
+        client._token = token
+        client._headers = {**self._headers, "Authorization": f"Bearer {token}"}
+        client._owns_pool = False
+        return client
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Checks the connection to GMS and opens up to `connections` pooled
+        connections ahead of time, so that the first requests don't pay for
+        connection setup."""
+
+        await asyncio.gather(*[self.test_connection() for _ in range(connections)])
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "_AsyncResponse":
+        """Sends a request, retrying on connection errors and on the configured
+        status codes with exponential backoff."""
+
+        session = self._pool.get_session()
+        kwargs.setdefault("headers", self._headers)
+        max_retries = (
+            self._retry_max_times if method.upper() in self._retry_methods else 0
+        )
+        attempt = 0
+        while True:
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    if (
+                        response.status not in self._retry_status_codes
+                        or attempt >= max_retries
+                    ):
+                        return _AsyncResponse(response.status, body)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= max_retries:
+                    raise
+            attempt += 1
+            # Same schedule as urllib3: no delay before the first retry.
+            if attempt > 1:
+                await asyncio.sleep(_RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+
+    async def test_connection(self) -> dict:
+        url = f"{self._gms_server}/config"
+        response = await self._request("GET", url)
+        if response.status == 200:
+            config: dict = response.json()
+            _validate_server_config(config)
+            self.server_config = config
+            return config
+        else:
+            logger.debug(
+                f"Unable to connect to {url} with status_code: {response.status}. Response: {response.text}"
+            )
+            raise ConfigurationError(
+                _connection_error_message(url, response.status, response.text)
+            )
+
+    async def emit(
+        self,
+        item: Union[
+            MetadataChangeEvent,
+            MetadataChangeProposal,
+            MetadataChangeProposalWrapper,
+        ],
+    ) -> None:
+        if isinstance(item, (MetadataChangeProposal, MetadataChangeProposalWrapper)):
+            await self.emit_mcp(item)
+        else:
+            await self.emit_mce(item)
+
+    async def emit_mce(self, mce: MetadataChangeEvent) -> None:
+        url = f"{self._gms_server}/entities?action=ingest"
+        await self._emit_generic(url, _make_mce_payload(mce))
+
+    async def emit_mcp(
+        self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+    ) -> None:
+        url = f"{self._gms_server}/aspects?action=ingestProposal"
+        await self._emit_generic(url, _make_mcp_payload(mcp))
+
+    async def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        max_batch_records: int = DEFAULT_BATCH_MAX_RECORDS,
+        max_batch_payload_bytes: int = DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    ) -> int:
+        """Emit MCPs using the batch ingestion endpoint.
+
+        See DataHubRestEmitter.emit_mcps for details.
+        """
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        requests_made = 0
+        for chunk in _chunk_serialized_mcps(
+            mcps, max_batch_records, max_batch_payload_bytes
+        ):
+            payload = '{"proposals": [' + ", ".join(chunk) + "]}"
+            await self._emit_generic(url, payload)
+            requests_made += 1
+        return requests_made
+
+    async def _emit_generic(self, url: str, payload: str) -> None:
+        logger.debug("Attempting to emit to DataHub GMS at %s", url)
+        try:
+            response = await self._request("POST", url, data=payload)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise OperationalError(
+                "Unable to emit metadata to DataHub GMS", {"message": str(e)}
+            ) from e
+
+        if response.status >= 400:
+            try:
+                info: Dict = response.json()
+            except ValueError:
+                raise OperationalError(
+                    "Unable to emit metadata to DataHub GMS",
+                    {"message": f"{response.status} Error: {response.text}"},
+                )
+            raise _make_emit_error(info)
+
+    def __repr__(self) -> str:
+        token_str = (
+            f" with token: {self._token[:4]}**********{self._token[-4:]}"
+            if self._token
+            else ""
+        )
+        return f"{self.__class__.__name__}: configured to talk to {self._gms_server}{token_str}"
+
+    async def close(self) -> None:
+        if self._owns_pool:
+            await self._pool.close()
+
+    async def __aenter__(self: _Self) -> _Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+class _ConnectionPool:
+    """Lazily creates the aiohttp session, since that must happen inside the
+    event loop. Shared between a client and the clients derived from it via
+    `with_token`."""
+
+    def __init__(
+        self,
+        timeout: aiohttp.ClientTimeout,
+        ssl_context: Union[ssl.SSLContext, bool],
+        max_connections: int,
+        keepalive_timeout_sec: Optional[float],
+    ):
+        self._timeout = timeout
+        self._ssl = ssl_context
+        self._max_connections = max_connections
+        self._keepalive_timeout_sec = keepalive_timeout_sec
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector_kwargs: Dict[str, Any] = {}
+            if self._keepalive_timeout_sec is not None:
+                connector_kwargs["keepalive_timeout"] = self._keepalive_timeout_sec
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_connections, ssl=self._ssl, **connector_kwargs
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _AsyncResponse:
+    """The parts of an aiohttp response we need, read eagerly so that the
+    underlying connection can be released back to the pool."""
+
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
@@ -4,12 +4,12 @@ import json
 import logging
 import os
 from json.decoder import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import requests
 from deprecated import deprecated
 from requests.adapters import HTTPAdapter, Retry
-from requests.exceptions import HTTPError, RequestException
+from requests.exceptions import HTTPError, RequestException, RetryError
 
 from datahub.cli.cli_utils import get_system_auth
 from datahub.configuration.common import ConfigurationError, OperationalError
@@ -39,6 +39,17 @@ _DEFAULT_RETRY_METHODS = ["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TR
 _DEFAULT_RETRY_MAX_TIMES = int(
     os.getenv("DATAHUB_REST_EMITTER_DEFAULT_RETRY_MAX_TIMES", "3")
 )
+# Status codes with which GMS tells us that it is overloaded.
+_THROTTLING_STATUS_CODES = {429, 503}
+
+# The default GMS request size limit is 16MB, so we leave some headroom for the
+# envelope around the proposals.
+DEFAULT_BATCH_MAX_PAYLOAD_BYTES = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_BYTES", str(15 * 1024 * 1024))
+)
+DEFAULT_BATCH_MAX_RECORDS = int(
+    os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_RECORDS", "200")
+)
 
 
 class DataHubRestEmitter(Closeable):
@@ -63,12 +74,16 @@ class DataHubRestEmitter(Closeable):
         extra_headers: Optional[Dict[str, str]] = None,
         ca_certificate_path: Optional[str] = None,
         disable_ssl_verification: bool = False,
+        on_throttled: Optional[Callable[[], None]] = None,
     ):
         if not gms_server:
             raise ConfigurationError("gms server is required")
         self._gms_server = gms_server
         self._token = token
         self.server_config: Dict[str, Any] = {}
+        # Called from the emitting thread whenever GMS throttles a write,
+        # including throttled attempts that were retried successfully.
+        self._on_throttled = on_throttled
 
         self._session = requests.Session()
 
@@ -148,37 +163,16 @@ class DataHubRestEmitter(Closeable):
         response = self._session.get(url)
         if response.status_code == 200:
             config: dict = response.json()
-            if config.get("noCode") == "true":
-                self.server_config = config
-                return config
-
-            else:
-                # Looks like we either connected to an old GMS or to some other service. Let's see if we can determine which before raising an error
-                # A common misconfiguration is connecting to datahub-frontend so we special-case this check
-                if (
-                    config.get("config", {}).get("application") == "datahub-frontend"
-                    or config.get("config", {}).get("shouldShowDatasetLineage")
-                    is not None
-                ):
-                    raise ConfigurationError(
-                        "You seem to have connected to the frontend instead of the GMS endpoint. "
-                        "The rest emitter should connect to DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)"
-                    )
-                else:
-                    raise ConfigurationError(
-                        "You have either connected to a pre-v0.8.0 DataHub GMS instance, or to a different server altogether! "
-                        "Please check your configuration and make sure you are talking to the DataHub GMS endpoint."
-                    )
+            _validate_server_config(config)
+            self.server_config = config
+            return config
         else:
             logger.debug(
                 f"Unable to connect to {url} with status_code: {response.status_code}. Response: {response.text}"
             )
-            if response.status_code == 401:
-                message = f"Unable to connect to {url} - got an authentication error: {response.text}."
-            else:
-                message = f"Unable to connect to {url} with status_code: {response.status_code}."
-            message += "\nPlease check your configuration and make sure you are talking to the DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)."
-            raise ConfigurationError(message)
+            raise ConfigurationError(
+                _connection_error_message(url, response.status_code, response.text)
+            )
 
     def emit(
         self,
@@ -214,46 +208,44 @@ class DataHubRestEmitter(Closeable):
 
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
-
-        raw_mce_obj = mce.proposedSnapshot.to_obj()
-        mce_obj = pre_json_transform(raw_mce_obj)
-        snapshot_fqn = (
-            f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
-        )
-        system_metadata_obj = {}
-        if mce.systemMetadata is not None:
-            system_metadata_obj = {
-                "lastObserved": mce.systemMetadata.lastObserved,
-                "runId": mce.systemMetadata.runId,
-            }
-        snapshot = {
-            "entity": {"value": {snapshot_fqn: mce_obj}},
-            "systemMetadata": system_metadata_obj,
-        }
-        payload = json.dumps(snapshot)
-
-        self._emit_generic(url, payload)
+        self._emit_generic(url, _make_mce_payload(mce))
 
     def emit_mcp(
         self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
     ) -> None:
         url = f"{self._gms_server}/aspects?action=ingestProposal"
+        self._emit_generic(url, _make_mcp_payload(mcp))
 
-        mcp_obj = pre_json_transform(mcp.to_obj())
-        payload = json.dumps({"proposal": mcp_obj})
-
-        self._emit_generic(url, payload)
+    def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        max_batch_records: int = DEFAULT_BATCH_MAX_RECORDS,
+        max_batch_payload_bytes: int = DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    ) -> int:
+        """Emit MCPs using the batch ingestion endpoint.
+
+        The proposals are split into chunks bounded by both record count and
+        serialized payload size, and each chunk is sent as a single request.
+        If any chunk fails, an OperationalError is raised and the remaining
+        chunks are not sent.
+
+        Returns the number of HTTP requests that were made.
+        """
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        requests_made = 0
+        for chunk in _chunk_serialized_mcps(
+            mcps, max_batch_records, max_batch_payload_bytes
+        ):
+            payload = '{"proposals": [' + ", ".join(chunk) + "]}"
+            self._emit_generic(url, payload)
+            requests_made += 1
+        return requests_made
 
     @deprecated
     def emit_usage(self, usageStats: UsageAggregation) -> None:
         url = f"{self._gms_server}/usageStats?action=batchIngest"
-
-        raw_usage_obj = usageStats.to_obj()
-        usage_obj = pre_json_transform(raw_usage_obj)
-
-        snapshot = {"buckets": [usage_obj]}
-        payload = json.dumps(snapshot)
-        self._emit_generic(url, payload)
+        self._emit_generic(url, _make_usage_payload(usageStats))
 
     def _emit_generic(self, url: str, payload: str) -> None:
         curl_command = make_curl_command(self._session, "POST", url, payload)
@@ -263,28 +255,35 @@ class DataHubRestEmitter(Closeable):
         )
         try:
             response = self._session.post(url, data=payload)
+            self._check_throttled(response)
             response.raise_for_status()
         except HTTPError as e:
             try:
                 info: Dict = response.json()
-                logger.debug(
-                    "Full stack trace from DataHub:\n%s", info.get("stackTrace")
-                )
-                info.pop("stackTrace", None)
-                raise OperationalError(
-                    f"Unable to emit metadata to DataHub GMS: {info.get('message')}",
-                    info,
-                ) from e
             except JSONDecodeError:
                 # If we can't parse the JSON, just raise the original error.
                 raise OperationalError(
                     "Unable to emit metadata to DataHub GMS", {"message": str(e)}
                 ) from e
+            raise _make_emit_error(info) from e
         except RequestException as e:
+            if isinstance(e, RetryError) and self._on_throttled:
+                # Every retry of the request hit one of the retry status codes.
+                self._on_throttled()
             raise OperationalError(
                 "Unable to emit metadata to DataHub GMS", {"message": str(e)}
             ) from e
 
+    def _check_throttled(self, response: requests.Response) -> None:
+        if not self._on_throttled:
+            return
+        retries = getattr(response.raw, "retries", None)
+        history = retries.history if retries is not None else ()
+        if response.status_code in _THROTTLING_STATUS_CODES or any(
+            attempt.status in _THROTTLING_STATUS_CODES for attempt in history
+        ):
+            self._on_throttled()
+
     def __repr__(self) -> str:
         token_str = (
             f" with token: {self._token[:4]}**********{self._token[-4:]}"
@@ -301,5 +300,103 @@ class DataHubRestEmitter(Closeable):
         self._session.close()
 
 
+def _validate_server_config(config: dict) -> None:
+    if config.get("noCode") == "true":
+        return
+
+    # Looks like we either connected to an old GMS or to some other service. Let's see if we can determine which before raising an error
+    # A common misconfiguration is connecting to datahub-frontend so we special-case this check
+    if (
+        config.get("config", {}).get("application") == "datahub-frontend"
+        or config.get("config", {}).get("shouldShowDatasetLineage") is not None
+    ):
+        raise ConfigurationError(
+            "You seem to have connected to the frontend instead of the GMS endpoint. "
+            "The rest emitter should connect to DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)"
+        )
+    else:
+        raise ConfigurationError(
+            "You have either connected to a pre-v0.8.0 DataHub GMS instance, or to a different server altogether! "
+            "Please check your configuration and make sure you are talking to the DataHub GMS endpoint."
+        )
+
+
+def _connection_error_message(url: str, status_code: int, text: str) -> str:
+    if status_code == 401:
+        message = f"Unable to connect to {url} - got an authentication error: {text}."
+    else:
+        message = f"Unable to connect to {url} with status_code: {status_code}."
+    message += "\nPlease check your configuration and make sure you are talking to the DataHub GMS (usually <datahub-gms-host>:8080) or Frontend GMS API (usually <frontend>:9002/api/gms)."
+    return message
+
+
+def _make_mce_payload(mce: MetadataChangeEvent) -> str:
+    raw_mce_obj = mce.proposedSnapshot.to_obj()
+    mce_obj = pre_json_transform(raw_mce_obj)
+    snapshot_fqn = (
+        f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
+    )
+    system_metadata_obj = {}
+    if mce.systemMetadata is not None:
+        system_metadata_obj = {
+            "lastObserved": mce.systemMetadata.lastObserved,
+            "runId": mce.systemMetadata.runId,
+        }
+    snapshot = {
+        "entity": {"value": {snapshot_fqn: mce_obj}},
+        "systemMetadata": system_metadata_obj,
+    }
+    return json.dumps(snapshot)
+
+
+def _make_mcp_payload(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> str:
+    mcp_obj = pre_json_transform(mcp.to_obj())
+    return json.dumps({"proposal": mcp_obj})
+
+
+def _make_usage_payload(usageStats: UsageAggregation) -> str:
+    raw_usage_obj = usageStats.to_obj()
+    usage_obj = pre_json_transform(raw_usage_obj)
+
+    snapshot = {"buckets": [usage_obj]}
+    return json.dumps(snapshot)
+
+
+def _make_emit_error(info: Dict) -> OperationalError:
+    logger.debug("Full stack trace from DataHub:\n%s", info.get("stackTrace"))
+    info.pop("stackTrace", None)
+    return OperationalError(
+        f"Unable to emit metadata to DataHub GMS: {info.get('message')}",
+        info,
+    )
+
+
+def _chunk_serialized_mcps(
+    mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+    max_batch_records: int,
+    max_batch_payload_bytes: int,
+) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    chunk_bytes = 0
+    for mcp in mcps:
+        serialized = json.dumps(pre_json_transform(mcp.to_obj()))
+        serialized_bytes = len(serialized.encode())
+        if chunk and (
+            len(chunk) >= max_batch_records
+            or chunk_bytes + serialized_bytes > max_batch_payload_bytes
+        ):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        # A single oversized proposal still gets its own request, so that GMS
+        # is the one to reject it.
+        chunk.append(serialized)
+        chunk_bytes += serialized_bytes
+    if chunk:
+        yield chunk
+
+
 """This class exists as a pass-through for backwards compatibility"""
 DatahubRestEmitter = DataHubRestEmitter
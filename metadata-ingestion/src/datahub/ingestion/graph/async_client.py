@@ -0,0 +1,135 @@
+import json
+import logging
+from typing import Any, Dict, Optional, Type
+
+from datahub.configuration.common import GraphError, OperationalError
+from datahub.emitter.aspect import TIMESERIES_ASPECT_MAP
+from datahub.emitter.async_rest_emitter import AsyncDataHubRestEmitter
+from datahub.emitter.mce_builder import Aspect
+from datahub.ingestion.graph.client import DatahubClientConfig, _parse_aspect_response
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    OwnershipClass,
+    SchemaMetadataClass,
+)
+from datahub.utilities.urns.urn import Urn
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDataHubGraph(AsyncDataHubRestEmitter):
+    """An asyncio-native counterpart to DataHubGraph.
+
+    Only a subset of the DataHubGraph read APIs is available. Unlike DataHubGraph,
+    the constructor does not check the connection, since that requires a running
+    event loop. Call `await graph.test_connection()` to do so explicitly.
+    """
+
+    def __init__(
+        self,
+        config: DatahubClientConfig,
+        max_connections: int = 100,
+        keepalive_timeout_sec: Optional[float] = None,
+    ):
+        self.config = config
+        super().__init__(
+            gms_server=self.config.server,
+            token=self.config.token,
+            connect_timeout_sec=self.config.timeout_sec,  # reuse timeout_sec for connect timeout
+            read_timeout_sec=self.config.timeout_sec,
+            retry_status_codes=self.config.retry_status_codes,
+            retry_max_times=self.config.retry_max_times,
+            extra_headers=self.config.extra_headers,
+            ca_certificate_path=self.config.ca_certificate_path,
+            disable_ssl_verification=self.config.disable_ssl_verification,
+            max_connections=max_connections,
+            keepalive_timeout_sec=keepalive_timeout_sec,
+        )
+
+    async def _send_restli_request(self, method: str, url: str, **kwargs: Any) -> Dict:
+        response = await self._request(method, url, **kwargs)
+        if response.status >= 400:
+            try:
+                info = response.json()
+            except ValueError:
+                info = {"message": f"{response.status} Error: {response.text}"}
+            raise OperationalError("Unable to get metadata from DataHub", info)
+        return response.json()
+
+    async def _get_generic(self, url: str, params: Optional[Dict] = None) -> Dict:
+        return await self._send_restli_request("GET", url, params=params)
+
+    async def _post_generic(self, url: str, payload_dict: Dict) -> Dict:
+        return await self._send_restli_request(
+            "POST", url, data=json.dumps(payload_dict)
+        )
+
+    async def get_aspect(
+        self,
+        entity_urn: str,
+        aspect_type: Type[Aspect],
+        version: int = 0,
+    ) -> Optional[Aspect]:
+        """
+        Get an aspect for an entity. See DataHubGraph.get_aspect for details.
+
+        :raises TypeError: if the aspect type is a timeseries aspect
+        :raises OperationalError: if the HTTP response is not a 200 or a 404
+        """
+
+        aspect = aspect_type.ASPECT_NAME
+        if aspect in TIMESERIES_ASPECT_MAP:
+            raise TypeError(
+                'Cannot get a timeseries aspect using "get_aspect". Use "get_latest_timeseries_value" instead.'
+            )
+
+        url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
+        response = await self._request("GET", url)
+        if response.status == 404:
+            # not found
+            return None
+        if response.status >= 400:
+            raise OperationalError(
+                "Unable to get metadata from DataHub",
+                {"message": f"{response.status} Error: {response.text}"},
+            )
+        return _parse_aspect_response(response.json(), aspect_type)
+
+    async def get_config(self) -> Dict[str, Any]:
+        return await self._get_generic(f"{self.config.server}/config")
+
+    async def get_ownership(self, entity_urn: str) -> Optional[OwnershipClass]:
+        return await self.get_aspect(entity_urn=entity_urn, aspect_type=OwnershipClass)
+
+    async def get_schema_metadata(
+        self, entity_urn: str
+    ) -> Optional[SchemaMetadataClass]:
+        return await self.get_aspect(
+            entity_urn=entity_urn, aspect_type=SchemaMetadataClass
+        )
+
+    async def get_dataset_properties(
+        self, entity_urn: str
+    ) -> Optional[DatasetPropertiesClass]:
+        return await self.get_aspect(
+            entity_urn=entity_urn, aspect_type=DatasetPropertiesClass
+        )
+
+    async def execute_graphql(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Dict:
+        url = f"{self.config.server}/api/graphql"
+        body: Dict = {
+            "query": query,
+        }
+        if variables:
+            body["variables"] = variables
+
+        logger.debug(
+            f"Executing graphql query: {query} with variables: {json.dumps(variables)}"
+        )
+        result = await self._post_generic(url, body)
+        if result.get("errors"):
+            raise GraphError(f"Error executing graphql query: {result['errors']}")
+
+        return result["data"]
@@ -105,6 +105,23 @@ def _graphql_entity_type(entity_type: str) -> str:
     return entity_type
 
 
+def _parse_aspect_response(response_json: Dict, aspect_type: Type[Aspect]) -> Aspect:
+    # Figure out what field to look in.
+    record_schema: RecordSchema = aspect_type.RECORD_SCHEMA
+    aspect_type_name = record_schema.fullname.replace(".pegasus2avro", "")
+
+    # Deserialize the aspect json into the aspect type.
+    aspect_json = response_json.get("aspect", {}).get(aspect_type_name)
+    if aspect_json is not None:
+        # need to apply a transform to the response to match rest.li and avro serialization
+        post_json_obj = post_json_transform(aspect_json)
+        return aspect_type.from_obj(post_json_obj)
+    else:
+        raise GraphError(
+            f"Failed to find {aspect_type_name} in response {response_json}"
+        )
+
+
 class DataHubGraph(DatahubRestEmitter):
     def __init__(self, config: DatahubClientConfig) -> None:
         self.config = config
@@ -189,22 +206,7 @@ class DataHubGraph(DatahubRestEmitter):
             # not found
             return None
         response.raise_for_status()
-        response_json = response.json()
-
-        # Figure out what field to look in.
-        record_schema: RecordSchema = aspect_type.RECORD_SCHEMA
-        aspect_type_name = record_schema.fullname.replace(".pegasus2avro", "")
-
-        # Deserialize the aspect json into the aspect type.
-        aspect_json = response_json.get("aspect", {}).get(aspect_type_name)
-        if aspect_json is not None:
-            # need to apply a transform to the response to match rest.li and avro serialization
-            post_json_obj = post_json_transform(aspect_json)
-            return aspect_type.from_obj(post_json_obj)
-        else:
-            raise GraphError(
-                f"Failed to find {aspect_type_name} in response {response_json}"
-            )
+        return _parse_aspect_response(response.json(), aspect_type)
 
     @deprecated(reason="Use get_aspect instead which makes aspect string name optional")
     def get_aspect_v2(
@@ -5,9 +5,10 @@ import os
 import platform
 import shutil
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 import click
 import humanfriendly
@@ -20,12 +21,18 @@ from datahub.configuration.common import (
     PipelineExecutionError,
 )
 from datahub.ingestion.api.committable import CommitPolicy
-from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.common import (
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+    WorkUnit,
+)
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.reporting.reporting_provider_registry import (
@@ -36,13 +43,17 @@ from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
 from datahub.ingestion.transformer.transform_registry import transform_registry
-from datahub.metadata.schema_classes import MetadataChangeProposalClass
+from datahub.metadata.schema_classes import (
+    MetadataChangeEventClass,
+    MetadataChangeProposalClass,
+)
 from datahub.telemetry import stats, telemetry
 from datahub.utilities.global_warning_util import (
     clear_global_warnings,
     get_global_warnings,
 )
 from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.partitioned_executor import PartitionedExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +249,7 @@ class Pipeline:
 
     def _configure_transforms(self) -> None:
         self.transformers = []
+        self._transformer_locks: List[threading.Lock] = []
         if self.config.transformers is not None:
             for transformer in self.config.transformers:
                 transformer_type = transformer.type
@@ -246,6 +258,7 @@ class Pipeline:
                 self.transformers.append(
                     transformer_class.create(transformer_config, self.ctx)
                 )
+                self._transformer_locks.append(threading.Lock())
                 logger.debug(
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
@@ -350,10 +363,11 @@ class Pipeline:
             return True
         return False
 
-    def run(self) -> None:
+    def run(self) -> None:  # noqa: C901
         self.final_status = "unknown"
         self._notify_reporters_on_ingestion_start()
         callback = None
+        executor: Optional[PartitionedExecutor] = None
         try:
             callback = (
                 LoggingCallback()
@@ -362,6 +376,10 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
+            if self.config.processing_workers > 1:
+                executor = PartitionedExecutor(
+                    max_workers=self.config.processing_workers
+                )
             for wu in itertools.islice(
                 self.source.get_workunits(),
                 self.preview_workunits if self.preview_mode else None,
@@ -372,6 +390,14 @@ class Pipeline:
                 except Exception as e:
                     logger.warning(f"Failed to print summary {e}")
 
+                if executor:
+                    executor.submit(
+                        self._get_partition_key(wu), self._process_workunit, wu
+                    )
+                    for future in executor.completed():
+                        self._write_processed_workunit(*future.result(), callback)
+                    continue
+
                 if not self.dry_run:
                     self.sink.handle_work_unit_start(wu)
                 try:
@@ -392,6 +418,10 @@ class Pipeline:
                 self.extractor.close()
                 if not self.dry_run:
                     self.sink.handle_work_unit_end(wu)
+            if executor:
+                for future in executor.completed(wait=True):
+                    self._write_processed_workunit(*future.result(), callback)
+                self.extractor.close()
             self.source.close()
             # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
             for record_envelope in self.transform(
@@ -417,11 +447,76 @@ class Pipeline:
         finally:
             clear_global_warnings()
 
+            if executor:
+                executor.close()
+
             if callback and hasattr(callback, "close"):
                 callback.close()  # type: ignore
 
             self._notify_reporters_on_ingestion_completion()
 
+    @staticmethod
+    def _get_partition_key(wu: WorkUnit) -> str:
+        # Transformers keep per-entity state, so all workunits for an entity
+        # must be processed by the same worker and in order.
+        if isinstance(wu, MetadataWorkUnit) and (
+            isinstance(wu.metadata, MetadataChangeEventClass) or wu.metadata.entityUrn
+        ):
+            return wu.get_urn()
+        # e.g. MCPs that only have an entityKeyAspect
+        return wu.id
+
+    def _process_workunit(
+        self, wu: WorkUnit
+    ) -> Tuple[WorkUnit, List[RecordEnvelope], Optional[Exception]]:
+        """Runs the extractor and transformers over a workunit. This is called from
+        the processing worker threads, so it must not touch the sink.
+
+        Transformers keep state across workunits, so each transformer is only run
+        by one worker at a time. Workers can still run different transformers at
+        the same time.
+
+        Like the serial path, a failure doesn't discard the records that were
+        produced before it: they're still passed through the remaining
+        transformers and returned along with the first error."""
+        error: Optional[Exception] = None
+        records: List[RecordEnvelope] = []
+        try:
+            for record_envelope in self.extractor.get_records(wu):
+                records.append(record_envelope)
+        except Exception as e:
+            error = e
+        for transformer, lock in zip(self.transformers, self._transformer_locks):
+            transformed: List[RecordEnvelope] = []
+            with lock:
+                try:
+                    for record_envelope in transformer.transform(records):
+                        transformed.append(record_envelope)
+                except Exception as e:
+                    error = error or e
+            records = transformed
+        return wu, records, error
+
+    def _write_processed_workunit(
+        self,
+        wu: WorkUnit,
+        records: List[RecordEnvelope],
+        error: Optional[Exception],
+        callback: WriteCallback,
+    ) -> None:
+        if not self.dry_run:
+            self.sink.handle_work_unit_start(wu)
+            for record_envelope in records:
+                self.sink.write_record_async(record_envelope, callback)
+
+        if isinstance(error, RuntimeError):
+            raise error
+        elif error is not None:
+            logger.error("Failed to process some records. Continuing.", exc_info=error)
+
+        if not self.dry_run:
+            self.sink.handle_work_unit_end(wu)
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
@@ -50,6 +50,15 @@ class PipelineConfig(ConfigModel):
     datahub_api: Optional[DatahubClientConfig] = None
     pipeline_name: Optional[str] = None
     failure_log: FailureLoggingConfig = FailureLoggingConfig()
+    processing_workers: int = Field(
+        1,
+        description="Experimental: Number of threads used to run the extractor and transformers. "
+        "Workunits for the same entity are always processed in order by the same thread, "
+        "and each transformer is only run by one thread at a time. "
+        "Because the workers are threads, this only speeds up ingestion when the extractor or transformers "
+        "spend their time waiting on I/O, e.g. transformers that call out to DataHub or another service; "
+        "CPU-bound transformers gain nothing from it.",
+    )
 
     _raw_dict: Optional[
         dict
@@ -89,6 +98,12 @@ class PipelineConfig(ConfigModel):
 
         return values
 
+    @validator("processing_workers")
+    def processing_workers_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("processing_workers must be at least 1")
+        return v
+
     @validator("datahub_api", always=True)
     def datahub_api_should_use_rest_sink_as_default(
         cls, v: Optional[DatahubClientConfig], values: Dict[str, Any], **kwargs: Any
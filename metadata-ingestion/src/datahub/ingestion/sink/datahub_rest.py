@@ -2,12 +2,12 @@ import concurrent.futures
 import contextlib
 import functools
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from datetime import timedelta
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import auto
-from threading import BoundedSemaphore
-from typing import Union
+from typing import Deque, List, Optional, Union
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -16,7 +16,11 @@ from datahub.configuration.common import (
     OperationalError,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.rest_emitter import (
+    DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    DEFAULT_BATCH_MAX_RECORDS,
+    DatahubRestEmitter,
+)
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -25,65 +29,89 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
 )
+from datahub.telemetry.stats import calculate_percentiles
+from datahub.utilities.adaptive_executor import AdaptiveExecutor, AIMDConcurrencyLimiter
 from datahub.utilities.server_config_util import set_gms_config
 
 logger = logging.getLogger(__name__)
 
+_MAX_TRACKED_LATENCIES = 10000
+
 
-class SyncOrAsync(ConfigEnum):
+class RestSinkMode(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    # Buffers MCPs and sends them to GMS using the batch ingestion endpoint.
+    BATCH = auto()
+
+
+# Alias for backwards compatibility.
+SyncOrAsync = RestSinkMode
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
-    mode: SyncOrAsync = SyncOrAsync.ASYNC
+    mode: RestSinkMode = RestSinkMode.ASYNC
 
-    # These only apply in async mode.
+    # These only apply in async and batch mode.
     max_threads: int = 15
     max_pending_requests: int = 1000
+    # If enabled, max_threads is only an upper bound: the number of concurrent
+    # requests is halved whenever GMS throttles us (429/503) or a write takes
+    # longer than slow_write_threshold_sec per record, and grows back slowly
+    # otherwise.
+    adaptive_concurrency: bool = True
+    slow_write_threshold_sec: float = 5.0
+
+    # These only apply in batch mode.
+    max_batch_records: int = DEFAULT_BATCH_MAX_RECORDS
+    max_batch_payload_bytes: int = DEFAULT_BATCH_MAX_PAYLOAD_BYTES
+    # A batch is sent once its first record has waited this long, even if it
+    # isn't full, so that records of a slow source aren't held back.
+    max_batch_wait_sec: float = 5.0
 
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    batch_requests: int = 0
+    batch_fallbacks: int = 0
+
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    in_flight_requests: int = 0
+    concurrency_limit: int = 0
+    concurrency_reductions: int = 0
+    throttled_requests: int = 0
+
+    write_latency_p50_ms: Optional[float] = None
+    write_latency_p95_ms: Optional[float] = None
+    write_latency_p99_ms: Optional[float] = None
+    # Only the most recent latencies are kept, so the percentiles reflect the
+    # current state of GMS rather than the whole run.
+    _write_latencies_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=_MAX_TRACKED_LATENCIES)
+    )
 
     def compute_stats(self) -> None:
         super().compute_stats()
+        percentiles = calculate_percentiles(
+            list(self._write_latencies_ms), [50, 95, 99]
+        )
+        if percentiles:
+            self.write_latency_p50_ms = round(percentiles[50], 1)
+            self.write_latency_p95_ms = round(percentiles[95], 1)
+            self.write_latency_p99_ms = round(percentiles[99], 1)
 
     def report_write_latency(self, delta: timedelta) -> None:
-        pass
-
-
-class BoundedExecutor:
-    """BoundedExecutor behaves as a ThreadPoolExecutor which will block on
-    calls to submit() once the limit given as "bound" work items are queued for
-    execution.
-    :param bound: Integer - the maximum number of items in the work queue
-    :param max_workers: Integer - the size of the thread pool
-    """
-
-    def __init__(self, bound, max_workers):
-        self.executor = ThreadPoolExecutor(max_workers)
-        self.semaphore = BoundedSemaphore(bound + max_workers)
+        self._write_latencies_ms.append(delta.total_seconds() * 1000)
 
-    """See concurrent.futures.Executor#submit"""
 
-    def submit(self, fn, *args, **kwargs):
-        self.semaphore.acquire()
-        try:
-            future = self.executor.submit(fn, *args, **kwargs)
-        except Exception:
-            self.semaphore.release()
-            raise
-        else:
-            future.add_done_callback(lambda x: self.semaphore.release())
-            return future
-
-    """See concurrent.futures.Executor#shutdown"""
-
-    def shutdown(self, wait=True):
-        self.executor.shutdown(wait)
+@dataclass
+class _PendingWrite:
+    record_envelope: RecordEnvelope
+    write_callback: WriteCallback
+    treat_errors_as_warnings: bool
 
 
 class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
@@ -101,6 +129,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             extra_headers=self.config.extra_headers,
             ca_certificate_path=self.config.ca_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            on_throttled=self._on_throttled,
         )
         try:
             gms_config = self.emitter.test_connection()
@@ -119,10 +148,42 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         set_env_variables_override_config(self.config.server, self.config.token)
         logger.debug("Setting gms config")
         set_gms_config(gms_config)
-        self.executor = BoundedExecutor(
-            max_workers=self.config.max_threads,
-            bound=self.config.max_pending_requests,
+        if self.config.adaptive_concurrency:
+            limiter = AIMDConcurrencyLimiter(
+                max_limit=self.config.max_threads,
+                slow_request_threshold_sec=self.config.slow_write_threshold_sec,
+            )
+        else:
+            limiter = AIMDConcurrencyLimiter(
+                max_limit=self.config.max_threads,
+                min_limit=self.config.max_threads,
+            )
+        self.executor = AdaptiveExecutor(
+            limiter, max_pending=self.config.max_pending_requests
+        )
+        # The batch is flushed by the pipeline's thread when it's full, and by a
+        # timer when it has waited for too long.
+        self._batch: List[_PendingWrite] = []
+        self._batch_lock = threading.Lock()
+        self._batch_timer: Optional[threading.Timer] = None
+
+    def _on_throttled(self) -> None:
+        self.report.throttled_requests += 1
+        if self.config.adaptive_concurrency:
+            self.executor.limiter.signal_overload()
+
+    def _update_concurrency_stats(self) -> None:
+        self.report.queue_depth = self.executor.queue_depth
+        self.report.max_queue_depth = max(
+            self.report.max_queue_depth, self.report.queue_depth
         )
+        self.report.in_flight_requests = self.executor.in_flight
+        self.report.concurrency_limit = self.executor.limiter.limit
+        self.report.concurrency_reductions = self.executor.limiter.num_decreases
+
+    def get_report(self) -> DataHubRestSinkReport:
+        self._update_concurrency_stats()
+        return self.report
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
@@ -150,35 +211,118 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 self.report.report_record_written(record_envelope)
                 self.report.report_write_latency(end_time - start_time)
                 write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
-                        )
-                        e.info["message"] = e.info.get("message", "").split("\n")[0][
-                            :200
-                        ]
-
-                # Include information about the entity that failed.
-                record = record_envelope.record
-                if isinstance(record, MetadataChangeProposalWrapper):
-                    entity_id = record.entityUrn
-                    e.info["id"] = entity_id
-                elif isinstance(record, MetadataChangeEvent):
-                    entity_id = record.proposedSnapshot.urn
-                    e.info["id"] = entity_id
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
-                else:
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
             else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                self._handle_write_failure(
+                    record_envelope,
+                    write_callback,
+                    e,
+                    self.treat_errors_as_warnings,
+                )
+
+    def _handle_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+        treat_errors_as_warnings: bool,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in e.info:
+                with contextlib.suppress(Exception):
+                    e.info["stackTrace"] = "\n".join(
+                        e.info["stackTrace"].split("\n")[:3]
+                    )
+                    e.info["message"] = e.info.get("message", "").split("\n")[0][:200]
+
+            # Include information about the entity that failed.
+            record = record_envelope.record
+            if isinstance(record, MetadataChangeProposalWrapper):
+                entity_id = record.entityUrn
+                e.info["id"] = entity_id
+            elif isinstance(record, MetadataChangeEvent):
+                entity_id = record.proposedSnapshot.urn
+                e.info["id"] = entity_id
+
+            if not treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                self.report.report_warning({"warning": e.message, "info": e.info})
+            write_callback.on_failure(record_envelope, e, e.info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
+
+    def _emit_batch(self, batch: List[_PendingWrite]) -> None:
+        start_time = datetime.now()
+        try:
+            self.emitter.emit_mcps(
+                [pending.record_envelope.record for pending in batch],
+                max_batch_records=self.config.max_batch_records,
+                max_batch_payload_bytes=self.config.max_batch_payload_bytes,
+            )
+        except Exception as e:
+            # GMS rejects a batch as a whole, so we don't know which records
+            # caused the failure. Fall back to writing the records one at a time
+            # so that successes and failures are attributed to the right records.
+            # Re-sending records that were part of an already-accepted chunk is
+            # safe, since aspect writes are idempotent upserts.
+            logger.debug(
+                f"Batch write of {len(batch)} records failed, retrying individually: {e}"
+            )
+            self.report.batch_fallbacks += 1
+            for pending in batch:
+                try:
+                    start, end = self.emitter.emit(pending.record_envelope.record)
+                except Exception as record_error:
+                    self._handle_write_failure(
+                        pending.record_envelope,
+                        pending.write_callback,
+                        record_error,
+                        pending.treat_errors_as_warnings,
+                    )
+                else:
+                    self.report.report_record_written(pending.record_envelope)
+                    self.report.report_write_latency(end - start)
+                    pending.write_callback.on_success(pending.record_envelope, {})
+        else:
+            self.report.report_write_latency(datetime.now() - start_time)
+            for pending in batch:
+                self.report.report_record_written(pending.record_envelope)
+                pending.write_callback.on_success(pending.record_envelope, {})
+
+    def _batch_done_callback(self, future: concurrent.futures.Future) -> None:
+        self.report.pending_requests -= 1
+        # _emit_batch handles its own errors, so this only fires on bugs.
+        e = future.exception()
+        if e:
+            self.report.report_failure({"error": "batch write failed", "e": e})
+
+    def _flush_batch(self) -> None:
+        with self._batch_lock:
+            self._flush_batch_locked()
+
+    def _flush_stale_batch(self, batch: List[_PendingWrite]) -> None:
+        with self._batch_lock:
+            # Unless the batch was flushed already, and a new one started since.
+            if self._batch is batch:
+                self._flush_batch_locked()
+
+    def _flush_batch_locked(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._batch:
+            return
+        batch = self._batch
+        self._batch = []
+        # A batch write is only slow if it's slow for the number of records in it.
+        write_future = self.executor.submit(self._emit_batch, batch, weight=len(batch))
+        write_future.add_done_callback(self._batch_done_callback)
+        self.report.pending_requests += 1
+        self.report.batch_requests += 1
+        self._update_concurrency_stats()
 
     def write_record_async(
         self,
@@ -192,7 +336,28 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.config.mode == RestSinkMode.BATCH and isinstance(
+            record, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+        ):
+            with self._batch_lock:
+                self._batch.append(
+                    _PendingWrite(
+                        record_envelope, write_callback, self.treat_errors_as_warnings
+                    )
+                )
+                if len(self._batch) >= self.config.max_batch_records:
+                    self._flush_batch_locked()
+                elif len(self._batch) == 1:
+                    self._batch_timer = threading.Timer(
+                        self.config.max_batch_wait_sec,
+                        self._flush_stale_batch,
+                        args=(self._batch,),
+                    )
+                    self._batch_timer.daemon = True
+                    self._batch_timer.start()
+        elif self.config.mode in {RestSinkMode.ASYNC, RestSinkMode.BATCH}:
+            # In batch mode, records that the batch endpoint does not accept
+            # (e.g. MCEs) are written individually.
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
@@ -200,15 +365,18 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 )
             )
             self.report.pending_requests += 1
+            self._update_concurrency_stats()
         else:
             # execute synchronously
             try:
                 (start, end) = self.emitter.emit(record)
+                self.report.report_write_latency(end - start)
                 write_callback.on_success(record_envelope, success_metadata={})
             except Exception as e:
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
     def close(self):
+        self._flush_batch()
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
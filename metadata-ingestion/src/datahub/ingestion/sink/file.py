@@ -1,7 +1,7 @@
 import json
 import logging
 import pathlib
-from typing import Iterable, Union
+from typing import Iterable, Optional, Union
 
 from datahub.configuration.common import ConfigModel
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -11,6 +11,12 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
 )
+from datahub.utilities.json_lines import (
+    JsonLinesIndex,
+    JsonLinesWriter,
+    is_json_lines_file,
+    write_index_sidecar,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +35,27 @@ def _to_obj_for_file(
 
 
 class FileSinkConfig(ConfigModel):
+    # Files ending in .jsonl, .jsonl.gz or .jsonl.zst are written as
+    # newline-delimited JSON, and always get an index sidecar.
     filename: str
 
     legacy_nested_json_string: bool = False
 
+    # Lets the file source report progress without counting the records first.
+    write_index: bool = False
+
 
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
         fpath = pathlib.Path(self.config.filename)
-        self.file = fpath.open("w")
-        self.file.write("[\n")
+        self.json_lines_writer: Optional[JsonLinesWriter] = None
+        if is_json_lines_file(fpath):
+            self.json_lines_writer = JsonLinesWriter(fpath)
+        else:
+            self.file = fpath.open("w")
+            self.file.write("[\n")
         self.wrote_something = False
+        self.num_written = 0
 
     def write_record_async(
         self,
@@ -57,19 +73,31 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
             record, simplified_structure=not self.config.legacy_nested_json_string
         )
 
-        if self.wrote_something:
-            self.file.write(",\n")
+        if self.json_lines_writer is not None:
+            self.json_lines_writer.write(obj)
+        else:
+            if self.wrote_something:
+                self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
+            json.dump(obj, self.file, indent=4)
         self.wrote_something = True
+        self.num_written += 1
 
         self.report.report_record_written(record_envelope)
         if write_callback:
             write_callback.on_success(record_envelope, {})
 
     def close(self):
+        if self.json_lines_writer is not None:
+            self.json_lines_writer.close()
+            return
+
         self.file.write("\n]")
         self.file.close()
+        if self.config.write_index:
+            write_index_sidecar(
+                self.config.filename, JsonLinesIndex(num_elements=self.num_written)
+            )
 
 
 def write_metadata_file(
@@ -83,6 +111,12 @@ def write_metadata_file(
     ],
 ) -> None:
     # This simplified version of the FileSink can be used for testing purposes.
+    if is_json_lines_file(file):
+        with JsonLinesWriter(file) as writer:
+            for record in records:
+                writer.write(_to_obj_for_file(record))
+        return
+
     with file.open("w") as f:
         f.write("[\n")
         for i, record in enumerate(records):
@@ -1,14 +1,27 @@
 import datetime
 import json
 import logging
+import multiprocessing
 import os.path
 import pathlib
-from collections import defaultdict
+import queue
+import traceback
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import auto
 from functools import partial
 from io import BufferedReader
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib import parse
 
 import ijson
@@ -41,6 +54,13 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities.json_lines import (
+    INDEX_SIDECAR_SUFFIX,
+    is_json_lines_file,
+    iterate_json_lines,
+    read_index_sidecar,
+    split_json_lines,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +77,7 @@ class FileSourceConfig(ConfigModel):
         message="filename is deprecated. Use path instead.",
     )
     path: str = Field(
-        description="File path to folder or file to ingest, or URL to a remote file. If pointed to a folder, all files with extension {file_extension} (default json) within that folder will be processed."
+        description="File path to folder or file to ingest, or URL to a remote file. If pointed to a folder, all files with extension {file_extension} (default json) within that folder will be processed. Local files ending in .jsonl, .jsonl.gz or .jsonl.zst are read as newline-delimited JSON."
     )
     file_extension: str = Field(
         ".json",
@@ -70,12 +90,20 @@ class FileSourceConfig(ConfigModel):
     )
     count_all_before_starting: bool = Field(
         default=True,
-        description="When enabled, counts total number of records in the file before starting. Used for accurate estimation of completion time. Turn it off if startup time is too high.",
+        description=f"When enabled, reports the total number of records in each file. The count is read from the file's index sidecar ({INDEX_SIDECAR_SUFFIX}) if there is one, and otherwise estimated from the bytes read so far, so files are only parsed once.",
+    )
+    read_ahead_files: int = Field(
+        default=0,
+        description="Number of local files to parse concurrently in worker processes, ahead of the file currently being ingested. JSON-lines files with an index sidecar are also split into up to this many parts that are parsed concurrently. Workunits are still produced in file order. 0 disables read-ahead.",
     )
 
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
     )
+    # Read-ahead workers hand over records in batches, and at most this many
+    # batches per file are held in memory.
+    _read_ahead_batch_size: int = 100
+    _read_ahead_max_pending_batches: int = 10
 
     _filename_populates_path_if_present = pydantic_renamed_field(
         "filename", "path", print_warning=False
@@ -90,6 +118,12 @@ class FileSourceConfig(ConfigModel):
                 return "." + v
         return v
 
+    @validator("read_ahead_files")
+    def read_ahead_files_must_not_be_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("read_ahead_files must be 0 or more")
+        return v
+
 
 @dataclass
 class FileSourceReport(SourceReport):
@@ -179,6 +213,7 @@ class GenericFileSource(TestableSource):
         self.config = config
         self.report = FileSourceReport()
         self.fp: Optional[BufferedReader] = None
+        self._current_file_count_is_exact = False
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -196,7 +231,7 @@ class GenericFileSource(TestableSource):
                 files_and_stats = [
                     (str(x), os.path.getsize(x))
                     for x in path.glob(f"*{self.config.file_extension}")
-                    if x.is_file()
+                    if x.is_file() and x.suffix != INDEX_SIDECAR_SUFFIX
                 ]
                 self.report.total_num_files = len(files_and_stats)
                 self.report.total_bytes_on_disk = sum([y for (x, y) in files_and_stats])
@@ -214,28 +249,234 @@ class GenericFileSource(TestableSource):
     def get_workunits_internal(
         self,
     ) -> Iterable[MetadataWorkUnit]:
-        for f in self.get_filenames():
-            for i, obj in self.iterate_generic_file(f):
-                id = f"file://{f}:{i}"
-                if isinstance(
-                    obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)
-                ):
-                    self.report.entity_type_counts[obj.entityType] += 1
-                    if obj.aspectName is not None:
-                        cur_aspect_name = str(obj.aspectName)
-                        self.report.aspect_counts[cur_aspect_name] += 1
-                        if (
-                            self.config.aspect is not None
-                            and cur_aspect_name != self.config.aspect
-                        ):
-                            continue
-
-                    if isinstance(obj, MetadataChangeProposalWrapper):
-                        yield MetadataWorkUnit(id, mcp=obj)
-                    else:
-                        yield MetadataWorkUnit(id, mcp_raw=obj)
+        for f, i, obj in self._iterate_all_files():
+            id = f"file://{f}:{i}"
+            if isinstance(obj, (MetadataChangeProposalWrapper, MetadataChangeProposal)):
+                self.report.entity_type_counts[obj.entityType] += 1
+                if obj.aspectName is not None:
+                    cur_aspect_name = str(obj.aspectName)
+                    self.report.aspect_counts[cur_aspect_name] += 1
+                    if (
+                        self.config.aspect is not None
+                        and cur_aspect_name != self.config.aspect
+                    ):
+                        continue
+
+                if isinstance(obj, MetadataChangeProposalWrapper):
+                    yield MetadataWorkUnit(id, mcp=obj)
                 else:
-                    yield MetadataWorkUnit(id, mce=obj)
+                    yield MetadataWorkUnit(id, mcp_raw=obj)
+            else:
+                yield MetadataWorkUnit(id, mce=obj)
+
+    def _iterate_all_files(
+        self,
+    ) -> Iterator[
+        Tuple[
+            str,
+            int,
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposalWrapper,
+                MetadataChangeProposal,
+            ],
+        ]
+    ]:
+        filenames = list(self.get_filenames())
+        if self.config.read_ahead_files > 0 and all(
+            _is_local_file(f) for f in filenames
+        ):
+            yield from self._iterate_files_read_ahead(filenames)
+        else:
+            for f in filenames:
+                for i, obj in self.iterate_generic_file(f):
+                    yield f, i, obj
+
+    def _iterate_files_read_ahead(
+        self, filenames: List[str]
+    ) -> Iterator[
+        Tuple[
+            str,
+            int,
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposalWrapper,
+                MetadataChangeProposal,
+            ],
+        ]
+    ]:
+        """
+        Parses and deserializes up to read_ahead_files files, or parts of
+        JSON-lines files, in worker processes, while yielding the records of the
+        oldest one in order.
+        """
+        pending: Deque[
+            Tuple[_ReadAheadTask, multiprocessing.Process, multiprocessing.Queue]
+        ] = deque()
+        remaining = self._get_read_ahead_tasks(filenames)
+
+        def start_next() -> None:
+            task = next(remaining, None)
+            if task is None:
+                return
+            result_queue: multiprocessing.Queue = multiprocessing.Queue(
+                maxsize=self.config._read_ahead_max_pending_batches
+            )
+            process = multiprocessing.Process(
+                target=_read_file_into_queue,
+                args=(
+                    result_queue,
+                    task,
+                    self._get_file_read_mode(task.path, os.path.getsize(task.path)),
+                    self.config._read_ahead_batch_size,
+                ),
+                daemon=True,
+            )
+            process.start()
+            pending.append((task, process, result_queue))
+
+        try:
+            for _ in range(self.config.read_ahead_files):
+                start_next()
+
+            while pending:
+                task, process, result_queue = pending[0]
+                path = task.path
+                if task.is_first_part:
+                    self._start_file_stats(path)
+                while True:
+                    message = self._get_read_ahead_message(path, process, result_queue)
+                    if message[0] == _READ_AHEAD_BATCH:
+                        _, records, bytes_read = message
+                        for i, item, error in records:
+                            self.report.current_file_elements_read += 1
+                            if error is not None:
+                                self.report.report_failure(f"path-{i}", error)
+                            elif item is not None:
+                                yield path, i, item
+                        self.report.current_file_bytes_read = bytes_read
+                        self._estimate_current_file_num_elements()
+                    elif message[0] == _READ_AHEAD_DONE:
+                        _, parse_seconds, deserialize_seconds = message
+                        self.report.add_parse_time(
+                            datetime.timedelta(seconds=parse_seconds)
+                        )
+                        self.report.add_deserialize_time(
+                            datetime.timedelta(seconds=deserialize_seconds)
+                        )
+                        break
+                    else:
+                        raise ConfigurationError(
+                            f"Failed to read file {path}: {message[1]}"
+                        )
+                process.join()
+                pending.popleft()
+                if task.is_last_part:
+                    self._finish_file_stats(path)
+                start_next()
+        finally:
+            for _, process, _ in pending:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    @staticmethod
+    def _get_read_ahead_message(
+        path: str,
+        process: multiprocessing.Process,
+        result_queue: multiprocessing.Queue,
+    ) -> Tuple[Any, ...]:
+        # The worker may be killed, e.g. when it runs out of memory, without
+        # putting DONE or ERROR on the queue.
+        while True:
+            try:
+                return result_queue.get(timeout=_READ_AHEAD_POLL_SECONDS)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+            # Messages that were put just before the worker exited may still be
+            # on their way.
+            try:
+                return result_queue.get(timeout=_READ_AHEAD_POLL_SECONDS)
+            except queue.Empty:
+                raise ConfigurationError(
+                    f"Failed to read file {path}: the read-ahead worker exited "
+                    f"unexpectedly with exit code {process.exitcode}"
+                )
+
+    def _get_read_ahead_tasks(self, filenames: List[str]) -> Iterator["_ReadAheadTask"]:
+        for path in filenames:
+            splits = (
+                split_json_lines(path, self.config.read_ahead_files)
+                if is_json_lines_file(path)
+                else None
+            )
+            if not splits:
+                yield _ReadAheadTask(path)
+                continue
+            for i, (start, end, first_index) in enumerate(splits):
+                yield _ReadAheadTask(
+                    path,
+                    start=start,
+                    end=end,
+                    first_index=first_index,
+                    is_first_part=i == 0,
+                    is_last_part=i == len(splits) - 1,
+                )
+
+    def _get_file_read_mode(self, path: str, file_size: int) -> FileReadMode:
+        if is_json_lines_file(path):
+            # JSON-lines files are always read one line at a time.
+            return FileReadMode.STREAM
+        if self.config.read_mode == FileReadMode.AUTO:
+            file_read_mode = (
+                FileReadMode.BATCH
+                if file_size < self.config._minsize_for_streaming_mode_in_bytes
+                else FileReadMode.STREAM
+            )
+            logger.info(f"Reading file {path} in {file_read_mode} mode")
+            return file_read_mode
+        return self.config.read_mode
+
+    def _start_file_stats(self, path: str) -> None:
+        self.report.current_file_name = path
+        self.report.current_file_size = os.path.getsize(path)
+        self.report.current_file_elements_read = 0
+        self._current_file_count_is_exact = False
+        if self.config.count_all_before_starting:
+            index = read_index_sidecar(path)
+            if index is not None:
+                self.report.current_file_num_elements = index.num_elements
+                self._current_file_count_is_exact = True
+
+    def _estimate_current_file_num_elements(self) -> None:
+        """
+        Without an index sidecar, extrapolates the number of records in the file
+        from the records read per byte so far.
+        """
+        if (
+            self.config.count_all_before_starting
+            and not self._current_file_count_is_exact
+            and self.report.current_file_bytes_read
+            and self.report.current_file_size
+            and self.report.current_file_elements_read
+        ):
+            self.report.current_file_num_elements = max(
+                self.report.current_file_elements_read,
+                int(
+                    self.report.current_file_elements_read
+                    * self.report.current_file_size
+                    / self.report.current_file_bytes_read
+                ),
+            )
+
+    def _finish_file_stats(self, path: str) -> None:
+        self.report.files_completed.append(path)
+        self.report.num_files_completed += 1
+        self.report.total_bytes_read_completed_files += (
+            self.report.current_file_size or 0
+        )
+        self.report.reset_current_file_stats()
 
     def get_report(self):
         return self.report
@@ -246,22 +487,23 @@ class GenericFileSource(TestableSource):
         super().close()
 
     def _iterate_file(self, path: str) -> Iterable[Tuple[int, Any]]:
-        self.report.current_file_name = path
-        path_parsed = parse.urlparse(path)
-        if path_parsed.scheme not in ("http", "https"):  # A local file
-            self.report.current_file_size = os.path.getsize(path)
-            if self.config.read_mode == FileReadMode.AUTO:
-                file_read_mode = (
-                    FileReadMode.BATCH
-                    if self.report.current_file_size
-                    < self.config._minsize_for_streaming_mode_in_bytes
-                    else FileReadMode.STREAM
-                )
-                logger.info(f"Reading file {path} in {file_read_mode} mode")
-            else:
-                file_read_mode = self.config.read_mode
+        if _is_local_file(path):
+            self._start_file_stats(path)
+            file_read_mode = self._get_file_read_mode(
+                path, self.report.current_file_size or 0
+            )
 
-            if file_read_mode == FileReadMode.BATCH:
+            if is_json_lines_file(path):
+                parse_start_time = datetime.datetime.now()
+                for i, row, bytes_read in iterate_json_lines(path):
+                    parse_end_time = datetime.datetime.now()
+                    self.report.add_parse_time(parse_end_time - parse_start_time)
+                    self.report.current_file_elements_read += 1
+                    self.report.current_file_bytes_read = bytes_read
+                    self._estimate_current_file_num_elements()
+                    yield i, row
+                    parse_start_time = datetime.datetime.now()
+            elif file_read_mode == FileReadMode.BATCH:
                 with open(path, "r") as f:
                     parse_start_time = datetime.datetime.now()
                     obj_list = json.load(f)
@@ -272,23 +514,11 @@ class GenericFileSource(TestableSource):
                 count_start_time = datetime.datetime.now()
                 self.report.current_file_num_elements = len(obj_list)
                 self.report.add_count_time(datetime.datetime.now() - count_start_time)
-                self.report.current_file_elements_read = 0
                 for i, obj in enumerate(obj_list):
                     yield i, obj
                     self.report.current_file_elements_read += 1
             else:
                 self.fp = open(path, "rb")
-                if self.config.count_all_before_starting:
-                    count_start_time = datetime.datetime.now()
-                    parse_stream = ijson.parse(self.fp, use_float=True)
-                    total_elements = 0
-                    for row in ijson.items(parse_stream, "item", use_float=True):
-                        total_elements += 1
-                    count_end_time = datetime.datetime.now()
-                    self.report.add_count_time(count_end_time - count_start_time)
-                    self.report.current_file_num_elements = total_elements
-                self.report.current_file_elements_read = 0
-                self.fp.seek(0)
                 parse_start_time = datetime.datetime.now()
                 parse_stream = ijson.parse(self.fp, use_float=True)
                 rows_yielded = 0
@@ -297,9 +527,13 @@ class GenericFileSource(TestableSource):
                     self.report.add_parse_time(parse_end_time - parse_start_time)
                     rows_yielded += 1
                     self.report.current_file_elements_read += 1
+                    self.report.current_file_bytes_read = self.fp.tell()
+                    self._estimate_current_file_num_elements()
                     yield rows_yielded, row
                     parse_start_time = datetime.datetime.now()
+            self._finish_file_stats(path)
         else:
+            self.report.current_file_name = path
             try:
                 response = requests.get(path)
                 parse_start_time = datetime.datetime.now()
@@ -315,11 +549,7 @@ class GenericFileSource(TestableSource):
             for i, obj in enumerate(data):
                 yield i, obj
                 self.report.current_file_elements_read += 1
-
-        self.report.files_completed.append(path)
-        self.report.num_files_completed += 1
-        self.report.total_bytes_read_completed_files += self.report.current_file_size
-        self.report.reset_current_file_stats()
+            self._finish_file_stats(path)
 
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
@@ -416,6 +646,98 @@ def _from_obj_for_file(
         return item
 
 
+def _is_local_file(path: str) -> bool:
+    return parse.urlparse(path).scheme not in ("http", "https")
+
+
+@dataclass
+class _ReadAheadTask:
+    path: str
+    # For JSON-lines files, a range of bytes to read. See split_json_lines.
+    start: int = 0
+    end: Optional[int] = None
+    first_index: int = 0
+    is_first_part: bool = True
+    is_last_part: bool = True
+
+
+_READ_AHEAD_BATCH = "batch"
+_READ_AHEAD_DONE = "done"
+_READ_AHEAD_ERROR = "error"
+# How often to check that a read-ahead worker is still alive, while waiting for it.
+_READ_AHEAD_POLL_SECONDS = 1.0
+
+
+def _read_file_into_queue(
+    result_queue: multiprocessing.Queue,
+    task: _ReadAheadTask,
+    file_read_mode: FileReadMode,
+    batch_size: int,
+) -> None:
+    """
+    Runs in a read-ahead worker process. Parses and deserializes a local file,
+    and puts the records on the queue in batches of (index, item, error). The
+    queue is bounded, so the worker blocks once it is too far ahead.
+    """
+    try:
+        parse_seconds = 0.0
+        deserialize_seconds = 0.0
+        bytes_read = 0
+        with open(task.path, "rb") as fp:
+            if is_json_lines_file(task.path):
+
+                def rows_from_json_lines() -> Iterator[Tuple[int, Any]]:
+                    nonlocal bytes_read
+                    for i, obj, bytes_read in iterate_json_lines(
+                        task.path, task.start, task.end, task.first_index
+                    ):
+                        yield i, obj
+
+                rows: Iterable[Tuple[int, Any]] = rows_from_json_lines()
+            elif file_read_mode == FileReadMode.BATCH:
+                parse_start_time = datetime.datetime.now()
+                obj_list = json.load(fp)
+                parse_seconds += (
+                    datetime.datetime.now() - parse_start_time
+                ).total_seconds()
+                if not isinstance(obj_list, list):
+                    obj_list = [obj_list]
+                rows = enumerate(obj_list)
+            else:
+                # Matches _iterate_file, where streamed records are numbered from 1.
+                rows = enumerate(
+                    ijson.items(
+                        ijson.parse(fp, use_float=True), "item", use_float=True
+                    ),
+                    start=1,
+                )
+
+            batch: List[Tuple[int, Any, Optional[str]]] = []
+            parse_start_time = datetime.datetime.now()
+            for i, obj in rows:
+                deserialize_start_time = datetime.datetime.now()
+                parse_seconds += (
+                    deserialize_start_time - parse_start_time
+                ).total_seconds()
+                try:
+                    batch.append((i, _from_obj_for_file(obj), None))
+                except Exception as e:
+                    batch.append((i, None, str(e)))
+                parse_start_time = datetime.datetime.now()
+                deserialize_seconds += (
+                    parse_start_time - deserialize_start_time
+                ).total_seconds()
+                if len(batch) >= batch_size:
+                    result_queue.put(
+                        (_READ_AHEAD_BATCH, batch, max(bytes_read, fp.tell()))
+                    )
+                    batch = []
+            result_queue.put((_READ_AHEAD_BATCH, batch, max(bytes_read, fp.tell())))
+        result_queue.put((_READ_AHEAD_DONE, parse_seconds, deserialize_seconds))
+    except BaseException:
+        result_queue.put((_READ_AHEAD_ERROR, traceback.format_exc()))
+
+
 def read_metadata_file(
     file: pathlib.Path,
 ) -> Iterable[
@@ -426,6 +748,13 @@ def read_metadata_file(
     ]
 ]:
     # This simplified version of the FileSource can be used for testing purposes.
+    if is_json_lines_file(file):
+        for _, obj, _ in iterate_json_lines(file):
+            item = _from_obj_for_file(obj)
+            if item:
+                yield item
+        return
+
     with file.open("r") as f:
         for obj in json.load(f):
             item = _from_obj_for_file(obj)
@@ -2,7 +2,7 @@ import logging
 from typing import Dict, Iterable, List, Optional
 from urllib.parse import unquote
 
-from pydantic import Field, SecretStr, validator
+from pydantic import Field, PositiveInt, SecretStr, validator
 
 from datahub.configuration.common import ConfigModel
 from datahub.configuration.source_common import DatasetSourceConfigMixin
@@ -49,7 +49,12 @@ class GCSSourceConfig(
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
+    )
+
+    max_bytes_to_sample: Optional[PositiveInt] = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum number of bytes to read from a TSV, CSV or JSON file when inferring its schema. For uncompressed files, only these bytes are downloaded. Set to null to read files until `max_rows` rows have been sampled.",
     )
 
     number_of_files_to_sample: int = Field(
@@ -135,6 +140,7 @@ class GCSSource(StatefulIngestionSourceBase):
             ),
             env=self.config.env,
             max_rows=self.config.max_rows,
+            max_bytes_to_sample=self.config.max_bytes_to_sample,
             number_of_files_to_sample=self.config.number_of_files_to_sample,
         )
         return s3_config
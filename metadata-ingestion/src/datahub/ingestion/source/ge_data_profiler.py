@@ -6,6 +6,7 @@ import contextlib
 import dataclasses
 import functools
 import logging
+import multiprocessing
 import threading
 import traceback
 import unittest.mock
@@ -38,7 +39,7 @@ from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyDataset
 from great_expectations.datasource.sqlalchemy_datasource import SqlAlchemyDatasource
 from great_expectations.profile.base import ProfilerDataType
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfilerBase
-from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine import Connection, Engine, create_engine
 from sqlalchemy.exc import ProgrammingError
 from typing_extensions import Concatenate, ParamSpec
 
@@ -48,6 +49,10 @@ from datahub.ingestion.source.profiling.common import (
     Cardinality,
     convert_to_cardinality,
 )
+from datahub.ingestion.source.profiling.planner import (
+    ProfilingPlan,
+    plan_table_profile,
+)
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
 from datahub.metadata.schema_classes import (
     DatasetFieldProfileClass,
@@ -62,6 +67,7 @@ from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sqlalchemy_query_combiner import (
     IS_SQLALCHEMY_1_4,
     SQLAlchemyQueryCombiner,
+    SQLAlchemyQueryCombinerReport,
     get_query_columns,
 )
 
@@ -257,6 +263,23 @@ class _SingleColumnSpec:
     cardinality: Optional[Cardinality] = None
 
 
+# The field-level metrics that are approximate when computed from a sample.
+_SAMPLED_FIELD_METRICS = [
+    "uniqueCount",
+    "uniqueProportion",
+    "nullCount",
+    "nullProportion",
+    "min",
+    "max",
+    "mean",
+    "median",
+    "stdev",
+    "quantiles",
+    "distinctValueFrequencies",
+    "histogram",
+]
+
+
 @dataclasses.dataclass
 class _SingleDatasetProfiler(BasicDatasetProfilerBase):
     dataset: SqlAlchemyDataset
@@ -267,6 +290,12 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
     query_combiner: SQLAlchemyQueryCombiner
 
+    # If set, the dataset is profiled from a sample, as planned.
+    plan: Optional[ProfilingPlan] = None
+    _sample_row_count: Optional[int] = None
+    # The factor to scale counts computed from the sample by.
+    _sample_scale: Optional[float] = None
+
     def _get_columns_to_profile(self) -> List[str]:
         if not self.config.any_field_level_metrics_enabled():
             return []
@@ -342,7 +371,11 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
     @_run_with_query_combiner
     def _get_dataset_rows(self, dataset_profile: DatasetProfileClass) -> None:
-        if (
+        if self.plan is not None:
+            dataset_profile.rowCount = self.plan.estimate.row_count
+            dataset_profile.approximateMetrics = ["rowCount"]
+            self._sample_row_count = self.dataset.get_row_count()
+        elif (
             self.config.profile_table_row_count_estimate_only
             and self.dataset.engine.dialect.name.lower() == "postgresql"
         ):
@@ -358,6 +391,7 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
                     )
                 ).scalar()
             )
+            dataset_profile.approximateMetrics = ["rowCount"]
         else:
             dataset_profile.rowCount = self.dataset.get_row_count()
 
@@ -470,8 +504,9 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         self, column_profile: DatasetFieldProfileClass, column: str
     ) -> None:
         if self.config.include_field_distinct_value_frequencies:
+            scale = self._sample_scale or 1.0
             column_profile.distinctValueFrequencies = [
-                ValueFrequencyClass(value=str(value), frequency=count)
+                ValueFrequencyClass(value=str(value), frequency=round(count * scale))
                 for value, count in self.dataset.get_column_value_counts(column).items()
             ]
 
@@ -552,6 +587,14 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if self.partition:
             profile.partitionSpec = PartitionSpecClass(partition=self.partition)
         profile.fieldProfiles = []
+        if self.plan is not None:
+            logger.info(
+                f"Profiling {self.dataset_name} from a {self.plan.sample_percent}% sample"
+            )
+            self.dataset._table = self.dataset._table.tablesample(
+                sa.func.system(self.plan.sample_percent),
+                seed=sa.literal_column(str(self.plan.seed)),
+            )
         self._get_dataset_rows(profile)
 
         all_columns = self.dataset.get_table_columns()
@@ -578,6 +621,8 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
         assert profile.rowCount is not None
         row_count: int = profile.rowCount
+        if self.plan is not None and self._sample_row_count:
+            self._sample_scale = row_count / self._sample_row_count
 
         for column_spec in columns_profiling_queue:
             column = column_spec.column
@@ -587,6 +632,11 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
             non_null_count = column_spec.nonnull_count
             unique_count = column_spec.unique_count
+            # The unique count can't be scaled up, so the unique proportion is
+            # computed from the sample's counts.
+            sample_non_null_count = non_null_count
+            if non_null_count is not None and self._sample_scale is not None:
+                non_null_count = round(non_null_count * self._sample_scale)
 
             if non_null_count is not None:
                 null_count = max(0, row_count - non_null_count)
@@ -600,10 +650,10 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
             if unique_count is not None:
                 if self.config.include_field_distinct_count:
                     column_profile.uniqueCount = unique_count
-                    if non_null_count is not None and non_null_count > 0:
+                    if sample_non_null_count is not None and sample_non_null_count > 0:
                         # Sometimes this value is bigger than 1 because of the approx queries
                         column_profile.uniqueProportion = min(
-                            1, unique_count / non_null_count
+                            1, unique_count / sample_non_null_count
                         )
 
             self._get_dataset_column_sample_values(column_profile, column)
@@ -679,6 +729,15 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
         logger.debug(f"profiling {self.dataset_name}: flushing stage 3 queries")
         self.query_combiner.flush()
+
+        if self.plan is not None:
+            for column_spec in columns_profiling_queue:
+                column_profile = column_spec.column_profile
+                column_profile.approximateMetrics = [
+                    metric
+                    for metric in _SAMPLED_FIELD_METRICS
+                    if getattr(column_profile, metric) is not None
+                ] or None
         return profile
 
 
@@ -688,6 +747,76 @@ class GEContext:
     datasource_name: str
 
 
+@contextlib.contextmanager
+def _patch_ge_methods() -> Iterator[None]:
+    with unittest.mock.patch(
+        "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset.get_column_unique_count",
+        get_column_unique_count_patch,
+    ), unittest.mock.patch(
+        "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
+        _get_column_quantiles_bigquery_patch,
+    ):
+        yield
+
+
+@dataclasses.dataclass
+class _ProcessProfileResult:
+    profile: Optional[DatasetProfileClass]
+    warnings: List[Tuple[str, List[str]]]
+    failures: List[Tuple[str, List[str]]]
+    time_taken: Optional[float]
+    row_count: int
+    sampled: List[str]
+    query_combiner: SQLAlchemyQueryCombinerReport
+
+
+# The profiler of a worker process, set up by _init_profiler_process.
+_process_profiler: Optional["DatahubGEProfiler"] = None
+
+
+def _init_profiler_process(
+    url: Any, engine_options: Dict[str, Any], config: GEProfilingConfig, platform: str
+) -> None:
+    global _process_profiler
+    _process_profiler = DatahubGEProfiler(
+        create_engine(url, **engine_options), SQLSourceReport(), config, platform
+    )
+
+
+def _generate_profile_in_process(
+    request: GEProfilerRequest,
+    platform: Optional[str],
+    profiler_args: Optional[Dict],
+) -> _ProcessProfileResult:
+    profiler = _process_profiler
+    assert profiler is not None
+
+    # Start from a clean report for every table, so that only its own warnings
+    # are sent back to the parent process.
+    profiler.report = SQLSourceReport()
+    profiler.times_taken = []
+    profiler.total_row_count = 0
+    with _patch_ge_methods(), SQLAlchemyQueryCombiner(
+        enabled=profiler.config.query_combiner_enabled,
+        catch_exceptions=profiler.config.catch_exceptions,
+        is_single_row_query_method=_is_single_row_query_method,
+        serial_execution_fallback_enabled=True,
+    ).activate() as query_combiner:
+        _, profile = profiler._generate_profile_from_request(
+            query_combiner, request, platform=platform, profiler_args=profiler_args
+        )
+
+    return _ProcessProfileResult(
+        profile=profile,
+        warnings=[(k, list(v)) for k, v in profiler.report.warnings.items()],
+        failures=[(k, list(v)) for k, v in profiler.report.failures.items()],
+        time_taken=profiler.times_taken[0] if profiler.times_taken else None,
+        row_count=profiler.total_row_count,
+        sampled=list(profiler.report.entities_sampled),
+        query_combiner=query_combiner.report,
+    )
+
+
 @dataclasses.dataclass
 class DatahubGEProfiler:
     report: SQLSourceReport
@@ -707,11 +836,15 @@ class DatahubGEProfiler:
         report: SQLSourceReport,
         config: GEProfilingConfig,
         platform: str,
+        engine_options: Optional[Dict[str, Any]] = None,
     ):
         self.report = report
         self.config = config
         self.times_taken = []
         self.total_row_count = 0
+        # The options to create the engine with in worker processes. Without them,
+        # profiling can't use worker processes.
+        self.engine_options = engine_options
 
         # TRICKY: The call to `.engine` is quite important here. Connection.connect()
         # returns a "branched" connection, which does not actually use a new underlying
@@ -780,6 +913,17 @@ class DatahubGEProfiler:
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
     ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        if self.config.max_worker_processes is not None:
+            if self.engine_options is not None:
+                yield from self._generate_profiles_in_processes(
+                    requests, platform, profiler_args
+                )
+                return
+            logger.warning(
+                f"Profiling in worker processes is not supported for {self.platform}; "
+                "using worker threads instead"
+            )
+
         with PerfTimer() as timer, concurrent.futures.ThreadPoolExecutor(
             max_workers=max_workers
         ) as async_executor, SQLAlchemyQueryCombiner(
@@ -792,66 +936,134 @@ class DatahubGEProfiler:
             logger.info(
                 f"Will profile {len(requests)} table(s) with {max_workers} worker(s) - this may take a while"
             )
-            with unittest.mock.patch(
-                "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset.get_column_unique_count",
-                get_column_unique_count_patch,
-            ):
-                with unittest.mock.patch(
-                    "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
-                    _get_column_quantiles_bigquery_patch,
-                ):
-                    async_profiles = collections.deque(
-                        async_executor.submit(
-                            self._generate_profile_from_request,
-                            query_combiner,
-                            request,
-                            platform=platform,
-                            profiler_args=profiler_args,
-                        )
-                        for request in requests
+            with _patch_ge_methods():
+                async_profiles = collections.deque(
+                    async_executor.submit(
+                        self._generate_profile_from_request,
+                        query_combiner,
+                        request,
+                        platform=platform,
+                        profiler_args=profiler_args,
                     )
+                    for request in requests
+                )
+
+                # Avoid using as_completed so that the results are yielded in the
+                # same order as the requests.
+                # for async_profile in concurrent.futures.as_completed(async_profiles):
+                while len(async_profiles) > 0:
+                    async_profile = async_profiles.popleft()
+                    yield async_profile.result()
 
-                    # Avoid using as_completed so that the results are yielded in the
-                    # same order as the requests.
-                    # for async_profile in concurrent.futures.as_completed(async_profiles):
-                    while len(async_profiles) > 0:
-                        async_profile = async_profiles.popleft()
-                        yield async_profile.result()
+                self._report_profiling_summary(len(requests), timer.elapsed_seconds())
 
-                    total_time_taken = timer.elapsed_seconds()
+                self.report.report_from_query_combiner(query_combiner.report)
 
-                    logger.info(
-                        f"Profiling {len(requests)} table(s) finished in {total_time_taken:.3f} seconds"
+    def _generate_profiles_in_processes(
+        self,
+        requests: List[GEProfilerRequest],
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        """
+        Profiles the tables in worker processes, each with its own engine and GE
+        context, which avoids contention on the GIL. Profiles are yielded in the same
+        order as the requests, as soon as they're available.
+        """
+        assert self.config.max_worker_processes is not None
+        assert self.engine_options is not None
+        num_processes = min(self.config.max_worker_processes, len(requests))
+        if num_processes == 0:
+            return
+        logger.info(
+            f"Will profile {len(requests)} table(s) with {num_processes} worker process(es) - this may take a while"
+        )
+
+        with PerfTimer() as timer, concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_processes,
+            # Forking a process with running threads, e.g. of database drivers, isn't safe.
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_profiler_process,
+            initargs=(
+                self.base_engine.url,
+                self.engine_options,
+                self.config,
+                self.platform,
+            ),
+        ) as executor:
+            # The query combiner reports of the worker processes, summed up.
+            query_combiner_report = SQLAlchemyQueryCombinerReport()
+            async_profiles = collections.deque(
+                (
+                    request,
+                    executor.submit(
+                        _generate_profile_in_process, request, platform, profiler_args
+                    ),
+                )
+                for request in requests
+            )
+            while len(async_profiles) > 0:
+                request, async_profile = async_profiles.popleft()
+                result = async_profile.result()
+
+                for key, reasons in result.warnings:
+                    for reason in reasons:
+                        self.report.report_warning(key, reason)
+                for key, reasons in result.failures:
+                    for reason in reasons:
+                        self.report.report_failure(key, reason)
+                if result.time_taken is not None:
+                    self.times_taken.append(result.time_taken)
+                self.total_row_count += result.row_count
+                for name in result.sampled:
+                    self.report.report_entity_sampled(name)
+                for field in dataclasses.fields(query_combiner_report):
+                    setattr(
+                        query_combiner_report,
+                        field.name,
+                        getattr(query_combiner_report, field.name)
+                        + getattr(result.query_combiner, field.name),
                     )
 
-                    time_percentiles: Dict[str, float] = {}
+                yield request, result.profile
 
-                    if len(self.times_taken) > 0:
-                        percentiles = [50, 75, 95, 99]
-                        percentile_values = stats.calculate_percentiles(
-                            self.times_taken, percentiles
-                        )
+            self._report_profiling_summary(len(requests), timer.elapsed_seconds())
 
-                        time_percentiles = {
-                            f"table_time_taken_p{percentile}": stats.discretize(
-                                percentile_values[percentile]
-                            )
-                            for percentile in percentiles
-                        }
-
-                    telemetry.telemetry_instance.ping(
-                        "sql_profiling_summary",
-                        # bucket by taking floor of log of time taken
-                        {
-                            "total_time_taken": stats.discretize(total_time_taken),
-                            "count": stats.discretize(len(self.times_taken)),
-                            "total_row_count": stats.discretize(self.total_row_count),
-                            "platform": self.platform,
-                            **time_percentiles,
-                        },
-                    )
+            self.report.report_from_query_combiner(query_combiner_report)
+
+    def _report_profiling_summary(
+        self, num_requests: int, total_time_taken: float
+    ) -> None:
+        logger.info(
+            f"Profiling {num_requests} table(s) finished in {total_time_taken:.3f} seconds"
+        )
 
-                    self.report.report_from_query_combiner(query_combiner.report)
+        time_percentiles: Dict[str, float] = {}
+
+        if len(self.times_taken) > 0:
+            percentiles = [50, 75, 95, 99]
+            percentile_values = stats.calculate_percentiles(
+                self.times_taken, percentiles
+            )
+
+            time_percentiles = {
+                f"table_time_taken_p{percentile}": stats.discretize(
+                    percentile_values[percentile]
+                )
+                for percentile in percentiles
+            }
+
+        telemetry.telemetry_instance.ping(
+            "sql_profiling_summary",
+            # bucket by taking floor of log of time taken
+            {
+                "total_time_taken": stats.discretize(total_time_taken),
+                "count": stats.discretize(len(self.times_taken)),
+                "total_row_count": stats.discretize(self.total_row_count),
+                "platform": self.platform,
+                **time_percentiles,
+            },
+        )
 
     def _generate_profile_from_request(
         self,
@@ -1009,6 +1221,23 @@ class DatahubGEProfiler:
                     platform=platform,
                 )
 
+                plan: Optional[ProfilingPlan] = None
+                if (
+                    self.config.max_bytes_to_scan_per_table is not None
+                    and ge_config["table"] is not None
+                    and "query" not in ge_config
+                    and not ge_config["limit"]
+                    and not ge_config["offset"]
+                ):
+                    plan = plan_table_profile(
+                        self.base_engine,
+                        ge_config["schema"],
+                        ge_config["table"],
+                        self.config.max_bytes_to_scan_per_table,
+                    )
+                    if plan is not None:
+                        self.report.report_entity_sampled(pretty_name)
+
                 profile = _SingleDatasetProfiler(
                     batch,
                     pretty_name,
@@ -1016,6 +1245,7 @@ class DatahubGEProfiler:
                     self.config,
                     self.report,
                     query_combiner,
+                    plan=plan,
                 ).generate_dataset_profile()
 
                 time_taken = timer.elapsed_seconds()
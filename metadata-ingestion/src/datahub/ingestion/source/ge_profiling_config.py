@@ -115,6 +115,15 @@ class GEProfilingConfig(ConfigModel):
         description="Profile tables only if their row count is less then specified count. If set to `null`, no limit on the row count of tables to profile. Supported only in `snowflake` and `BigQuery`",
     )
 
+    max_bytes_to_scan_per_table: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="If set, tables whose estimated size is larger than this many bytes are profiled from a TABLESAMPLE of about this size, instead of in full. "
+        "The sample is repeatable, so every metric of a table is computed from the same rows. "
+        "The budget applies per table rather than per metric for that reason: sampling each metric separately would make counts such as the null and unique proportions disagree with each other. "
+        "The row count of such tables comes from the database's statistics, counts are scaled up from the sample, and the metrics that are approximate as a result are listed in the profile's approximateMetrics. "
+        "Only supported for PostgreSQL and Snowflake; tables whose size the database doesn't know are profiled in full.",
+    )
+
     profile_table_row_count_estimate_only: bool = Field(
         default=False,
         description="Use an approximate query for row count. This will be much faster but slightly "
@@ -130,6 +139,14 @@ class GEProfilingConfig(ConfigModel):
         description="Number of worker threads to use for profiling. Set to 1 to disable.",
     )
 
+    max_worker_processes: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="If set, tables are profiled in this many worker processes instead of in `max_workers` threads. "
+        "This avoids contention on the Python GIL, which otherwise limits how much adding workers helps. "
+        "Each process creates its own SQLAlchemy engine and Great Expectations context, and profiles one table at a time. "
+        "Falls back to threads for sources whose connection options can't be passed to other processes, e.g. Snowflake.",
+    )
+
     # The query combiner enables us to combine multiple queries into a single query,
     # reducing the number of round-trips to the database and speeding up profiling.
     query_combiner_enabled: bool = Field(
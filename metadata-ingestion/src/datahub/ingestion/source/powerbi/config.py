@@ -160,6 +160,8 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
     number_of_workspaces: int = 0
+    m_query_expressions_parsed: int = 0
+    m_query_parse_cache_hits: int = 0
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -349,6 +351,18 @@ class PowerBiDashboardSourceConfig(
         default=True,
         description="Whether PowerBI native query should be parsed to extract lineage",
     )
+    # Number of processes to parse the M-Query expressions of tables in
+    m_query_parse_workers: int = pydantic.Field(
+        default=1,
+        description="Number of processes to parse M-Query expressions in, to extract lineage. "
+        "Parsing is CPU-bound, so with more than one, the expressions of a workspace are parsed in parallel.",
+    )
+    # Cache of the M-Query parse trees across ingestion runs
+    m_query_parse_cache_file: Optional[str] = pydantic.Field(
+        default=None,
+        description="Path of a file to cache the parse trees of M-Query expressions in, so that unchanged "
+        "expressions aren't parsed again in the next ingestion run. If not set, they are only cached during a run.",
+    )
 
     # convert PowerBI dataset URN to lower-case
     convert_urns_to_lowercase: bool = pydantic.Field(
@@ -389,6 +403,12 @@ class PowerBiDashboardSourceConfig(
 
         return value
 
+    @validator("m_query_parse_workers")
+    def m_query_parse_workers_must_be_positive(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("m_query_parse_workers must be at least 1")
+        return value
+
     @root_validator(pre=False)
     def workspace_id_backward_compatibility(cls, values: Dict) -> Dict:
         workspace_id = values.get("workspace_id")
@@ -1,29 +1,48 @@
+import collections
 import functools
+import hashlib
 import importlib.resources as pkg_resource
 import logging
-from typing import Dict, List
+import multiprocessing
+import pathlib
+import pickle
+import sqlite3
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, OrderedDict, Union
 
 import lark
 from lark import Lark, Tree
 
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.source.powerbi.config import PowerBiDashboardSourceReport
 from datahub.ingestion.source.powerbi.m_query import resolver, validator
 from datahub.ingestion.source.powerbi.m_query.data_classes import (
     TRACE_POWERBI_MQUERY_PARSER,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
+from datahub.utilities.file_backed_collections import ConnectionWrapper
 
 logger = logging.getLogger(__name__)
 
+# The number of parse trees that are kept in memory after they were used, for the
+# tables of other datasets with the same expression.
+_MEMORY_CACHE_MAX_SIZE = 256
+
 
 @functools.lru_cache(maxsize=1)
-def get_lark_parser() -> Lark:
+def _get_grammar() -> str:
     # Read lexical grammar as text
-    grammar: str = pkg_resource.read_text(
+    return pkg_resource.read_text(
         "datahub.ingestion.source.powerbi", "powerbi-lexical-grammar.rule"
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_lark_parser() -> Lark:
     # Create lark parser for the grammar text
-    return Lark(grammar, start="let_expression", regex=True)
+    return Lark(_get_grammar(), start="let_expression", regex=True)
 
 
 def _parse_expression(expression: str) -> Tree:
@@ -42,11 +61,189 @@ def _parse_expression(expression: str) -> Tree:
     return parse_tree
 
 
+@dataclass
+class ParseFailure:
+    message: str
+    error: str
+
+
+ParseResult = Union[Tree, ParseFailure]
+
+
+def _parse_expression_or_failure(expression: str) -> ParseResult:
+    try:
+        return _parse_expression(expression)
+    except Exception as e:
+        logger.debug("Stack trace of the m-query parser:", exc_info=e)
+        if isinstance(e, lark.exceptions.UnexpectedCharacters):
+            return ParseFailure("Unsupported m-query expression", str(e))
+        return ParseFailure("Failed to parse m-query expression", str(e))
+
+
+def _expression_key(expression: str) -> str:
+    return hashlib.sha256(expression.encode("utf-8")).hexdigest()
+
+
+class MQueryParser(Closeable):
+    """
+    Parses each distinct M-Query expression once, as the tables of many datasets
+    often share expressions, and a dataset's tables are mapped once per tile and
+    report that uses it.
+
+    Parse results are cached by a hash of the expression, in memory, and in the
+    cache file, if any, across runs. The Earley parser is CPU-bound, so with more
+    than one worker, the expressions passed to parse_ahead are parsed in a process
+    pool while the tables are mapped.
+    """
+
+    def __init__(
+        self,
+        reporter: PowerBiDashboardSourceReport,
+        max_workers: int = 1,
+        cache_file: Optional[str] = None,
+    ):
+        self.reporter = reporter
+        self._executor: Optional[ProcessPoolExecutor] = (
+            ProcessPoolExecutor(
+                max_workers=max_workers,
+                # Forking a process with running threads, e.g. of the HTTP client,
+                # isn't safe.
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if max_workers > 1
+            else None
+        )
+        self._pending: Dict[str, "Future[ParseResult]"] = {}
+        self._results: OrderedDict[str, ParseResult] = collections.OrderedDict()
+        self._cache_conn: Optional[ConnectionWrapper] = None
+        if cache_file:
+            self._open_cache_file(pathlib.Path(cache_file))
+
+    def _open_cache_file(self, cache_file: pathlib.Path) -> None:
+        # A cache that can't be used only makes parsing slower.
+        try:
+            # The file is kept across runs, so it's opened with durable settings.
+            self._cache_conn = ConnectionWrapper(cache_file, durable=True)
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_results (key TEXT PRIMARY KEY, value BLOB)"
+            )
+        except sqlite3.Error as e:
+            self._disable_cache_file(e)
+
+    def _disable_cache_file(self, error: sqlite3.Error) -> None:
+        logger.warning(f"Unable to use the m-query parse cache, disabling it: {error}")
+        if self._cache_conn is not None:
+            try:
+                self._cache_conn.close()
+            except sqlite3.Error:
+                pass
+        self._cache_conn = None
+
+    def _cache_file_key(self, key: str) -> str:
+        # Parse trees of other grammars or Lark versions aren't reused.
+        return _expression_key(f"{lark.__version__}\0{_get_grammar()}\0{key}")
+
+    def _read_cache_file(self, key: str) -> Optional[ParseResult]:
+        if self._cache_conn is None:
+            return None
+        try:
+            row = self._cache_conn.execute(
+                "SELECT value FROM parse_results WHERE key = ?",
+                (self._cache_file_key(key),),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable_cache_file(e)
+            return None
+        if row is None:
+            return None
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def _write_cache_file(self, key: str, result: ParseResult) -> None:
+        if self._cache_conn is None:
+            return
+        try:
+            self._cache_conn.execute(
+                "INSERT OR REPLACE INTO parse_results (key, value) VALUES (?, ?)",
+                (self._cache_file_key(key), zlib.compress(pickle.dumps(result))),
+            )
+        except sqlite3.Error as e:
+            self._disable_cache_file(e)
+
+    def _add_to_memory_cache(self, key: str, result: ParseResult) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > _MEMORY_CACHE_MAX_SIZE:
+            self._results.popitem(last=False)
+
+    def parse_ahead(self, expressions: Iterable[str]) -> None:
+        """
+        Starts parsing the expressions in the process pool, if any, unless they
+        are cached already.
+        """
+        if self._executor is None:
+            return
+        for expression in expressions:
+            key = _expression_key(expression)
+            if key in self._pending or key in self._results:
+                continue
+            cached = self._read_cache_file(key)
+            if cached is not None:
+                self._add_to_memory_cache(key, cached)
+                continue
+            self._pending[key] = self._executor.submit(
+                _parse_expression_or_failure, expression
+            )
+
+    def parse(self, expression: str) -> ParseResult:
+        key = _expression_key(expression)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            self.reporter.m_query_parse_cache_hits += 1
+            return result
+
+        future = self._pending.pop(key, None)
+        if future is not None:
+            result = future.result()
+        else:
+            result = self._read_cache_file(key)
+            if result is not None:
+                self._add_to_memory_cache(key, result)
+                self.reporter.m_query_parse_cache_hits += 1
+                return result
+            result = _parse_expression_or_failure(expression)
+
+        self.reporter.m_query_expressions_parsed += 1
+        self._write_cache_file(key, result)
+        self._add_to_memory_cache(key, result)
+        return result
+
+    def discard_pending(self) -> None:
+        # The expressions that were parsed ahead, but not used after all, are
+        # still cached for the next run.
+        for key, future in self._pending.items():
+            if not future.cancel():
+                self._write_cache_file(key, future.result())
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            for future in self._pending.values():
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._pending.clear()
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
+
+
 def get_upstream_tables(
     table: Table,
     reporter: PowerBiDashboardSourceReport,
     native_query_enabled: bool = True,
     parameters: Dict[str, str] = {},
+    m_query_parser: Optional[MQueryParser] = None,
 ) -> List[resolver.DataPlatformTable]:
     if table.expression is None:
         logger.debug(f"Expression is none for table {table.full_name}")
@@ -55,7 +252,18 @@ def get_upstream_tables(
     parameters = parameters or {}
 
     try:
-        parse_tree: Tree = _parse_expression(table.expression)
+        parse_result: ParseResult = (
+            m_query_parser.parse(table.expression)
+            if m_query_parser is not None
+            else _parse_expression_or_failure(table.expression)
+        )
+        if isinstance(parse_result, ParseFailure):
+            reporter.report_warning(table.full_name, parse_result.message)
+            logger.info(
+                f"{parse_result.message} for table {table.full_name}: {parse_result.error}"
+            )
+            return []
+        parse_tree: Tree = parse_result
 
         valid, message = validator.validate_parse_tree(
             parse_tree, native_query_enabled=native_query_enabled
@@ -98,10 +98,12 @@ class Mapper:
         config: PowerBiDashboardSourceConfig,
         reporter: PowerBiDashboardSourceReport,
         dataplatform_instance_resolver: AbstractDataPlatformInstanceResolver,
+        m_query_parser: Optional[parser.MQueryParser] = None,
     ):
         self.__config = config
         self.__reporter = reporter
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
+        self.__m_query_parser = m_query_parser
         self.processed_datasets: Set[powerbi_data_classes.PowerBIDataset] = set()
         self.workspace_key: PlatformKey
 
@@ -173,7 +175,10 @@ class Mapper:
 
         upstreams: List[UpstreamClass] = []
         upstream_tables: List[resolver.DataPlatformTable] = parser.get_upstream_tables(
-            table, self.__reporter, parameters=parameters
+            table,
+            self.__reporter,
+            parameters=parameters,
+            m_query_parser=self.__m_query_parser,
         )
         logger.debug(
             f"PowerBI virtual table {table.full_name} and it's upstream dataplatform tables = {upstream_tables}"
@@ -281,6 +286,38 @@ class Mapper:
 
         return schema_metadata
 
+    def is_dataset_allowed(self, dataset: powerbi_data_classes.PowerBIDataset) -> bool:
+        return any(
+            [
+                self.__config.filter_dataset_endorsements.allowed(tag)
+                for tag in (dataset.tags or [""])
+            ]
+        )
+
+    def parse_m_queries_ahead(self, workspace: powerbi_data_classes.Workspace) -> None:
+        """
+        Starts parsing the M-Query expressions of the tables of the workspace's datasets
+        that are going to be mapped, while the dashboards and reports are mapped.
+        """
+        if self.__m_query_parser is None or self.__config.extract_lineage is False:
+            return
+
+        datasets: List[Optional[powerbi_data_classes.PowerBIDataset]] = [
+            tile.dataset
+            for dashboard in workspace.dashboards
+            for tile in dashboard.tiles
+        ]
+        datasets.extend(report.dataset for report in workspace.reports)
+        self.__m_query_parser.parse_ahead(
+            table.expression
+            for dataset in deduplicate_list(
+                [dataset for dataset in datasets if dataset is not None]
+            )
+            if self.is_dataset_allowed(dataset)
+            for table in dataset.tables
+            if table.expression is not None
+        )
+
     def to_datahub_dataset(
         self,
         dataset: Optional[powerbi_data_classes.PowerBIDataset],
@@ -294,12 +331,7 @@ class Mapper:
         dataset_mcps: List[MetadataChangeProposalWrapper] = []
         if dataset is None:
             return dataset_mcps
-        if not any(
-            [
-                self.__config.filter_dataset_endorsements.allowed(tag)
-                for tag in (dataset.tags or [""])
-            ]
-        ):
+        if not self.is_dataset_allowed(dataset):
             logger.debug(
                 "Returning empty dataset_mcps as no dataset tag matched with filter_dataset_endorsements"
             )
@@ -1102,7 +1134,17 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
             )  # Exit pipeline as we are not able to connect to PowerBI API Service. This exit will avoid raising
             # unwanted stacktrace on console
 
-        self.mapper = Mapper(config, self.reporter, self.dataplatform_instance_resolver)
+        self.m_query_parser = parser.MQueryParser(
+            self.reporter,
+            max_workers=self.source_config.m_query_parse_workers,
+            cache_file=self.source_config.m_query_parse_cache_file,
+        )
+        self.mapper = Mapper(
+            config,
+            self.reporter,
+            self.dataplatform_instance_resolver,
+            self.m_query_parser,
+        )
 
         # Create and register the stateful ingestion use-case handler.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler.create(
@@ -1155,6 +1197,8 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
             for workunit in workspace_workunits:
                 # Return workunit to Datahub Ingestion framework
                 yield workunit
+
+        self.mapper.parse_m_queries_ahead(workspace)
         for dashboard in workspace.dashboards:
             try:
                 # Fetch PowerBi users for dashboards
@@ -1178,6 +1222,7 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
                 report, workspace
             ):
                 yield work_unit
+        self.m_query_parser.discard_pending()
 
         for dataset in self.mapper.processed_datasets:
             if self.source_config.extract_datasets_to_containers:
@@ -1244,3 +1289,7 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.m_query_parser.close()
+        super().close()
@@ -0,0 +1,91 @@
+import dataclasses
+import logging
+from typing import Dict, Optional, Union
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+# Queries for the row count and size in bytes of a table, as estimated by the
+# database's own statistics. They're cheap, but may be stale.
+_SIZE_ESTIMATE_QUERIES: Dict[str, str] = {
+    "postgresql": """
+        SELECT c.reltuples::bigint, pg_table_size(c.oid)
+        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relname = :table AND n.nspname = :schema
+    """,
+    "snowflake": """
+        SELECT row_count, bytes
+        FROM information_schema.tables
+        WHERE table_schema = :schema AND table_name = :table
+    """,
+}
+
+# Don't sample less than this percentage of a table, so that the sample doesn't end
+# up empty.
+_MIN_SAMPLE_PERCENT = 0.01
+
+# Seed for TABLESAMPLE ... REPEATABLE. Every query that profiles a table, including
+# deferred and combined ones, must see the same sample, or the counts computed from
+# different queries won't be consistent with each other.
+_SAMPLE_SEED = 42
+
+
+@dataclasses.dataclass
+class TableSizeEstimate:
+    row_count: int
+    size_in_bytes: int
+
+
+@dataclasses.dataclass
+class ProfilingPlan:
+    """How to profile a table that is too large to profile in full."""
+
+    estimate: TableSizeEstimate
+    # The percentage of the table's blocks to sample with TABLESAMPLE SYSTEM.
+    sample_percent: float
+    # The seed for TABLESAMPLE ... REPEATABLE, so that all queries see the same rows.
+    seed: int = _SAMPLE_SEED
+
+
+def estimate_table_size(
+    conn: Union[Engine, Connection], schema: Optional[str], table: str
+) -> Optional[TableSizeEstimate]:
+    query = _SIZE_ESTIMATE_QUERIES.get(conn.dialect.name)
+    if query is None:
+        return None
+    try:
+        row = conn.execute(sa.text(query), {"schema": schema, "table": table}).first()
+    except Exception as e:
+        logger.debug(f"Unable to estimate the size of {schema}.{table}: {e}")
+        return None
+    # Tables that were never analyzed have no (or negative) estimates.
+    if row is None or row[0] is None or row[1] is None or row[0] <= 0:
+        return None
+    return TableSizeEstimate(row_count=int(row[0]), size_in_bytes=int(row[1]))
+
+
+def plan_table_profile(
+    conn: Union[Engine, Connection],
+    schema: Optional[str],
+    table: str,
+    max_bytes_to_scan: int,
+) -> Optional[ProfilingPlan]:
+    """
+    Decides whether a table should be profiled from a sample of its rows, based on
+    the database's estimate of its size. Returns None if the table should be profiled
+    in full, either because it fits in the budget or because its size is unknown.
+    """
+    estimate = estimate_table_size(conn, schema, table)
+    if estimate is None or estimate.size_in_bytes <= max_bytes_to_scan:
+        return None
+
+    sample_percent = max(
+        100.0 * max_bytes_to_scan / estimate.size_in_bytes, _MIN_SAMPLE_PERCENT
+    )
+    logger.debug(
+        f"Sampling {sample_percent:.4f}% of {schema}.{table}, "
+        f"which has an estimated {estimate.size_in_bytes} bytes"
+    )
+    return ProfilingPlan(estimate=estimate, sample_percent=round(sample_percent, 4))
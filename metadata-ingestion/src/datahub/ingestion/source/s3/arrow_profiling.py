@@ -0,0 +1,587 @@
+"""
+Profiles data lake tables in-process with Apache Arrow, as an alternative to the
+PyDeequ profiler in `profiling.py`, which needs a Spark session.
+
+Tables are read as Arrow datasets, so only the profiled columns are read from
+Parquet and CSV files, and files and Parquet row groups are scanned in parallel.
+The metrics are aggregated one record batch at a time with vectorized Arrow and
+NumPy kernels, so memory use doesn't grow with the size of the table. The same
+metrics are computed for the same columns as with Spark.
+"""
+
+import logging
+import math
+import pathlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.dataset as ds
+import pyarrow.fs
+import pyarrow.json
+from avro.datafile import DataFileReader
+from avro.io import DatumReader
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
+from datahub.ingestion.source.aws.s3_util import is_s3_uri, strip_s3_prefix
+from datahub.ingestion.source.profiling.common import (
+    Cardinality,
+    convert_to_cardinality,
+)
+from datahub.ingestion.source.s3.profiling_common import (
+    MAX_HIST_BINS,
+    NUM_SAMPLE_ROWS,
+    QUANTILES,
+    DataLakeProfilerConfig,
+    null_str,
+)
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+from datahub.telemetry import stats, telemetry
+
+logger = logging.getLogger(__name__)
+
+_FEW_VALUES = [
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+]
+
+
+def make_arrow_filesystem(
+    aws_config: Optional[AwsConnectionConfig],
+) -> pyarrow.fs.S3FileSystem:
+    if aws_config is None:
+        # use the default AWS credentials chain
+        return pyarrow.fs.S3FileSystem()
+
+    credentials = aws_config.get_credentials()
+    return pyarrow.fs.S3FileSystem(
+        access_key=credentials.get("aws_access_key_id"),
+        secret_key=credentials.get("aws_secret_access_key"),
+        session_token=credentials.get("aws_session_token"),
+        region=aws_config.aws_region,
+        endpoint_override=aws_config.aws_endpoint_url,
+    )
+
+
+def _read_avro_file(file: Any) -> pa.Table:
+    records = list(DataFileReader(file, DatumReader()))
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    return pa.table({column: [r.get(column) for r in records] for column in columns})
+
+
+def read_arrow_dataset(
+    path: str, extension: str, s3_filesystem: Optional[pyarrow.fs.FileSystem]
+) -> Optional[ds.Dataset]:
+    """
+    Opens a file, or a folder of (possibly hive-partitioned) files, as a dataset.
+    Returns None if the file type isn't supported.
+    """
+
+    filesystem: pyarrow.fs.FileSystem
+    if is_s3_uri(path):
+        assert s3_filesystem is not None
+        filesystem = s3_filesystem
+        path = strip_s3_prefix(path)
+    else:
+        filesystem = pyarrow.fs.LocalFileSystem()
+
+    if extension == ".parquet":
+        return ds.dataset(
+            path, format="parquet", filesystem=filesystem, partitioning="hive"
+        )
+    elif extension in (".csv", ".tsv"):
+        csv_format = ds.CsvFileFormat(
+            parse_options=pyarrow.csv.ParseOptions(
+                delimiter="\t" if extension == ".tsv" else ","
+            )
+        )
+        return ds.dataset(
+            path, format=csv_format, filesystem=filesystem, partitioning="hive"
+        )
+    elif extension not in (".json", ".avro"):
+        return None
+
+    # Arrow can't scan these formats as datasets, so each file is read in full.
+    info = filesystem.get_file_info(path)
+    if info.type == pyarrow.fs.FileType.Directory:
+        files = [
+            file.path
+            for file in filesystem.get_file_info(
+                pyarrow.fs.FileSelector(path, recursive=True)
+            )
+            if file.type == pyarrow.fs.FileType.File
+            and pathlib.PurePosixPath(file.path).suffix == extension
+        ]
+    else:
+        files = [path]
+
+    tables = []
+    for file in files:
+        with filesystem.open_input_file(file) as f:
+            if extension == ".json":
+                tables.append(pyarrow.json.read_json(f))
+            else:
+                tables.append(_read_avro_file(f))
+    return ds.dataset(pa.concat_tables(tables, promote=True))
+
+
+# Tables are scanned in record batches of this many rows, so that the memory used
+# doesn't grow with the size of the table.
+_BATCH_SIZE = 64 * 1024
+
+# The value counts of a column are kept exactly up to this many distinct values,
+# for value frequencies and histograms. Beyond that, the number of distinct values
+# is estimated with HyperLogLog, as with Spark's ApproxCountDistinct, and there is
+# no histogram.
+_MAX_TRACKED_DISTINCT_VALUES = 10_000
+
+# Quantiles are computed from a uniform sample of this many values of a column.
+# They're approximate with Spark too.
+_QUANTILE_SAMPLE_SIZE = 100_000
+
+_HLL_PRECISION = 14
+# The FNV-1 64-bit prime. Being odd, it's invertible modulo 2**64.
+_STRING_HASH_MULTIPLIER = 0x100000001B3
+
+
+def _inverse_mod_2_64(value: int) -> int:
+    # Newton's iteration, which doubles the number of correct low bits each time.
+    inverse = value
+    for _ in range(6):
+        inverse = (inverse * (2 - value * inverse)) % 2**64
+    return inverse
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    # The finalizer of splitmix64, so that similar values get unrelated hashes.
+    with np.errstate(over="ignore"):
+        values = values + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def _powers(base: int, count: int) -> np.ndarray:
+    powers = np.ones(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        powers[1:] = np.cumprod(np.full(count - 1, base, dtype=np.uint64))
+    return powers
+
+
+def _hash_binary(values: pa.Array) -> np.ndarray:
+    # A polynomial hash of each value's bytes, sum(b[j] * P**j), computed for all
+    # values at once from prefix sums, and divided by P to the power of the value's
+    # start offset.
+    values = values.cast(pa.large_binary())
+    _, offsets_buffer, data_buffer = values.buffers()
+    offsets = np.frombuffer(
+        offsets_buffer, dtype=np.int64, count=len(values) + 1, offset=values.offset * 8
+    )
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8)[offsets[0] : offsets[-1]]
+        if data_buffer is not None
+        else np.zeros(0, dtype=np.uint8)
+    )
+    offsets = offsets - offsets[0]
+
+    with np.errstate(over="ignore"):
+        powers = _powers(_STRING_HASH_MULTIPLIER, len(data) + 1)
+        prefix_sums = np.zeros(len(data) + 1, dtype=np.uint64)
+        np.cumsum(data.astype(np.uint64) * powers[:-1], out=prefix_sums[1:])
+        inverse_powers = _powers(
+            _inverse_mod_2_64(_STRING_HASH_MULTIPLIER), len(data) + 1
+        )
+        hashes = (prefix_sums[offsets[1:]] - prefix_sums[offsets[:-1]]) * (
+            inverse_powers[offsets[:-1]]
+        )
+    return hashes ^ _mix64(np.diff(offsets).astype(np.uint64))
+
+
+def _hash_values(values: pa.Array) -> Optional[np.ndarray]:
+    """
+    Hashes an array without nulls to uint64s. Returns None if the type isn't
+    supported.
+    """
+
+    type_ = values.type
+    if pa.types.is_floating(type_):
+        # Adding 0.0 turns -0.0 into 0.0.
+        floats = values.cast(pa.float64()).to_numpy(zero_copy_only=False) + 0.0
+        bits = floats.view(np.uint64)
+    elif pa.types.is_integer(type_) or pa.types.is_boolean(type_):
+        ints = values.cast(pa.int64(), safe=False).to_numpy(zero_copy_only=False)
+        bits = ints.view(np.uint64)
+    elif pa.types.is_temporal(type_):
+        ints = values.view(pa.int32() if type_.bit_width == 32 else pa.int64())
+        bits = ints.to_numpy(zero_copy_only=False).astype(np.int64).view(np.uint64)
+    elif pa.types.is_decimal(type_):
+        bits = _hash_binary(values.cast(pa.string()))
+    elif (
+        pa.types.is_string(type_)
+        or pa.types.is_large_string(type_)
+        or pa.types.is_binary(type_)
+        or pa.types.is_large_binary(type_)
+    ):
+        bits = _hash_binary(values)
+    else:
+        return None
+    return _mix64(bits)
+
+
+class _HyperLogLog:
+    """Estimates the number of distinct hashes, with a standard error of about 1%."""
+
+    def __init__(self) -> None:
+        self.registers = np.zeros(1 << _HLL_PRECISION, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray) -> None:
+        num_bits = 64 - _HLL_PRECISION
+        indices = (hashes >> np.uint64(num_bits)).astype(np.intp)
+        bits = hashes & np.uint64((1 << num_bits) - 1)
+        # frexp's exponent is the position of the highest 1 bit. It's exact, since
+        # the bits fit in a float64's mantissa.
+        _, bit_lengths = np.frexp(bits.astype(np.float64))
+        np.maximum.at(
+            self.registers, indices, (num_bits - bit_lengths + 1).astype(np.uint8)
+        )
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        num_zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # Linear counting is more accurate for few distinct values.
+            estimate = m * math.log(m / num_zeros)
+        return round(estimate)
+
+
+class _ColumnAggregator:
+    """Aggregates the metrics of a column over the record batches of a table."""
+
+    def __init__(self, type_: pa.DataType, rng: np.random.Generator):
+        self.type = type_
+        self.rng = rng
+        self.is_numeric = (
+            pa.types.is_integer(type_)
+            or pa.types.is_floating(type_)
+            or pa.types.is_decimal(type_)
+        )
+        self.null_count = 0
+        self.non_null_count = 0
+
+        # Exact until there are too many distinct values, then estimated.
+        self.value_counts: Optional[Dict[Any, int]] = {}
+        self.distinct_values: Optional[_HyperLogLog] = None
+
+        self.min: Any = None
+        self.max: Any = None
+        # The mean and the sum of squared differences from it, which are merged
+        # across batches as in Chan et al.'s parallel variance algorithm.
+        self.mean = 0.0
+        self.m2 = 0.0
+        # A uniform sample of the values, the ones with the smallest random keys.
+        self.sample_keys = np.zeros(0)
+        self.sample_values = np.zeros(0)
+
+    def add(self, values: pa.Array) -> None:
+        non_null = pc.drop_null(values)
+        if pa.types.is_floating(self.type):
+            # NaNs count as nulls, as with Spark
+            non_null = non_null.filter(pc.invert(pc.is_nan(non_null)))
+        self.null_count += len(values) - len(non_null)
+        if pa.types.is_nested(self.type) or len(non_null) == 0:
+            return
+
+        self._add_value_counts(non_null)
+        if self.is_numeric or pa.types.is_temporal(self.type):
+            batch_min_max = pc.min_max(non_null).as_py()
+            if self.min is None or batch_min_max["min"] < self.min:
+                self.min = batch_min_max["min"]
+            if self.max is None or batch_min_max["max"] > self.max:
+                self.max = batch_min_max["max"]
+        if self.is_numeric:
+            self._add_moments(non_null)
+        self.non_null_count += len(non_null)
+
+    def _add_value_counts(self, non_null: pa.Array) -> None:
+        counts = pc.value_counts(non_null)
+        values = counts.field("values")
+        if self.value_counts is not None:
+            if len(values) <= _MAX_TRACKED_DISTINCT_VALUES:
+                for value, count in zip(
+                    values.to_pylist(), counts.field("counts").to_pylist()
+                ):
+                    self.value_counts[value] = self.value_counts.get(value, 0) + count
+                if len(self.value_counts) <= _MAX_TRACKED_DISTINCT_VALUES:
+                    return
+
+            # Too many distinct values to count each of them, so only their number
+            # is estimated from now on.
+            tracked_values = pa.array(list(self.value_counts), type=self.type)
+            self.value_counts = None
+            self.distinct_values = _HyperLogLog()
+            tracked_hashes = _hash_values(tracked_values)
+            if tracked_hashes is None:
+                logger.debug(f"Unable to estimate the distinct values of {self.type}")
+                self.distinct_values = None
+                return
+            self.distinct_values.add(tracked_hashes)
+
+        if self.distinct_values is not None:
+            hashes = _hash_values(values)
+            assert hashes is not None
+            self.distinct_values.add(hashes)
+
+    def _add_moments(self, non_null: pa.Array) -> None:
+        floats = non_null.cast(pa.float64()).to_numpy(zero_copy_only=False)
+        batch_mean = float(floats.mean())
+        batch_m2 = float(np.square(floats - batch_mean).sum())
+        count = self.non_null_count + len(floats)
+        delta = batch_mean - self.mean
+        self.mean += delta * len(floats) / count
+        self.m2 += batch_m2 + delta * delta * self.non_null_count * len(floats) / count
+
+        keys = np.concatenate([self.sample_keys, self.rng.random(len(floats))])
+        sample = np.concatenate([self.sample_values, floats])
+        if len(keys) > _QUANTILE_SAMPLE_SIZE:
+            keep = np.argpartition(keys, _QUANTILE_SAMPLE_SIZE)[:_QUANTILE_SAMPLE_SIZE]
+            keys, sample = keys[keep], sample[keep]
+        self.sample_keys, self.sample_values = keys, sample
+
+    @property
+    def unique_count(self) -> Optional[int]:
+        if self.value_counts is not None:
+            return len(self.value_counts)
+        if self.distinct_values is not None:
+            return min(self.distinct_values.estimate(), self.non_null_count)
+        return None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        if self.non_null_count == 0:
+            return None
+        return math.sqrt(self.m2 / self.non_null_count)
+
+    def quantiles(self) -> List[float]:
+        return [float(q) for q in np.quantile(self.sample_values, QUANTILES)]
+
+
+class _ArrowTableProfiler:
+    dataset: ds.Dataset
+    profiling_config: DataLakeProfilerConfig
+    report: DataLakeSourceReport
+    file_path: str
+    columns_to_profile: List[str]
+    ignored_columns: List[str]
+    profile: DatasetProfileClass
+
+    def __init__(
+        self,
+        dataset: ds.Dataset,
+        profiling_config: DataLakeProfilerConfig,
+        report: DataLakeSourceReport,
+        file_path: str,
+        batch_size: int = _BATCH_SIZE,
+    ):
+        self.dataset = dataset
+        self.profiling_config = profiling_config
+        self.report = report
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.columns_to_profile = []
+        self.ignored_columns = []
+        self.profile = DatasetProfileClass(timestampMillis=get_sys_time())
+
+    def generate_profile(self) -> DatasetProfileClass:
+        column_names = self.dataset.schema.names
+        self.profile.columnCount = len(column_names)
+
+        if self.profiling_config.profile_table_level_only:
+            # for Parquet files, this only reads the file footers
+            self.profile.rowCount = self.dataset.count_rows()
+            return self.profile
+
+        for column in column_names:
+            if not self.profiling_config._allow_deny_patterns.allowed(column):
+                self.ignored_columns.append(column)
+                continue
+            self.columns_to_profile.append(column)
+
+        max_fields = self.profiling_config.max_number_of_fields_to_profile
+        if max_fields is not None and len(self.columns_to_profile) > max_fields:
+            columns_being_dropped = self.columns_to_profile[max_fields:]
+            self.columns_to_profile = self.columns_to_profile[:max_fields]
+
+            self.report.report_file_dropped(
+                f"The max_number_of_fields_to_profile={max_fields} reached. Profile of columns {self.file_path}({', '.join(sorted(columns_being_dropped))})"
+            )
+
+        if not self.columns_to_profile:
+            self.profile.rowCount = self.dataset.count_rows()
+            self.profile.fieldProfiles = []
+            return self.profile
+
+        rng = np.random.default_rng(0)
+        aggregators = [
+            _ColumnAggregator(self.dataset.schema.field(column).type, rng)
+            for column in self.columns_to_profile
+        ]
+        row_count = 0
+        sample_keys = np.zeros(0)
+        sample: Optional[pa.Table] = None
+
+        # The table is aggregated one record batch at a time, so only the profiled
+        # columns of a few batches are in memory at once.
+        for batch in self.dataset.to_batches(
+            columns=self.columns_to_profile,
+            batch_size=self.batch_size,
+            use_threads=True,
+        ):
+            row_count += batch.num_rows
+            for aggregator, values in zip(aggregators, batch.columns):
+                aggregator.add(values)
+
+            if self.profiling_config.include_field_sample_values and batch.num_rows:
+                # Keep the rows with the smallest random keys, a uniform sample.
+                batch_keys = rng.random(batch.num_rows)
+                candidates = np.argsort(batch_keys)[:NUM_SAMPLE_ROWS]
+                batch_sample = pa.Table.from_batches([batch.take(pa.array(candidates))])
+                sample = (
+                    pa.concat_tables([sample, batch_sample])
+                    if sample is not None
+                    else batch_sample
+                )
+                sample_keys = np.concatenate([sample_keys, batch_keys[candidates]])
+                keep = np.argsort(sample_keys)[:NUM_SAMPLE_ROWS]
+                sample = sample.take(pa.array(keep))
+                sample_keys = sample_keys[keep]
+
+        self.profile.rowCount = row_count
+        telemetry.telemetry_instance.ping(
+            "profile_data_lake_table",
+            {"rows_profiled": stats.discretize(row_count)},
+        )
+
+        self.profile.fieldProfiles = []
+        for column, aggregator in zip(self.columns_to_profile, aggregators):
+            column_profile = DatasetFieldProfileClass(fieldPath=column)
+            if sample is not None:
+                column_profile.sampleValues = sorted(
+                    str(x) for x in sample.column(column).to_pylist()
+                )
+            self._profile_column(column_profile, aggregator, row_count)
+            self.profile.fieldProfiles.append(column_profile)
+
+        return self.profile
+
+    def _profile_column(
+        self,
+        column_profile: DatasetFieldProfileClass,
+        aggregator: _ColumnAggregator,
+        row_count: int,
+    ) -> None:
+        type_ = aggregator.type
+        null_count = aggregator.null_count
+        null_fraction = null_count / row_count if row_count != 0 else 0
+        column_profile.nullCount = null_count
+        column_profile.nullProportion = null_fraction
+
+        unique_count = aggregator.unique_count
+        if pa.types.is_nested(type_) or unique_count is None:
+            return
+        column_profile.uniqueCount = unique_count
+        non_null_count = aggregator.non_null_count
+        column_profile.uniqueProportion = (
+            unique_count / non_null_count if non_null_count > 0 else 0
+        )
+
+        # as with Spark, the null fraction decides between few and many values
+        cardinality = convert_to_cardinality(unique_count, null_fraction)
+
+        if aggregator.is_numeric:
+            if cardinality in _FEW_VALUES:
+                self._add_distinct_value_frequencies(column_profile, aggregator)
+            elif cardinality in [Cardinality.MANY, Cardinality.VERY_MANY]:
+                self._add_numeric_stats(column_profile, aggregator)
+        elif pa.types.is_string(type_) or pa.types.is_large_string(type_):
+            if cardinality in _FEW_VALUES:
+                self._add_distinct_value_frequencies(column_profile, aggregator)
+        elif pa.types.is_temporal(type_):
+            self._add_min_max(column_profile, aggregator)
+            if cardinality in _FEW_VALUES:
+                self._add_distinct_value_frequencies(column_profile, aggregator)
+
+    def _add_min_max(
+        self, column_profile: DatasetFieldProfileClass, aggregator: _ColumnAggregator
+    ) -> None:
+        if self.profiling_config.include_field_min_value:
+            column_profile.min = null_str(aggregator.min)
+        if self.profiling_config.include_field_max_value:
+            column_profile.max = null_str(aggregator.max)
+
+    def _add_numeric_stats(
+        self, column_profile: DatasetFieldProfileClass, aggregator: _ColumnAggregator
+    ) -> None:
+        self._add_min_max(column_profile, aggregator)
+
+        if aggregator.non_null_count == 0:
+            return
+        if self.profiling_config.include_field_mean_value:
+            column_profile.mean = null_str(aggregator.mean)
+        if self.profiling_config.include_field_stddev_value:
+            column_profile.stdev = null_str(aggregator.stddev)
+        if (
+            self.profiling_config.include_field_median_value
+            or self.profiling_config.include_field_quantiles
+        ):
+            # approximate, like Spark's quantiles
+            quantiles = aggregator.quantiles()
+            if self.profiling_config.include_field_median_value:
+                column_profile.median = null_str(quantiles[QUANTILES.index(0.5)])
+            if self.profiling_config.include_field_quantiles:
+                column_profile.quantiles = [
+                    QuantileClass(quantile=str(quantile), value=str(value))
+                    for quantile, value in zip(QUANTILES, quantiles)
+                ]
+        # Columns with too many distinct values to count have no histogram.
+        if (
+            self.profiling_config.include_field_histogram
+            and aggregator.value_counts is not None
+        ):
+            # like Deequ's histogram, the frequencies of the most common values
+            top_values = sorted(
+                aggregator.value_counts.items(), key=lambda x: x[1], reverse=True
+            )[:MAX_HIST_BINS]
+            top_values.sort(key=lambda x: str(x[0]))
+            column_profile.histogram = HistogramClass(
+                [str(value) for value, _ in top_values],
+                [float(count) for _, count in top_values],
+            )
+
+    def _add_distinct_value_frequencies(
+        self, column_profile: DatasetFieldProfileClass, aggregator: _ColumnAggregator
+    ) -> None:
+        if (
+            self.profiling_config.include_field_distinct_value_frequencies
+            and aggregator.value_counts is not None
+        ):
+            column_profile.distinctValueFrequencies = sorted(
+                (
+                    ValueFrequencyClass(value=str(value), frequency=count)
+                    for value, count in aggregator.value_counts.items()
+                ),
+                key=lambda x: x.value,
+            )
@@ -11,7 +11,7 @@ from datahub.configuration.validate_field_rename import pydantic_renamed_field
 from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
 from datahub.ingestion.source.data_lake_common.config import PathSpecsConfigMixin
 from datahub.ingestion.source.data_lake_common.path_spec import PathSpec
-from datahub.ingestion.source.s3.profiling import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.profiling_common import DataLakeProfilerConfig
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StatefulStaleMetadataRemovalConfig,
 )
@@ -67,7 +67,12 @@ class DataLakeSourceConfig(
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
+    )
+
+    max_bytes_to_sample: Optional[pydantic.PositiveInt] = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum number of bytes to read from a TSV, CSV or JSON file when inferring its schema. For uncompressed files, only these bytes are downloaded. Set to null to read files until `max_rows` rows have been sampled.",
     )
 
     verify_ssl: Union[bool, str] = Field(
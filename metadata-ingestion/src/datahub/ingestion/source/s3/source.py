@@ -1,5 +1,6 @@
 import dataclasses
 import functools
+import io
 import logging
 import os
 import pathlib
@@ -7,34 +8,9 @@ import re
 import time
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-import pydeequ
 from more_itertools import peekable
-from pydeequ.analyzers import AnalyzerContext
-from pyspark.conf import SparkConf
-from pyspark.sql import SparkSession
-from pyspark.sql.dataframe import DataFrame
-from pyspark.sql.types import (
-    ArrayType,
-    BinaryType,
-    BooleanType,
-    ByteType,
-    DateType,
-    DecimalType,
-    DoubleType,
-    FloatType,
-    IntegerType,
-    LongType,
-    MapType,
-    NullType,
-    ShortType,
-    StringType,
-    StructField,
-    StructType,
-    TimestampType,
-)
-from pyspark.sql.utils import AnalysisException
 from smart_open import open as smart_open
 
 from datahub.emitter.mce_builder import (
@@ -51,7 +27,7 @@ from datahub.ingestion.api.decorators import (
     platform_name,
     support_status,
 )
-from datahub.ingestion.api.source import MetadataWorkUnitProcessor, SourceReport
+from datahub.ingestion.api.source import MetadataWorkUnitProcessor
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.aws.s3_boto_utils import get_s3_tags, list_folders
 from datahub.ingestion.source.aws.s3_util import (
@@ -62,7 +38,7 @@ from datahub.ingestion.source.aws.s3_util import (
 )
 from datahub.ingestion.source.data_lake_common.data_lake_utils import ContainerWUCreator
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
-from datahub.ingestion.source.s3.profiling import _SingleTableProfiler
+from datahub.ingestion.source.s3.profiling_common import DataLakeProfilingEngine
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
@@ -71,21 +47,9 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionSourceBase,
 )
-from datahub.metadata.com.linkedin.pegasus2avro.schema import (
-    BooleanTypeClass,
-    BytesTypeClass,
-    DateTypeClass,
-    NullTypeClass,
-    NumberTypeClass,
-    RecordTypeClass,
-    SchemaFieldDataType,
-    SchemaMetadata,
-    StringTypeClass,
-    TimeTypeClass,
-)
+from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaMetadata
 from datahub.metadata.schema_classes import (
     DatasetPropertiesClass,
-    MapTypeClass,
     OperationClass,
     OperationTypeClass,
     OtherSchemaClass,
@@ -94,56 +58,17 @@ from datahub.metadata.schema_classes import (
 from datahub.telemetry import stats, telemetry
 from datahub.utilities.perf_timer import PerfTimer
 
+if TYPE_CHECKING:
+    from pyarrow.fs import S3FileSystem
+    from pyspark.sql.dataframe import DataFrame
+
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
 
-# for a list of all types, see https://spark.apache.org/docs/3.0.3/api/python/_modules/pyspark/sql/types.html
-_field_type_mapping = {
-    NullType: NullTypeClass,
-    StringType: StringTypeClass,
-    BinaryType: BytesTypeClass,
-    BooleanType: BooleanTypeClass,
-    DateType: DateTypeClass,
-    TimestampType: TimeTypeClass,
-    DecimalType: NumberTypeClass,
-    DoubleType: NumberTypeClass,
-    FloatType: NumberTypeClass,
-    ByteType: BytesTypeClass,
-    IntegerType: NumberTypeClass,
-    LongType: NumberTypeClass,
-    ShortType: NumberTypeClass,
-    ArrayType: NullTypeClass,
-    MapType: MapTypeClass,
-    StructField: RecordTypeClass,
-    StructType: RecordTypeClass,
-}
 PAGE_SIZE = 1000
 
 
-def get_column_type(
-    report: SourceReport, dataset_name: str, column_type: str
-) -> SchemaFieldDataType:
-    """
-    Maps known Spark types to datahub types
-    """
-    TypeClass: Any = None
-
-    for field_type, type_class in _field_type_mapping.items():
-        if isinstance(column_type, field_type):
-            TypeClass = type_class
-            break
-
-    # if still not found, report the warning
-    if TypeClass is None:
-        report.report_warning(
-            dataset_name, f"unable to map type {column_type} to metadata schema"
-        )
-        TypeClass = NullTypeClass
-
-    return SchemaFieldDataType(type=TypeClass())
-
-
 # config flags to emit telemetry for
 config_options_to_report = [
     "platform",
@@ -282,9 +207,25 @@ class S3Source(StatefulIngestionSourceBase):
                     for config_flag in profiling_flags_to_report
                 },
             )
-            self.init_spark()
+            if config.profiling.engine == DataLakeProfilingEngine.ARROW:
+                self.init_arrow()
+            else:
+                self.init_spark()
+
+    def init_arrow(self):
+        from datahub.ingestion.source.s3.arrow_profiling import make_arrow_filesystem
+
+        self.arrow_s3_filesystem: Optional["S3FileSystem"] = None
+        if self.is_s3_platform():
+            self.arrow_s3_filesystem = make_arrow_filesystem(
+                self.source_config.aws_config
+            )
 
     def init_spark(self):
+        import pydeequ
+        from pyspark.conf import SparkConf
+        from pyspark.sql import SparkSession
+
         conf = SparkConf()
 
         conf.set(
@@ -364,7 +305,9 @@ class S3Source(StatefulIngestionSourceBase):
 
         return cls(config, ctx)
 
-    def read_file_spark(self, file: str, ext: str) -> Optional[DataFrame]:
+    def read_file_spark(self, file: str, ext: str) -> Optional["DataFrame"]:
+        from pyspark.sql.utils import AnalysisException
+
         logger.debug(f"Opening file {file} for profiling in spark")
         file = file.replace("s3://", "s3a://")
 
@@ -415,6 +358,21 @@ class S3Source(StatefulIngestionSourceBase):
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
+        extension = pathlib.Path(table_data.full_path).suffix
+        from datahub.ingestion.source.data_lake_common.path_spec import (
+            SUPPORTED_COMPRESSIONS,
+        )
+
+        is_compressed = path_spec.enable_compression and (
+            extension[1:] in SUPPORTED_COMPRESSIONS
+        )
+        if is_compressed:
+            # Removing the compression extension and using the one before that like .json.gz -> .json
+            extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
+        if extension == "" and path_spec.default_extension:
+            extension = f".{path_spec.default_extension}"
+
+        max_bytes = self.source_config.max_bytes_to_sample
         if self.is_s3_platform():
             if self.source_config.aws_config is None:
                 raise ValueError("AWS config is required for S3 file sources")
@@ -423,38 +381,47 @@ class S3Source(StatefulIngestionSourceBase):
                 self.source_config.verify_ssl
             )
 
-            file = smart_open(
-                table_data.full_path, "rb", transport_params={"client": s3_client}
-            )
+            if (
+                extension in (".csv", ".tsv", ".json")
+                and not is_compressed
+                and max_bytes is not None
+            ):
+                # Only download the bytes that we may sample, rather than the whole file.
+                try:
+                    file = s3_client.get_object(
+                        Bucket=get_bucket_name(table_data.full_path),
+                        Key=get_bucket_relative_path(table_data.full_path),
+                        Range=f"bytes=0-{max_bytes - 1}",
+                    )["Body"]
+                except s3_client.exceptions.ClientError as e:
+                    # S3 rejects ranges of empty files.
+                    if e.response["Error"]["Code"] != "InvalidRange":
+                        raise
+                    file = io.BytesIO()
+            else:
+                file = smart_open(
+                    table_data.full_path, "rb", transport_params={"client": s3_client}
+                )
         else:
             file = open(table_data.full_path, "rb")
 
         fields = []
 
-        extension = pathlib.Path(table_data.full_path).suffix
-        from datahub.ingestion.source.data_lake_common.path_spec import (
-            SUPPORTED_COMPRESSIONS,
-        )
-
-        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
-            # Removing the compression extension and using the one before that like .json.gz -> .json
-            extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
-        if extension == "" and path_spec.default_extension:
-            extension = f".{path_spec.default_extension}"
-
         try:
             if extension == ".parquet":
                 fields = parquet.ParquetInferrer().infer_schema(file)
             elif extension == ".csv":
                 fields = csv_tsv.CsvInferrer(
-                    max_rows=self.source_config.max_rows
+                    max_rows=self.source_config.max_rows, max_bytes=max_bytes
                 ).infer_schema(file)
             elif extension == ".tsv":
                 fields = csv_tsv.TsvInferrer(
-                    max_rows=self.source_config.max_rows
+                    max_rows=self.source_config.max_rows, max_bytes=max_bytes
                 ).infer_schema(file)
             elif extension == ".json":
-                fields = json.JsonInferrer().infer_schema(file)
+                fields = json.JsonInferrer(
+                    max_rows=self.source_config.max_rows, max_bytes=max_bytes
+                ).infer_schema(file)
             elif extension == ".avro":
                 fields = avro.AvroInferrer().infer_schema(file)
             else:
@@ -477,6 +444,14 @@ class S3Source(StatefulIngestionSourceBase):
     def get_table_profile(
         self, table_data: TableData, dataset_urn: str
     ) -> Iterable[MetadataWorkUnit]:
+        if self.source_config.profiling.engine == DataLakeProfilingEngine.ARROW:
+            yield from self.get_table_profile_arrow(table_data, dataset_urn)
+            return
+
+        from pydeequ.analyzers import AnalyzerContext
+
+        from datahub.ingestion.source.s3.profiling import _SingleTableProfiler
+
         # read in the whole table with Spark for profiling
         table = None
         try:
@@ -547,6 +522,51 @@ class S3Source(StatefulIngestionSourceBase):
             aspect=table_profiler.profile,
         ).as_workunit()
 
+    def get_table_profile_arrow(
+        self, table_data: TableData, dataset_urn: str
+    ) -> Iterable[MetadataWorkUnit]:
+        from datahub.ingestion.source.s3.arrow_profiling import (
+            _ArrowTableProfiler,
+            read_arrow_dataset,
+        )
+
+        path = table_data.table_path if table_data.partitions else table_data.full_path
+        extension = os.path.splitext(table_data.full_path)[1]
+        telemetry.telemetry_instance.ping("data_lake_file", {"extension": extension})
+
+        with PerfTimer() as timer:
+            try:
+                dataset = read_arrow_dataset(path, extension, self.arrow_s3_filesystem)
+                if dataset is None:
+                    self.report.report_warning(
+                        path, f"file {path} has unsupported extension"
+                    )
+                    return
+                profile = _ArrowTableProfiler(
+                    dataset,
+                    self.source_config.profiling,
+                    self.report,
+                    table_data.full_path,
+                ).generate_profile()
+            except Exception as e:
+                logger.error(e)
+                self.report.report_warning(
+                    table_data.display_name,
+                    f"unable to profile table {table_data.display_name} from file {table_data.full_path}: {e}",
+                )
+                return
+
+            time_taken = timer.elapsed_seconds()
+            logger.info(
+                f"Finished profiling {table_data.full_path}; took {time_taken:.3f} seconds"
+            )
+            self.profiling_times_taken.append(time_taken)
+
+        yield MetadataChangeProposalWrapper(
+            entityUrn=dataset_urn,
+            aspect=profile,
+        ).as_workunit()
+
     def _create_table_operation_aspect(self, table_data: TableData) -> OperationClass:
         reported_time = int(time.time() * 1000)
 
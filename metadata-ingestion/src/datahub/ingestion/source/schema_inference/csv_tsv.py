@@ -1,4 +1,5 @@
-from typing import IO, Dict, List, Type
+import io
+from typing import IO, Dict, List, Optional, Type
 
 from tableschema import Table
 
@@ -35,6 +36,42 @@ tableschema_type_map: Dict[str, Type] = {
 }
 
 
+# Files are read in chunks of this size until enough rows have been sampled.
+_SAMPLE_CHUNK_SIZE = 64 * 1024
+
+
+def read_sample_lines(
+    file: IO[bytes], max_lines: int, max_bytes: Optional[int] = None
+) -> bytes:
+    """
+    Reads the first `max_lines` lines of a file, or as many whole lines as fit in
+    `max_bytes` bytes, whichever is less. Since quoted values may contain newlines,
+    this may be fewer rows than lines.
+    """
+
+    sample = bytearray()
+    num_lines = 0
+    while num_lines < max_lines and (max_bytes is None or len(sample) < max_bytes):
+        chunk_size = _SAMPLE_CHUNK_SIZE
+        if max_bytes is not None:
+            chunk_size = min(chunk_size, max_bytes - len(sample))
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return bytes(sample)
+        num_lines += chunk.count(b"\n")
+        sample += chunk
+
+    if num_lines >= max_lines:
+        # cut the sample after the last line we need
+        end = -1
+        for _ in range(max_lines):
+            end = sample.index(b"\n", end + 1)
+    else:
+        # drop the partial line at the end of the byte limit
+        end = sample.rfind(b"\n")
+    return bytes(sample[: end + 1])
+
+
 def get_table_schema_fields(table: Table, max_rows: int) -> List[SchemaField]:
     table.infer(limit=max_rows)
 
@@ -55,20 +92,24 @@ def get_table_schema_fields(table: Table, max_rows: int) -> List[SchemaField]:
 
 
 class CsvInferrer(SchemaInferenceBase):
-    def __init__(self, max_rows: int):
+    def __init__(self, max_rows: int, max_bytes: Optional[int] = None):
         self.max_rows = max_rows
+        self.max_bytes = max_bytes
 
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         # infer schema of a csv file without reading the whole file
-        table = Table(file, format="csv")
+        sample = read_sample_lines(file, self.max_rows + 1, self.max_bytes)
+        table = Table(io.BytesIO(sample), format="csv")
         return get_table_schema_fields(table, max_rows=self.max_rows)
 
 
 class TsvInferrer(SchemaInferenceBase):
-    def __init__(self, max_rows: int):
+    def __init__(self, max_rows: int, max_bytes: Optional[int] = None):
         self.max_rows = max_rows
+        self.max_bytes = max_bytes
 
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         # infer schema of a tsv file without reading the whole file
-        table = Table(file, format="tsv")
+        sample = read_sample_lines(file, self.max_rows + 1, self.max_bytes)
+        table = Table(io.BytesIO(sample), format="tsv")
         return get_table_schema_fields(table, max_rows=self.max_rows)
@@ -1,11 +1,11 @@
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 
-import jsonlines as jsl
-import ujson
+import ijson
+from ijson.common import ObjectBuilder
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
-from datahub.ingestion.source.schema_inference.object import construct_schema
+from datahub.ingestion.source.schema_inference.object import SchemaBuilder
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     BooleanTypeClass,
@@ -32,20 +32,110 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
 logger = logging.getLogger(__name__)
 
 
+class _SampleReader:
+    """Reads at most `max_bytes` bytes from a file, then reports EOF."""
+
+    def __init__(self, file: IO[bytes], max_bytes: Optional[int]):
+        self.file = file
+        self.remaining = max_bytes
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining is None:
+            return self.file.read(size)
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size > 0 else b""
+        self.remaining -= len(data)
+        return data
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining == 0
+
+
+def _iter_documents(events: Iterable[tuple]) -> Iterator[Any]:
+    """
+    Assembles the top-level JSON values of a stream of ijson events, one at a time.
+    The stream may be a single value, a sequence of values (JSON lines), or an array,
+    in which case its items are the documents. If the stream ends in the middle of a
+    value, the part of the value that was read is returned only if no document was
+    complete. Otherwise it would count as a document that lacks the fields after the
+    cut, and mark them as nullable.
+    """
+
+    builder: Optional[ObjectBuilder] = None
+    num_documents = 0
+    # the depth at which documents start, 1 inside a top-level array
+    document_depth = 0
+    depth = 0
+    try:
+        for _, event, value in events:
+            if event in ("start_map", "start_array"):
+                if depth == 0 and event == "start_array" and document_depth == 0:
+                    depth = document_depth = 1
+                    continue
+                if depth == document_depth:
+                    builder = ObjectBuilder()
+                depth += 1
+                assert builder is not None
+                builder.event(event, value)
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth < document_depth:
+                    # the end of a top-level array
+                    document_depth = 0
+                    continue
+                assert builder is not None
+                builder.event(event, value)
+                if depth == document_depth:
+                    num_documents += 1
+                    yield builder.value
+                    builder = None
+            elif depth > document_depth:
+                assert builder is not None
+                builder.event(event, value)
+            # scalar documents have no fields, and are skipped
+    except ijson.IncompleteJSONError:
+        if builder is not None and num_documents == 0:
+            yield builder.value
+
+
 class JsonInferrer(SchemaInferenceBase):
+    """
+    Infers the schema of a JSON or JSON lines file from a sample of its documents.
+    The file is parsed incrementally, and reading stops once `max_rows` documents
+    or `max_bytes` bytes have been read, so files of any size can be sampled.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
-        try:
-            datastore = ujson.load(file)
-        except ujson.JSONDecodeError as e:
-            logger.info(f"Got ValueError: {e}. Retry with jsonlines")
-            file.seek(0)
-            reader = jsl.Reader(file)
-            datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
+        reader = _SampleReader(file, self.max_bytes)
+        events = ijson.parse(reader, multiple_values=True, use_float=True)
 
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+        builder = SchemaBuilder(delimiter=".")
+        try:
+            for document in _iter_documents(events):
+                if isinstance(document, dict):
+                    builder.add_document(document)
+                if self.max_rows is not None and builder.num_documents >= self.max_rows:
+                    break
+        except ijson.JSONError as e:
+            # Use what we've sampled so far, unless nothing could be parsed at all.
+            if builder.num_documents == 0:
+                raise
+            logger.info(
+                f"Got {e} after {builder.num_documents} documents, "
+                "inferring the schema from those"
+            )
+        if reader.exhausted:
+            logger.debug(
+                f"Inferred schema from the first {self.max_bytes} bytes of the file"
+            )
 
-        schema = construct_schema(datastore, delimiter=".")
+        schema = builder.get_schema()
         fields: List[SchemaField] = []
 
         for schema_field in sorted(schema.values(), key=lambda x: x["delimited_name"]):
@@ -101,69 +101,107 @@ def construct_schema(
             string to concatenate field names by
     """
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
-
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
-        """
-        Recursively update the schema with a document, which may/may not contain nested fields.
-
-        Parameters
-        ----------
-            doc:
-                document to scan
-            parent_prefix:
-                prefix of fields that the document is under, pass an empty tuple when initializing
-        """
-
-        for key, value in doc.items():
-            new_parent_prefix = parent_prefix + (key,)
-
-            # if nested value, look at the types within
-            if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
-            # if array of values, check what types are within
-            if isinstance(value, list):
-                for item in value:
-                    # if dictionary, add it as a nested object
-                    if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
-
-            # don't record None values (counted towards nullable)
-            if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
-                        "types": Counter([type(value)]),
-                        "count": 1,
-                    }
-
-                else:
-                    # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
-
+    builder = SchemaBuilder(delimiter)
     for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+        builder.add_document(document)
+    return builder.get_schema()
+
+
+class SchemaBuilder:
+    """
+    Incrementally constructs (infers) a schema from documents, one at a time, so that
+    the documents don't all have to be held in memory. The resulting schema is the same
+    as that of `construct_schema` over all of the documents added.
+
+    Parameters
+    ----------
+        delimiter:
+            string to concatenate field names by
+    """
+
+    def __init__(self, delimiter: str):
+        self.delimiter = delimiter
+        self.num_documents = 0
+        self._schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        self._nullable: Dict[Tuple[str, ...], bool] = {}
+
+    def add_document(self, doc: Dict[str, Any]) -> None:
+        new_fields = []
+
+        def append_to_schema(
+            doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+        ) -> None:
+            """
+            Recursively update the schema with a document, which may/may not contain nested fields.
+
+            Parameters
+            ----------
+                doc:
+                    document to scan
+                parent_prefix:
+                    prefix of fields that the document is under, pass an empty tuple when initializing
+            """
+
+            for key, value in doc.items():
+                new_parent_prefix = parent_prefix + (key,)
+
+                # if nested value, look at the types within
+                if isinstance(value, dict):
+                    append_to_schema(value, new_parent_prefix)
+                # if array of values, check what types are within
+                if isinstance(value, list):
+                    for item in value:
+                        # if dictionary, add it as a nested object
+                        if isinstance(item, dict):
+                            append_to_schema(item, new_parent_prefix)
+
+                # don't record None values (counted towards nullable)
+                if value is not None:
+                    if new_parent_prefix not in self._schema:
+                        self._schema[new_parent_prefix] = {
+                            "types": Counter([type(value)]),
+                            "count": 1,
+                        }
+                        new_fields.append(new_parent_prefix)
+
+                    else:
+                        # update the type count
+                        self._schema[new_parent_prefix]["types"].update(
+                            {type(value): 1}
+                        )
+                        self._schema[new_parent_prefix]["count"] += 1
+
+        append_to_schema(doc, ())
+
+        # a field that is first seen now was missing from all of the previous documents
+        for field_path in new_fields:
+            self._nullable[field_path] = self.num_documents > 0
+        for field_path, nullable in self._nullable.items():
+            if not nullable:
+                self._nullable[field_path] = is_field_nullable(doc, field_path)
+        self.num_documents += 1
+
+    def get_schema(self) -> Dict[Tuple[str, ...], SchemaDescription]:
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path, description in self._schema.items():
+            field_types = description["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": description["types"],
+                "count": description["count"],
+                "nullable": self._nullable[field_path],
+                "delimited_name": self.delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
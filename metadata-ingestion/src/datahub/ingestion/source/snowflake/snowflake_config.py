@@ -90,6 +90,11 @@ class SnowflakeV2Config(
         description="Whether `schema_pattern` is matched against fully qualified schema name `<catalog>.<schema>`.",
     )
 
+    max_workers_for_schema_extraction: int = Field(
+        default=1,
+        description="Number of schemas, across databases, whose tables and views are extracted concurrently. Each worker uses its own Snowflake connection. Workunits are emitted in the same order as with a single worker.",
+    )
+
     use_legacy_lineage_method: bool = Field(
         default=True,
         description="Whether to use the legacy lineage computation method. If set to False, ingestion uses new optimised lineage extraction method that requires less ingestion process memory.",
@@ -110,6 +115,12 @@ class SnowflakeV2Config(
         description="[Advanced] Regex patterns for upstream tables to filter in ingestion. Specify regex to match the entire table name in database.schema.table format. Defaults are to set in such a way to ignore the temporary staging tables created by known ETL tools. Not used if `use_legacy_lineage_method=True`",
     )
 
+    @validator("max_workers_for_schema_extraction")
+    def validate_max_workers_for_schema_extraction(cls, v):
+        if v < 1:
+            raise ValueError("max_workers_for_schema_extraction must be at least 1")
+        return v
+
     @validator("include_column_lineage")
     def validate_include_column_lineage(cls, v, values):
         if not values.get("include_table_lineage") and v:
@@ -135,7 +135,7 @@ class SnowflakeProfiler(GenericProfiler, SnowflakeCommonMixin):
             else:
                 skip_profiling = True
 
-        if len(table.columns) == 0:
+        if not table.column_count:
             skip_profiling = True
 
         if skip_profiling:
@@ -262,7 +262,7 @@ class SnowflakeQuery:
         is_identity AS "IS_IDENTITY"
         from {db_clause}information_schema.columns
         WHERE table_schema='{schema_name}'
-        ORDER BY ordinal_position"""
+        ORDER BY table_name, ordinal_position"""
 
     @staticmethod
     def columns_for_table(
@@ -1,9 +1,22 @@
+import functools
+import itertools
 import logging
+import threading
 from collections import defaultdict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import pandas as pd
 from snowflake.connector import SnowflakeConnection
@@ -15,6 +28,8 @@ from datahub.ingestion.source.sql.sql_generic import BaseColumn, BaseTable, Base
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class SnowflakePK:
@@ -51,6 +66,8 @@ class SnowflakeTag:
 
 @dataclass
 class SnowflakeColumn(BaseColumn):
+    __slots__ = ("character_maximum_length", "numeric_precision", "numeric_scale")
+
     character_maximum_length: Optional[int]
     numeric_precision: Optional[int]
     numeric_scale: Optional[int]
@@ -114,6 +131,67 @@ class SnowflakeDatabase:
     tags: Optional[List[SnowflakeTag]] = None
 
 
+def _make_column(column: Dict[str, Any]) -> SnowflakeColumn:
+    return SnowflakeColumn(
+        name=column["COLUMN_NAME"],
+        ordinal_position=column["ORDINAL_POSITION"],
+        is_nullable=column["IS_NULLABLE"] == "YES",
+        data_type=column["DATA_TYPE"],
+        comment=column["COMMENT"],
+        character_maximum_length=column["CHARACTER_MAXIMUM_LENGTH"],
+        numeric_precision=column["NUMERIC_PRECISION"],
+        numeric_scale=column["NUMERIC_SCALE"],
+    )
+
+
+class SnowflakeSchemaColumns:
+    """
+    The columns of a schema's tables and views, read one table at a time from a
+    result set that is ordered by table name. Tables must be requested in the same
+    order, so that only the columns of the requested table are held in memory,
+    apart from those of the deferred tables, which are kept until requested.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]) -> None:
+        self._tables = itertools.groupby(rows, key=lambda row: row["TABLE_NAME"])
+        # The next table's columns, once read
+        self._next: Optional[Tuple[str, List[SnowflakeColumn]]] = None
+        self._deferred_tables: Set[str] = set()
+        self._deferred: Dict[str, List[SnowflakeColumn]] = {}
+
+    def defer(self, table_names: Iterable[str]) -> None:
+        """Keeps the columns of these tables, to request them out of order."""
+        self._deferred_tables.update(table_names)
+
+    def get(self, table_name: str) -> Optional[List[SnowflakeColumn]]:
+        """
+        Returns None if the table's columns weren't found, including if the table
+        was requested out of order.
+        """
+
+        if table_name in self._deferred:
+            return self._deferred.pop(table_name)
+
+        while True:
+            if self._next is None:
+                table = next(self._tables, None)
+                if table is None:
+                    return None
+                self._next = table[0], [_make_column(row) for row in table[1]]
+
+            name, columns = self._next
+            if name == table_name:
+                self._next = None
+                return columns
+            elif name > table_name:
+                # compares by code point, like Snowflake's default collation
+                return None
+
+            self._next = None
+            if name in self._deferred_tables:
+                self._deferred[name] = columns
+
+
 class _SnowflakeTagCache:
     def __init__(self) -> None:
         # self._database_tags[<database_name>] = list of tags applied to database
@@ -176,19 +254,109 @@ class _SnowflakeTagCache:
         )
 
 
+class _DataDictionaryCache:
+    """
+    Caches the metadata that is fetched for a whole database or schema at once, until
+    it is evicted. Concurrent requests for the same entry only run the query once.
+    """
+
+    def __init__(self, names: List[str]) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Any, ...], Future] = {}
+        self._hits: Dict[str, int] = {name: 0 for name in names}
+        self._misses: Dict[str, int] = {name: 0 for name in names}
+
+    def get(self, key: Tuple[Any, ...], fetch: Callable[[], T]) -> T:
+        """The key is the name of the method, followed by its arguments, the last
+        of which is the database name."""
+
+        with self._lock:
+            future = self._entries.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._entries[key] = future
+                self._misses[key[0]] = self._misses.get(key[0], 0) + 1
+            else:
+                self._hits[key[0]] = self._hits.get(key[0], 0) + 1
+
+        if is_owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as e:
+                # failures aren't cached
+                with self._lock:
+                    self._entries.pop(key, None)
+                future.set_exception(e)
+        return future.result()
+
+    def evict(self, db_name: str, schema_name: Optional[str] = None) -> None:
+        """Evicts the entries of a database, or only those of one of its schemas."""
+
+        with self._lock:
+            for key in list(self._entries):
+                if key[-1] == db_name and (
+                    schema_name is None or (len(key) == 3 and key[1] == schema_name)
+                ):
+                    del self._entries[key]
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: {
+                    "hits": self._hits.get(name, 0),
+                    "misses": self._misses.get(name, 0),
+                    "currsize": sum(1 for key in self._entries if key[0] == name),
+                }
+                for name in sorted({*self._hits, *self._misses})
+            }
+
+
+_cached_method_names: List[str] = []
+
+
+def _cached_per_database(func: Callable[..., T]) -> Callable[..., T]:
+    """Caches the results of a data dictionary method whose last argument is the
+    database name, and whose other argument, if any, is the schema name."""
+
+    _cached_method_names.append(func.__name__)
+
+    @functools.wraps(func)
+    def wrapper(self: "SnowflakeDataDictionary", *args: str) -> T:
+        return self._cache.get((func.__name__, *args), lambda: func(self, *args))
+
+    return wrapper
+
+
 class SnowflakeDataDictionary(SnowflakeQueryMixin):
     def __init__(self) -> None:
         self.logger = logger
         self.connection: Optional[SnowflakeConnection] = None
+        # Connections of the threads that extract schemas concurrently.
+        self._thread_local = threading.local()
+        self._cache = _DataDictionaryCache(_cached_method_names)
 
     def set_connection(self, connection: SnowflakeConnection) -> None:
         self.connection = connection
 
+    def set_thread_connection(self, connection: Optional[SnowflakeConnection]) -> None:
+        """Sets the connection to use for queries run by the current thread."""
+        self._thread_local.connection = connection
+
     def get_connection(self) -> SnowflakeConnection:
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is not None:
+            return connection
         # Connection is already present by the time this is called
         assert self.connection is not None
         return self.connection
 
+    def evict_cache(self, db_name: str, schema_name: Optional[str] = None) -> None:
+        self._cache.evict(db_name, schema_name)
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        return self._cache.cache_info()
+
     def show_databases(self) -> List[SnowflakeDatabase]:
         databases: List[SnowflakeDatabase] = []
 
@@ -241,7 +409,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             snowflake_schemas.append(snowflake_schema)
         return snowflake_schemas
 
-    @lru_cache(maxsize=1)
+    @_cached_per_database
     def get_tables_for_database(
         self, db_name: str
     ) -> Optional[Dict[str, List[SnowflakeTable]]]:
@@ -296,7 +464,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             )
         return tables
 
-    @lru_cache(maxsize=1)
+    @_cached_per_database
     def get_views_for_database(
         self, db_name: str
     ) -> Optional[Dict[str, List[SnowflakeView]]]:
@@ -344,11 +512,10 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             )
         return views
 
-    @lru_cache(maxsize=1)
+    @_cached_per_database
     def get_columns_for_schema(
         self, schema_name: str, db_name: str
-    ) -> Optional[Dict[str, List[SnowflakeColumn]]]:
-        columns: Dict[str, List[SnowflakeColumn]] = {}
+    ) -> Optional[SnowflakeSchemaColumns]:
         try:
             cur = self.query(SnowflakeQuery.columns_for_schema(schema_name, db_name))
         except Exception as e:
@@ -359,22 +526,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             # Please repeat query with more selective predicates.
             return None
 
-        for column in cur:
-            if column["TABLE_NAME"] not in columns:
-                columns[column["TABLE_NAME"]] = []
-            columns[column["TABLE_NAME"]].append(
-                SnowflakeColumn(
-                    name=column["COLUMN_NAME"],
-                    ordinal_position=column["ORDINAL_POSITION"],
-                    is_nullable=column["IS_NULLABLE"] == "YES",
-                    data_type=column["DATA_TYPE"],
-                    comment=column["COMMENT"],
-                    character_maximum_length=column["CHARACTER_MAXIMUM_LENGTH"],
-                    numeric_precision=column["NUMERIC_PRECISION"],
-                    numeric_scale=column["NUMERIC_SCALE"],
-                )
-            )
-        return columns
+        return SnowflakeSchemaColumns(cur)
 
     def get_columns_for_table(
         self, table_name: str, schema_name: str, db_name: str
@@ -386,21 +538,10 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
         )
 
         for column in cur:
-            columns.append(
-                SnowflakeColumn(
-                    name=column["COLUMN_NAME"],
-                    ordinal_position=column["ORDINAL_POSITION"],
-                    is_nullable=column["IS_NULLABLE"] == "YES",
-                    data_type=column["DATA_TYPE"],
-                    comment=column["COMMENT"],
-                    character_maximum_length=column["CHARACTER_MAXIMUM_LENGTH"],
-                    numeric_precision=column["NUMERIC_PRECISION"],
-                    numeric_scale=column["NUMERIC_SCALE"],
-                )
-            )
+            columns.append(_make_column(column))
         return columns
 
-    @lru_cache(maxsize=1)
+    @_cached_per_database
     def get_pk_constraints_for_schema(
         self, schema_name: str, db_name: str
     ) -> Dict[str, SnowflakePK]:
@@ -417,7 +558,7 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
             constraints[row["table_name"]].column_names.append(row["column_name"])
         return constraints
 
-    @lru_cache(maxsize=1)
+    @_cached_per_database
     def get_fk_constraints_for_schema(
         self, schema_name: str, db_name: str
     ) -> Dict[str, List[SnowflakeFK]]:
@@ -1,10 +1,25 @@
+import functools
 import json
 import logging
 import os
 import os.path
 import platform
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Optional, Union, cast
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pandas as pd
 from snowflake.connector import SnowflakeConnection
@@ -278,8 +293,10 @@ class SnowflakeV2Source(
                 self.config, self.report
             )
 
-        # Caches tables for a single database. Consider moving to disk or S3 when possible.
-        self.db_tables: Dict[str, List[SnowflakeTable]] = {}
+        # Connections of the threads that extract schemas concurrently, see
+        # max_workers_for_schema_extraction.
+        self._worker_local = threading.local()
+        self._worker_connections: List[SnowflakeConnection] = []
 
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Source":
@@ -496,27 +513,22 @@ class SnowflakeV2Source(
         if databases is None or len(databases) == 0:
             return
 
-        for snowflake_db in databases:
-            try:
-                yield from self._process_database(snowflake_db)
+        try:
+            if self.config.max_workers_for_schema_extraction > 1:
+                yield from self._process_databases_concurrently(databases)
+            else:
+                for snowflake_db in databases:
+                    yield from self._process_database(snowflake_db)
 
-            except SnowflakePermissionError as e:
-                # FIXME - This may break stateful ingestion if new tables than previous run are emitted above
-                # and stateful ingestion is enabled
-                self.report_error(GENERIC_PERMISSION_ERROR_KEY, str(e))
-                return
+        except SnowflakePermissionError as e:
+            # FIXME - This may break stateful ingestion if new tables than previous run are emitted above
+            # and stateful ingestion is enabled
+            self.report_error(GENERIC_PERMISSION_ERROR_KEY, str(e))
+            return
 
         self.connection.close()
 
-        lru_cache_functions: List[Callable] = [
-            self.data_dictionary.get_tables_for_database,
-            self.data_dictionary.get_views_for_database,
-            self.data_dictionary.get_columns_for_schema,
-            self.data_dictionary.get_pk_constraints_for_schema,
-            self.data_dictionary.get_fk_constraints_for_schema,
-        ]
-        for func in lru_cache_functions:
-            self.report.lru_cache_info[func.__name__] = func.cache_info()._asdict()  # type: ignore
+        self.report.lru_cache_info = self.data_dictionary.cache_info()
 
         # TODO: The checkpoint state for stale entity detection can be committed here.
 
@@ -639,6 +651,22 @@ class SnowflakeV2Source(
     def _process_database(
         self, snowflake_db: SnowflakeDatabase
     ) -> Iterable[MetadataWorkUnit]:
+        yield from self._start_database(snowflake_db)
+
+        db_tables: Dict[str, List[SnowflakeTable]] = {}
+        for snowflake_schema in snowflake_db.schemas:
+            yield from self._process_schema(
+                snowflake_schema, snowflake_db.name, db_tables
+            )
+            self.data_dictionary.evict_cache(snowflake_db.name, snowflake_schema.name)
+
+        yield from self._finish_database(snowflake_db, db_tables)
+
+    def _start_database(
+        self, snowflake_db: SnowflakeDatabase
+    ) -> Iterable[MetadataWorkUnit]:
+        """Emits the database's container and finds its schemas, if it is allowed."""
+
         self.report.report_entity_scanned(snowflake_db.name, "database")
         if not self.config.database_pattern.allowed(snowflake_db.name):
             self.report.report_dropped(f"{snowflake_db.name}.*")
@@ -682,12 +710,119 @@ class SnowflakeV2Source(
             for tag in snowflake_db.tags:
                 yield from self._process_tag(tag)
 
-        self.db_tables = {}
-        for snowflake_schema in snowflake_db.schemas:
-            yield from self._process_schema(snowflake_schema, db_name)
+    def _finish_database(
+        self,
+        snowflake_db: SnowflakeDatabase,
+        db_tables: Dict[str, List[SnowflakeTable]],
+    ) -> Iterable[MetadataWorkUnit]:
+        self.data_dictionary.evict_cache(snowflake_db.name)
 
-        if self.config.profiling.enabled and self.db_tables:
-            yield from self.profiler.get_workunits(snowflake_db, self.db_tables)
+        if self.config.profiling.enabled and db_tables:
+            yield from self.profiler.get_workunits(snowflake_db, db_tables)
+
+    def _process_databases_concurrently(
+        self, databases: List[SnowflakeDatabase]
+    ) -> Iterable[MetadataWorkUnit]:
+        """
+        Extracts the metadata of several schemas at once, across databases, each
+        thread over a connection of its own. A schema's workunits are buffered
+        until it is done, and are then emitted in the order of the schemas, so the
+        workunits are the same, and in the same order, as with a single worker.
+        Only a few schemas are extracted ahead of the one being emitted, to bound
+        the buffered workunits.
+        """
+
+        def extract_schema(
+            snowflake_schema: SnowflakeSchema, db_name: str
+        ) -> Tuple[
+            List[Union[MetadataWorkUnit, SnowflakeTag]], Dict[str, List[SnowflakeTable]]
+        ]:
+            schema_tables: Dict[str, List[SnowflakeTable]] = {}
+            output: List[Union[MetadataWorkUnit, SnowflakeTag]] = []
+            self._worker_local.output = output
+            try:
+                for wu in self._process_schema(
+                    snowflake_schema, db_name, schema_tables
+                ):
+                    output.append(wu)
+            finally:
+                self._worker_local.output = None
+                self.data_dictionary.evict_cache(db_name, snowflake_schema.name)
+            return output, schema_tables
+
+        def emit_schema(
+            future: "Future[Tuple[List[Union[MetadataWorkUnit, SnowflakeTag]], Dict[str, List[SnowflakeTable]]]]",
+            db_tables: Dict[str, List[SnowflakeTable]],
+        ) -> Iterable[MetadataWorkUnit]:
+            output, schema_tables = future.result()
+            futures.discard(future)
+            db_tables.update(schema_tables)
+            for item in output:
+                if isinstance(item, SnowflakeTag):
+                    yield from self._process_tag(item)
+                else:
+                    yield item
+
+        def raise_error(e: Exception) -> Iterable[MetadataWorkUnit]:
+            raise e
+
+        max_workers = self.config.max_workers_for_schema_extraction
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="snowflake-schema",
+            initializer=self._open_worker_connection,
+        )
+        # The workunits of each database's container, schemas and profiles, in order.
+        pending: Deque[Callable[[], Iterable[MetadataWorkUnit]]] = deque()
+        futures: Set[Future] = set()
+        try:
+            for snowflake_db in databases:
+                db_workunits: List[MetadataWorkUnit] = []
+                pending.append(functools.partial(iter, db_workunits))
+                try:
+                    db_workunits.extend(self._start_database(snowflake_db))
+                except SnowflakePermissionError as e:
+                    # raised once the workunits before it are emitted
+                    pending.append(functools.partial(raise_error, e))
+                    break
+
+                db_tables: Dict[str, List[SnowflakeTable]] = {}
+                for snowflake_schema in snowflake_db.schemas:
+                    future = executor.submit(
+                        extract_schema, snowflake_schema, snowflake_db.name
+                    )
+                    futures.add(future)
+                    pending.append(functools.partial(emit_schema, future, db_tables))
+                    while len(pending) > 2 * max_workers:
+                        yield from pending.popleft()()
+                pending.append(
+                    functools.partial(self._finish_database, snowflake_db, db_tables)
+                )
+
+            while pending:
+                yield from pending.popleft()()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for connection in self._worker_connections:
+                connection.close()
+            self._worker_connections = []
+
+    def _open_worker_connection(self) -> None:
+        connection = self.create_connection()
+        if connection is None:
+            # the failure is reported, and the thread uses the shared connection
+            return
+        self._worker_connections.append(connection)
+        self._worker_local.connection = connection
+        self.data_dictionary.set_thread_connection(connection)
+
+    def get_connection(self) -> SnowflakeConnection:
+        connection = getattr(self._worker_local, "connection", None)
+        if connection is not None:
+            return connection
+        return super().get_connection()
 
     def fetch_schemas_for_database(self, snowflake_db, db_name):
         try:
@@ -716,7 +851,10 @@ class SnowflakeV2Source(
             )
 
     def _process_schema(
-        self, snowflake_schema: SnowflakeSchema, db_name: str
+        self,
+        snowflake_schema: SnowflakeSchema,
+        db_name: str,
+        db_tables: Dict[str, List[SnowflakeTable]],
     ) -> Iterable[MetadataWorkUnit]:
         self.report.report_entity_scanned(snowflake_schema.name, "schema")
         if not is_schema_allowed(
@@ -738,22 +876,24 @@ class SnowflakeV2Source(
         if self.config.include_technical_schema:
             yield from self.gen_schema_containers(snowflake_schema, db_name)
 
+        tables: List[SnowflakeTable] = []
+        views: List[SnowflakeView] = []
         if self.config.include_tables:
             tables = self.fetch_tables_for_schema(
                 snowflake_schema, db_name, schema_name
             )
-            self.db_tables[schema_name] = tables
-
-            if self.config.include_technical_schema:
-                for table in tables:
-                    yield from self._process_table(table, schema_name, db_name)
+            db_tables[schema_name] = tables
 
         if self.config.include_views:
             views = self.fetch_views_for_schema(snowflake_schema, db_name, schema_name)
 
-            if self.config.include_technical_schema:
-                for view in views:
-                    yield from self._process_view(view, schema_name, db_name)
+        if self.config.include_technical_schema:
+            if tables and views:
+                self.defer_columns_for_views(views, schema_name, db_name)
+            for table in tables:
+                yield from self._process_table(table, schema_name, db_name)
+            for view in views:
+                yield from self._process_view(view, schema_name, db_name)
 
         if self.config.include_technical_schema and snowflake_schema.tags:
             for tag in snowflake_schema.tags:
@@ -765,6 +905,21 @@ class SnowflakeV2Source(
                 f"{db_name}.{schema_name}",
             )
 
+    def defer_columns_for_views(
+        self, views: List[SnowflakeView], schema_name: str, db_name: str
+    ) -> None:
+        # The schema's columns are read in order of table name, and the views are
+        # processed after the tables, so the views' columns are kept until then.
+        columns = self.data_dictionary.get_columns_for_schema(schema_name, db_name)
+        if columns is not None:
+            columns.defer(
+                view.name
+                for view in views
+                if self.config.view_pattern.allowed(
+                    self.get_dataset_identifier(view.name, schema_name, db_name)
+                )
+            )
+
     def fetch_views_for_schema(self, snowflake_schema, db_name, schema_name):
         try:
             views = self.get_views_for_schema(schema_name, db_name)
@@ -850,6 +1005,11 @@ class SnowflakeV2Source(
 
         yield from self.gen_dataset_workunits(table, schema_name, db_name)
 
+        # Tables are kept until the database is profiled, which only needs the
+        # column count, so their columns and sample data are dropped.
+        table.columns = []
+        table.sample_data = None
+
     def fetch_sample_data_for_classification(
         self, table, schema_name, db_name, dataset_name
     ):
@@ -967,6 +1127,13 @@ class SnowflakeV2Source(
         yield from self.gen_dataset_workunits(view, schema_name, db_name)
 
     def _process_tag(self, tag: SnowflakeTag) -> Iterable[MetadataWorkUnit]:
+        worker_output = getattr(self._worker_local, "output", None)
+        if worker_output is not None:
+            # Tags seen by schema extraction threads are deduplicated when their
+            # schema's workunits are emitted, so that the same tags are emitted.
+            worker_output.append(tag)
+            return
+
         tag_identifier = tag.identifier()
 
         if self.report.is_tag_processed(tag_identifier):
@@ -1341,17 +1508,17 @@ class SnowflakeV2Source(
         self, table_name: str, schema_name: str, db_name: str
     ) -> List[SnowflakeColumn]:
         columns = self.data_dictionary.get_columns_for_schema(schema_name, db_name)
+        table_columns = columns.get(table_name) if columns is not None else None
 
-        # get all columns for schema failed,
-        # falling back to get columns for table
-        if columns is None:
+        # get all columns for schema failed, or the table's columns weren't
+        # found in them, falling back to get columns for table
+        if table_columns is None:
             self.report.num_get_columns_for_table_queries += 1
             return self.data_dictionary.get_columns_for_table(
                 table_name, schema_name, db_name
             )
 
-        # Access to table but none of its columns - is this possible ?
-        return columns.get(table_name, [])
+        return table_columns
 
     def get_pk_constraints_for_table(
         self, table_name: str, schema_name: str, db_name: str
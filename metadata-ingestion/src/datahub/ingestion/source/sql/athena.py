@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 import typing
 from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
@@ -125,7 +126,12 @@ class AthenaSource(SQLAlchemySource):
 
     def __init__(self, config, ctx):
         super().__init__(config, ctx, "athena")
-        self.cursor: Optional[BaseCursor] = None
+        # Cursors aren't thread-safe, and schemas may be extracted in several
+        # threads, see schema_introspection_workers. So every thread gets a cursor
+        # of its own, created lazily.
+        self._local = threading.local()
+        self._cursors: List[BaseCursor] = []
+        self._cursors_lock = threading.Lock()
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -135,13 +141,17 @@ class AthenaSource(SQLAlchemySource):
     def get_table_properties(
         self, inspector: Inspector, schema: str, table: str
     ) -> Tuple[Optional[str], Dict[str, str], Optional[str]]:
-        if not self.cursor:
-            self.cursor = cast(BaseCursor, inspector.engine.raw_connection().cursor())
-            assert self.cursor
+        cursor: Optional[BaseCursor] = getattr(self._local, "cursor", None)
+        if not cursor:
+            cursor = cast(BaseCursor, inspector.engine.raw_connection().cursor())
+            assert cursor
+            self._local.cursor = cursor
+            with self._cursors_lock:
+                self._cursors.append(cursor)
 
         # Unfortunately properties can be only get through private methods as those are not exposed
         # https://github.com/laughingman7743/PyAthena/blob/9e42752b0cc7145a87c3a743bb2634fe125adfa7/pyathena/model.py#L201
-        metadata: AthenaTableMetadata = self.cursor._get_table_metadata(
+        metadata: AthenaTableMetadata = cursor._get_table_metadata(
             table_name=table, schema_name=schema
         )
         description = metadata.comment
@@ -248,6 +258,8 @@ class AthenaSource(SQLAlchemySource):
         return schemas
 
     def close(self):
-        if self.cursor:
-            self.cursor.close()
+        with self._cursors_lock:
+            for cursor in self._cursors:
+                cursor.close()
+            self._cursors = []
         super().close()
@@ -6,8 +6,9 @@ from unittest.mock import patch
 import cx_Oracle
 import pydantic
 from pydantic.fields import Field
-from sqlalchemy import event, sql
+from sqlalchemy import event, inspect, sql
 from sqlalchemy.dialects.oracle.base import OracleDialect
+from sqlalchemy.engine import Connection
 from sqlalchemy.engine.reflection import Inspector
 
 from datahub.ingestion.api.decorators import (
@@ -189,6 +190,9 @@ class OracleSource(SQLAlchemySource):
             # To silent the mypy lint error
             yield cast(Inspector, OracleInspectorObjectWrapper(inspector))
 
+    def create_inspector(self, conn: Connection) -> Inspector:
+        return cast(Inspector, OracleInspectorObjectWrapper(inspect(conn)))
+
     def get_workunits(self):
         with patch.dict(
             "sqlalchemy.dialects.oracle.base.OracleDialect.ischema_names",
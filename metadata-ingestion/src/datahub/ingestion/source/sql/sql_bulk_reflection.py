@@ -0,0 +1,377 @@
+"""
+Reflection of all the tables of a schema at once.
+
+SQLAlchemy's Inspector issues several catalog queries per table, which adds up
+to a lot of round trips on databases with many tables. A BulkReflector fetches
+the columns and constraints of a whole schema in a few information_schema
+queries instead, and SQLAlchemySource serves its per-table lookups from that.
+
+Tables that a reflector can't fully describe, e.g. because one of their column
+types isn't known, are left out of SchemaReflection.columns, and the source
+falls back to the Inspector for them.
+"""
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.types import TypeEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchemaReflection:
+    # The same dicts as returned by Inspector.get_columns, get_pk_constraint
+    # and get_foreign_keys, keyed by table name.
+    columns: Dict[str, List[dict]] = field(default_factory=dict)
+    pk_constraints: Dict[str, dict] = field(default_factory=dict)
+    foreign_keys: Dict[str, List[dict]] = field(default_factory=dict)
+
+    def get_pk_constraint(self, table: str) -> dict:
+        return self.pk_constraints.get(table, {"constrained_columns": [], "name": None})
+
+    def get_foreign_keys(self, table: str) -> List[dict]:
+        return self.foreign_keys.get(table, [])
+
+
+class BulkReflector(ABC):
+    @abstractmethod
+    def reflect_schema(
+        self, conn: Connection, dialect: Dialect, schema: str
+    ) -> SchemaReflection:
+        pass
+
+
+def _group_columns(
+    rows: List[Any], make_column: Any
+) -> Tuple[Dict[str, List[dict]], List[str]]:
+    """Groups column rows by table. Tables with a column that make_column can't
+    describe are left out. Returns the columns and the tables left out."""
+
+    columns: Dict[str, List[dict]] = defaultdict(list)
+    unsupported: Dict[str, None] = {}
+    for row in rows:
+        table = row["table_name"]
+        if table in unsupported:
+            continue
+        column = make_column(row)
+        if column is None:
+            unsupported[table] = None
+            columns.pop(table, None)
+        else:
+            columns[table].append(column)
+    return dict(columns), list(unsupported)
+
+
+def _group_foreign_keys(rows: List[Any]) -> Dict[str, List[dict]]:
+    foreign_keys: Dict[str, Dict[str, dict]] = defaultdict(dict)
+    for row in rows:
+        fk = foreign_keys[row["table_name"]].setdefault(
+            row["constraint_name"],
+            {
+                "name": row["constraint_name"],
+                "constrained_columns": [],
+                "referred_schema": row["referred_schema"],
+                "referred_table": row["referred_table"],
+                "referred_columns": [],
+                "options": {},
+            },
+        )
+        fk["constrained_columns"].append(row["column_name"])
+        fk["referred_columns"].append(row["referred_column"])
+    return {table: list(fks.values()) for table, fks in foreign_keys.items()}
+
+
+class PostgresBulkReflector(BulkReflector):
+    _COLUMNS_QUERY = """
+        SELECT
+            c.table_name,
+            c.column_name,
+            c.data_type,
+            c.character_maximum_length,
+            c.numeric_precision,
+            c.numeric_scale,
+            c.datetime_precision,
+            c.is_nullable,
+            c.column_default,
+            col_description(
+                format('%I.%I', c.table_schema, c.table_name)::regclass,
+                c.ordinal_position
+            ) AS comment
+        FROM information_schema.columns c
+        WHERE c.table_schema = :schema
+        ORDER BY c.table_name, c.ordinal_position
+    """
+
+    # information_schema only shows the constraints of tables that the user has
+    # privileges other than SELECT on, so the constraints come from pg_catalog.
+    _PK_QUERY = """
+        SELECT c.relname AS table_name, con.conname AS constraint_name, a.attname AS column_name
+        FROM pg_catalog.pg_constraint con
+        JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_catalog.pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+        WHERE n.nspname = :schema AND con.contype = 'p'
+        ORDER BY c.relname, k.ord
+    """
+
+    _FK_QUERY = """
+        SELECT
+            c.relname AS table_name,
+            con.conname AS constraint_name,
+            a.attname AS column_name,
+            rn.nspname AS referred_schema,
+            rc.relname AS referred_table,
+            ra.attname AS referred_column
+        FROM pg_catalog.pg_constraint con
+        JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+        JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+        CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+            WITH ORDINALITY AS k(attnum, referred_attnum, ord)
+        JOIN pg_catalog.pg_attribute a
+            ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+        JOIN pg_catalog.pg_attribute ra
+            ON ra.attrelid = con.confrelid AND ra.attnum = k.referred_attnum
+        WHERE n.nspname = :schema AND con.contype = 'f'
+        ORDER BY c.relname, con.conname, k.ord
+    """
+
+    # Mirrors how PGDialect builds the column types from the catalog.
+    _TIMEZONE_TYPES = {
+        "timestamp with time zone": True,
+        "time with time zone": True,
+        "timestamp without time zone": False,
+        "time without time zone": False,
+        "time": False,
+        "timestamp": False,
+    }
+
+    def _make_type(self, dialect: Dialect, row: Any) -> Optional[TypeEngine]:
+        data_type: str = row["data_type"]
+        type_cls = dialect.ischema_names.get(data_type)  # type: ignore
+        if type_cls is None:
+            # e.g. arrays, enums and domains.
+            return None
+
+        args: Tuple[int, ...] = ()
+        kwargs: Dict[str, Any] = {}
+        if data_type == "numeric":
+            if row["numeric_precision"] is not None:
+                args = (row["numeric_precision"], row["numeric_scale"] or 0)
+        elif data_type == "double precision":
+            args = (53,)
+        elif data_type in self._TIMEZONE_TYPES:
+            kwargs["timezone"] = self._TIMEZONE_TYPES[data_type]
+        elif data_type == "bit varying":
+            kwargs["varying"] = True
+            if row["character_maximum_length"] is not None:
+                args = (row["character_maximum_length"],)
+        elif data_type in ("character varying", "character", "bit"):
+            if row["character_maximum_length"] is not None:
+                args = (row["character_maximum_length"],)
+        return type_cls(*args, **kwargs)
+
+    def reflect_schema(
+        self, conn: Connection, dialect: Dialect, schema: str
+    ) -> SchemaReflection:
+        def make_column(row: Any) -> Optional[dict]:
+            column_type = self._make_type(dialect, row)
+            if column_type is None:
+                return None
+            return {
+                "name": row["column_name"],
+                "type": column_type,
+                "nullable": row["is_nullable"] == "YES",
+                "default": row["column_default"],
+                "comment": row["comment"],
+            }
+
+        params = {"schema": schema}
+        columns, unsupported = _group_columns(
+            list(conn.execute(text(self._COLUMNS_QUERY), params)), make_column
+        )
+        if unsupported:
+            logger.debug(
+                f"Falling back to per-table reflection for {len(unsupported)} tables in {schema}"
+            )
+
+        pk_constraints: Dict[str, dict] = {}
+        for row in conn.execute(text(self._PK_QUERY), params):
+            pk = pk_constraints.setdefault(
+                row["table_name"],
+                {"constrained_columns": [], "name": row["constraint_name"]},
+            )
+            pk["constrained_columns"].append(row["column_name"])
+
+        foreign_keys = _group_foreign_keys(
+            list(conn.execute(text(self._FK_QUERY), params))
+        )
+        return SchemaReflection(columns, pk_constraints, foreign_keys)
+
+
+class MySQLBulkReflector(BulkReflector):
+    _COLUMNS_QUERY = """
+        SELECT
+            TABLE_NAME AS table_name,
+            COLUMN_NAME AS column_name,
+            DATA_TYPE AS data_type,
+            COLUMN_TYPE AS column_type,
+            IS_NULLABLE AS is_nullable,
+            COLUMN_DEFAULT AS column_default,
+            COLUMN_COMMENT AS comment
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = :schema
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """
+
+    _PK_QUERY = """
+        SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = :schema AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """
+
+    _FK_QUERY = """
+        SELECT
+            TABLE_NAME AS table_name,
+            CONSTRAINT_NAME AS constraint_name,
+            COLUMN_NAME AS column_name,
+            REFERENCED_TABLE_SCHEMA AS referred_schema,
+            REFERENCED_TABLE_NAME AS referred_table,
+            REFERENCED_COLUMN_NAME AS referred_column
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = :schema AND REFERENCED_TABLE_NAME IS NOT NULL
+        ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
+    """
+
+    _COLUMN_TYPE_RE = re.compile(r"^(\w+)(?:\(([^)]*)\))?(.*)$")
+
+    _INTEGER_TYPES = {"tinyint", "smallint", "mediumint", "int", "integer", "bigint"}
+    _DECIMAL_TYPES = {"decimal", "numeric", "fixed", "float", "double"}
+    _STRING_TYPES = {"char", "varchar", "nchar", "nvarchar", "binary", "varbinary"}
+    _TIME_TYPES = {"datetime", "timestamp", "time"}
+
+    def _make_type(self, dialect: Dialect, row: Any) -> Optional[TypeEngine]:
+        match = self._COLUMN_TYPE_RE.match(row["column_type"] or "")
+        if not match:
+            return None
+        type_name, type_args, suffix = match.groups()
+        type_name = type_name.lower()
+        type_cls = dialect.ischema_names.get(type_name)  # type: ignore
+        if type_cls is None or type_name in ("enum", "set"):
+            return None
+
+        args = [int(arg) for arg in type_args.split(",")] if type_args else []
+        kwargs: Dict[str, Any] = {}
+        if "unsigned" in suffix:
+            kwargs["unsigned"] = True
+        if "zerofill" in suffix:
+            kwargs["zerofill"] = True
+
+        if type_name in self._INTEGER_TYPES:
+            if args:
+                kwargs["display_width"] = args[0]
+        elif type_name in self._DECIMAL_TYPES:
+            if args:
+                kwargs["precision"] = args[0]
+                if len(args) > 1:
+                    kwargs["scale"] = args[1]
+        elif type_name in self._STRING_TYPES or type_name == "bit":
+            if args:
+                kwargs["length"] = args[0]
+        elif type_name in self._TIME_TYPES:
+            if args:
+                kwargs["fsp"] = args[0]
+        elif args:
+            return None
+        try:
+            return type_cls(**kwargs)
+        except TypeError:
+            return None
+
+    def reflect_schema(
+        self, conn: Connection, dialect: Dialect, schema: str
+    ) -> SchemaReflection:
+        def make_column(row: Any) -> Optional[dict]:
+            column_type = self._make_type(dialect, row)
+            if column_type is None:
+                return None
+            return {
+                "name": row["column_name"],
+                "type": column_type,
+                "nullable": row["is_nullable"] == "YES",
+                "default": row["column_default"],
+                "comment": row["comment"] or None,
+            }
+
+        params = {"schema": schema}
+        columns, _ = _group_columns(
+            list(conn.execute(text(self._COLUMNS_QUERY), params)), make_column
+        )
+
+        pk_constraints: Dict[str, dict] = {}
+        for row in conn.execute(text(self._PK_QUERY), params):
+            pk = pk_constraints.setdefault(
+                row["table_name"], {"constrained_columns": [], "name": None}
+            )
+            pk["constrained_columns"].append(row["column_name"])
+
+        foreign_keys = _group_foreign_keys(
+            list(conn.execute(text(self._FK_QUERY), params))
+        )
+        return SchemaReflection(columns, pk_constraints, foreign_keys)
+
+
+class TrinoBulkReflector(BulkReflector):
+    """Trino has no primary or foreign keys, so only the columns are fetched."""
+
+    _COLUMNS_QUERY = """
+        SELECT table_name, column_name, data_type, is_nullable, column_default, comment
+        FROM information_schema.columns
+        WHERE table_schema = :schema
+        ORDER BY table_name, ordinal_position
+    """
+
+    def reflect_schema(
+        self, conn: Connection, dialect: Dialect, schema: str
+    ) -> SchemaReflection:
+        # Same as TrinoDialect.get_columns.
+        from trino.sqlalchemy.datatype import parse_sqltype
+
+        def make_column(row: Any) -> Optional[dict]:
+            return {
+                "name": row["column_name"],
+                "type": parse_sqltype(row["data_type"]),
+                "nullable": row["is_nullable"].upper() == "YES",
+                "default": row["column_default"],
+                "comment": row["comment"],
+            }
+
+        columns, _ = _group_columns(
+            list(conn.execute(text(self._COLUMNS_QUERY), {"schema": schema})),
+            make_column,
+        )
+        return SchemaReflection(columns)
+
+
+# Maps SQLAlchemy dialect names to the bulk reflector to use for them.
+bulk_reflector_registry: Dict[str, Type[BulkReflector]] = {
+    "postgresql": PostgresBulkReflector,
+    "mysql": MySQLBulkReflector,
+    "mariadb": MySQLBulkReflector,
+    "trino": TrinoBulkReflector,
+}
+
+
+def get_bulk_reflector(dialect_name: str) -> Optional[BulkReflector]:
+    reflector_cls = bulk_reflector_registry.get(dialect_name)
+    return reflector_cls() if reflector_cls is not None else None
@@ -1,7 +1,10 @@
+import contextlib
 import datetime
 import logging
+import threading
 import traceback
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
@@ -9,6 +12,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -19,6 +23,7 @@ from typing import (
 
 import sqlalchemy.dialects.postgresql.base
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Connection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.sql import sqltypes as types
@@ -38,6 +43,10 @@ from datahub.ingestion.source.common.subtypes import (
     DatasetContainerSubTypes,
     DatasetSubTypes,
 )
+from datahub.ingestion.source.sql.sql_bulk_reflection import (
+    SchemaReflection,
+    get_bulk_reflector,
+)
 from datahub.ingestion.source.sql.sql_config import SQLAlchemyConfig
 from datahub.ingestion.source.sql.sql_utils import (
     add_table_to_schema_container,
@@ -87,8 +96,10 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.telemetry import telemetry
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombinerReport
+from datahub.utilities.stats_collections import TopKDict
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.ge_data_profiler import (
@@ -152,26 +163,65 @@ class SQLSourceReport(StaleEntityRemovalSourceReport):
     tables_scanned: int = 0
     views_scanned: int = 0
     entities_profiled: int = 0
+    # Entities profiled from a sample, because they exceeded the profiling budget.
+    entities_sampled: LossyList[str] = field(default_factory=LossyList)
     filtered: LossyList[str] = field(default_factory=LossyList)
+    # Time spent on extracting the metadata of each schema, keyed by db.schema.
+    schema_introspection_sec: TopKDict[str, float] = field(default_factory=TopKDict)
+    # Schemas reflected in bulk, and those where bulk reflection failed.
+    bulk_reflection_schemas: int = 0
+    bulk_reflection_failures: int = 0
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
 
+    # Schemas may be extracted in several threads, see schema_introspection_workers,
+    # so the report is updated under a lock.
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
+
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
         Entity could be a view or a table
         """
-        if ent_type == "table":
-            self.tables_scanned += 1
-        elif ent_type == "view":
-            self.views_scanned += 1
-        else:
-            raise KeyError(f"Unknown entity {ent_type}.")
+        with self._lock:
+            if ent_type == "table":
+                self.tables_scanned += 1
+            elif ent_type == "view":
+                self.views_scanned += 1
+            else:
+                raise KeyError(f"Unknown entity {ent_type}.")
 
     def report_entity_profiled(self, name: str) -> None:
-        self.entities_profiled += 1
+        with self._lock:
+            self.entities_profiled += 1
+
+    def report_entity_sampled(self, name: str) -> None:
+        with self._lock:
+            self.entities_sampled.append(name)
 
     def report_dropped(self, ent_name: str) -> None:
-        self.filtered.append(ent_name)
+        with self._lock:
+            self.filtered.append(ent_name)
+
+    def report_schema_introspection(self, schema: str, seconds: float) -> None:
+        with self._lock:
+            self.schema_introspection_sec[schema] = round(seconds, 2)
+
+    def report_bulk_reflection(self, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.bulk_reflection_schemas += 1
+            else:
+                self.bulk_reflection_failures += 1
 
     def report_from_query_combiner(
         self, query_combiner_report: SQLAlchemyQueryCombinerReport
@@ -346,6 +396,10 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 cached_domains=[k for k in self.config.domain], graph=self.ctx.graph
             )
 
+        # Bulk reflections of the schemas being processed, keyed by (db, schema).
+        self._bulk_reflections: Dict[Tuple[str, str], Optional[SchemaReflection]] = {}
+        self._bulk_reflections_lock = threading.Lock()
+
     def warn(self, log: logging.Logger, key: str, reason: str) -> None:
         self.report.report_warning(key, reason)
         log.warning(f"{key} => {reason}")
@@ -474,10 +528,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
+        max_overflow = 0
         if sql_config.profiling.enabled:
-            sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
-            )
+            max_overflow = sql_config.profiling.max_workers
+        if sql_config.schema_introspection_workers > 1:
+            max_overflow = max(max_overflow, sql_config.schema_introspection_workers)
+        if max_overflow:
+            sql_config.options.setdefault("max_overflow", max_overflow)
 
         for inspector in self.get_inspectors():
             profiler = None
@@ -490,26 +547,23 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 database=db_name,
             )
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
-
-                yield from self.gen_schema_containers(
-                    database=db_name,
-                    schema=schema,
-                    extra_properties=self.get_schema_properties(
-                        inspector=inspector, schema=schema, database=db_name
-                    ),
+            schemas = self.get_allowed_schemas(inspector, db_name)
+            if sql_config.schema_introspection_workers > 1:
+                yield from self._get_schema_workunits_concurrently(
+                    inspector, db_name, schemas, profile_requests, profiler is not None
                 )
-
-                if sql_config.include_tables:
-                    yield from self.loop_tables(inspector, schema, sql_config)
-
-                if sql_config.include_views:
-                    yield from self.loop_views(inspector, schema, sql_config)
-
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
+            else:
+                for schema in schemas:
+                    with PerfTimer() as timer:
+                        yield from self._get_schema_workunits(
+                            inspector,
+                            db_name,
+                            schema,
+                            profile_requests,
+                            profiler is not None,
+                        )
+                    self.report.report_schema_introspection(
+                        f"{db_name}.{schema}", timer.elapsed_seconds()
                     )
 
             if profiler and profile_requests:
@@ -517,6 +571,122 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                     profile_requests, profiler, platform=self.platform
                 )
 
+    def _get_schema_workunits(
+        self,
+        inspector: Inspector,
+        db_name: str,
+        schema: str,
+        profile_requests: List["GEProfilerRequest"],
+        include_profile_requests: bool,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        try:
+            yield from self._get_schema_workunits_inner(
+                inspector, db_name, schema, profile_requests, include_profile_requests
+            )
+        finally:
+            with self._bulk_reflections_lock:
+                self._bulk_reflections.pop((db_name, schema), None)
+
+    def _get_schema_workunits_inner(
+        self,
+        inspector: Inspector,
+        db_name: str,
+        schema: str,
+        profile_requests: List["GEProfilerRequest"],
+        include_profile_requests: bool,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        sql_config = self.config
+        self.add_information_for_schema(inspector, schema)
+
+        yield from self.gen_schema_containers(
+            database=db_name,
+            schema=schema,
+            extra_properties=self.get_schema_properties(
+                inspector=inspector, schema=schema, database=db_name
+            ),
+        )
+
+        if sql_config.include_tables:
+            yield from self.loop_tables(inspector, schema, sql_config)
+
+        if sql_config.include_views:
+            yield from self.loop_views(inspector, schema, sql_config)
+
+        if include_profile_requests:
+            profile_requests += list(
+                self.loop_profiler_requests(inspector, schema, sql_config)
+            )
+
+    def _get_schema_workunits_concurrently(
+        self,
+        inspector: Inspector,
+        db_name: str,
+        schemas: Iterable[str],
+        profile_requests: List["GEProfilerRequest"],
+        include_profile_requests: bool,
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        """
+        Extracts the metadata of several schemas at once, each over a connection
+        of its own. A schema's workunits are buffered until it is done, and are
+        then emitted in the order of the schemas. Only a few schemas are
+        extracted ahead of the one being emitted, to bound the buffered workunits.
+        """
+
+        def extract_schema(
+            schema: str,
+        ) -> Tuple[
+            List[Union[MetadataWorkUnit, SqlWorkUnit]], List["GEProfilerRequest"]
+        ]:
+            schema_profile_requests: List["GEProfilerRequest"] = []
+            with PerfTimer() as timer, self.get_worker_inspector(
+                inspector
+            ) as worker_inspector:
+                workunits = list(
+                    self._get_schema_workunits(
+                        worker_inspector,
+                        db_name,
+                        schema,
+                        schema_profile_requests,
+                        include_profile_requests,
+                    )
+                )
+            self.report.report_schema_introspection(
+                f"{db_name}.{schema}", timer.elapsed_seconds()
+            )
+            return workunits, schema_profile_requests
+
+        max_workers = self.config.schema_introspection_workers
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="schema-introspection"
+        ) as executor:
+            pending: "OrderedDict[str, Future]" = OrderedDict()
+
+            def next_schema_workunits() -> List[Union[MetadataWorkUnit, SqlWorkUnit]]:
+                _, future = pending.popitem(last=False)
+                workunits, schema_profile_requests = future.result()
+                profile_requests.extend(schema_profile_requests)
+                return workunits
+
+            for schema in schemas:
+                pending[schema] = executor.submit(extract_schema, schema)
+                if len(pending) >= 2 * max_workers:
+                    yield from next_schema_workunits()
+            while pending:
+                yield from next_schema_workunits()
+
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        """
+        Opens an inspector over a new connection to the same database as the
+        given inspector, for use by a single introspection thread. Sources that
+        wrap their inspectors should wrap this one in the same way.
+        """
+        with inspector.engine.connect() as conn:
+            yield self.create_inspector(conn)
+
+    def create_inspector(self, conn: Connection) -> Inspector:
+        return inspect(conn)
+
     def standardize_schema_table_names(
         self, schema: str, entity: str
     ) -> Tuple[str, str]:
@@ -678,7 +848,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             ).as_workunit()
 
         extra_tags = self.get_extra_tags(inspector, schema, table)
-        pk_constraints: dict = inspector.get_pk_constraint(table, schema)
+        pk_constraints: dict = self._get_pk_constraint(inspector, schema, table)
         foreign_keys = self._get_foreign_keys(dataset_urn, inspector, schema, table)
         schema_fields = self.get_schema_fields(
             dataset_name, columns, pk_constraints, tags=extra_tags
@@ -780,12 +950,60 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         else:
             return None
 
+    def _get_bulk_reflection(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflection]:
+        """Returns the bulk reflection of the schema, reflecting it on first use.
+        Returns None if bulk reflection is disabled, unsupported or failed, in
+        which case the Inspector should be used."""
+
+        if not self.config.bulk_reflection:
+            return None
+        key = (self.get_db_name(inspector), schema)
+        with self._bulk_reflections_lock:
+            if key in self._bulk_reflections:
+                return self._bulk_reflections[key]
+
+        reflection: Optional[SchemaReflection] = None
+        reflector = get_bulk_reflector(inspector.dialect.name)
+        if reflector is not None:
+            try:
+                with PerfTimer() as timer:
+                    reflection = reflector.reflect_schema(
+                        inspector.bind, inspector.dialect, schema
+                    )
+                logger.debug(
+                    f"Reflected {len(reflection.columns)} tables of {key[0]}.{schema} "
+                    f"in bulk in {timer.elapsed_seconds():.2f} seconds"
+                )
+                self.report.report_bulk_reflection(success=True)
+            except Exception as e:
+                logger.warning(
+                    f"Unable to reflect {key[0]}.{schema} in bulk, "
+                    f"falling back to per-table reflection: {e}"
+                )
+                self.report.report_bulk_reflection(success=False)
+
+        with self._bulk_reflections_lock:
+            self._bulk_reflections[key] = reflection
+        return reflection
+
+    def _get_pk_constraint(self, inspector: Inspector, schema: str, table: str) -> dict:
+        reflection = self._get_bulk_reflection(inspector, schema)
+        if reflection is not None:
+            return reflection.get_pk_constraint(table)
+        return inspector.get_pk_constraint(table, schema)
+
     def _get_columns(
         self, dataset_name: str, inspector: Inspector, schema: str, table: str
     ) -> List[dict]:
         columns = []
         try:
-            columns = inspector.get_columns(table, schema)
+            reflection = self._get_bulk_reflection(inspector, schema)
+            if reflection is not None and table in reflection.columns:
+                columns = reflection.columns[table]
+            else:
+                columns = inspector.get_columns(table, schema)
             if len(columns) == 0:
                 self.report.report_warning(MISSING_COLUMN_INFO, dataset_name)
         except Exception as e:
@@ -798,10 +1016,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     def _get_foreign_keys(
         self, dataset_urn: str, inspector: Inspector, schema: str, table: str
     ) -> List[ForeignKeyConstraint]:
+        reflection = self._get_bulk_reflection(inspector, schema)
         try:
             foreign_keys = [
                 self.get_foreign_key_metadata(dataset_urn, schema, fk_rec, inspector)
-                for fk_rec in inspector.get_foreign_keys(table, schema)
+                for fk_rec in (
+                    reflection.get_foreign_keys(table)
+                    if reflection is not None
+                    else inspector.get_foreign_keys(table, schema)
+                )
             ]
         except KeyError:
             # certain databases like MySQL cause issues due to lower-case/upper-case irregularities
@@ -996,6 +1219,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             report=self.report,
             config=self.config.profiling,
             platform=self.platform,
+            engine_options=self.config.options,
         )
 
     def get_profile_args(self) -> Dict:
@@ -57,6 +57,16 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin):
         default=True, description="Whether tables should be ingested."
     )
 
+    schema_introspection_workers: int = Field(
+        default=1,
+        description="Number of schemas to introspect concurrently, each over its own connection from the SQLAlchemy connection pool. Workunits are still emitted one schema at a time, in the same order as with a single worker.",
+    )
+
+    bulk_reflection: bool = Field(
+        default=False,
+        description="Fetch the columns and constraints of all the tables in a schema with a few information_schema queries, instead of several queries per table. Supported for PostgreSQL, MySQL, MariaDB and Trino; other databases, and tables with column types that can't be mapped, use per-table reflection. The native data types of columns may be formatted slightly differently than with per-table reflection.",
+    )
+
     include_table_location_lineage: bool = Field(
         default=True,
         description="If the source supports it, include table lineage to the underlying storage location.",
@@ -77,6 +87,12 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin):
             values["view_pattern"] = table_pattern
         return values
 
+    @pydantic.validator("schema_introspection_workers")
+    def schema_introspection_workers_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("schema_introspection_workers must be at least 1")
+        return v
+
     @pydantic.root_validator()
     def ensure_profiling_pattern_is_passed_to_profiling(
         cls, values: Dict[str, Any]
@@ -19,6 +19,9 @@ from datahub.ingestion.source.sql.sql_config import SQLAlchemyConfig
 
 @dataclass
 class BaseColumn:
+    # Sources may hold the columns of many tables at once.
+    __slots__ = ("name", "ordinal_position", "is_nullable", "data_type", "comment")
+
     name: str
     ordinal_position: int
     is_nullable: bool
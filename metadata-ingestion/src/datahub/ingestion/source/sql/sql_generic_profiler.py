@@ -125,6 +125,7 @@ class GenericProfiler:
             report=self.report,
             config=self.config.profiling,
             platform=self.platform,
+            engine_options=self.config.options,
         )
 
     def is_dataset_eligible_for_profiling(
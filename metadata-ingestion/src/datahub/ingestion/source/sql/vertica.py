@@ -112,6 +112,16 @@ class VerticaConfig(BasicSQLAlchemyConfig):
     def clean_host_port(cls, v):
         return config_clean.remove_protocol(v)
 
+    @validator("schema_introspection_workers")
+    def schema_introspection_workers_not_supported(cls, v: int) -> int:
+        # VerticaSource walks the schemas itself, and its lineage maps are shared
+        # across schemas, so it always introspects one schema at a time.
+        if v > 1:
+            raise ValueError(
+                "schema_introspection_workers is not supported for Vertica, set it to 1"
+            )
+        return v
+
 
 @platform_name("Vertica")
 @config_class(VerticaConfig)
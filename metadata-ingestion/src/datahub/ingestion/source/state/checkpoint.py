@@ -48,7 +48,7 @@ class CheckpointStateBase(ConfigModel):
         """
 
         if self.serde == "utf-8":
-            encoded_bytes = CheckpointStateBase._to_bytes_utf8(self)
+            encoded_bytes = self._to_bytes_utf8()
         elif self.serde == "base85":
             # The original base85 implementation used pickle, which would cause
             # issues with deserialization if we ever changed the state class definition.
@@ -56,7 +56,7 @@ class CheckpointStateBase(ConfigModel):
                 "Cannot write base85 encoded bytes. Use base85-bz2-json instead."
             )
         elif self.serde == "base85-bz2-json":
-            encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+            encoded_bytes = self._to_bytes_base85_json(compressor)
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -67,15 +67,11 @@ class CheckpointStateBase(ConfigModel):
 
         return encoded_bytes
 
-    @staticmethod
-    def _to_bytes_utf8(model: ConfigModel) -> bytes:
-        return model.json(exclude={"version", "serde"}).encode("utf-8")
+    def _to_bytes_utf8(self) -> bytes:
+        return self.json(exclude={"version", "serde"}).encode("utf-8")
 
-    @staticmethod
-    def _to_bytes_base85_json(
-        model: ConfigModel, compressor: Callable[[bytes], bytes]
-    ) -> bytes:
-        return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
+    def _to_bytes_base85_json(self, compressor: Callable[[bytes], bytes]) -> bytes:
+        return base64.b85encode(compressor(self._to_bytes_utf8()))
 
     def prepare_for_commit(self) -> None:
         """
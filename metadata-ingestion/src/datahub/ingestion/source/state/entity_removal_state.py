@@ -1,4 +1,5 @@
-from typing import Any, Dict, Iterable, List, Tuple, Type
+import json
+from typing import Any, Dict, Iterable, List, Type
 
 import pydantic
 
@@ -63,6 +64,14 @@ class GenericCheckpointState(CheckpointStateBase):
     # it isn't JSON serializable.
     _urns_set: set = pydantic.PrivateAttr(default_factory=set)
 
+    @pydantic.root_validator(pre=True, allow_reuse=True)
+    def _decode_front_coded_urns(cls, values: dict) -> dict:
+        if "front_coded_urns" in values:
+            values["urns"] = CheckpointStateUtil.decode_front_coded(
+                values.pop("front_coded_urns")
+            )
+        return values
+
     _migration = pydantic_state_migrator(
         {
             # From SQL:
@@ -83,6 +92,14 @@ class GenericCheckpointState(CheckpointStateBase):
         self.urns = deduplicate_list(self.urns)
         self._urns_set = set(self.urns)
 
+    def _to_bytes_utf8(self) -> bytes:
+        # The urns are stored sorted and front-coded, since urns from the same source
+        # tend to share long prefixes. This keeps large states well below the size
+        # limit, and makes compressing them many times faster.
+        state = json.loads(self.json(exclude={"version", "serde", "urns"}))
+        state["front_coded_urns"] = CheckpointStateUtil.front_code(sorted(self.urns))
+        return json.dumps(state).encode("utf-8")
+
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
         Adds an urn into the list used for tracking the type.
@@ -107,7 +124,9 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream over our urns rather than building new sets, since states can be huge.
+        other_urns = other_checkpoint_state._urns_set
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -127,30 +146,8 @@ class GenericCheckpointState(CheckpointStateBase):
         :param old_checkpoint_state: the old checkpoint state to compute the relative change percent against.
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
-        return compute_percent_entities_changed(
-            [(self.urns, old_checkpoint_state.urns)]
-        )
-
-
-def compute_percent_entities_changed(
-    new_old_entity_list: List[Tuple[List[str], List[str]]]
-) -> float:
-    old_count_all = 0
-    overlap_count_all = 0
-    for new_entities, old_entities in new_old_entity_list:
-        (overlap_count, old_count, _,) = get_entity_overlap_and_cardinalities(
-            new_entities=new_entities, old_entities=old_entities
-        )
-        overlap_count_all += overlap_count
-        old_count_all += old_count
-    if old_count_all:
-        return (1 - overlap_count_all / old_count_all) * 100.0
-    return 0.0
-
-
-def get_entity_overlap_and_cardinalities(
-    new_entities: List[str], old_entities: List[str]
-) -> Tuple[int, int, int]:
-    new_set = set(new_entities)
-    old_set = set(old_entities)
-    return len(new_set.intersection(old_set)), len(old_set), len(new_set)
+        old_urns = old_checkpoint_state._urns_set
+        if not old_urns:
+            return 0.0
+        overlap_count = sum(1 for urn in old_urns if urn in self._urns_set)
+        return (1 - overlap_count / len(old_urns)) * 100.0
@@ -1,6 +1,15 @@
+import base64
+import bz2
+import hashlib
+import json
 import logging
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import pydantic
+from pydantic.fields import Field
 
 from datahub.configuration.common import ConfigurationError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -11,21 +20,48 @@ from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
     JobId,
 )
 from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
-from datahub.metadata.schema_classes import DatahubIngestionCheckpointClass, StatusClass
+from datahub.metadata.schema_classes import (
+    DatahubIngestionCheckpointClass,
+    IngestionCheckpointStateClass,
+    StatusClass,
+)
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 
 logger = logging.getLogger(__name__)
 
+# The serde of the checkpoint that lists the shards of a sharded state.
+SHARDED_STATE_SERDE = "sharded-json"
+
+_MAX_SHARD_FETCH_WORKERS = 8
+
 
 class DatahubIngestionStateProviderConfig(IngestionCheckpointingProviderConfig):
     datahub_api: Optional[DatahubClientConfig] = DatahubClientConfig()
+    num_shards: int = Field(
+        default=1,
+        description="Number of checkpoint aspects to split the urns of each job's state across, by urn hash. "
+        "Only the shards whose urns changed since the last run are rewritten, and shards are fetched in parallel. "
+        "Each shard must fit in a single aspect, so max_checkpoint_state_size can be raised accordingly. "
+        "States without urns are never sharded.",
+    )
+
+    @pydantic.validator("num_shards")
+    def num_shards_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("num_shards must be at least 1")
+        return v
 
 
 class DatahubIngestionCheckpointingProvider(IngestionCheckpointingProviderBase):
     orchestrator_name: str = "datahub"
 
-    def __init__(self, graph: DataHubGraph, name: str):
+    def __init__(self, graph: DataHubGraph, name: str, num_shards: int = 1):
         super().__init__(name)
         self.graph = graph
+        self.num_shards = num_shards
+        # The digests of the shards of the last committed state of each job, so that
+        # unchanged shards aren't rewritten.
+        self._last_shard_digests: Dict[JobId, List[str]] = {}
         if not self._is_server_stateful_ingestion_capable():
             raise ConfigurationError(
                 "Datahub server is not capable of supporting stateful ingestion."
@@ -38,14 +74,17 @@ class DatahubIngestionCheckpointingProvider(IngestionCheckpointingProviderBase):
     ) -> "DatahubIngestionCheckpointingProvider":
         if ctx.graph:
             # Use the pipeline-level graph if set
-            return cls(ctx.graph, name)
+            provider_config = DatahubIngestionStateProviderConfig.parse_obj(
+                config_dict or {}
+            )
+            return cls(ctx.graph, name, provider_config.num_shards)
         elif config_dict is None:
             raise ConfigurationError("Missing provider configuration.")
         else:
             provider_config = DatahubIngestionStateProviderConfig.parse_obj(config_dict)
             if provider_config.datahub_api:
                 graph = DataHubGraph(provider_config.datahub_api)
-                return cls(graph, name)
+                return cls(graph, name, provider_config.num_shards)
             else:
                 raise ConfigurationError(
                     "Missing datahub_api. Provide either a global one or under the state_provider."
@@ -80,6 +119,10 @@ class DatahubIngestionCheckpointingProvider(IngestionCheckpointingProviderBase):
                 "pipelineName": pipeline_name,
             },
         )
+        if latest_checkpoint and latest_checkpoint.state.serde == SHARDED_STATE_SERDE:
+            latest_checkpoint = self._get_sharded_checkpoint(
+                pipeline_name, job_name, latest_checkpoint
+            )
         if latest_checkpoint:
             logger.debug(
                 f"The last committed ingestion checkpoint for pipelineName:'{pipeline_name}',"
@@ -115,21 +158,9 @@ class DatahubIngestionCheckpointingProvider(IngestionCheckpointingProviderBase):
                 job_name,
             )
 
-            self.graph.emit_mcp(
-                # We don't want the state payloads to show up in search. As such, we emit the
-                # dataJob aspects as soft-deleted. This doesn't affect the ability to query
-                # them using the timeseries API.
-                MetadataChangeProposalWrapper(
-                    entityUrn=datajob_urn,
-                    aspect=StatusClass(removed=True),
-                )
-            )
-            self.graph.emit_mcp(
-                MetadataChangeProposalWrapper(
-                    entityUrn=datajob_urn,
-                    aspect=checkpoint,
-                )
-            )
+            if self.num_shards > 1:
+                checkpoint = self._commit_shards(job_name, checkpoint)
+            self._emit_checkpoint(datajob_urn, checkpoint)
 
             self.committed = True
 
@@ -137,3 +168,171 @@ class DatahubIngestionCheckpointingProvider(IngestionCheckpointingProviderBase):
                 f"Committed ingestion checkpoint for pipeline:'{checkpoint.pipelineName}', "
                 f"job:'{job_name}'"
             )
+
+    def _emit_checkpoint(
+        self, datajob_urn: str, checkpoint: DatahubIngestionCheckpointClass
+    ) -> None:
+        self.graph.emit_mcp(
+            # We don't want the state payloads to show up in search. As such, we emit the
+            # dataJob aspects as soft-deleted. This doesn't affect the ability to query
+            # them using the timeseries API.
+            MetadataChangeProposalWrapper(
+                entityUrn=datajob_urn,
+                aspect=StatusClass(removed=True),
+            )
+        )
+        self.graph.emit_mcp(
+            MetadataChangeProposalWrapper(
+                entityUrn=datajob_urn,
+                aspect=checkpoint,
+            )
+        )
+
+    def _get_shard_urn(self, pipeline_name: str, job_name: JobId, shard: int) -> str:
+        return self.get_data_job_urn(
+            self.orchestrator_name, pipeline_name, JobId(f"{job_name}_shard_{shard}")
+        )
+
+    @staticmethod
+    def _decode_state(state: IngestionCheckpointStateClass) -> Optional[dict]:
+        if state.payload is None:
+            return None
+        if state.serde == "utf-8":
+            return json.loads(state.payload.decode("utf-8"))
+        elif state.serde == "base85-bz2-json":
+            return json.loads(bz2.decompress(base64.b85decode(state.payload)))
+        return None
+
+    def _commit_shards(
+        self, job_name: JobId, checkpoint: DatahubIngestionCheckpointClass
+    ) -> DatahubIngestionCheckpointClass:
+        """
+        Splits the urns of the checkpoint's state across shards, and emits the shards
+        that changed since the last committed state. Returns the checkpoint that
+        lists the shards, which should be emitted last. States without urns are
+        returned as is.
+        """
+        state = self._decode_state(checkpoint.state)
+        if state is None or not ("urns" in state or "front_coded_urns" in state):
+            return checkpoint
+
+        urns = state.pop("urns", None)
+        if urns is None:
+            urns = CheckpointStateUtil.decode_front_coded(state.pop("front_coded_urns"))
+        shards: List[List[str]] = [[] for _ in range(self.num_shards)]
+        for urn in urns:
+            shards[zlib.crc32(urn.encode("utf-8")) % self.num_shards].append(urn)
+
+        last_digests = self._last_shard_digests.get(job_name, [])
+        digests: List[str] = []
+        num_written = 0
+        for i, shard_urns in enumerate(shards):
+            shard_bytes = json.dumps(
+                {"front_coded_urns": CheckpointStateUtil.front_code(sorted(shard_urns))}
+            ).encode("utf-8")
+            digest = hashlib.sha256(shard_bytes).hexdigest()
+            digests.append(digest)
+            if i < len(last_digests) and last_digests[i] == digest:
+                continue
+
+            self._emit_checkpoint(
+                self._get_shard_urn(checkpoint.pipelineName, job_name, i),
+                DatahubIngestionCheckpointClass(
+                    timestampMillis=checkpoint.timestampMillis,
+                    pipelineName=checkpoint.pipelineName,
+                    platformInstanceId=checkpoint.platformInstanceId,
+                    runId=checkpoint.runId,
+                    config=checkpoint.config,
+                    state=IngestionCheckpointStateClass(
+                        formatVersion=checkpoint.state.formatVersion,
+                        serde="base85-bz2-json",
+                        payload=base64.b85encode(bz2.compress(shard_bytes)),
+                    ),
+                ),
+            )
+            num_written += 1
+        logger.info(
+            f"Committed {num_written} of {self.num_shards} checkpoint shards for job:'{job_name}'"
+        )
+        self._last_shard_digests[job_name] = digests
+
+        return DatahubIngestionCheckpointClass(
+            timestampMillis=checkpoint.timestampMillis,
+            pipelineName=checkpoint.pipelineName,
+            platformInstanceId=checkpoint.platformInstanceId,
+            runId=checkpoint.runId,
+            config=checkpoint.config,
+            state=IngestionCheckpointStateClass(
+                formatVersion=checkpoint.state.formatVersion,
+                serde=SHARDED_STATE_SERDE,
+                payload=json.dumps({"state": state, "shards": digests}).encode("utf-8"),
+            ),
+        )
+
+    def _get_sharded_checkpoint(
+        self,
+        pipeline_name: str,
+        job_name: JobId,
+        manifest: DatahubIngestionCheckpointClass,
+    ) -> Optional[DatahubIngestionCheckpointClass]:
+        """
+        Fetches the shards listed by the checkpoint in parallel, and reassembles
+        the state. Returns None if any shard is missing or doesn't match the
+        checkpoint, e.g. because a commit was interrupted.
+        """
+        assert manifest.state.payload is not None
+        sharded_state = json.loads(manifest.state.payload.decode("utf-8"))
+        digests: List[str] = sharded_state["shards"]
+
+        def fetch_shard(shard: int) -> Optional[DatahubIngestionCheckpointClass]:
+            return self.graph.get_latest_timeseries_value(
+                entity_urn=self._get_shard_urn(pipeline_name, job_name, shard),
+                aspect_type=DatahubIngestionCheckpointClass,
+                filter_criteria_map={
+                    "pipelineName": pipeline_name,
+                },
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(digests), _MAX_SHARD_FETCH_WORKERS)
+        ) as executor:
+            shard_checkpoints = list(executor.map(fetch_shard, range(len(digests))))
+
+        urns: List[str] = []
+        for i, shard_checkpoint in enumerate(shard_checkpoints):
+            shard_bytes = (
+                bz2.decompress(base64.b85decode(shard_checkpoint.state.payload))
+                if shard_checkpoint is not None
+                and shard_checkpoint.state.payload is not None
+                else None
+            )
+            if (
+                shard_bytes is None
+                or hashlib.sha256(shard_bytes).hexdigest() != digests[i]
+            ):
+                logger.warning(
+                    f"Checkpoint shard {i} of pipelineName:'{pipeline_name}', job_name:'{job_name}' "
+                    "is missing or out of date; ignoring the last checkpoint"
+                )
+                return None
+            urns.extend(
+                CheckpointStateUtil.decode_front_coded(
+                    json.loads(shard_bytes)["front_coded_urns"]
+                )
+            )
+        self._last_shard_digests[job_name] = digests
+
+        state = sharded_state["state"]
+        state["urns"] = urns
+        return DatahubIngestionCheckpointClass(
+            timestampMillis=manifest.timestampMillis,
+            pipelineName=manifest.pipelineName,
+            platformInstanceId=manifest.platformInstanceId,
+            runId=manifest.runId,
+            config=manifest.config,
+            state=IngestionCheckpointStateClass(
+                formatVersion=manifest.state.formatVersion,
+                serde="utf-8",
+                payload=json.dumps(state).encode("utf-8"),
+            ),
+        )
@@ -1,10 +1,25 @@
+import dataclasses
 import json
 import logging
 import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dateutil.parser as dp
 import tableauserverclient as TSC
@@ -78,6 +93,10 @@ from datahub.ingestion.source.tableau_common import (
     tableau_field_to_schema_field,
     workbook_graphql_query,
 )
+from datahub.ingestion.source.tableau_state import (
+    TableauCheckpointState,
+    TableauIncrementalHandler,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.common import (
     AuditStamp,
     ChangeAuditStamps,
@@ -123,6 +142,9 @@ from datahub.metadata.schema_classes import (
     ViewPropertiesClass,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
+from datahub.utilities.urns.urn import guess_entity_type
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -273,7 +295,8 @@ class TableauConfig(
 
     page_size: int = Field(
         default=10,
-        description="[advanced] Number of metadata objects (e.g. CustomSQLTable, PublishedDatasource, etc) to query at a time using the Tableau API.",
+        description="[advanced] Number of metadata objects (e.g. CustomSQLTable, PublishedDatasource, etc) to query at a time using the Tableau API. "
+        "Pages that exceed the API's node limit are fetched again in halves, and the page size is reduced for the rest of the query.",
     )
     # We've found that even with a small workbook page size (e.g. 10), the Tableau API often
     # returns warnings like this:
@@ -293,6 +316,14 @@ class TableauConfig(
         description="[advanced] Number of workbooks to query at a time using the Tableau API.",
     )
 
+    max_concurrent_queries: int = Field(
+        default=1,
+        description="[advanced] Number of Tableau Metadata API queries to run at once. "
+        "Once the first page of a query returns the total count of objects, its other pages are fetched in parallel, "
+        "and sheets, dashboards and embedded data sources are queried at the same time. "
+        "Objects are still emitted in the same order.",
+    )
+
     env: str = Field(
         default=builder.DEFAULT_ENV,
         description="Environment to use in namespace when constructing URNs.",
@@ -312,6 +343,20 @@ class TableauConfig(
         default=None, description=""
     )
 
+    incremental_ingestion: bool = Field(
+        default=False,
+        description="Only ingest the workbooks, with their sheets, dashboards and embedded data sources, and the published data sources "
+        "that were created or updated since the previous run, based on their updatedAt, which is stored in the stateful ingestion checkpoint. "
+        "The entities of unchanged workbooks are kept in the checkpoint, so that they aren't removed as stale. Requires stateful_ingestion.",
+    )
+
+    full_resync_interval: int = Field(
+        default=10,
+        description="With incremental_ingestion, every this many runs, all workbooks and published data sources are ingested. "
+        "Until then, published data sources, custom SQL queries and tables that are no longer used aren't removed as stale, "
+        "and the usage statistics of unchanged workbooks aren't updated.",
+    )
+
     ingest_embed_url: Optional[bool] = Field(
         default=True,
         description="Ingest a URL to render an embedded Preview of assets within Tableau.",
@@ -327,6 +372,29 @@ class TableauConfig(
         description="[Experimental] Whether to extract lineage from unsupported custom sql queries using SQL parsing",
     )
 
+    @validator("max_concurrent_queries")
+    def max_concurrent_queries_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("max_concurrent_queries must be at least 1")
+        return v
+
+    @validator("full_resync_interval")
+    def full_resync_interval_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("full_resync_interval must be at least 1")
+        return v
+
+    @root_validator(pre=False)
+    def incremental_ingestion_stateful_option_validator(cls, values: Dict) -> Dict:
+        sti = values.get("stateful_ingestion")
+        if not sti or not sti.enabled:
+            if values.get("incremental_ingestion"):
+                logger.warning(
+                    "Stateful ingestion is disabled, disabling incremental_ingestion config option as well"
+                )
+                values["incremental_ingestion"] = False
+        return values
+
     # pre = True because we want to take some decision before pydantic initialize the configuration to default values
     @root_validator(pre=True)
     def projects_backward_compatibility(cls, values: Dict) -> Dict:
@@ -370,6 +438,144 @@ class TableauProject:
     path: List[str]
 
 
+@dataclass
+class TableauSourceReport(StaleEntityRemovalSourceReport):
+    # Metadata API queries, and their latency, per connection type
+    num_metadata_queries: TopKDict[str, int] = dataclasses.field(
+        default_factory=int_top_k_dict
+    )
+    metadata_query_sec: TopKDict[str, float] = dataclasses.field(
+        default_factory=lambda: TopKDict(float)
+    )
+    metadata_query_max_sec: TopKDict[str, float] = dataclasses.field(
+        default_factory=lambda: TopKDict(float)
+    )
+    # Page sizes that were reduced after exceeding the node limit
+    reduced_page_sizes: Dict[str, int] = dataclasses.field(default_factory=dict)
+    # Whether only the changed workbooks and published data sources were ingested
+    incremental_run: bool = False
+    num_unchanged_workbooks: int = 0
+
+
+class _NodeLimitExceededError(Exception):
+    pass
+
+
+@dataclass
+class _ConnectionObjectPage:
+    nodes: List[dict]
+    total_count: int
+    has_next_page: bool
+
+
+class _ConnectionQuery(Iterable[dict]):
+    """
+    The objects of a Metadata API connection query, fetched a page at a time.
+
+    With an executor, the first page is requested as soon as the query is
+    created. Once it returns the total count of objects, the other pages are
+    fetched in parallel, a few pages ahead of the one being read, and are read
+    in order. A page that exceeds the node limit is fetched again in halves, and
+    the rest of the query uses the smaller page size.
+    """
+
+    def __init__(
+        self,
+        source: "TableauSource",
+        query: str,
+        connection_type: str,
+        query_filter: str,
+        page_size: int,
+        executor: Optional[ThreadPoolExecutor],
+        max_pages_ahead: int,
+    ):
+        self.source = source
+        self.query = query
+        self.connection_type = connection_type
+        self.query_filter = query_filter
+        self.page_size = page_size
+        self.executor = executor
+        self.max_pages_ahead = max_pages_ahead
+
+        self._first_count = page_size
+        self._first_page: Optional["Future[_ConnectionObjectPage]"] = None
+        if executor is not None:
+            self._first_page = executor.submit(self._fetch_page, 0, page_size)
+
+    def __iter__(self) -> Iterator[dict]:
+        if self._first_page is not None:
+            page = self._first_page.result()
+        else:
+            page = self._fetch_page(0, self._first_count)
+        offset = self._first_count
+        total_count = page.total_count
+        has_next_page = page.has_next_page
+        yield from page.nodes
+
+        if self.executor is not None and has_next_page and offset < total_count:
+            pending: Deque["Future[_ConnectionObjectPage]"] = deque()
+            try:
+                while pending or offset < total_count:
+                    while offset < total_count and len(pending) < self.max_pages_ahead:
+                        count = min(self.page_size, total_count - offset)
+                        pending.append(
+                            self.executor.submit(self._fetch_page, offset, count)
+                        )
+                        offset += count
+                    page = pending.popleft().result()
+                    yield from page.nodes
+            finally:
+                for future in pending:
+                    future.cancel()
+            # objects may have been added in the meantime
+            total_count = max(total_count, page.total_count)
+            has_next_page = page.has_next_page
+
+        while has_next_page:
+            count = (
+                self.page_size
+                if offset + self.page_size < total_count
+                else total_count - offset
+            )
+            page = self._fetch_page(offset, count)
+            offset += count
+            total_count = page.total_count
+            has_next_page = page.has_next_page
+            yield from page.nodes
+
+    def _fetch_page(self, offset: int, count: int) -> _ConnectionObjectPage:
+        try:
+            (
+                connection_object,
+                total_count,
+                has_next_page,
+            ) = self.source.get_connection_object_page(
+                self.query, self.connection_type, self.query_filter, count, offset
+            )
+        except _NodeLimitExceededError:
+            # only raised for pages of more than one object
+            half = count // 2
+            if half < self.page_size:
+                logger.info(
+                    f"Query {self.connection_type} exceeded the node limit, reducing its page size to {half}"
+                )
+                self.page_size = half
+                self.source.report.reduced_page_sizes[self.connection_type] = half
+            first = self._fetch_page(offset, half)
+            second = self._fetch_page(offset + half, count - half)
+            return _ConnectionObjectPage(
+                nodes=first.nodes + second.nodes,
+                total_count=second.total_count,
+                has_next_page=second.has_next_page,
+            )
+
+        return _ConnectionObjectPage(
+            nodes=connection_object.get(tableau_constant.NODES, []),
+            total_count=total_count,
+            has_next_page=has_next_page,
+        )
+
+
 @platform_name("Tableau")
 @config_class(TableauConfig)
 @support_status(SupportStatus.INCUBATING)
@@ -389,7 +595,7 @@ class TableauProject:
 @capability(SourceCapability.LINEAGE_COARSE, "Enabled by default")
 class TableauSource(StatefulIngestionSourceBase):
     config: TableauConfig
-    report: StaleEntityRemovalSourceReport
+    report: TableauSourceReport
     platform = "tableau"
     server: Optional[Server]
     upstream_tables: Dict[str, Tuple[Any, Optional[str], bool]] = {}
@@ -397,6 +603,8 @@ class TableauSource(StatefulIngestionSourceBase):
     tableau_project_registry: Dict[str, TableauProject] = {}
     workbook_project_map: Dict[str, str] = {}
     datasource_project_map: Dict[str, str] = {}
+    workbook_updated_at: Dict[str, str] = {}
+    datasource_updated_at: Dict[str, str] = {}
 
     def __hash__(self):
         return id(self)
@@ -409,13 +617,18 @@ class TableauSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
 
         self.config = config
-        self.report = StaleEntityRemovalSourceReport()
+        self.report = TableauSourceReport()
         self.server = None
+        # Runs the Metadata API queries, see max_concurrent_queries.
+        self._query_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
         self.upstream_tables = {}
         self.tableau_stat_registry = {}
         self.tableau_project_registry = {}
         self.workbook_project_map = {}
         self.datasource_project_map = {}
+        self.workbook_updated_at = {}
+        self.datasource_updated_at = {}
 
         # This list keeps track of sheets in workbooks so that we retrieve those
         # when emitting sheets.
@@ -433,6 +646,21 @@ class TableauSource(StatefulIngestionSourceBase):
         # when emitting custom SQL data sources.
         self.custom_sql_ids_being_used: List[str] = []
 
+        # Create and register the stateful ingestion use-case handlers.
+        self.stale_entity_removal_handler = StaleEntityRemovalHandler.create(
+            self, self.config, self.ctx
+        )
+        self.incremental_handler: Optional[TableauIncrementalHandler] = (
+            TableauIncrementalHandler(self, self.config, ctx.pipeline_name, ctx.run_id)
+            if self.config.incremental_ingestion
+            else None
+        )
+        self.incremental_state: Optional[TableauCheckpointState] = None
+        # In an incremental run, the luids of the workbooks and of the published data
+        # sources that changed since the previous run. None if everything is ingested.
+        self.changed_workbook_luids: Optional[List[str]] = None
+        self.changed_datasource_luids: Optional[List[str]] = None
+
         self._authenticate()
 
     def close(self) -> None:
@@ -570,6 +798,8 @@ class TableauSource(StatefulIngestionSourceBase):
                 )
                 continue
             self.datasource_project_map[ds.id] = ds.project_id
+            if ds.updated_at:
+                self.datasource_updated_at[ds.id] = ds.updated_at.isoformat()
 
     def _init_workbook_registry(self) -> None:
         if self.server is None:
@@ -583,6 +813,8 @@ class TableauSource(StatefulIngestionSourceBase):
                 )
                 continue
             self.workbook_project_map[wb.id] = wb.project_id
+            if wb.updated_at:
+                self.workbook_updated_at[wb.id] = wb.updated_at.isoformat()
 
     def _populate_projects_registry(self):
         if self.server is None:
@@ -605,6 +837,76 @@ class TableauSource(StatefulIngestionSourceBase):
             f"Tableau workbooks {self.workbook_project_map}",
         )
 
+    def _plan_incremental_run(self) -> None:
+        if self.incremental_handler is None:
+            return
+        self.incremental_state = self.incremental_handler.get_current_state()
+        last_state = self.incremental_handler.get_last_state()
+        if self.incremental_state is None or last_state is None:
+            return
+        if last_state.runs_since_full_resync + 1 >= self.config.full_resync_interval:
+            logger.info("Ingesting all workbooks and published data sources")
+            return
+
+        state = self.incremental_state
+        state.runs_since_full_resync = last_state.runs_since_full_resync + 1
+        self.report.incremental_run = True
+
+        # The entities of unchanged workbooks aren't emitted, so they are added to the
+        # stale entity removal state here. Those of deleted workbooks are not.
+        self.changed_workbook_luids = []
+        for luid in self.workbook_project_map:
+            updated_at = self.workbook_updated_at.get(luid)
+            if (
+                updated_at is None
+                or last_state.workbook_updated_at.get(luid) != updated_at
+                or luid not in last_state.workbook_urns
+            ):
+                self.changed_workbook_luids.append(luid)
+                continue
+            state.workbook_updated_at[luid] = updated_at
+            state.workbook_urns[luid] = last_state.workbook_urns[luid]
+            self.report.num_unchanged_workbooks += 1
+            for urn in last_state.workbook_urns[luid]:
+                self.stale_entity_removal_handler.add_entity_to_state(
+                    guess_entity_type(urn), urn
+                )
+
+        # Published data sources are only ingested if a workbook uses them, so only
+        # those that were ingested before are checked for changes.
+        self.changed_datasource_luids = []
+        for luid, last_updated_at in last_state.datasource_updated_at.items():
+            if luid not in self.datasource_project_map:
+                continue
+            if self.datasource_updated_at.get(luid) != last_updated_at:
+                self.changed_datasource_luids.append(luid)
+            else:
+                state.datasource_updated_at[luid] = last_updated_at
+
+        # Data sources and tables that are no longer used are only removed by the
+        # next full resync.
+        for urn in last_state.shared_urns:
+            state.add_urn(urn)
+            self.stale_entity_removal_handler.add_entity_to_state(
+                guess_entity_type(urn), urn
+            )
+
+        logger.info(
+            f"Ingesting {len(self.changed_workbook_luids)} changed workbooks and "
+            f"{len(self.changed_datasource_luids)} changed published data sources"
+        )
+
+    def _track_urns(
+        self, workunits: Iterable[MetadataWorkUnit], workbook: Optional[dict] = None
+    ) -> Iterable[MetadataWorkUnit]:
+        # Records the urns of the emitted entities in the incremental ingestion
+        # state, under their workbook if they belong to one.
+        workbook_luid = workbook.get(tableau_constant.LUID) if workbook else None
+        for wu in workunits:
+            if self.incremental_state is not None and wu.is_primary_source:
+                self.incremental_state.add_urn(wu.get_urn(), workbook_luid)
+            yield wu
+
     def _authenticate(self):
         try:
             self.server = self.config.make_tableau_client()
@@ -638,10 +940,12 @@ class TableauSource(StatefulIngestionSourceBase):
         logger.debug(
             f"Query {connection_type} to get {count} objects with offset {offset}"
         )
+        server = self.server
         try:
-            query_data = query_metadata(
-                self.server, query, connection_type, count, offset, query_filter
-            )
+            with PerfTimer() as timer:
+                query_data = query_metadata(
+                    server, query, connection_type, count, offset, query_filter
+                )
         except NonXMLResponseError:
             if not retry_on_auth_error:
                 raise
@@ -649,11 +953,22 @@ class TableauSource(StatefulIngestionSourceBase):
             # If ingestion has been running for over 2 hours, the Tableau
             # temporary credentials will expire. If this happens, this exception
             # will be thrown and we need to re-authenticate and retry.
-            self._authenticate()
+            with self._lock:
+                # unless another query already did
+                if self.server is server:
+                    self._authenticate()
             return self.get_connection_object_page(
                 query, connection_type, query_filter, count, offset, False
             )
 
+        with self._lock:
+            elapsed = timer.elapsed_seconds()
+            self.report.num_metadata_queries[connection_type] += 1
+            self.report.metadata_query_sec[connection_type] += elapsed
+            self.report.metadata_query_max_sec[connection_type] = max(
+                self.report.metadata_query_max_sec[connection_type], elapsed
+            )
+
         if tableau_constant.ERRORS in query_data:
             errors = query_data[tableau_constant.ERRORS]
             if all(
@@ -666,6 +981,15 @@ class TableauSource(StatefulIngestionSourceBase):
                 == tableau_constant.WARNING
                 for error in errors
             ):
+                if count > 1 and any(
+                    (error.get(tableau_constant.EXTENSIONS) or {}).get(
+                        tableau_constant.CODE
+                    )
+                    == tableau_constant.NODE_LIMIT_EXCEEDED
+                    for error in errors
+                ):
+                    # the page only has partial results
+                    raise _NodeLimitExceededError(f"{errors}")
                 self.report.report_warning(key=connection_type, reason=f"{errors}")
             else:
                 raise RuntimeError(f"Query {connection_type} error: {errors}")
@@ -691,32 +1015,15 @@ class TableauSource(StatefulIngestionSourceBase):
     ) -> Iterable[dict]:
         # Calls the get_connection_object_page function to get the objects,
         # and automatically handles pagination.
-
-        page_size = page_size_override or self.config.page_size
-
-        total_count = page_size
-        has_next_page = 1
-        offset = 0
-        while has_next_page:
-            count = (
-                page_size if offset + page_size < total_count else total_count - offset
-            )
-            (
-                connection_objects,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object_page(
-                query,
-                connection_type,
-                query_filter,
-                count,
-                offset,
-            )
-
-            offset += count
-
-            for obj in connection_objects.get(tableau_constant.NODES, []):
-                yield obj
+        return _ConnectionQuery(
+            self,
+            query,
+            connection_type,
+            query_filter,
+            page_size_override or self.config.page_size,
+            self._query_executor,
+            max_pages_ahead=2 * self.config.max_concurrent_queries,
+        )
 
     def emit_workbooks(self) -> Iterable[MetadataWorkUnit]:
         if self.tableau_project_registry:
@@ -725,6 +1032,10 @@ class TableauSource(StatefulIngestionSourceBase):
             ]
             project_names_str: str = json.dumps(project_names)
             projects = f"{tableau_constant.PROJECT_NAME_WITH_IN}: {project_names_str}"
+            if self.changed_workbook_luids is not None:
+                if not self.changed_workbook_luids:
+                    return
+                projects += f", {tableau_constant.LUID_WITH_IN}: {json.dumps(self.changed_workbook_luids)}"
 
             for workbook in self.get_connection_objects(
                 workbook_graphql_query,
@@ -750,7 +1061,17 @@ class TableauSource(StatefulIngestionSourceBase):
                     )
                     continue
 
-                yield from self.emit_workbook_as_container(workbook)
+                yield from self._track_urns(
+                    self.emit_workbook_as_container(workbook), workbook
+                )
+                luid = workbook.get(tableau_constant.LUID)
+                if (
+                    self.incremental_state is not None
+                    and luid in self.workbook_updated_at
+                ):
+                    self.incremental_state.workbook_updated_at[
+                        luid
+                    ] = self.workbook_updated_at[luid]
 
                 for sheet in workbook.get(tableau_constant.SHEETS, []):
                     self.sheet_ids.append(sheet[tableau_constant.ID])
@@ -1608,8 +1929,37 @@ class TableauSource(StatefulIngestionSourceBase):
             tableau_constant.PUBLISHED_DATA_SOURCES_CONNECTION,
             datasource_filter,
         ):
+            self._track_published_datasource(datasource)
+            yield from self.emit_datasource(datasource)
+
+    def emit_changed_published_datasources(self) -> Iterable[MetadataWorkUnit]:
+        # The changed data sources that no changed workbook uses
+        assert self.changed_datasource_luids is not None
+        assert self.incremental_state is not None
+        luids = [
+            luid
+            for luid in self.changed_datasource_luids
+            if luid not in self.incremental_state.datasource_updated_at
+        ]
+        if not luids:
+            return
+        datasource_filter = f"{tableau_constant.LUID_WITH_IN}: {json.dumps(luids)}"
+
+        for datasource in self.get_connection_objects(
+            published_datasource_graphql_query,
+            tableau_constant.PUBLISHED_DATA_SOURCES_CONNECTION,
+            datasource_filter,
+        ):
+            self._track_published_datasource(datasource)
             yield from self.emit_datasource(datasource)
 
+    def _track_published_datasource(self, datasource: dict) -> None:
+        luid = datasource.get(tableau_constant.LUID)
+        if self.incremental_state is not None and luid in self.datasource_updated_at:
+            self.incremental_state.datasource_updated_at[
+                luid
+            ] = self.datasource_updated_at[luid]
+
     def emit_upstream_tables(self) -> Iterable[MetadataWorkUnit]:
         for (
             table_urn,
@@ -1722,16 +2072,20 @@ class TableauSource(StatefulIngestionSourceBase):
             entityUrn=sheet_urn,
         ).as_workunit()
 
-    def emit_sheets(self) -> Iterable[MetadataWorkUnit]:
+    def get_sheets(self) -> Iterable[dict]:
         sheets_filter = f"{tableau_constant.ID_WITH_IN}: {json.dumps(self.sheet_ids)}"
 
-        for sheet in self.get_connection_objects(
+        return self.get_connection_objects(
             sheet_graphql_query,
             tableau_constant.SHEETS_CONNECTION,
             sheets_filter,
-        ):
-            yield from self.emit_sheets_as_charts(
-                sheet, sheet.get(tableau_constant.WORKBOOK)
+        )
+
+    def emit_sheets(self, sheets: Iterable[dict]) -> Iterable[MetadataWorkUnit]:
+        for sheet in sheets:
+            workbook = sheet.get(tableau_constant.WORKBOOK)
+            yield from self._track_urns(
+                self.emit_sheets_as_charts(sheet, workbook), workbook
             )
 
     def emit_sheets_as_charts(
@@ -2034,18 +2388,22 @@ class TableauSource(StatefulIngestionSourceBase):
             mcp=mcp,
         )
 
-    def emit_dashboards(self) -> Iterable[MetadataWorkUnit]:
+    def get_dashboards(self) -> Iterable[dict]:
         dashboards_filter = (
             f"{tableau_constant.ID_WITH_IN}: {json.dumps(self.dashboard_ids)}"
         )
 
-        for dashboard in self.get_connection_objects(
+        return self.get_connection_objects(
             dashboard_graphql_query,
             tableau_constant.DASHBOARDS_CONNECTION,
             dashboards_filter,
-        ):
-            yield from self.emit_dashboard(
-                dashboard, dashboard.get(tableau_constant.WORKBOOK)
+        )
+
+    def emit_dashboards(self, dashboards: Iterable[dict]) -> Iterable[MetadataWorkUnit]:
+        for dashboard in dashboards:
+            workbook = dashboard.get(tableau_constant.WORKBOOK)
+            yield from self._track_urns(
+                self.emit_dashboard(dashboard, workbook), workbook
             )
 
     def emit_dashboard(
@@ -2162,18 +2520,23 @@ class TableauSource(StatefulIngestionSourceBase):
                 dashboard_snapshot.urn,
             )
 
-    def emit_embedded_datasources(self) -> Iterable[MetadataWorkUnit]:
+    def get_embedded_datasources(self) -> Iterable[dict]:
         datasource_filter = f"{tableau_constant.ID_WITH_IN}: {json.dumps(self.embedded_datasource_ids_being_used)}"
 
-        for datasource in self.get_connection_objects(
+        return self.get_connection_objects(
             embedded_datasource_graphql_query,
             tableau_constant.EMBEDDED_DATA_SOURCES_CONNECTION,
             datasource_filter,
-        ):
-            yield from self.emit_datasource(
-                datasource,
-                datasource.get(tableau_constant.WORKBOOK),
-                is_embedded_ds=True,
+        )
+
+    def emit_embedded_datasources(
+        self, datasources: Iterable[dict]
+    ) -> Iterable[MetadataWorkUnit]:
+        for datasource in datasources:
+            workbook = datasource.get(tableau_constant.WORKBOOK)
+            yield from self._track_urns(
+                self.emit_datasource(datasource, workbook, is_embedded_ds=True),
+                workbook,
             )
 
     @lru_cache(maxsize=None)
@@ -2268,38 +2631,73 @@ class TableauSource(StatefulIngestionSourceBase):
     def get_workunit_processors(self) -> List[Optional[MetadataWorkUnitProcessor]]:
         return [
             *super().get_workunit_processors(),
-            StaleEntityRemovalHandler.create(
-                self, self.config, self.ctx
-            ).workunit_processor,
+            self._track_tag_urns,
+            self.stale_entity_removal_handler.workunit_processor,
         ]
 
+    def _track_tag_urns(
+        self, stream: Iterable[MetadataWorkUnit]
+    ) -> Iterable[MetadataWorkUnit]:
+        # Tags are materialized by a workunit processor, after _track_urns has seen
+        # the workunits that reference them. They may be referenced by many
+        # workbooks, so they're recorded as shared urns.
+        for wu in stream:
+            if (
+                self.incremental_state is not None
+                and wu.is_primary_source
+                and guess_entity_type(wu.get_urn()) == "tag"
+            ):
+                self.incremental_state.add_urn(wu.get_urn())
+            yield wu
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         if self.server is None or not self.server.is_signed_in():
             return
+        if self.config.max_concurrent_queries > 1:
+            self._query_executor = ThreadPoolExecutor(
+                max_workers=self.config.max_concurrent_queries,
+                thread_name_prefix="tableau-metadata-query",
+            )
         try:
             # Initialise the dictionary to later look-up for chart and dashboard stat
             if self.config.extract_usage_stats:
                 self._populate_usage_stat_registry()
 
             self._populate_projects_registry()
+            self._plan_incremental_run()
             yield from self.emit_project_containers()
             yield from self.emit_workbooks()
-            if self.sheet_ids:
-                yield from self.emit_sheets()
-            if self.dashboard_ids:
-                yield from self.emit_dashboards()
-            if self.embedded_datasource_ids_being_used:
-                yield from self.emit_embedded_datasources()
+            # These only depend on the workbooks, so with concurrent queries, they
+            # are all queried before any of them is emitted.
+            sheets = self.get_sheets() if self.sheet_ids else None
+            dashboards = self.get_dashboards() if self.dashboard_ids else None
+            embedded_datasources = (
+                self.get_embedded_datasources()
+                if self.embedded_datasource_ids_being_used
+                else None
+            )
+            if sheets is not None:
+                yield from self.emit_sheets(sheets)
+            if dashboards is not None:
+                yield from self.emit_dashboards(dashboards)
+            if embedded_datasources is not None:
+                yield from self.emit_embedded_datasources(embedded_datasources)
             if self.datasource_ids_being_used:
-                yield from self.emit_published_datasources()
+                yield from self._track_urns(self.emit_published_datasources())
+            if self.changed_datasource_luids:
+                yield from self._track_urns(self.emit_changed_published_datasources())
             if self.custom_sql_ids_being_used:
-                yield from self.emit_custom_sql_datasources()
-            yield from self.emit_upstream_tables()
+                yield from self._track_urns(self.emit_custom_sql_datasources())
+            yield from self._track_urns(self.emit_upstream_tables())
         except MetadataQueryException as md_exception:
             self.report.report_failure(
                 key="tableau-metadata",
                 reason=f"Unable to retrieve metadata from tableau. Information: {str(md_exception)}",
             )
+        finally:
+            if self._query_executor is not None:
+                self._query_executor.shutdown(wait=True)
+                self._query_executor = None
 
-    def get_report(self) -> StaleEntityRemovalSourceReport:
+    def get_report(self) -> TableauSourceReport:
         return self.report
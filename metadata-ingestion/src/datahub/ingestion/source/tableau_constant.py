@@ -6,6 +6,8 @@ DATA = "data"
 EXTENSIONS = "extensions"
 SEVERITY = "severity"
 WARNING = "WARNING"
+CODE = "code"
+NODE_LIMIT_EXCEEDED = "NODE_LIMIT_EXCEEDED"
 ERRORS = "errors"
 NODES = "nodes"
 PROJECT_NAME_WITH_IN = "projectNameWithin"
@@ -39,6 +41,7 @@ CALCULATED_FIELD = "CalculatedField"
 FORMULA = "formula"
 CUSTOM_SQL_TABLE_CONNECTION = "customSQLTablesConnection"
 ID_WITH_IN = "idWithin"
+LUID_WITH_IN = "luidWithin"
 DATA_SOURCES = "datasources"
 WORKBOOK = "workbook"
 DATASET = "dataset"
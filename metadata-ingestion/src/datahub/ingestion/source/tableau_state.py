@@ -0,0 +1,133 @@
+import logging
+from typing import Dict, List, Optional, cast
+
+import pydantic
+
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfig,
+    StatefulIngestionConfigBase,
+    StatefulIngestionSourceBase,
+)
+from datahub.ingestion.source.state.use_case_handler import (
+    StatefulIngestionUsecaseHandlerBase,
+)
+from datahub.utilities.dedup_list import deduplicate_list
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TableauCheckpointState(CheckpointStateBase):
+    """
+    The checkpoint state of incremental Tableau ingestion.
+    Stores the updatedAt of the ingested workbooks and published data sources, and
+    the urns that were emitted for them, so that the next run only has to ingest
+    the ones that changed.
+    """
+
+    # The updatedAt of each ingested workbook, by workbook luid
+    workbook_updated_at: Dict[str, str] = pydantic.Field(default_factory=dict)
+    # The urns of the workbook's container, sheets, dashboards and embedded data
+    # sources, by workbook luid
+    workbook_urns: Dict[str, List[str]] = pydantic.Field(default_factory=dict)
+    # The updatedAt of each ingested published data source, by data source luid
+    datasource_updated_at: Dict[str, str] = pydantic.Field(default_factory=dict)
+    # The urns of the published data sources, custom SQL and upstream tables, which
+    # may be used by many workbooks
+    shared_urns: List[str] = pydantic.Field(default_factory=list)
+    # The number of incremental runs since the last run that ingested everything
+    runs_since_full_resync: int = 0
+
+    def add_urn(self, urn: str, workbook_luid: Optional[str] = None) -> None:
+        urns = (
+            self.workbook_urns.setdefault(workbook_luid, [])
+            if workbook_luid
+            else self.shared_urns
+        )
+        # the workunits of an entity are usually emitted one after the other
+        if not urns or urns[-1] != urn:
+            urns.append(urn)
+
+    def prepare_for_commit(self) -> None:
+        self.workbook_urns = {
+            luid: deduplicate_list(urns) for luid, urns in self.workbook_urns.items()
+        }
+        self.shared_urns = deduplicate_list(self.shared_urns)
+
+
+class TableauIncrementalHandler(
+    StatefulIngestionUsecaseHandlerBase[TableauCheckpointState]
+):
+    """
+    The stateful ingestion helper class that keeps the state of incremental Tableau
+    ingestion across runs.
+    """
+
+    def __init__(
+        self,
+        source: StatefulIngestionSourceBase,
+        config: StatefulIngestionConfigBase[StatefulIngestionConfig],
+        pipeline_name: Optional[str],
+        run_id: str,
+    ):
+        self.state_provider = source.state_provider
+        self.stateful_ingestion_config: Optional[
+            StatefulIngestionConfig
+        ] = config.stateful_ingestion
+        self.pipeline_name = pipeline_name
+        self.run_id = run_id
+        self.checkpointing_enabled: bool = (
+            self.state_provider.is_stateful_ingestion_configured()
+        )
+        self._job_id = JobId("tableau_incremental")
+        self.state_provider.register_stateful_ingestion_usecase_handler(self)
+
+    def _ignore_old_state(self) -> bool:
+        return (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_old_state
+        )
+
+    def _ignore_new_state(self) -> bool:
+        return (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_new_state
+        )
+
+    @property
+    def job_id(self) -> JobId:
+        return self._job_id
+
+    def is_checkpointing_enabled(self) -> bool:
+        return self.checkpointing_enabled
+
+    def create_checkpoint(self) -> Optional[Checkpoint[TableauCheckpointState]]:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return None
+
+        assert self.pipeline_name is not None
+        return Checkpoint(
+            job_name=self.job_id,
+            pipeline_name=self.pipeline_name,
+            run_id=self.run_id,
+            state=TableauCheckpointState(),
+        )
+
+    def get_current_state(self) -> Optional[TableauCheckpointState]:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return None
+        cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
+        assert cur_checkpoint is not None
+        return cast(TableauCheckpointState, cur_checkpoint.state)
+
+    def get_last_state(self) -> Optional[TableauCheckpointState]:
+        if not self.is_checkpointing_enabled() or self._ignore_old_state():
+            return None
+        last_checkpoint = self.state_provider.get_last_checkpoint(
+            self.job_id, TableauCheckpointState
+        )
+        if last_checkpoint and last_checkpoint.state:
+            return cast(TableauCheckpointState, last_checkpoint.state)
+
+        return None
@@ -0,0 +1,178 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_Task = Tuple[Future, Callable[..., Any], Tuple[Any, ...], int]
+
+
+class AIMDConcurrencyLimiter:
+    """Limits the number of concurrent requests, adapting the limit with
+    additive increase / multiplicative decrease (AIMD), as in TCP congestion
+    control.
+
+    Every fast, successful request raises the limit by 1/limit, i.e. by about one
+    per round of requests. When the server signals overload, by throttling or by
+    responding slower than `slow_request_threshold_sec` per unit of work, the
+    limit is multiplied by `backoff_ratio`. A request's weight is its number of
+    units of work, e.g. the number of records in a batch write. Only requests started after the last decrease can
+    trigger another one, so that a single burst of slow responses only halves
+    the limit once.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        backoff_ratio: float = 0.5,
+        slow_request_threshold_sec: Optional[float] = None,
+    ):
+        assert 0 < min_limit <= max_limit
+        assert 0 < backoff_ratio < 1
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.backoff_ratio = backoff_ratio
+        self.slow_request_threshold_sec = slow_request_threshold_sec
+
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self.num_decreases = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Blocks until a request may start. Returns the start time, which must
+        be passed to `release`."""
+
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        start = time.monotonic()
+        self._local.start = start
+        return start
+
+    def release(self, start: float, success: bool = True, weight: int = 1) -> float:
+        """Marks a request as done. Returns its latency in seconds."""
+
+        self._local.start = None
+        latency = time.monotonic() - start
+        with self._cond:
+            self._in_flight -= 1
+            if (
+                self.slow_request_threshold_sec is not None
+                and latency > self.slow_request_threshold_sec * max(weight, 1)
+            ):
+                self._decrease(start)
+            elif success and self._limit < self.max_limit:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            self._cond.notify_all()
+        return latency
+
+    def signal_overload(self) -> None:
+        """Reports that the server throttled the request running on this thread."""
+
+        start = getattr(self._local, "start", None)
+        with self._cond:
+            self._decrease(start if start is not None else time.monotonic())
+
+    def _decrease(self, start: float) -> None:
+        if start < self._last_decrease:
+            return
+        new_limit = max(self._limit * self.backoff_ratio, self.min_limit)
+        if new_limit < self._limit:
+            logger.debug(
+                f"Lowering concurrency limit from {int(self._limit)} to {int(new_limit)}"
+            )
+            self._limit = new_limit
+            self.num_decreases += 1
+        self._last_decrease = time.monotonic()
+
+
+class AdaptiveExecutor(Closeable):
+    """Runs tasks on a pool of worker threads, while an AIMDConcurrencyLimiter
+    decides how many of them may run at once.
+
+    Tasks wait in a bounded queue, so `submit` blocks once `max_pending` tasks
+    are waiting. As with ThreadPoolExecutor, futures and their callbacks are
+    completed on the worker threads.
+    """
+
+    def __init__(
+        self,
+        limiter: AIMDConcurrencyLimiter,
+        max_pending: int,
+    ):
+        self.limiter = limiter
+        self._queue: "queue.Queue[Optional[_Task]]" = queue.Queue(maxsize=max_pending)
+        self._threads: List[threading.Thread] = [
+            threading.Thread(
+                target=self._worker, name=f"adaptive-executor-{i}", daemon=True
+            )
+            for i in range(limiter.max_limit)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def in_flight(self) -> int:
+        return self.limiter.in_flight
+
+    def _worker(self) -> None:
+        while True:
+            task = self._queue.get()
+            if task is None:
+                break
+
+            future, fn, args, weight = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            start = self.limiter.acquire()
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                self.limiter.release(start, success=False, weight=weight)
+                future.set_exception(e)
+            else:
+                self.limiter.release(start, weight=weight)
+                future.set_result(result)
+
+    def submit(self, fn: Callable[..., T], *args: Any, weight: int = 1) -> "Future[T]":
+        """Submits a task. Its weight is passed to the limiter, see
+        AIMDConcurrencyLimiter."""
+
+        future: "Future[T]" = Future()
+        self._queue.put((future, fn, args, weight))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        for _ in self._threads:
+            self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def close(self) -> None:
+        self.shutdown(wait=True)
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List, Sequence, Set, Union
 
 from datahub.emitter.mce_builder import dataset_key_to_urn, make_dataset_urn
 from datahub.metadata.schema_classes import DatasetKeyClass
@@ -31,3 +31,37 @@ class CheckpointStateUtil:
     def get_urn_from_encoded_topic(encoded_urn: str) -> str:
         platform, name, env = encoded_urn.split(CheckpointStateUtil.get_separator())
         return make_dataset_urn(platform, name, env)
+
+    @staticmethod
+    def front_code(sorted_strs: Sequence[str]) -> List[Union[int, str]]:
+        """
+        Front-codes a sorted list of strings: every string is replaced by the length of
+        the prefix it shares with the previous one, followed by the rest of it. Since
+        sorted urns share long prefixes, this is much smaller than the plain list, and
+        also compresses faster.
+        """
+        encoded: List[Union[int, str]] = []
+        prev = ""
+        for s in sorted_strs:
+            # Binary search over slice comparisons is much faster than comparing
+            # characters one by one in Python.
+            lo, hi = 0, min(len(prev), len(s))
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if prev[:mid] == s[:mid]:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            encoded.append(lo)
+            encoded.append(s[lo:])
+            prev = s
+        return encoded
+
+    @staticmethod
+    def decode_front_coded(encoded: Sequence[Union[int, str]]) -> List[str]:
+        decoded: List[str] = []
+        prev = ""
+        for i in range(0, len(encoded), 2):
+            prev = prev[: encoded[i]] + encoded[i + 1]  # type: ignore
+            decoded.append(prev)
+        return decoded
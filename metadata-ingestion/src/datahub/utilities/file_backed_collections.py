@@ -1,10 +1,13 @@
 import collections
-import gzip
+import contextlib
+import itertools
 import logging
 import pathlib
 import pickle
 import sqlite3
 import tempfile
+import threading
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from types import TracebackType
@@ -57,38 +60,69 @@ class ConnectionWrapper:
     filename: pathlib.Path
     _directory: Optional[tempfile.TemporaryDirectory]
 
-    def __init__(self, filename: Optional[pathlib.Path] = None):
+    def __init__(self, filename: Optional[pathlib.Path] = None, durable: bool = False):
         self._directory = None
         # Warning: If filename is provided, the file will not be automatically cleaned up
         if not filename:
             self._directory = tempfile.TemporaryDirectory()
             filename = pathlib.Path(self._directory.name) / _DEFAULT_FILE_NAME
 
-        self.conn = sqlite3.connect(filename, isolation_level=None)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = self._connect(filename)
         self.filename = filename
 
-        # These settings are optimized for performance.
         # See https://www.sqlite.org/pragma.html for more information.
-        # Because we're only using these dbs to offload data from memory, we don't need
-        # to worry about data integrity too much.
-        self.conn.execute('PRAGMA locking_mode = "EXCLUSIVE"')
-        self.conn.execute('PRAGMA synchronous = "OFF"')
-        self.conn.execute('PRAGMA journal_mode = "MEMORY"')
+        if durable:
+            # For files that outlive the process, e.g. caches across runs. These
+            # settings keep the file consistent if the process crashes, and let
+            # other processes open it.
+            self.conn.execute('PRAGMA journal_mode = "WAL"')
+            self.conn.execute('PRAGMA synchronous = "NORMAL"')
+        else:
+            # These settings are optimized for performance.
+            # Because we're only using these dbs to offload data from memory, we don't need
+            # to worry about data integrity too much.
+            self.conn.execute('PRAGMA locking_mode = "EXCLUSIVE"')
+            self.conn.execute('PRAGMA synchronous = "OFF"')
+            self.conn.execute('PRAGMA journal_mode = "MEMORY"')
         self.conn.execute(f"PRAGMA journal_size_limit = {100 * 1024 * 1024}")  # 100MB
 
+    def _connect(self, filename: pathlib.Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(filename, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
     def execute(
         self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
     ) -> sqlite3.Cursor:
-        logger.debug(f"Executing <{sql}> ({parameters})")
+        # Formatting the message is costly, so only do it when debug logging is on.
+        logger.debug("Executing <%s> (%s)", sql, parameters)
         return self.conn.execute(sql, parameters)
 
     def executemany(
         self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
     ) -> sqlite3.Cursor:
-        logger.debug(f"Executing many <{sql}> ({parameters})")
+        logger.debug("Executing many <%s> (%s)", sql, parameters)
         return self.conn.executemany(sql, parameters)
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Runs the enclosed statements in a single transaction. Otherwise, every
+        statement, and every row of an executemany, is committed on its own.
+        Nested calls join the outer transaction.
+        """
+        if self.conn.in_transaction:
+            yield
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.execute("COMMIT")
+
     def close(self) -> None:
         self.conn.close()
         if self._directory:
@@ -135,6 +169,12 @@ def _default_deserializer(value: Any) -> Any:
     return pickle.loads(value)
 
 
+# The databases are temporary, so we favor speed over size: zlib at level 1
+# compresses about as well as gzip at its default level 9 here, and avoids the
+# overhead of the gzip header on every value.
+_VALUE_COMPRESSION_LEVEL = 1
+
+
 @dataclass(eq=False)
 class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
     """
@@ -177,13 +217,22 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
         if self.shared_connection:
             self._conn = self.shared_connection
         else:
-            self._conn = ConnectionWrapper()
+            self._conn = self._new_connection()
 
         # We keep a small cache in memory to avoid having to serialize/deserialize
         # data from the database too often. We use an OrderedDict to build
         # a poor-man's LRU cache.
         self._active_object_cache = collections.OrderedDict()
 
+        # The statements are built once, so that sqlite3 can reuse its
+        # prepared statements from the statement cache.
+        columns = ["key", "value", *self.extra_columns.keys()]
+        self._insert_sql = f"""INSERT OR REPLACE INTO {self.tablename} (
+            {', '.join(columns)}
+        ) VALUES ({', '.join(['?'] * len(columns))})"""
+        self._select_value_sql = f"SELECT value FROM {self.tablename} WHERE key = ?"
+        self._delete_sql = f"DELETE FROM {self.tablename} WHERE key = ?"
+
         # Create the table. We're not using "IF NOT EXISTS" because creating
         # the same table twice indicates a client usage error.
         self._conn.execute(
@@ -199,9 +248,14 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
 
         if self.should_compress_value:
             serializer = self.serializer
-            self.serializer = lambda value: gzip.compress(serializer(value))  # type: ignore
+            self.serializer = lambda value: zlib.compress(  # type: ignore
+                serializer(value), _VALUE_COMPRESSION_LEVEL  # type: ignore
+            )
             deserializer = self.deserializer
-            self.deserializer = lambda value: deserializer(gzip.decompress(value))
+            self.deserializer = lambda value: deserializer(zlib.decompress(value))
+
+    def _new_connection(self) -> ConnectionWrapper:
+        return ConnectionWrapper()
 
     def create_indexes(self) -> None:
         if self.indexes_created:
@@ -224,25 +278,30 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
             self._prune_cache(num_items_to_prune)
 
     def _prune_cache(self, num_items_to_prune: int) -> None:
-        items_to_write: List[Tuple[SqliteValue, ...]] = []
-        for _ in range(num_items_to_prune):
-            key, (value, dirty) = self._active_object_cache.popitem(last=False)
-            if dirty:
-                values = [key, self.serializer(value)]
-                for column_serializer in self.extra_columns.values():
-                    values.append(column_serializer(value))
-                items_to_write.append(tuple(values))
+        if num_items_to_prune >= len(self._active_object_cache):
+            items_to_prune = list(self._active_object_cache.items())
+            self._active_object_cache.clear()
+        else:
+            items_to_prune = list(
+                itertools.islice(self._active_object_cache.items(), num_items_to_prune)
+            )
+            for key, _ in items_to_prune:
+                del self._active_object_cache[key]
+
+        column_serializers = list(self.extra_columns.values())
+        items_to_write: List[Tuple[SqliteValue, ...]] = [
+            (
+                key,
+                self.serializer(value),
+                *(column_serializer(value) for column_serializer in column_serializers),
+            )
+            for key, (value, dirty) in items_to_prune
+            if dirty
+        ]
 
         if items_to_write:
-            self._conn.executemany(
-                f"""INSERT OR REPLACE INTO {self.tablename} (
-                    key,
-                    value
-                    {''.join(f', {column_name}' for column_name in self.extra_columns.keys())}
-                )
-                VALUES ({', '.join(['?'] *(2 + len(self.extra_columns)))})""",
-                items_to_write,
-            )
+            with self._conn.transaction():
+                self._conn.executemany(self._insert_sql, items_to_write)
 
     def flush(self) -> None:
         self._prune_cache(len(self._active_object_cache))
@@ -252,9 +311,7 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
             self._active_object_cache.move_to_end(key)
             return self._active_object_cache[key][0]
 
-        cursor = self._conn.execute(
-            f"SELECT value FROM {self.tablename} WHERE key = ?", (key,)
-        )
+        cursor = self._conn.execute(self._select_value_sql, (key,))
         result: Sequence[SqliteValue] = cursor.fetchone()
         if result is None:
             raise KeyError(key)
@@ -272,9 +329,7 @@ class FileBackedDict(MutableMapping[str, _VT], Closeable, Generic[_VT]):
             del self._active_object_cache[key]
             in_cache = True
 
-        n_deleted = self._conn.execute(
-            f"DELETE FROM {self.tablename} WHERE key = ?", (key,)
-        ).rowcount
+        n_deleted = self._conn.execute(self._delete_sql, (key,)).rowcount
         if not in_cache and not n_deleted:
             raise KeyError(key)
 
@@ -381,6 +436,7 @@ class FileBackedList(Generic[_VT]):
 
     _len: int = field(default=0)
     _dict: FileBackedDict[_VT] = field(init=False)
+    _dict_class: Type[FileBackedDict] = FileBackedDict
 
     def __init__(
         self,
@@ -393,7 +449,7 @@ class FileBackedList(Generic[_VT]):
         cache_eviction_batch_size: Optional[int] = None,
     ) -> None:
         self._len = 0
-        self._dict = FileBackedDict[_VT](
+        self._dict = self._dict_class(
             shared_connection=connection,
             serializer=serializer,
             deserializer=deserializer,
@@ -447,3 +503,298 @@ class FileBackedList(Generic[_VT]):
 
     def __del__(self) -> None:
         self.close()
+
+
+class ConcurrentConnectionWrapper(ConnectionWrapper):
+    """
+    A ConnectionWrapper that can be shared between threads.
+
+    The database uses write-ahead logging, so that reads don't block on writes.
+    All writes go through the shared connection and are serialized by a lock,
+    while every thread reads through a connection of its own.
+    """
+
+    def __init__(self, filename: Optional[pathlib.Path] = None, durable: bool = False):
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        super().__init__(filename, durable)
+
+        # Unlike ConnectionWrapper, we can't take an exclusive lock on the file,
+        # since the per-thread connections need to read it.
+        self.conn.execute('PRAGMA locking_mode = "NORMAL"')
+        self.conn.execute('PRAGMA journal_mode = "WAL"')
+
+    def _connect(self, filename: pathlib.Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(filename, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def execute(
+        self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
+    ) -> sqlite3.Cursor:
+        with self._write_lock:
+            return super().execute(sql, parameters)
+
+    def executemany(
+        self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
+    ) -> sqlite3.Cursor:
+        with self._write_lock:
+            return super().executemany(sql, parameters)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._write_lock, super().transaction():
+            yield
+
+    def read(
+        self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
+    ) -> sqlite3.Cursor:
+        """Runs a read-only query on this thread's own connection."""
+        reader: Optional[sqlite3.Connection] = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = self._connect(self.filename)
+            reader.execute('PRAGMA synchronous = "OFF"')
+            self._local.reader = reader
+            with self._readers_lock:
+                self._readers.append(reader)
+
+        logger.debug("Executing read <%s> (%s)", sql, parameters)
+        return reader.execute(sql, parameters)
+
+    def close(self) -> None:
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+        super().close()
+
+
+@dataclass
+class _CacheStripe(Generic[_VT]):
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Same as FileBackedDict._active_object_cache.
+    cache: OrderedDict[str, Tuple[_VT, bool]] = field(
+        default_factory=collections.OrderedDict
+    )
+
+
+@dataclass(eq=False)
+class ConcurrentFileBackedDict(FileBackedDict[_VT]):
+    """
+    A thread-safe variant of FileBackedDict.
+
+    The in-memory cache is split into stripes by key, each with its own lock,
+    so threads working on different keys rarely wait on each other. Reads that
+    miss the cache go to SQLite through a connection per thread. Writes of
+    evicted entries are batched, and serialized across threads.
+
+    A shared_connection must be a ConcurrentConnectionWrapper.
+    """
+
+    num_stripes: int = 16
+
+    _stripes: List[_CacheStripe[_VT]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        assert self.num_stripes > 0, "num_stripes must be positive"
+        if self.shared_connection:
+            assert isinstance(
+                self.shared_connection, ConcurrentConnectionWrapper
+            ), "shared_connection must be a ConcurrentConnectionWrapper"
+
+        super().__post_init__()
+        self._stripes = [_CacheStripe() for _ in range(self.num_stripes)]
+        self._stripe_max_size = max(self.cache_max_size // self.num_stripes, 1)
+        self._stripe_eviction_batch_size = max(
+            self.cache_eviction_batch_size // self.num_stripes, 1
+        )
+
+    def _new_connection(self) -> ConnectionWrapper:
+        return ConcurrentConnectionWrapper()
+
+    @property
+    def _concurrent_conn(self) -> ConcurrentConnectionWrapper:
+        assert isinstance(self._conn, ConcurrentConnectionWrapper)
+        return self._conn
+
+    def _get_stripe(self, key: str) -> _CacheStripe[_VT]:
+        return self._stripes[hash(key) % self.num_stripes]
+
+    def _add_to_stripe(
+        self, stripe: _CacheStripe[_VT], key: str, value: _VT, dirty: bool
+    ) -> None:
+        # Must be called with the stripe's lock held.
+        stripe.cache[key] = value, dirty
+        stripe.cache.move_to_end(key)
+
+        if len(stripe.cache) > self._stripe_max_size or self.cache_max_size == 0:
+            self._prune_stripe(
+                stripe, min(len(stripe.cache), self._stripe_eviction_batch_size)
+            )
+
+    def _prune_stripe(self, stripe: _CacheStripe[_VT], num_items_to_prune: int) -> None:
+        # Must be called with the stripe's lock held, so that other threads
+        # can't miss an entry that's no longer cached but not yet written.
+        items_to_prune = list(
+            itertools.islice(stripe.cache.items(), num_items_to_prune)
+        )
+        for key, _ in items_to_prune:
+            del stripe.cache[key]
+
+        self._write_items(
+            [(key, value) for key, (value, dirty) in items_to_prune if dirty]
+        )
+
+    def _write_items(self, items: List[Tuple[str, _VT]]) -> None:
+        column_serializers = list(self.extra_columns.values())
+        items_to_write: List[Tuple[SqliteValue, ...]] = [
+            (
+                key,
+                self.serializer(value),
+                *(column_serializer(value) for column_serializer in column_serializers),
+            )
+            for key, value in items
+        ]
+
+        if items_to_write:
+            with self._conn.transaction():
+                self._conn.executemany(self._insert_sql, items_to_write)
+
+    def flush(self) -> None:
+        for stripe in self._stripes:
+            with stripe.lock:
+                self._prune_stripe(stripe, len(stripe.cache))
+
+    def _write_dirty(self) -> None:
+        """
+        Writes out the modified entries, so that queries see them. Unlike flush,
+        this keeps them cached.
+        """
+        for stripe in self._stripes:
+            with stripe.lock:
+                dirty_items = [
+                    (key, value)
+                    for key, (value, dirty) in stripe.cache.items()
+                    if dirty
+                ]
+                self._write_items(dirty_items)
+                for key, value in dirty_items:
+                    stripe.cache[key] = value, False
+
+    def __getitem__(self, key: str) -> _VT:
+        stripe = self._get_stripe(key)
+        with stripe.lock:
+            if key in stripe.cache:
+                stripe.cache.move_to_end(key)
+                return stripe.cache[key][0]
+
+            result: Sequence[SqliteValue] = self._concurrent_conn.read(
+                self._select_value_sql, (key,)
+            ).fetchone()
+            if result is None:
+                raise KeyError(key)
+
+            deserialized_result = self.deserializer(result[0])
+            self._add_to_stripe(stripe, key, deserialized_result, False)
+            return deserialized_result
+
+    def __setitem__(self, key: str, value: _VT) -> None:
+        stripe = self._get_stripe(key)
+        with stripe.lock:
+            self._add_to_stripe(stripe, key, value, True)
+
+    def __delitem__(self, key: str) -> None:
+        stripe = self._get_stripe(key)
+        with stripe.lock:
+            in_cache = stripe.cache.pop(key, None) is not None
+            n_deleted = self._conn.execute(self._delete_sql, (key,)).rowcount
+            if not in_cache and not n_deleted:
+                raise KeyError(key)
+
+    def mark_dirty(self, key: str) -> None:
+        stripe = self._get_stripe(key)
+        with stripe.lock:
+            if key in stripe.cache and not stripe.cache[key][1]:
+                stripe.cache[key] = stripe.cache[key][0], True
+
+    def __iter__(self) -> Iterator[str]:
+        cache_keys = set()
+        for stripe in self._stripes:
+            with stripe.lock:
+                cache_keys.update(stripe.cache.keys())
+        yield from cache_keys
+
+        for row in self._concurrent_conn.read(f"SELECT key FROM {self.tablename}"):
+            if row[0] not in cache_keys:
+                yield row[0]
+
+    def items_snapshot(
+        self, cond_sql: Optional[str] = None
+    ) -> Iterator[Tuple[str, _VT]]:
+        self._write_dirty()
+        sql = f"SELECT key, value FROM {self.tablename}"
+        if cond_sql:
+            sql += f" WHERE {cond_sql}"
+
+        for row in self._concurrent_conn.read(sql):
+            yield row[0], self.deserializer(row[1])
+
+    def __len__(self) -> int:
+        # Every cached entry is stored too, once the modified ones are written.
+        self._write_dirty()
+        row = self._concurrent_conn.read(
+            f"SELECT COUNT(*) FROM {self.tablename}"
+        ).fetchone()
+        return row[0]
+
+    def _sql_query(
+        self,
+        query: str,
+        params: Tuple[Any, ...] = (),
+        refs: Optional[List[Union["FileBackedList", "FileBackedDict"]]] = None,
+    ) -> sqlite3.Cursor:
+        self._write_dirty()
+        if refs is not None:
+            for referenced_table in refs:
+                if isinstance(referenced_table, FileBackedList):
+                    referenced_table = referenced_table._dict
+                if isinstance(referenced_table, ConcurrentFileBackedDict):
+                    referenced_table._write_dirty()
+                else:
+                    referenced_table.flush()
+
+        return self._concurrent_conn.read(query, params)
+
+    def close(self) -> None:
+        # The connection is missing if __post_init__ failed its checks.
+        if getattr(self, "_conn", None):
+            if self.shared_connection:  # Connection not owned by this object
+                self.flush()  # Ensure everything is written out
+            else:
+                self._conn.close()
+
+            # This forces all writes to go directly to the DB so they fail immediately.
+            self.cache_max_size = 0
+            self._conn = None  # type: ignore
+
+
+class ConcurrentFileBackedList(FileBackedList[_VT]):
+    """
+    A thread-safe variant of FileBackedList, backed by a ConcurrentFileBackedDict.
+
+    The connection, if provided, must be a ConcurrentConnectionWrapper.
+    """
+
+    _dict_class = ConcurrentFileBackedDict
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._append_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def append(self, value: _VT) -> None:
+        with self._append_lock:
+            index = self._len
+            self._dict[str(index)] = value
+            self._len += 1
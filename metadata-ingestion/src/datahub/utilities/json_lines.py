@@ -0,0 +1,252 @@
+"""
+Reading and writing of newline-delimited JSON files, optionally compressed.
+
+Records are written in frames of up to `frame_size` lines. With compression,
+every frame is an independent gzip member or zstd frame, so the file can be
+decompressed from the start of any frame. The byte offset and the index of the
+first record of every frame are stored in an index sidecar next to the file,
+e.g. mces.jsonl.gz.idx:
+
+    {"num_elements": 2500, "frames": [[0, 0], [81234, 1000], [160001, 2000]]}
+
+This makes the files seekable and splittable: a reader can start at any frame,
+and a file can be split into ranges of frames that are read in parallel.
+"""
+
+import gzip
+import io
+import json
+import logging
+import pathlib
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterator, List, Optional, Tuple, Union
+
+from datahub.configuration.common import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+INDEX_SIDECAR_SUFFIX = ".idx"
+
+_DEFAULT_FRAME_SIZE = 1000
+
+_GZIP_SUFFIX = ".gz"
+_ZSTD_SUFFIX = ".zst"
+_JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+PathLike = Union[str, pathlib.Path]
+
+
+@dataclass
+class JsonLinesIndex:
+    num_elements: int
+    # (byte offset, index of the first record) of every frame.
+    frames: List[Tuple[int, int]] = field(default_factory=list)
+
+
+def is_json_lines_file(path: PathLike) -> bool:
+    name = str(path)
+    for suffix in (_GZIP_SUFFIX, _ZSTD_SUFFIX):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return name.endswith(_JSON_LINES_SUFFIXES)
+
+
+def _get_compression(path: PathLike) -> Optional[str]:
+    name = str(path)
+    if name.endswith(_GZIP_SUFFIX):
+        return "gzip"
+    elif name.endswith(_ZSTD_SUFFIX):
+        return "zstd"
+    return None
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError as e:
+        raise ConfigurationError(
+            "Reading or writing .zst files requires the zstandard package. "
+            "Install it with `pip install 'acryl-datahub[zstd]'`."
+        ) from e
+
+
+def write_index_sidecar(path: PathLike, index: JsonLinesIndex) -> None:
+    obj: dict = {"num_elements": index.num_elements}
+    if index.frames:
+        obj["frames"] = index.frames
+    with open(f"{path}{INDEX_SIDECAR_SUFFIX}", "w") as f:
+        json.dump(obj, f)
+
+
+def read_index_sidecar(path: PathLike) -> Optional[JsonLinesIndex]:
+    try:
+        with open(f"{path}{INDEX_SIDECAR_SUFFIX}", "r") as f:
+            obj = json.load(f)
+        return JsonLinesIndex(
+            num_elements=int(obj["num_elements"]),
+            frames=[(int(offset), int(i)) for offset, i in obj.get("frames", [])],
+        )
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable index sidecar for {path}: {e}")
+        return None
+
+
+class JsonLinesWriter:
+    """
+    Writes records to a JSON-lines file, compressed if the file name ends with
+    .gz or .zst, and writes the index sidecar when closed.
+    """
+
+    def __init__(self, path: PathLike, frame_size: int = _DEFAULT_FRAME_SIZE):
+        self.path = path
+        self.frame_size = frame_size
+        self._compression = _get_compression(path)
+        self._compressor = (
+            _import_zstandard().ZstdCompressor()
+            if self._compression == "zstd"
+            else None
+        )
+        self._file: IO[bytes] = open(path, "wb")
+        self._frame: List[bytes] = []
+        self._index = JsonLinesIndex(num_elements=0)
+
+    def write(self, obj: Any) -> None:
+        self._frame.append(json.dumps(obj).encode() + b"\n")
+        if len(self._frame) >= self.frame_size:
+            self._flush_frame()
+
+    def _flush_frame(self) -> None:
+        if not self._frame:
+            return
+        self._index.frames.append((self._file.tell(), self._index.num_elements))
+        data = b"".join(self._frame)
+        if self._compression == "gzip":
+            data = gzip.compress(data)
+        elif self._compressor is not None:
+            data = self._compressor.compress(data)
+        self._file.write(data)
+        self._index.num_elements += len(self._frame)
+        self._frame = []
+
+    def close(self) -> None:
+        self._flush_frame()
+        self._file.close()
+        write_index_sidecar(self.path, self._index)
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def split_json_lines(
+    path: PathLike, num_splits: int
+) -> Optional[List[Tuple[int, Optional[int], int]]]:
+    """
+    Splits a file into up to num_splits ranges of whole frames. Returns a list of
+    (start offset, end offset or None for the end of the file, first record
+    index), or None if the file has no index sidecar.
+    """
+
+    index = read_index_sidecar(path)
+    if index is None:
+        return None
+    if not index.frames:
+        return [(0, None, 0)]
+
+    frames_per_split = -(-len(index.frames) // max(num_splits, 1))
+    splits: List[Tuple[int, Optional[int], int]] = []
+    for i in range(0, len(index.frames), frames_per_split):
+        start, first_index = index.frames[i]
+        end = (
+            index.frames[i + frames_per_split][0]
+            if i + frames_per_split < len(index.frames)
+            else None
+        )
+        splits.append((start, end, first_index))
+    return splits
+
+
+def iterate_json_lines(
+    path: PathLike,
+    start: int = 0,
+    end: Optional[int] = None,
+    first_index: int = 0,
+) -> Iterator[Tuple[int, Any, int]]:
+    """
+    Yields (record index, record, bytes consumed so far) for the records stored
+    between the start and end byte offsets. For compressed files, start must be
+    the offset of a frame. For uncompressed files, a start offset in the middle
+    of a line skips to the next line.
+    """
+
+    with open(path, "rb") as fp:
+        fp.seek(start)
+        if _get_compression(path) is None:
+            lines: Iterator[bytes] = _iterate_plain_lines(fp, start, end)
+        else:
+            lines = _iterate_compressed_lines(fp, path, end)
+
+        i = first_index
+        for line in lines:
+            if line.strip():
+                yield i, json.loads(line), fp.tell()
+                i += 1
+
+
+def _iterate_plain_lines(
+    fp: IO[bytes], start: int, end: Optional[int]
+) -> Iterator[bytes]:
+    if start > 0:
+        fp.seek(start - 1)
+        if fp.read(1) != b"\n":
+            # Started in the middle of a line, which belongs to the previous range.
+            fp.readline()
+    while end is None or fp.tell() < end:
+        line = fp.readline()
+        if not line:
+            break
+        yield line
+
+
+def _iterate_compressed_lines(
+    fp: IO[bytes], path: PathLike, end: Optional[int]
+) -> Iterator[bytes]:
+    raw: IO[bytes] = fp
+    if end is not None:
+        raw = io.BufferedReader(_BoundedReader(fp, end))
+
+    if _get_compression(path) == "gzip":
+        with gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+            yield from stream
+    else:
+        decompressor = _import_zstandard().ZstdDecompressor()
+        with decompressor.stream_reader(
+            raw, read_across_frames=True, closefd=False
+        ) as stream:
+            yield from io.BufferedReader(stream)
+
+
+class _BoundedReader(io.RawIOBase):
+    """Reads from a file up to, but not including, the end offset."""
+
+    def __init__(self, fp: IO[bytes], end: int):
+        self._fp = fp
+        self._end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        remaining = self._end - self._fp.tell()
+        if remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:remaining]
+        data = self._fp.read(len(view))
+        view[: len(data)] = data
+        return len(data)
@@ -0,0 +1,89 @@
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_Task = Tuple[Future, Callable[..., Any], Tuple[Any, ...]]
+
+
+class PartitionedExecutor(Closeable):
+    """Runs tasks on a fixed pool of worker threads, where all tasks submitted
+    with the same key are run by the same worker in submission order.
+
+    This is useful when tasks for different keys can be processed concurrently,
+    but tasks for the same key (e.g. the same entity) must not be reordered.
+
+    Completed futures are handed back to the submitting thread in completion
+    order via `completed()`. Each worker has a bounded queue, so `submit` blocks
+    once `max_pending_per_worker` tasks are queued for the target worker.
+    """
+
+    def __init__(self, max_workers: int, max_pending_per_worker: int = 100):
+        assert max_workers > 0
+        self.max_workers = max_workers
+
+        self._queues: List["queue.Queue[Optional[_Task]]"] = [
+            queue.Queue(maxsize=max_pending_per_worker) for _ in range(max_workers)
+        ]
+        self._done: "queue.Queue[Future]" = queue.Queue()
+        self._outstanding = 0
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(work_queue,),
+                name=f"partitioned-executor-{i}",
+                daemon=True,
+            )
+            for i, work_queue in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _worker(self, work_queue: "queue.Queue[Optional[_Task]]") -> None:
+        while True:
+            task = work_queue.get()
+            if task is None:
+                break
+
+            future, fn, args = task
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            self._done.put(future)
+
+    def submit(self, key: str, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        future: "Future[T]" = Future()
+        self._outstanding += 1
+        self._queues[hash(key) % self.max_workers].put((future, fn, args))
+        return future
+
+    def completed(self, wait: bool = False) -> Iterator[Future]:
+        """Yields futures as they complete.
+
+        If wait is False, only yields the futures that have already completed.
+        Otherwise, blocks until all submitted tasks have completed.
+        """
+
+        while self._outstanding > 0:
+            try:
+                future = self._done.get(block=wait)
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            yield future
+
+    def close(self) -> None:
+        for work_queue in self._queues:
+            work_queue.put(None)
+        for thread in self._threads:
+            thread.join()
@@ -0,0 +1,263 @@
+import logging
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import psutil
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+
+class TaskTimeoutError(TimeoutError):
+    pass
+
+
+class WorkerCrashedError(RuntimeError):
+    pass
+
+
+@dataclass
+class TaskResult:
+    value: Any = None
+    error: Optional[BaseException] = None
+    # The formatted traceback of the error, as seen in the worker process.
+    traceback: Optional[str] = None
+
+    def get(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _worker_main(fn: Callable[..., Any], conn: Connection) -> None:
+    while True:
+        try:
+            batch = conn.recv()
+        except EOFError:
+            break
+        if batch is None:
+            break
+
+        for args in batch:
+            try:
+                result: Tuple[bool, Any, Optional[str]] = (True, fn(*args), None)
+            except BaseException as e:
+                result = (False, e, traceback.format_exc())
+            try:
+                conn.send(result)
+            except Exception as e:
+                # The result or exception could not be pickled.
+                conn.send((False, RuntimeError(repr(e)), traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(self, fn: Callable[..., Any], ctx: Any):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(fn, child_conn), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.num_tasks = 0
+
+    def rss_bytes(self) -> int:
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=5)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessWorkerPool(Closeable):
+    """Runs a function in a pool of long-lived worker processes.
+
+    This isolates the caller from memory leaks and hangs in the function, without
+    paying for a new process per call. Tasks are sent to the workers in batches,
+    and every task is subject to `task_timeout_sec`: a worker that exceeds it is
+    killed, and the rest of its batch is resent to a fresh worker. Workers are
+    also replaced after `max_tasks_per_worker` tasks, or once their resident
+    memory exceeds `max_worker_rss_bytes`.
+
+    The function and its arguments and results must be picklable. Workers are
+    started lazily, and the pool is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        num_workers: int = 1,
+        max_tasks_per_worker: Optional[int] = None,
+        max_worker_rss_bytes: Optional[int] = None,
+        task_timeout_sec: Optional[float] = None,
+        mp_context: Optional[str] = None,
+    ):
+        assert num_workers > 0
+        self.fn = fn
+        self.num_workers = num_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss_bytes = max_worker_rss_bytes
+        self.task_timeout_sec = task_timeout_sec
+        self._ctx = multiprocessing.get_context(mp_context)
+
+        self._idle: List[_Worker] = []
+        self._num_started = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.num_workers_recycled = 0
+        self.num_tasks_timed_out = 0
+
+    def run(self, *args: Any) -> Any:
+        """Runs a single task, re-raising any exception it raises."""
+        return self.run_batch([args])[0].get()
+
+    def run_batch(self, batch: Sequence[Tuple[Any, ...]]) -> List[TaskResult]:
+        """Runs the tasks and returns their results in order. The batch is split
+        evenly between the workers."""
+
+        if not batch:
+            return []
+        num_chunks = min(self.num_workers, len(batch))
+        if num_chunks == 1:
+            return self._run_chunk(batch)
+
+        chunk_size = -(-len(batch) // num_chunks)
+        chunks = [batch[i : i + chunk_size] for i in range(0, len(batch), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results: List[TaskResult] = []
+            for chunk_results in executor.map(self._run_chunk, chunks):
+                results.extend(chunk_results)
+            return results
+
+    def _checkout(self) -> Optional[_Worker]:
+        with self._cond:
+            while (
+                not self._closed
+                and not self._idle
+                and self._num_started >= self.num_workers
+            ):
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("The worker pool is closed")
+            if self._idle:
+                return self._idle.pop()
+            self._num_started += 1
+        return None
+
+    def _checkin(self, worker: Optional[_Worker]) -> None:
+        with self._cond:
+            if worker is None:
+                self._num_started -= 1
+            elif self._closed:
+                worker.stop()
+                self._num_started -= 1
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+
+    def _run_chunk(self, chunk: Sequence[Tuple[Any, ...]]) -> List[TaskResult]:
+        results: List[TaskResult] = []
+        worker = self._checkout()
+        try:
+            while len(results) < len(chunk):
+                if worker is None:
+                    worker = _Worker(self.fn, self._ctx)
+                worker = self._send_tasks(worker, chunk[len(results) :], results)
+                if worker is not None and self._should_recycle(worker):
+                    logger.debug(f"Recycling worker process {worker.process.pid}")
+                    self.num_workers_recycled += 1
+                    worker.stop()
+                    worker = None
+        except BaseException:
+            if worker is not None:
+                worker.kill()
+                worker = None
+            raise
+        finally:
+            self._checkin(worker)
+        return results
+
+    def _send_tasks(
+        self,
+        worker: _Worker,
+        tasks: Sequence[Tuple[Any, ...]],
+        results: List[TaskResult],
+    ) -> Optional[_Worker]:
+        """Sends as many tasks as the worker may still run and collects their
+        results. Returns the worker, or None if it had to be killed."""
+
+        if self.max_tasks_per_worker is not None:
+            tasks = tasks[: max(self.max_tasks_per_worker - worker.num_tasks, 1)]
+        worker.conn.send(list(tasks))
+
+        for _ in tasks:
+            try:
+                if not worker.conn.poll(self.task_timeout_sec):
+                    self.num_tasks_timed_out += 1
+                    results.append(
+                        TaskResult(
+                            error=TaskTimeoutError(
+                                f"Task timed out after {self.task_timeout_sec} seconds"
+                            )
+                        )
+                    )
+                    worker.kill()
+                    return None
+                ok, value, tb = worker.conn.recv()
+            except (EOFError, OSError):
+                results.append(
+                    TaskResult(
+                        error=WorkerCrashedError(
+                            "Worker process exited unexpectedly "
+                            f"with code {worker.process.exitcode}"
+                        )
+                    )
+                )
+                worker.kill()
+                return None
+
+            worker.num_tasks += 1
+            if ok:
+                results.append(TaskResult(value=value))
+            else:
+                results.append(TaskResult(error=value, traceback=tb))
+        return worker
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if (
+            self.max_tasks_per_worker is not None
+            and worker.num_tasks >= self.max_tasks_per_worker
+        ):
+            return True
+        return (
+            self.max_worker_rss_bytes is not None
+            and worker.rss_bytes() > self.max_worker_rss_bytes
+        )
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._num_started -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop()
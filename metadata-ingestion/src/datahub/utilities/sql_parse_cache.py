@@ -0,0 +1,235 @@
+"""
+A persistent cache of SQL parsing results.
+
+Lineage and usage sources parse the same queries over and over, both within a
+run and across runs. The results are cached in a SQLite database, keyed by a
+hash of the normalized query text and of everything else that can affect the
+result: the parser, its version and options, and the datahub version.
+
+By default, the cache lives in a temporary file and only deduplicates parsing
+within a run. Set DATAHUB_SQL_PARSE_CACHE_PATH to keep it across runs. Once the
+cached results exceed DATAHUB_SQL_PARSE_CACHE_MAX_SIZE_MB, the least recently
+used ones are evicted.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+from datahub import __version__
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import ConcurrentConnectionWrapper
+
+logger = logging.getLogger(__name__)
+
+# Bump this whenever a change to the parsers changes their results.
+_CACHE_FORMAT_VERSION = 1
+
+_TABLE_NAME = "sql_parse_cache"
+
+# Evicting down to a fraction of the maximum size means that we don't have to
+# evict again on the next insert.
+_EVICTION_TARGET_RATIO = 0.9
+
+# Last-used times are written in batches, rather than on every hit.
+_TOUCH_BATCH_SIZE = 1000
+
+_DEFAULT_MAX_SIZE_MB = 256
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(sql_query: str) -> str:
+    """Normalizes insignificant differences between queries, so that they share
+    a cache entry. Only runs of whitespace and trailing semicolons are
+    normalized, since anything else may change what the parsers extract."""
+
+    return _WHITESPACE_RE.sub(" ", sql_query).strip().rstrip(";").rstrip()
+
+
+def _get_package_version(package: str) -> str:
+    try:
+        from importlib.metadata import version
+
+        return version(package)
+    except Exception:
+        return "unknown"
+
+
+class SqlParseCache(Closeable):
+    """Maps (parser, options, query) to what the parser extracted, e.g. the list
+    of tables, as a JSON-serializable value. Failed parses should not be cached.
+    Thread-safe."""
+
+    def __init__(
+        self,
+        filename: Optional[pathlib.Path] = None,
+        max_size_bytes: int = _DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        self.max_size_bytes = max_size_bytes
+        # A file that's kept across runs must survive crashes.
+        self._conn = ConcurrentConnectionWrapper(filename, durable=filename is not None)
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {_TABLE_NAME} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {_TABLE_NAME}_last_used ON {_TABLE_NAME} (last_used)"
+        )
+        self._size_bytes: int = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {_TABLE_NAME}"
+        ).fetchone()[0]
+
+        self._lock = threading.Lock()
+        self._touched: Set[str] = set()
+        self._parser_versions: Dict[str, str] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(
+        self,
+        parser: str,
+        kind: str,
+        sql_query: str,
+        library: Optional[str] = None,
+        **options: Any,
+    ) -> str:
+        """
+        :param parser: The name of the parser.
+        :param kind: What was extracted, e.g. "tables" or "columns".
+        :param library: The package that does the actual parsing, whose version
+            is part of the key.
+        """
+        if library is not None and library not in self._parser_versions:
+            self._parser_versions[library] = _get_package_version(library)
+
+        prefix = json.dumps(
+            [
+                _CACHE_FORMAT_VERSION,
+                __version__,
+                parser,
+                library and self._parser_versions[library],
+                kind,
+                sorted(options.items()),
+            ]
+        )
+        return hashlib.sha256(
+            f"{prefix}\n{normalize_query(sql_query)}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._conn.read(
+            f"SELECT value FROM {_TABLE_NAME} WHERE key = ?", (key,)
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched.add(key)
+            should_write_touched = len(self._touched) >= _TOUCH_BATCH_SIZE
+        if should_write_touched:
+            self._write_touched()
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        serialized = json.dumps(value)
+        size = len(key) + len(serialized)
+        with self._conn.transaction():
+            previous = self._conn.execute(
+                f"SELECT size FROM {_TABLE_NAME} WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {_TABLE_NAME} (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, serialized, size, int(time.time())),
+            )
+            self._size_bytes += size - (previous[0] if previous else 0)
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        target = int(self.max_size_bytes * _EVICTION_TARGET_RATIO)
+        cursor = self._conn.execute(
+            f"SELECT key, size FROM {_TABLE_NAME} ORDER BY last_used, rowid"
+        )
+        to_evict = []
+        for key, size in cursor:
+            if self._size_bytes <= target:
+                break
+            to_evict.append((key,))
+            self._size_bytes -= size
+        cursor.close()
+
+        self._conn.executemany(f"DELETE FROM {_TABLE_NAME} WHERE key = ?", to_evict)
+        self.evictions += len(to_evict)
+        logger.debug(f"Evicted {len(to_evict)} entries from the SQL parse cache")
+
+    def _write_touched(self) -> None:
+        with self._lock:
+            touched, self._touched = self._touched, set()
+        if touched:
+            now = int(time.time())
+            with self._conn.transaction():
+                self._conn.executemany(
+                    f"UPDATE {_TABLE_NAME} SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in touched],
+                )
+
+    def __len__(self) -> int:
+        return self._conn.read(f"SELECT COUNT(*) FROM {_TABLE_NAME}").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._write_touched()
+            self._conn.close()
+            self._conn = None  # type: ignore
+
+
+_cache: Optional[SqlParseCache] = None
+_cache_pid: Optional[int] = None
+_cache_lock = threading.Lock()
+
+
+def _open_cache() -> SqlParseCache:
+    max_size_bytes = (
+        int(os.getenv("DATAHUB_SQL_PARSE_CACHE_MAX_SIZE_MB", str(_DEFAULT_MAX_SIZE_MB)))
+        * 1024
+        * 1024
+    )
+    path = os.getenv("DATAHUB_SQL_PARSE_CACHE_PATH")
+    if path:
+        try:
+            filename = pathlib.Path(path).expanduser()
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            return SqlParseCache(filename, max_size_bytes=max_size_bytes)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Unable to open the SQL parse cache at {path}, "
+                f"falling back to a temporary cache: {e}"
+            )
+    return SqlParseCache(max_size_bytes=max_size_bytes)
+
+
+def get_sql_parse_cache() -> SqlParseCache:
+    global _cache, _cache_pid
+    with _cache_lock:
+        # A cache inherited through fork shares its connection with the parent.
+        if _cache is None or _cache_pid != os.getpid():
+            _cache = _open_cache()
+            _cache_pid = os.getpid()
+            atexit.register(_cache.close)
+        return _cache
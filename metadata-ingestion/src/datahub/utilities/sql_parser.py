@@ -1,18 +1,36 @@
+import atexit
 import contextlib
 import logging
 import multiprocessing
+import os
 import re
+import threading
 import traceback
-from multiprocessing import Process, Queue
 from typing import Any, List, Optional, Tuple
 
+from datahub.utilities.process_worker_pool import ProcessWorkerPool
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
+from datahub.utilities.sql_parse_cache import get_sql_parse_cache
 from datahub.utilities.sql_parser_base import SQLParser
 
 with contextlib.suppress(ImportError):
     from sql_metadata import Parser as MetadataSQLParser
 logger = logging.getLogger(__name__)
 
+# Settings of the worker processes that run SqlLineageSQLParserImpl. sqllineage
+# leaks memory, so workers are replaced after a number of queries or once they
+# grow too large.
+_PARSER_NUM_WORKERS = int(os.getenv("DATAHUB_SQL_PARSER_NUM_WORKERS", "1"))
+_PARSER_MAX_QUERIES_PER_WORKER = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_QUERIES_PER_WORKER", "1000")
+)
+_PARSER_MAX_WORKER_RSS_MB = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_WORKER_RSS_MB", "512")
+)
+_PARSER_QUERY_TIMEOUT_SEC = float(
+    os.getenv("DATAHUB_SQL_PARSER_QUERY_TIMEOUT_SEC", "60")
+)
+
 
 class MetadataSQLSQLParser(SQLParser):
     _DATE_SWAP_TOKEN = "__d_a_t_e"
@@ -20,6 +38,14 @@ class MetadataSQLSQLParser(SQLParser):
     def __init__(self, sql_query: str, use_external_process: bool = True) -> None:
         super().__init__(sql_query, use_external_process)
 
+        self._cache = get_sql_parse_cache()
+        self._tables_key = self._cache.make_key(
+            self.__class__.__name__, "tables", sql_query, library="sql-metadata"
+        )
+        self._columns_key = self._cache.make_key(
+            self.__class__.__name__, "columns", sql_query, library="sql-metadata"
+        )
+
         original_sql_query = sql_query
 
         # MetadataSQLParser makes mistakes on lateral flatten queries, use the prefix
@@ -38,12 +64,26 @@ class MetadataSQLSQLParser(SQLParser):
         self._parser = MetadataSQLParser(sql_query)
 
     def get_tables(self) -> List[str]:
+        result = self._cache.get(self._tables_key)
+        if result is None:
+            result = self._get_tables()
+            self._cache.set(self._tables_key, result)
+        return result
+
+    def _get_tables(self) -> List[str]:
         result = self._parser.tables
         # Sort tables to make the list deterministic
         result.sort()
         return result
 
     def get_columns(self) -> List[str]:
+        result = self._cache.get(self._columns_key)
+        if result is None:
+            result = self._get_columns()
+            self._cache.set(self._columns_key, result)
+        return result
+
+    def _get_columns(self) -> List[str]:
         columns_dict = self._parser.columns_dict
         # don't attempt to parse columns if there are joins involved
         if columns_dict.get("join", {}) != {}:
@@ -70,14 +110,16 @@ def sql_lineage_parser_impl_func_wrapper(
     queue: Optional[multiprocessing.Queue], sql_query: str, use_raw_names: bool = False
 ) -> Optional[Tuple[List[str], List[str], Any]]:
     """
-    The wrapper function that computes the tables and columns using the SqlLineageSQLParserImpl
-    and puts the results on the shared IPC queue. This is used to isolate SqlLineageSQLParserImpl
-    functionality in a separate process, and hence protect our sources from memory leaks originating in
-    the sqllineage module.
-    :param queue: The shared IPC queue on to which the results will be put.
+    The wrapper function that computes the tables and columns using the SqlLineageSQLParserImpl.
+    It runs in the parser worker processes (see _get_parser_pool), which isolates
+    SqlLineageSQLParserImpl functionality from the main process, and hence protects our sources
+    from memory leaks originating in the sqllineage module.
+    :param queue: If set, the results are put on this IPC queue instead of being returned.
+        The worker processes pass None.
     :param sql_query: The SQL query to extract the tables & columns from.
     :param use_raw_names: Parameter used to ignore sqllineage's default lowercasing.
-    :return: None.
+    :return: The tables, the columns and the details of the exception raised, if any,
+        or None if a queue is given.
     """
     exception_details: Optional[Tuple[BaseException, str]] = None
     tables: List[str] = []
@@ -98,6 +140,40 @@ def sql_lineage_parser_impl_func_wrapper(
         return (tables, columns, exception_details)
 
 
+def _make_sub_process_exception(
+    exception_details: Tuple[BaseException, str]
+) -> BaseException:
+    exception, exc_msg = exception_details
+    msg = f"Sub-process exception: {exc_msg}"
+    try:
+        return type(exception)(msg)
+    except Exception:
+        # Not every exception type can be created from just a message.
+        return Exception(msg)
+
+
+_parser_pool: Optional[ProcessWorkerPool] = None
+_parser_pool_pid: Optional[int] = None
+_parser_pool_lock = threading.Lock()
+
+
+def _get_parser_pool() -> ProcessWorkerPool:
+    global _parser_pool, _parser_pool_pid
+    with _parser_pool_lock:
+        # A pool inherited through fork belongs to the parent process.
+        if _parser_pool is None or _parser_pool_pid != os.getpid():
+            _parser_pool = ProcessWorkerPool(
+                sql_lineage_parser_impl_func_wrapper,
+                num_workers=_PARSER_NUM_WORKERS,
+                max_tasks_per_worker=_PARSER_MAX_QUERIES_PER_WORKER,
+                max_worker_rss_bytes=_PARSER_MAX_WORKER_RSS_MB * 1024 * 1024,
+                task_timeout_sec=_PARSER_QUERY_TIMEOUT_SEC,
+            )
+            _parser_pool_pid = os.getpid()
+            atexit.register(_parser_pool.close)
+        return _parser_pool
+
+
 class SqlLineageSQLParser(SQLParser):
     def __init__(
         self,
@@ -106,6 +182,14 @@ class SqlLineageSQLParser(SQLParser):
         use_raw_names: bool = False,
     ) -> None:
         super().__init__(sql_query, use_external_process)
+
+        cache = get_sql_parse_cache()
+        cache_key = self._make_cache_key(sql_query, use_raw_names)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.tables, self.columns = cached
+            return
+
         if use_external_process:
             self.tables, self.columns = self._get_tables_columns_process_wrapped(
                 sql_query, use_raw_names
@@ -114,12 +198,27 @@ class SqlLineageSQLParser(SQLParser):
             return_tuple = sql_lineage_parser_impl_func_wrapper(
                 None, sql_query, use_raw_names
             )
-            if return_tuple is not None:
-                (
-                    self.tables,
-                    self.columns,
-                    some_exception,
-                ) = return_tuple
+            if return_tuple is None:
+                return
+            (
+                self.tables,
+                self.columns,
+                some_exception,
+            ) = return_tuple
+            if some_exception is not None:
+                # Don't cache the empty results of a failed parse.
+                return
+        cache.set(cache_key, [self.tables, self.columns])
+
+    @staticmethod
+    def _make_cache_key(sql_query: str, use_raw_names: bool) -> str:
+        return get_sql_parse_cache().make_key(
+            SqlLineageSQLParser.__name__,
+            "tables_columns",
+            sql_query,
+            library="sqllineage",
+            use_raw_names=use_raw_names,
+        )
 
     @staticmethod
     def _get_tables_columns_process_wrapped(
@@ -129,15 +228,14 @@ class SqlLineageSQLParser(SQLParser):
         # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
         # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
         # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(queue, sql_query, use_raw_names),
+        # The worker processes are reused across queries, and recycled before
+        # the leaks add up. A query that times out or crashes its worker raises
+        # the pool's error.
+        tables, columns, exception_details = _get_parser_pool().run(
+            None, sql_query, use_raw_names
         )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
         if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
+            raise _make_sub_process_exception(exception_details)
         return tables, columns
 
     def get_tables(self) -> List[str]:
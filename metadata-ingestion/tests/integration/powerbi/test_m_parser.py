@@ -619,3 +619,72 @@ def test_redshift_native_query():
         data_platform_tables[0].data_platform_pair.powerbi_data_platform_name
         == SupportedDataPlatform.AMAZON_REDSHIFT.value.powerbi_data_platform_name
     )
+
+
+def test_m_query_parse_cache(tmp_path):
+    table: powerbi_data_classes.Table = powerbi_data_classes.Table(
+        expression=M_QUERIES[21],
+        name="category",
+        full_name="dev.public.category",
+    )
+    cache_file = str(tmp_path / "m_query_parse_cache.db")
+
+    reporter = PowerBiDashboardSourceReport()
+    m_query_parser = parser.MQueryParser(reporter, cache_file=cache_file)
+    for _ in range(2):
+        data_platform_tables: List[DataPlatformTable] = parser.get_upstream_tables(
+            table, reporter, native_query_enabled=False, m_query_parser=m_query_parser
+        )
+        assert [t.full_name for t in data_platform_tables] == [table.full_name]
+    m_query_parser.close()
+    assert reporter.m_query_expressions_parsed == 1
+    assert reporter.m_query_parse_cache_hits == 1
+
+    # The next run reads the parse tree from the cache file
+    reporter = PowerBiDashboardSourceReport()
+    m_query_parser = parser.MQueryParser(reporter, cache_file=cache_file)
+    data_platform_tables = parser.get_upstream_tables(
+        table, reporter, native_query_enabled=False, m_query_parser=m_query_parser
+    )
+    m_query_parser.close()
+    assert [t.full_name for t in data_platform_tables] == [table.full_name]
+    assert reporter.m_query_expressions_parsed == 0
+    assert reporter.m_query_parse_cache_hits == 1
+
+
+def test_m_query_parse_cache_errors(tmp_path):
+    # A file that isn't a database
+    cache_file = tmp_path / "m_query_parse_cache.db"
+    cache_file.write_bytes(b"not a database" * 100)
+    reporter = PowerBiDashboardSourceReport()
+    m_query_parser = parser.MQueryParser(reporter, cache_file=str(cache_file))
+    assert isinstance(m_query_parser.parse(M_QUERIES[21]), Tree)
+    m_query_parser.close()
+    assert reporter.m_query_expressions_parsed == 1
+
+    # A cache that fails after being opened is disabled, but parsing goes on.
+    reporter = PowerBiDashboardSourceReport()
+    m_query_parser = parser.MQueryParser(
+        reporter, cache_file=str(tmp_path / "other_cache.db")
+    )
+    assert m_query_parser._cache_conn is not None
+    m_query_parser._cache_conn.execute("DROP TABLE parse_results")
+    assert isinstance(m_query_parser.parse(M_QUERIES[21]), Tree)
+    assert m_query_parser._cache_conn is None
+    m_query_parser.close()
+    assert reporter.m_query_expressions_parsed == 1
+
+
+def test_m_query_parse_workers():
+    reporter = PowerBiDashboardSourceReport()
+    m_query_parser = parser.MQueryParser(reporter, max_workers=2)
+    m_query_parser.parse_ahead([M_QUERIES[21], M_QUERIES[22], "let Source = foo("])
+    try:
+        assert isinstance(m_query_parser.parse(M_QUERIES[21]), Tree)
+        assert isinstance(
+            m_query_parser.parse("let Source = foo("), parser.ParseFailure
+        )
+        m_query_parser.discard_pending()
+    finally:
+        m_query_parser.close()
+    assert reporter.m_query_expressions_parsed == 2
@@ -1,7 +1,10 @@
 import json
 import logging
 import pathlib
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import cast
 from unittest import mock
 
@@ -678,6 +681,103 @@ def test_tableau_stateful(pytestconfig, tmp_path, mock_time, mock_datahub_graph)
     assert sorted(deleted_dashboard_urns) == sorted(difference_dashboard_urns)
 
 
+@freeze_time(FROZEN_TIME)
+def test_tableau_incremental_ingestion(pytestconfig, tmp_path, mock_datahub_graph):
+    deleted_workbook_luid = "b2c84ac6-1e37-4ca0-bf9b-62339be046fc"
+
+    def run(side_effect_query_metadata_response, deleted_workbook_luids):
+        def side_effect_updated_workbook_data(*arg, **kwargs):
+            workbooks, mock_pagination = side_effect_workbook_data(*arg, **kwargs)
+            for workbook in workbooks:
+                workbook._updated_at = datetime(2021, 12, 1)
+            return [
+                workbook
+                for workbook in workbooks
+                if workbook.id not in deleted_workbook_luids
+            ], mock_pagination
+
+        with mock.patch(
+            "datahub.ingestion.source.state_provider.datahub_ingestion_checkpointing_provider.DataHubGraph",
+            mock_datahub_graph,
+        ) as mock_checkpoint:
+            mock_checkpoint.return_value = mock_datahub_graph
+
+            with mock.patch("datahub.ingestion.source.tableau.Server") as mock_sdk:
+                mock_client = mock.Mock()
+                mock_client.metadata.query.side_effect = (
+                    side_effect_query_metadata_response
+                )
+                mock_client.projects.get.side_effect = side_effect_project_data
+                mock_client.datasources.get.side_effect = side_effect_datasource_data
+                mock_client.workbooks.get.side_effect = (
+                    side_effect_updated_workbook_data
+                )
+                mock_client.views.get.side_effect = side_effect_usage_stat
+                mock_sdk.return_value = mock_client
+
+                pipeline = Pipeline.create(
+                    {
+                        "run_id": "tableau-test",
+                        "pipeline_name": "tableau-incremental-test-pipeline",
+                        "source": {
+                            "type": "tableau",
+                            "config": {
+                                **config_source_default,
+                                "incremental_ingestion": True,
+                            },
+                        },
+                        "sink": {
+                            "type": "file",
+                            "config": {"filename": f"{tmp_path}/tableau_mces.json"},
+                        },
+                    }
+                )
+                pipeline.run()
+                pipeline.raise_from_status()
+                return pipeline, mock_client.metadata.query
+
+    pipeline_run1, _ = run(
+        [
+            read_response(pytestconfig, "workbooksConnection_all.json"),
+            read_response(pytestconfig, "sheetsConnection_all.json"),
+            read_response(pytestconfig, "dashboardsConnection_all.json"),
+            read_response(pytestconfig, "embeddedDatasourcesConnection_all.json"),
+            read_response(pytestconfig, "publishedDatasourcesConnection_all.json"),
+            read_response(pytestconfig, "customSQLTablesConnection_all.json"),
+        ],
+        deleted_workbook_luids=[],
+    )
+    source1 = cast(TableauSource, pipeline_run1.source)
+    assert not source1.get_report().incremental_run
+    incremental_state1 = source1.incremental_state
+    assert incremental_state1
+    assert deleted_workbook_luid in incremental_state1.workbook_urns
+    assert incremental_state1.shared_urns
+
+    # Nothing changed, except that a workbook was deleted, so nothing is queried.
+    pipeline_run2, query_metadata = run([], [deleted_workbook_luid])
+    source2 = cast(TableauSource, pipeline_run2.source)
+    report = source2.get_report()
+    assert report.incremental_run
+    assert report.num_unchanged_workbooks == len(incremental_state1.workbook_urns) - 1
+    query_metadata.assert_not_called()
+    incremental_state2 = source2.incremental_state
+    assert incremental_state2
+    assert incremental_state2.runs_since_full_resync == 1
+    assert deleted_workbook_luid not in incremental_state2.workbook_urns
+
+    # Only the entities of the deleted workbook are removed as stale.
+    checkpoint1 = get_current_checkpoint_from_pipeline(pipeline_run1)
+    checkpoint2 = get_current_checkpoint_from_pipeline(pipeline_run2)
+    assert checkpoint1 and checkpoint1.state
+    assert checkpoint2 and checkpoint2.state
+    assert sorted(
+        checkpoint1.state.get_urns_not_in(
+            type="*", other_checkpoint_state=checkpoint2.state
+        )
+    ) == sorted(incremental_state1.workbook_urns[deleted_workbook_luid])
+
+
 def test_tableau_no_verify():
     enable_logging()
     # This test ensures that we can connect to a self-signed certificate
@@ -726,6 +826,14 @@ def test_tableau_signout_timeout(pytestconfig, tmp_path, mock_datahub_graph):
     )
 
 
+def test_tableau_incremental_ingestion_requires_stateful_ingestion():
+    config_dict = {**config_source_default, "incremental_ingestion": True}
+    assert TableauConfig.parse_obj(config_dict).incremental_ingestion
+
+    del config_dict["stateful_ingestion"]
+    assert not TableauConfig.parse_obj(config_dict).incremental_ingestion
+
+
 def test_tableau_unsupported_csql(mock_datahub_graph):
     context = PipelineContext(run_id="0", pipeline_name="test_tableau")
     context.graph = mock_datahub_graph
@@ -758,3 +866,70 @@ def test_tableau_unsupported_csql(mock_datahub_graph):
         mcp.entityUrn
         == "urn:li:dataset:(urn:li:dataPlatform:tableau,09988088-05ad-173c-a2f1-f33ba3a13d1a,PROD)"
     )
+
+
+@pytest.mark.parametrize("max_concurrent_queries", [1, 4])
+def test_tableau_concurrent_pagination(max_concurrent_queries, mock_datahub_graph):
+    num_sheets = 57
+
+    def side_effect_query_metadata(query):
+        first, offset = (
+            int(x)
+            for x in re.search(r"first:(\d+), offset:(\d+)", query).groups()  # type: ignore
+        )
+        response: dict = {
+            "data": {
+                "sheetsConnection": {
+                    "nodes": [
+                        {"id": str(i)}
+                        for i in range(offset, min(offset + first, num_sheets))
+                    ],
+                    "pageInfo": {"hasNextPage": offset + first < num_sheets},
+                    "totalCount": num_sheets,
+                }
+            }
+        }
+        if first > 4:
+            response["errors"] = [
+                {
+                    "message": "Showing partial results. The request exceeded the 20000 node limit.",
+                    "extensions": {
+                        "severity": "WARNING",
+                        "code": "NODE_LIMIT_EXCEEDED",
+                        "properties": {"nodeLimit": 20000},
+                    },
+                }
+            ]
+        return response
+
+    with mock.patch("datahub.ingestion.source.tableau.Server") as mock_sdk:
+        mock_client = mock.Mock()
+        mock_client.metadata.query.side_effect = side_effect_query_metadata
+        mock_sdk.return_value = mock_client
+
+        config = TableauConfig.parse_obj(
+            {
+                **config_source_default,
+                "max_concurrent_queries": max_concurrent_queries,
+            }
+        )
+        context = PipelineContext(run_id="0", pipeline_name="test_tableau")
+        context.graph = mock_datahub_graph
+        source = TableauSource(config=config, ctx=context)
+        source._query_executor = (
+            ThreadPoolExecutor(max_workers=max_concurrent_queries)
+            if max_concurrent_queries > 1
+            else None
+        )
+        sheets = list(
+            source.get_connection_objects(
+                "{ id }", "sheetsConnection", "idWithin: []", page_size_override=10
+            )
+        )
+
+    assert [sheet["id"] for sheet in sheets] == [str(i) for i in range(num_sheets)]
+    report = source.get_report()
+    assert report.reduced_page_sizes == {"sheetsConnection": 2}
+    assert report.num_metadata_queries["sheetsConnection"] > 0
+    assert "sheetsConnection" in report.metadata_query_max_sec
+    assert not report.warnings
@@ -0,0 +1,72 @@
+import logging
+import os
+import random
+import sys
+import tempfile
+
+import humanfriendly
+import psutil
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.s3.config import DataLakeSourceConfig
+from datahub.ingestion.source.s3.source import S3Source
+from datahub.utilities.perf_timer import PerfTimer
+
+NUM_FILES = 10
+NUM_ROWS_PER_FILE = 1_000_000
+
+
+def generate_table(folder: str) -> None:
+    for i in range(NUM_FILES):
+        pq.write_table(
+            pa.table(
+                {
+                    "id": range(i * NUM_ROWS_PER_FILE, (i + 1) * NUM_ROWS_PER_FILE),
+                    "category": [
+                        random.choice(["a", "b", "c", None])
+                        for _ in range(NUM_ROWS_PER_FILE)
+                    ],
+                    "amount": [random.gauss(100, 20) for _ in range(NUM_ROWS_PER_FILE)],
+                }
+            ),
+            os.path.join(folder, f"part-{i}.parquet"),
+            row_group_size=NUM_ROWS_PER_FILE // 10,
+        )
+
+
+def run_test(engine: str) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        folder = os.path.join(root, "table")
+        os.makedirs(folder)
+        generate_table(folder)
+
+        config = DataLakeSourceConfig.parse_obj(
+            {
+                "path_specs": [{"include": f"{root}/{{table}}/*.parquet"}],
+                "profiling": {"enabled": True, "engine": engine},
+            }
+        )
+        pre_mem_usage = psutil.Process(os.getpid()).memory_info().rss
+
+        with PerfTimer() as timer:
+            source = S3Source(config, PipelineContext(run_id="data-lake-profiling"))
+            num_workunits = len(list(source.get_workunits()))
+
+        print(f"Engine: {engine}")
+        print(f"Workunits Generated: {num_workunits}")
+        print(f"Seconds Elapsed: {timer.elapsed_seconds():.2f} seconds")
+        print(f"Profiling Seconds: {sum(source.profiling_times_taken):.2f} seconds")
+        print(
+            f"Memory Used: {humanfriendly.format_size(psutil.Process(os.getpid()).memory_info().rss - pre_mem_usage)}"
+        )
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    # Run each engine in its own process, e.g. with `arrow` and then `spark`, since
+    # Spark's memory isn't part of this process's.
+    run_test(sys.argv[1] if len(sys.argv) > 1 else "arrow")
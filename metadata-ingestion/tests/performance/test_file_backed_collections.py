@@ -0,0 +1,118 @@
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List
+
+from datahub.utilities.file_backed_collections import (
+    ConcurrentFileBackedDict,
+    FileBackedDict,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+NUM_KEYS = 200_000
+NUM_LOOKUPS = 200_000
+CACHE_MAX_SIZE = 2000
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+@dataclass
+class Event:
+    name: str
+    user: str
+    query: str
+    timestamp: int
+
+
+def make_event(i: int) -> Event:
+    return Event(
+        name=f"job-{i}",
+        user=f"user-{i % 100}@example.com",
+        query=f"SELECT * FROM table_{i % 1000} WHERE id > {i}",
+        timestamp=i,
+    )
+
+
+def run_workers(num_threads: int, work: List[List[int]], fn) -> float:
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(chunk: List[int]) -> None:
+        barrier.wait()
+        for i in chunk:
+            fn(i)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [executor.submit(worker, chunk) for chunk in work]
+        with PerfTimer() as timer:
+            barrier.wait()
+            for future in futures:
+                future.result()
+        return timer.elapsed_seconds()
+
+
+def split(items: List[int], num_chunks: int) -> List[List[int]]:
+    return [items[i::num_chunks] for i in range(num_chunks)]
+
+
+def bench_single_threaded() -> None:
+    cache = FileBackedDict[Event](cache_max_size=CACHE_MAX_SIZE)
+    with PerfTimer() as timer:
+        for i in range(NUM_KEYS):
+            cache[f"key-{i}"] = make_event(i)
+        cache.flush()
+    insert_seconds = timer.elapsed_seconds()
+
+    lookups = [random.randrange(NUM_KEYS) for _ in range(NUM_LOOKUPS)]
+    with PerfTimer() as timer:
+        for i in lookups:
+            cache[f"key-{i}"]
+    lookup_seconds = timer.elapsed_seconds()
+    cache.close()
+
+    report("FileBackedDict", 1, insert_seconds, lookup_seconds)
+
+
+def bench_concurrent(num_threads: int) -> None:
+    cache = ConcurrentFileBackedDict[Event](cache_max_size=CACHE_MAX_SIZE)
+
+    def insert(i: int) -> None:
+        cache[f"key-{i}"] = make_event(i)
+
+    insert_seconds = run_workers(
+        num_threads, split(list(range(NUM_KEYS)), num_threads), insert
+    )
+    cache.flush()
+
+    def lookup(i: int) -> None:
+        cache[f"key-{i}"]
+
+    lookups = [random.randrange(NUM_KEYS) for _ in range(NUM_LOOKUPS)]
+    lookup_seconds = run_workers(num_threads, split(lookups, num_threads), lookup)
+    cache.close()
+
+    report("ConcurrentFileBackedDict", num_threads, insert_seconds, lookup_seconds)
+
+
+def report(
+    name: str, num_threads: int, insert_seconds: float, lookup_seconds: float
+) -> None:
+    print(
+        f"{name:<26} threads={num_threads:<2} "
+        f"inserts/s={NUM_KEYS / insert_seconds:>10,.0f} "
+        f"lookups/s={NUM_LOOKUPS / lookup_seconds:>10,.0f}"
+    )
+
+
+def run_test():
+    random.seed(0)
+    bench_single_threaded()
+    for num_threads in THREAD_COUNTS:
+        bench_concurrent(num_threads)
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
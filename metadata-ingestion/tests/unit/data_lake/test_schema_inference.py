@@ -1,9 +1,10 @@
+import io
+import json as jsonlib
 import tempfile
 from typing import List, Type
 
 import avro.schema
 import pandas as pd
-import ujson
 from avro import schema as avro_schema
 from avro.datafile import DataFileWriter
 from avro.io import DatumWriter
@@ -88,6 +89,66 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+def test_infer_schema_json_lines_sampled():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(test_table.to_json(orient="records", lines=True), encoding="utf-8")
+        )
+        # a record past the sample limit, which must not be read
+        file.write(b'{"late_field": 1}\n')
+        file.seek(0)
+
+        fields = json.JsonInferrer(max_rows=3).infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+        assert not any(field.nullable for field in fields)
+
+
+def test_infer_schema_json_truncated():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        records = test_table.to_json(orient="records")
+        file.write(bytes(records, encoding="utf-8"))
+        file.seek(0)
+
+        # stop in the middle of the last record, after its boolean field
+        max_bytes = records.rindex('"integer_field"')
+        fields = json.JsonInferrer(max_bytes=max_bytes).infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        # the truncated record is dropped, so it doesn't make later fields nullable
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+        assert not any(field.nullable for field in fields)
+
+
+def test_infer_schema_json_truncated_first_record():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        records = test_table.to_json(orient="records")
+        file.write(bytes(records, encoding="utf-8"))
+        file.seek(0)
+
+        # stop in the middle of the first record: it's all there is to sample
+        max_bytes = records.index('"integer_field"')
+        fields = json.JsonInferrer(max_bytes=max_bytes).infer_schema(file)
+
+        assert [field.fieldPath for field in fields] == ["boolean_field"]
+
+
+def test_read_sample_lines():
+    data = b"header\n" + b"".join(b"row %d\n" % i for i in range(100))
+
+    sample = csv_tsv.read_sample_lines(io.BytesIO(data), max_lines=3)
+    assert sample == b"header\nrow 0\nrow 1\n"
+
+    # the partial line at the byte limit is dropped
+    sample = csv_tsv.read_sample_lines(io.BytesIO(data), max_lines=50, max_bytes=20)
+    assert sample == b"header\nrow 0\nrow 1\n"
+
+    assert csv_tsv.read_sample_lines(io.BytesIO(data), max_lines=1000) == data
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
@@ -103,7 +164,7 @@ def test_infer_schema_parquet():
 def test_infer_schema_avro():
     with tempfile.TemporaryFile(mode="w+b") as file:
         schema = avro_schema.parse(
-            ujson.dumps(
+            jsonlib.dumps(
                 {
                     "type": "record",
                     "name": "test",
@@ -0,0 +1,131 @@
+from collections import Counter
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from datahub.ingestion.source.s3.arrow_profiling import (
+    _BATCH_SIZE,
+    _ArrowTableProfiler,
+    read_arrow_dataset,
+)
+from datahub.ingestion.source.s3.profiling_common import (
+    DataLakeProfilerConfig,
+    DataLakeProfilingEngine,
+)
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+
+ids = list(range(100))
+categories = [None if i % 10 == 0 else "abc"[i % 3] for i in ids]
+scores = [float("nan") if i % 20 == 0 else i / 2 for i in ids]
+
+
+def _profile(tmp_path, table=None, batch_size=_BATCH_SIZE, **config):
+    path = tmp_path / "table.parquet"
+    if table is None:
+        table = pa.table({"id": ids, "category": categories, "score": scores})
+    pq.write_table(table, path)
+    dataset = read_arrow_dataset(str(path), ".parquet", None)
+    assert dataset is not None
+
+    profiling_config = DataLakeProfilerConfig(enabled=True, engine="arrow", **config)
+    assert profiling_config.engine == DataLakeProfilingEngine.ARROW
+    return _ArrowTableProfiler(
+        dataset, profiling_config, DataLakeSourceReport(), str(path), batch_size
+    ).generate_profile()
+
+
+def test_arrow_profile(tmp_path):
+    profile = _profile(tmp_path)
+
+    assert profile.rowCount == 100
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles is not None
+    id_profile, category_profile, score_profile = profile.fieldProfiles
+
+    assert id_profile.fieldPath == "id"
+    assert id_profile.nullCount == 0
+    assert id_profile.uniqueCount == 100
+    assert id_profile.min == "0"
+    assert id_profile.max == "99"
+    assert id_profile.mean == "49.5"
+    assert id_profile.quantiles is not None and len(id_profile.quantiles) == 5
+    assert id_profile.histogram is not None
+    assert len(id_profile.histogram.boundaries) == 25
+    assert id_profile.sampleValues is not None and len(id_profile.sampleValues) == 20
+
+    assert category_profile.nullCount == 10
+    assert category_profile.nullProportion == 0.1
+    assert category_profile.uniqueCount == 3
+    assert category_profile.distinctValueFrequencies is not None
+    expected = Counter(c for c in categories if c is not None)
+    assert {
+        f.value: f.frequency for f in category_profile.distinctValueFrequencies
+    } == dict(expected)
+
+    # NaNs count as nulls
+    assert score_profile.nullCount == 5
+    assert score_profile.uniqueCount == 95
+    assert score_profile.min == "0.5"
+
+
+def test_arrow_profile_table_level_only(tmp_path):
+    profile = _profile(tmp_path, profile_table_level_only=True)
+
+    assert profile.rowCount == 100
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles is None
+
+
+def test_arrow_profile_over_batches(tmp_path):
+    profile = _profile(tmp_path)
+    batched_profile = _profile(tmp_path, batch_size=7)
+
+    assert batched_profile.rowCount == 100
+    assert profile.fieldProfiles is not None
+    assert batched_profile.fieldProfiles is not None
+    for field_profile, batched_field_profile in zip(
+        profile.fieldProfiles, batched_profile.fieldProfiles
+    ):
+        assert batched_field_profile.nullCount == field_profile.nullCount
+        assert batched_field_profile.uniqueCount == field_profile.uniqueCount
+        assert batched_field_profile.min == field_profile.min
+        assert batched_field_profile.max == field_profile.max
+        if field_profile.mean is not None:
+            assert float(batched_field_profile.mean) == pytest.approx(
+                float(field_profile.mean)
+            )
+            assert float(batched_field_profile.stdev) == pytest.approx(
+                float(field_profile.stdev)
+            )
+        assert batched_field_profile.quantiles == field_profile.quantiles
+        assert batched_field_profile.histogram == field_profile.histogram
+        assert (
+            batched_field_profile.distinctValueFrequencies
+            == field_profile.distinctValueFrequencies
+        )
+        assert batched_field_profile.sampleValues is not None
+        assert len(batched_field_profile.sampleValues) == 20
+
+
+def test_arrow_profile_many_distinct_values(tmp_path):
+    num_rows = 50_000
+    table = pa.table(
+        {
+            "id": range(num_rows),
+            "name": [f"name-{i % 30_000}" for i in range(num_rows)],
+        }
+    )
+    profile = _profile(tmp_path, table=table, batch_size=4096)
+
+    assert profile.rowCount == num_rows
+    assert profile.fieldProfiles is not None
+    id_profile, name_profile = profile.fieldProfiles
+
+    # too many distinct values to count exactly
+    assert id_profile.uniqueCount == pytest.approx(num_rows, rel=0.03)
+    assert id_profile.min == "0"
+    assert id_profile.max == str(num_rows - 1)
+    assert id_profile.quantiles is not None
+    assert id_profile.histogram is None
+    assert name_profile.uniqueCount == pytest.approx(30_000, rel=0.03)
@@ -1,5 +1,6 @@
 import io
 import json
+import os
 import pathlib
 import shutil
 from unittest.mock import patch
@@ -11,6 +12,7 @@ from freezegun import freeze_time
 
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
+from datahub.configuration.common import ConfigurationError
 from datahub.emitter import mce_builder
 from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
 from datahub.ingestion.run.pipeline import Pipeline
@@ -62,6 +64,117 @@ def test_serde_to_json(
     )
 
 
+@pytest.mark.parametrize("read_mode", ["BATCH", "STREAM"])
+def test_file_source_read_ahead(tmp_path: pathlib.Path, read_mode: str) -> None:
+    source_files = [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_chart_snapshot.json",
+        "tests/unit/serde/test_serde_profile.json",
+    ]
+    for i, json_filename in enumerate(source_files):
+        shutil.copy(json_filename, tmp_path / f"{i}.json")
+
+    def read_all(read_ahead_files: int) -> list:
+        source = GenericFileSource.create(
+            {
+                "path": str(tmp_path),
+                "read_mode": read_mode,
+                "read_ahead_files": read_ahead_files,
+            },
+            None,
+        )
+        workunits = [(wu.id, wu.metadata.to_obj()) for wu in source.get_workunits()]
+        report = source.get_report()
+        assert not report.failures
+        assert report.num_files_completed == len(source_files)
+        return workunits
+
+    sequential = read_all(read_ahead_files=0)
+    assert sequential
+    assert read_all(read_ahead_files=2) == sequential
+
+
+def _exit_without_result(*args: object) -> None:
+    # Like a read-ahead worker that is killed, e.g. when it runs out of memory.
+    os._exit(137)
+
+
+def test_file_source_read_ahead_worker_killed(tmp_path: pathlib.Path) -> None:
+    shutil.copy("tests/unit/serde/test_serde_large.json", tmp_path / "0.json")
+    source = GenericFileSource.create(
+        {"path": str(tmp_path), "read_ahead_files": 1}, None
+    )
+    with patch(
+        "datahub.ingestion.source.file._read_file_into_queue", _exit_without_result
+    ), pytest.raises(ConfigurationError, match="exit code 137"):
+        list(source.get_workunits())
+
+
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize("json_lines_filename", ["output.jsonl", "output.jsonl.gz"])
+@pytest.mark.parametrize("read_ahead_files", [0, 3])
+def test_serde_json_lines_round_trip(
+    pytestconfig: PytestConfig,
+    tmp_path: pathlib.Path,
+    json_lines_filename: str,
+    read_ahead_files: int,
+) -> None:
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    json_lines_file = tmp_path / json_lines_filename
+    output_file = tmp_path / "output.json"
+
+    for source_path, sink_path, source_extra in [
+        (golden_file, json_lines_file, {}),
+        (json_lines_file, output_file, {"read_ahead_files": read_ahead_files}),
+    ]:
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "file",
+                    "config": {"path": str(source_path), **source_extra},
+                },
+                "sink": {"type": "file", "config": {"filename": str(sink_path)}},
+                "run_id": "serde_test",
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=output_file,
+        golden_path=golden_file,
+    )
+
+
+def test_file_source_index_sidecar(tmp_path: pathlib.Path) -> None:
+    golden_file = "tests/unit/serde/test_serde_large.json"
+    output_file = tmp_path / "output.json"
+    pipeline = Pipeline.create(
+        {
+            "source": {"type": "file", "config": {"filename": golden_file}},
+            "sink": {
+                "type": "file",
+                "config": {"filename": str(output_file), "write_index": True},
+            },
+            "run_id": "serde_test",
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    num_records = len(json.loads(output_file.read_text()))
+    assert json.loads((tmp_path / "output.json.idx").read_text()) == {
+        "num_elements": num_records
+    }
+
+    source = GenericFileSource.create(
+        {"path": str(output_file), "read_mode": "STREAM"}, None
+    )
+    source._start_file_stats(str(output_file))
+    assert source.report.current_file_num_elements == num_records
+
+
 @pytest.mark.parametrize(
     "json_filename",
     [
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 from avrogen.dict_wrapper import DictWrapper
 
+from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
@@ -166,3 +167,57 @@ class TestDatahubIngestionCheckpointProvider(unittest.TestCase):
             state_class=type(job2_state_obj),
         )
         self.assertEqual(job2_last_checkpoint, job2_checkpoint)
+
+    def test_sharded_provider(self):
+        ctx = PipelineContext(run_id=self.run_id, pipeline_name=self.pipeline_name)
+        ctx.graph = self.mock_graph
+        provider = DatahubIngestionCheckpointingProvider.create(
+            {"num_shards": 4}, ctx, name=DatahubIngestionCheckpointingProvider.__name__
+        )
+
+        state_obj = BaseSQLAlchemyCheckpointState()
+        for i in range(100):
+            state_obj.add_checkpoint_urn(
+                type="table", urn=make_dataset_urn("mysql", f"db1.t{i}", "prod")
+            )
+        checkpoint = Checkpoint(
+            job_name=self.job_names[0],
+            pipeline_name=self.pipeline_name,
+            run_id=self.run_id,
+            state=state_obj,
+        )
+        provider.state_to_commit = {
+            self.job_names[0]: assert_not_null(
+                checkpoint.to_checkpoint_aspect(max_allowed_state_size=2**20)
+            )
+        }
+        provider.commit()
+        self.assertTrue(provider.committed)
+        shard_urns = [urn for urn in self.mcps_emitted if "_shard_" in urn]
+        self.assertEqual(len(shard_urns), 4)
+
+        last_state = provider.get_latest_checkpoint(
+            self.pipeline_name, self.job_names[0]
+        )
+        last_checkpoint = assert_not_null(
+            Checkpoint.create_from_checkpoint_aspect(
+                job_name=self.job_names[0],
+                checkpoint_aspect=last_state,
+                state_class=BaseSQLAlchemyCheckpointState,
+            )
+        )
+        self.assertEqual(sorted(last_checkpoint.state.urns), sorted(state_obj.urns))
+
+        # Only the shard of the new urn is rewritten.
+        self.mcps_emitted.clear()
+        state_obj.add_checkpoint_urn(
+            type="table", urn=make_dataset_urn("mysql", "db1.new_table", "prod")
+        )
+        provider.state_to_commit = {
+            self.job_names[0]: assert_not_null(
+                checkpoint.to_checkpoint_aspect(max_allowed_state_size=2**20)
+            )
+        }
+        provider.commit()
+        shard_urns = [urn for urn in self.mcps_emitted if "_shard_" in urn]
+        self.assertEqual(len(shard_urns), 1)
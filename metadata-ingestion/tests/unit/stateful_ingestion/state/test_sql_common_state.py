@@ -1,3 +1,5 @@
+import json
+
 from datahub.emitter.mce_builder import make_container_urn, make_dataset_urn
 from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.sql_common_state import (
@@ -89,3 +91,33 @@ def test_deduplication_and_order_preservation() -> None:
     # verifies that the state can be serialized without raising an error
     json = state.json()
     assert json
+
+
+def test_front_coded_serialization() -> None:
+    urns = [
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db1.v1,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db1.t1,PROD)",
+        "urn:li:container:1154d1da73a95376c9f33f47694cf1de",
+        "urn:li:dataset:(urn:li:dataPlatform:mysql,db1.t10,PROD)",
+    ]
+    state = GenericCheckpointState(urns=urns)
+
+    serialized = json.loads(state._to_bytes_utf8())
+    assert "urns" not in serialized
+    assert serialized["front_coded_urns"] == [
+        0,
+        "urn:li:container:1154d1da73a95376c9f33f47694cf1de",
+        7,
+        "dataset:(urn:li:dataPlatform:mysql,db1.t1,PROD)",
+        48,
+        "0,PROD)",
+        46,
+        "v1,PROD)",
+    ]
+
+    deserialized = GenericCheckpointState.parse_obj(serialized)
+    assert deserialized.urns == sorted(urns)
+    assert not list(
+        deserialized.get_urns_not_in(type="*", other_checkpoint_state=state)
+    )
+    assert deserialized.get_percent_entities_changed(state) == 0.0
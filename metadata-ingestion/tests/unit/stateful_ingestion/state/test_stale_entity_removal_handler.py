@@ -2,9 +2,7 @@ from typing import Dict, List, Tuple
 
 import pytest
 
-from datahub.ingestion.source.state.entity_removal_state import (
-    compute_percent_entities_changed,
-)
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 
 OldNewEntLists = List[Tuple[List[str], List[str]]]
 
@@ -43,5 +41,13 @@ old_new_ent_tests: Dict[str, Tuple[OldNewEntLists, float]] = {
 def test_change_percent(
     new_old_entity_list: OldNewEntLists, expected_percent_change: float
 ) -> None:
-    actual_percent_change = compute_percent_entities_changed(new_old_entity_list)
+    ((new_entities, old_entities),) = new_old_entity_list
+    new_state = GenericCheckpointState()
+    for urn in new_entities:
+        new_state.add_checkpoint_urn("*", urn)
+    old_state = GenericCheckpointState()
+    for urn in old_entities:
+        old_state.add_checkpoint_urn("*", urn)
+
+    actual_percent_change = new_state.get_percent_entities_changed(old_state)
     assert actual_percent_change == expected_percent_change
@@ -0,0 +1,124 @@
+from typing import List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from datahub.configuration.common import ConfigurationError, OperationalError
+from datahub.emitter.async_rest_emitter import AsyncDataHubRestEmitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import StatusClass
+
+_GMS_CONFIG = {"noCode": "true", "versions": {}}
+
+
+def _make_mcp() -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+        aspect=StatusClass(removed=False),
+    )
+
+
+async def _start_server(app: web.Application) -> TestServer:
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def test_async_rest_emitter_emit_mcp():
+    received: List[dict] = []
+
+    async def ingest_proposal(request: web.Request) -> web.Response:
+        assert request.headers["X-RestLi-Protocol-Version"] == "2.0.0"
+        assert request.headers["Authorization"] == "Bearer my-token"
+        received.append(await request.json())
+        return web.json_response({"value": "ok"})
+
+    app = web.Application()
+    app.router.add_post("/aspects", ingest_proposal)
+    server = await _start_server(app)
+    try:
+        async with AsyncDataHubRestEmitter(
+            f"http://{server.host}:{server.port}", token="my-token"
+        ) as emitter:
+            await emitter.emit(_make_mcp())
+    finally:
+        await server.close()
+
+    assert len(received) == 1
+    assert received[0]["proposal"]["entityUrn"] == _make_mcp().entityUrn
+
+
+async def test_async_rest_emitter_retries_on_status_code():
+    attempts = 0
+
+    async def get_config(request: web.Request) -> web.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return web.Response(status=503)
+        return web.json_response(_GMS_CONFIG)
+
+    app = web.Application()
+    app.router.add_get("/config", get_config)
+    server = await _start_server(app)
+    try:
+        async with AsyncDataHubRestEmitter(
+            f"http://{server.host}:{server.port}", retry_max_times=1
+        ) as emitter:
+            assert await emitter.test_connection() == _GMS_CONFIG
+    finally:
+        await server.close()
+
+    assert attempts == 2
+
+
+async def test_async_rest_emitter_errors():
+    async def get_config(request: web.Request) -> web.Response:
+        return web.json_response({"config": {"application": "datahub-frontend"}})
+
+    async def ingest_proposal(request: web.Request) -> web.Response:
+        return web.json_response(
+            {"message": "bad proposal", "stackTrace": "..."}, status=422
+        )
+
+    app = web.Application()
+    app.router.add_get("/config", get_config)
+    app.router.add_post("/aspects", ingest_proposal)
+    server = await _start_server(app)
+    try:
+        async with AsyncDataHubRestEmitter(
+            f"http://{server.host}:{server.port}"
+        ) as emitter:
+            with pytest.raises(ConfigurationError, match="frontend"):
+                await emitter.test_connection()
+            with pytest.raises(OperationalError, match="bad proposal") as e:
+                await emitter.emit_mcp(_make_mcp())
+            assert "stackTrace" not in e.value.info
+    finally:
+        await server.close()
+
+
+async def test_async_rest_emitter_with_token_shares_pool():
+    auth_headers: List[str] = []
+
+    async def ingest_proposal(request: web.Request) -> web.Response:
+        auth_headers.append(request.headers.get("Authorization", ""))
+        return web.json_response({"value": "ok"})
+
+    app = web.Application()
+    app.router.add_post("/aspects", ingest_proposal)
+    server = await _start_server(app)
+    try:
+        async with AsyncDataHubRestEmitter(
+            f"http://{server.host}:{server.port}"
+        ) as emitter:
+            async with emitter.with_token("token-a") as emitter_a:
+                await emitter_a.emit_mcp(_make_mcp())
+            # Closing the derived client must not close the shared pool.
+            await emitter.with_token("token-b").emit_mcp(_make_mcp())
+            assert emitter._pool is emitter_a._pool
+    finally:
+        await server.close()
+
+    assert auth_headers == ["Bearer token-a", "Bearer token-b"]
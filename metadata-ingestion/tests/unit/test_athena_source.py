@@ -126,3 +126,53 @@ def test_athena_get_table_properties():
     }
 
     assert location == make_s3_urn("s3://testLocation", "PROD")
+
+
+def test_athena_cursor_per_thread():
+    import threading
+
+    from pyathena.model import AthenaTableMetadata
+
+    from datahub.ingestion.source.sql.athena import AthenaConfig, AthenaSource
+
+    config = AthenaConfig.parse_obj(
+        {
+            "aws_region": "us-west-1",
+            "query_result_location": "s3://sample-staging-dir/",
+            "work_group": "test-workgroup",
+        }
+    )
+    cursors = []
+
+    def make_cursor() -> mock.MagicMock:
+        cursor = mock.MagicMock()
+        cursor._get_table_metadata.return_value = AthenaTableMetadata(
+            response={"TableMetadata": {"Name": "test", "Parameters": {}}}
+        )
+        cursors.append(cursor)
+        return cursor
+
+    mock_inspector = mock.MagicMock()
+    mock_inspector.engine.raw_connection().cursor.side_effect = make_cursor
+    source = AthenaSource(config=config, ctx=PipelineContext(run_id="test"))
+
+    def get_table_properties() -> None:
+        for _ in range(2):
+            source.get_table_properties(
+                inspector=mock_inspector, table="test_table", schema="test_schema"
+            )
+
+    threads = [threading.Thread(target=get_table_properties) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Each thread created a cursor of its own, and reused it.
+    assert len(cursors) == 2
+    for cursor in cursors:
+        assert cursor._get_table_metadata.call_count == 2
+
+    source.close()
+    for cursor in cursors:
+        cursor.close.assert_called_once()
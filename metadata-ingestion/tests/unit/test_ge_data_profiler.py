@@ -0,0 +1,176 @@
+from typing import Optional
+from unittest import mock
+
+import sqlalchemy as sa
+
+from datahub.ingestion.source import ge_data_profiler
+from datahub.ingestion.source.ge_data_profiler import (
+    DatahubGEProfiler,
+    GEProfilerRequest,
+)
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.profiling.planner import (
+    ProfilingPlan,
+    TableSizeEstimate,
+)
+from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.metadata.schema_classes import DatasetProfileClass
+
+
+def _create_table(engine: sa.engine.Engine, name: str, num_rows: int) -> sa.Table:
+    table = sa.Table(
+        name,
+        sa.MetaData(),
+        sa.Column("id", sa.Integer),
+        sa.Column("category", sa.String),
+    )
+    table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [
+                {"id": i, "category": None if i % 5 == 0 else "ab"[i % 2]}
+                for i in range(num_rows)
+            ],
+        )
+    return table
+
+
+def _profile(
+    engine: sa.engine.Engine, config: GEProfilingConfig
+) -> Optional[DatasetProfileClass]:
+    profiler = DatahubGEProfiler(engine, SQLSourceReport(), config, "sqlite")
+    [(_, profile)] = profiler.generate_profiles(
+        [
+            GEProfilerRequest(
+                pretty_name="main.events",
+                batch_kwargs={"schema": "main", "table": "events"},
+            )
+        ],
+        max_workers=1,
+    )
+    return profile
+
+
+def test_profile_scaled_from_sample(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    _create_table(engine, "events", 1000)
+    # SQLite has no TABLESAMPLE, so the sample is a table of its own: 100 of the
+    # 1000 rows, with 20 nulls and 40 of each category.
+    sample = _create_table(engine, "events_sample", 100)
+
+    config = GEProfilingConfig(
+        enabled=True,
+        max_bytes_to_scan_per_table=2**20,
+        include_field_distinct_value_frequencies=True,
+        include_field_sample_values=False,
+    )
+    plan = ProfilingPlan(
+        estimate=TableSizeEstimate(row_count=1000, size_in_bytes=10 * 2**20),
+        sample_percent=10.0,
+    )
+    with mock.patch(
+        "datahub.ingestion.source.ge_data_profiler.plan_table_profile",
+        return_value=plan,
+    ), mock.patch.object(sa.Table, "tablesample", return_value=sample) as tablesample:
+        profile = _profile(engine, config)
+
+    # The sample is seeded, so that every query sees the same rows.
+    tablesample.assert_called_once()
+    assert str(tablesample.call_args.kwargs["seed"]) == str(plan.seed)
+
+    assert profile is not None
+    assert profile.rowCount == 1000
+    assert profile.approximateMetrics == ["rowCount"]
+    assert profile.fieldProfiles is not None
+    id_profile, category_profile = profile.fieldProfiles
+
+    assert id_profile.nullCount == 0
+    assert id_profile.uniqueCount == 100
+    # The unique count isn't scaled up, so the proportion is the sample's.
+    assert id_profile.uniqueProportion == 1
+
+    assert category_profile.nullCount == 200
+    assert category_profile.nullProportion == 0.2
+    assert category_profile.uniqueCount == 2
+    assert category_profile.uniqueProportion == 2 / 80
+    assert category_profile.distinctValueFrequencies is not None
+    assert {
+        f.value: f.frequency for f in category_profile.distinctValueFrequencies
+    } == {"a": 400, "b": 400}
+    assert category_profile.approximateMetrics is not None
+    assert "nullCount" in category_profile.approximateMetrics
+    assert "distinctValueFrequencies" in category_profile.approximateMetrics
+
+
+def test_profile_not_sampled(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    _create_table(engine, "events", 100)
+
+    profile = _profile(engine, GEProfilingConfig(enabled=True))
+
+    assert profile is not None
+    assert profile.rowCount == 100
+    assert profile.approximateMetrics is None
+    assert profile.fieldProfiles is not None
+    _, category_profile = profile.fieldProfiles
+    assert category_profile.nullCount == 20
+    assert category_profile.approximateMetrics is None
+
+
+def test_profile_in_process(tmp_path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    _create_table(sa.create_engine(url), "events", 100)
+    config = GEProfilingConfig(enabled=True)
+
+    # Run the worker process's functions in this process, without changing its
+    # profiler for other tests.
+    with mock.patch.object(ge_data_profiler, "_process_profiler", None):
+        ge_data_profiler._init_profiler_process(url, {}, config, "sqlite")
+        result = ge_data_profiler._generate_profile_in_process(
+            GEProfilerRequest(
+                pretty_name="main.events",
+                batch_kwargs={"schema": "main", "table": "events"},
+            ),
+            None,
+            None,
+        )
+
+    assert result.failures == []
+    assert result.row_count == 100
+    assert result.time_taken is not None
+    assert result.profile is not None
+    assert result.profile.rowCount == 100
+    assert result.profile.fieldProfiles is not None
+    _, category_profile = result.profile.fieldProfiles
+    assert category_profile.nullCount == 20
+    assert result.query_combiner.total_queries > 0
+
+
+def test_profile_in_worker_processes(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    _create_table(engine, "events", 100)
+    report = SQLSourceReport()
+    profiler = DatahubGEProfiler(
+        engine,
+        report,
+        GEProfilingConfig(enabled=True, max_worker_processes=1),
+        "sqlite",
+        engine_options={},
+    )
+
+    [(_, profile)] = profiler.generate_profiles(
+        [
+            GEProfilerRequest(
+                pretty_name="main.events",
+                batch_kwargs={"schema": "main", "table": "events"},
+            )
+        ],
+        max_workers=1,
+    )
+
+    assert profile is not None
+    assert profile.rowCount == 100
+    assert profiler.total_row_count == 100
+    assert report.query_combiner is not None
+    assert report.query_combiner.total_queries > 0
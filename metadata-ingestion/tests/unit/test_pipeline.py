@@ -13,9 +13,12 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
+    ChangeTypeClass,
     DatasetPropertiesClass,
     DatasetSnapshotClass,
+    GenericAspectClass,
     MetadataChangeEventClass,
+    MetadataChangeProposalClass,
     StatusClass,
 )
 from tests.test_helpers.sink_helpers import RecordingSinkReport
@@ -176,7 +179,8 @@ class TestPipeline(object):
         assert pipeline.ctx.graph is None, "DataHubGraph should not be initialized"
 
     @freeze_time(FROZEN_TIME)
-    def test_run_including_fake_transformation(self):
+    @pytest.mark.parametrize("processing_workers", [1, 2])
+    def test_run_including_fake_transformation(self, processing_workers):
         pipeline = Pipeline.create(
             {
                 "source": {"type": "tests.unit.test_pipeline.FakeSource"},
@@ -185,9 +189,15 @@ class TestPipeline(object):
                 ],
                 "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
                 "run_id": "pipeline_test",
+                "processing_workers": processing_workers,
             }
         )
-        pipeline.run()
+        # freezegun doesn't freeze the time in the processing worker threads.
+        with patch(
+            "datahub.ingestion.extractor.mce_extractor.get_sys_time",
+            return_value=1586847600000,
+        ):
+            pipeline.run()
         pipeline.raise_from_status()
 
         expected_mce = get_initial_mce()
@@ -202,6 +212,46 @@ class TestPipeline(object):
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @pytest.mark.parametrize("processing_workers", [1, 2])
+    def test_run_keeps_records_before_transformer_failure(self, processing_workers):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.FailAfterFirstMceTransformer"},
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"},
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "processing_workers": processing_workers,
+            }
+        )
+        pipeline.run()
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        # The record yielded before the failure is still transformed and written.
+        assert len(sink_report.received_records) == 1
+        record = sink_report.received_records[0].record
+        assert isinstance(record, MetadataChangeEventClass)
+        assert get_status_removed_aspect() in record.proposedSnapshot.aspects
+
+    def test_partition_key_without_entity_urn(self):
+        mcp = MetadataChangeProposalClass(
+            entityType="dataset",
+            changeType=ChangeTypeClass.UPSERT,
+            entityKeyAspect=GenericAspectClass(
+                value=b"{}", contentType="application/json"
+            ),
+            aspectName="status",
+        )
+        wu = MetadataWorkUnit(id="key-only-mcp", mcp_raw=mcp)
+        assert Pipeline._get_partition_key(wu) == "key-only-mcp"
+
+        mce_wu = MetadataWorkUnit(id="mce", mce=get_initial_mce())
+        assert Pipeline._get_partition_key(mce_wu) == mce_wu.get_urn()
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
@@ -331,6 +381,20 @@ class AddStatusRemovedTransformer(Transformer):
             yield record_envelope
 
 
+class FailAfterFirstMceTransformer(Transformer):
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            yield record_envelope
+            if isinstance(record_envelope.record, MetadataChangeEventClass):
+                raise ValueError("transformer failed")
+
+
 class FakeSource(Source):
     def __init__(self):
         self.source_report = SourceReport()
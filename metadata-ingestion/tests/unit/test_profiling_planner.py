@@ -0,0 +1,38 @@
+from unittest import mock
+
+from datahub.ingestion.source.profiling.planner import (
+    TableSizeEstimate,
+    plan_table_profile,
+)
+
+
+def _fake_connection(dialect: str, row: tuple) -> mock.MagicMock:
+    conn = mock.MagicMock()
+    conn.dialect.name = dialect
+    conn.execute.return_value.first.return_value = row
+    return conn
+
+
+def test_plan_table_profile_samples_large_tables():
+    conn = _fake_connection("postgresql", (1_000_000, 10 * 2**30))
+    plan = plan_table_profile(conn, "public", "events", max_bytes_to_scan=2**30)
+    assert plan is not None
+    assert plan.estimate == TableSizeEstimate(
+        row_count=1_000_000, size_in_bytes=10 * 2**30
+    )
+    assert plan.sample_percent == 10.0
+
+
+def test_plan_table_profile_profiles_in_full():
+    # Small enough to scan in full.
+    conn = _fake_connection("postgresql", (1000, 2**20))
+    assert plan_table_profile(conn, "public", "t", max_bytes_to_scan=2**30) is None
+
+    # Never analyzed, so the size is unknown.
+    conn = _fake_connection("postgresql", (-1, 10 * 2**30))
+    assert plan_table_profile(conn, "public", "t", max_bytes_to_scan=2**30) is None
+
+    # No TABLESAMPLE support or size estimates.
+    conn = _fake_connection("mysql", (1_000_000, 10 * 2**30))
+    assert plan_table_profile(conn, "db", "t", max_bytes_to_scan=2**30) is None
+    conn.execute.assert_not_called()
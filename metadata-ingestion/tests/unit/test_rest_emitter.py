@@ -1,5 +1,7 @@
 from datahub.emitter import rest_emitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.metadata.schema_classes import StatusClass
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -36,3 +38,57 @@ def test_datahub_rest_emitter_extra_params():
     )
     assert emitter._session.headers.get("key1") == "value1"
     assert emitter._session.headers.get("key2") == "value2"
+
+
+def _make_status_mcp(i: int) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,table{i},PROD)",
+        aspect=StatusClass(removed=False),
+    )
+
+
+def test_datahub_rest_emitter_chunk_mcps_by_count():
+    mcps = [_make_status_mcp(i) for i in range(5)]
+    chunks = list(
+        rest_emitter._chunk_serialized_mcps(
+            mcps, max_batch_records=2, max_batch_payload_bytes=10_000_000
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_datahub_rest_emitter_chunk_mcps_by_size():
+    mcps = [_make_status_mcp(i) for i in range(3)]
+    record_size = len(list(rest_emitter._chunk_serialized_mcps(mcps[:1], 1, 1))[0][0])
+
+    chunks = list(
+        rest_emitter._chunk_serialized_mcps(
+            mcps, max_batch_records=100, max_batch_payload_bytes=2 * record_size
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    # A record larger than the budget still gets sent on its own.
+    chunks = list(
+        rest_emitter._chunk_serialized_mcps(
+            mcps, max_batch_records=100, max_batch_payload_bytes=1
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [1, 1, 1]
+
+
+def test_datahub_rest_emitter_emit_mcps(requests_mock):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        request_headers={"X-RestLi-Protocol-Version": "2.0.0"},
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    mcps = [_make_status_mcp(i) for i in range(5)]
+    assert emitter.emit_mcps(mcps, max_batch_records=3) == 2
+
+    assert requests_mock.call_count == 2
+    first_payload = requests_mock.request_history[0].json()
+    assert len(first_payload["proposals"]) == 3
+    assert first_payload["proposals"][0]["entityUrn"] == mcps[0].entityUrn
+    assert len(requests_mock.request_history[1].json()["proposals"]) == 2
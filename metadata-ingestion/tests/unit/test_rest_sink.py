@@ -1,4 +1,6 @@
 import json
+import time
+from typing import List
 
 import pytest
 import requests
@@ -6,6 +8,9 @@ import requests
 import datahub.metadata.schema_classes as models
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -259,3 +264,106 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+class _RecordingWriteCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.succeeded: List[str] = []
+        self.failed: List[str] = []
+
+    def on_success(
+        self, record_envelope: RecordEnvelope, success_metadata: dict
+    ) -> None:
+        self.succeeded.append(record_envelope.record.entityUrn)
+
+    def on_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        failure_exception: Exception,
+        failure_metadata: dict,
+    ) -> None:
+        self.failed.append(record_envelope.record.entityUrn)
+
+
+def _make_batch_sink(requests_mock, **config) -> DatahubRestSink:
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+    return DatahubRestSink.create(
+        {"server": MOCK_GMS_ENDPOINT, "mode": "BATCH", **config},
+        PipelineContext(run_id="test-rest-sink"),
+    )
+
+
+def _write_mcps(sink: DatahubRestSink, num_mcps: int) -> _RecordingWriteCallback:
+    callback = _RecordingWriteCallback()
+    for i in range(num_mcps):
+        mcp = MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+    return callback
+
+
+def test_datahub_rest_sink_batch(requests_mock):
+    batch_endpoint = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", json={}
+    )
+    sink = _make_batch_sink(requests_mock, max_batch_records=3)
+
+    callback = _write_mcps(sink, 7)
+    sink.close()
+
+    assert sorted(
+        len(request.json()["proposals"]) for request in batch_endpoint.request_history
+    ) == [1, 3, 3]
+    assert len(callback.succeeded) == 7
+    assert callback.failed == []
+    assert sink.report.batch_requests == 3
+    assert sink.report.batch_fallbacks == 0
+
+
+def test_datahub_rest_sink_batch_falls_back_to_single_records(requests_mock):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=400,
+        json={"message": "invalid proposal"},
+    )
+    failing_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,table1,PROD)"
+
+    def ingest_proposal(request, context):
+        if request.json()["proposal"]["entityUrn"] == failing_urn:
+            context.status_code = 400
+            return {"message": "invalid proposal"}
+        return {}
+
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal", json=ingest_proposal
+    )
+    sink = _make_batch_sink(requests_mock)
+
+    callback = _write_mcps(sink, 3)
+    sink.close()
+
+    # Only the record that GMS rejects on its own fails.
+    assert callback.failed == [failing_urn]
+    assert len(callback.succeeded) == 2
+    assert sink.report.batch_fallbacks == 1
+    assert sink.report.failures
+
+
+def test_datahub_rest_sink_flushes_waiting_batch(requests_mock):
+    batch_endpoint = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", json={}
+    )
+    sink = _make_batch_sink(requests_mock, max_batch_wait_sec=0.1)
+
+    callback = _write_mcps(sink, 2)
+    # The batch isn't full, but is sent without waiting for more records.
+    deadline = time.time() + 10
+    while len(callback.succeeded) < 2 and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert len(callback.succeeded) == 2
+    assert batch_endpoint.call_count == 1
+    sink.close()
+    assert batch_endpoint.call_count == 1
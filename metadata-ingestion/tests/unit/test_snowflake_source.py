@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +19,10 @@ from datahub.ingestion.source.snowflake.snowflake_config import (
 from datahub.ingestion.source.snowflake.snowflake_query import (
     create_deny_regex_sql_filter,
 )
+from datahub.ingestion.source.snowflake.snowflake_schema import (
+    SnowflakeDataDictionary,
+    SnowflakeSchemaColumns,
+)
 from datahub.ingestion.source.snowflake.snowflake_usage_v2 import (
     SnowflakeObjectAccessEntry,
 )
@@ -604,3 +609,83 @@ def test_snowflake_query_create_deny_regex_sql():
         )
         == r"NOT RLIKE(upstream_table_name,'.*\.FIVETRAN_.*_STAGING\..*','i') AND NOT RLIKE(upstream_table_name,'.*__DBT_TMP$','i') AND NOT RLIKE(upstream_table_name,'.*\.SEGMENT_[a-f0-9]{8}[-_][a-f0-9]{4}[-_][a-f0-9]{4}[-_][a-f0-9]{4}[-_][a-f0-9]{12}','i') AND NOT RLIKE(upstream_table_name,'.*\.STAGING_.*_[a-f0-9]{8}[-_][a-f0-9]{4}[-_][a-f0-9]{4}[-_][a-f0-9]{4}[-_][a-f0-9]{12}','i')"
     )
+
+
+def test_snowflake_data_dictionary_cache():
+    data_dictionary = SnowflakeDataDictionary()
+    data_dictionary.query = MagicMock(  # type: ignore
+        return_value=[
+            {
+                "table_name": "T1",
+                "constraint_name": "PK_T1",
+                "column_name": "ID",
+            }
+        ]
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: data_dictionary.get_pk_constraints_for_schema("S1", "DB1"),
+                range(8),
+            )
+        )
+    assert all(result is results[0] for result in results)
+    assert data_dictionary.query.call_count == 1
+
+    data_dictionary.get_pk_constraints_for_schema("S2", "DB1")
+    data_dictionary.evict_cache("DB1", "S1")
+    data_dictionary.get_pk_constraints_for_schema("S1", "DB1")
+    assert data_dictionary.cache_info()["get_pk_constraints_for_schema"] == {
+        "hits": 7,
+        "misses": 3,
+        "currsize": 2,
+    }
+
+    data_dictionary.evict_cache("DB1")
+    assert (
+        data_dictionary.cache_info()["get_pk_constraints_for_schema"]["currsize"] == 0
+    )
+
+
+def test_snowflake_max_workers_for_schema_extraction():
+    with pytest.raises(ValidationError):
+        SnowflakeV2Config.parse_obj(
+            {"account_id": "test", "max_workers_for_schema_extraction": 0}
+        )
+
+
+def test_snowflake_schema_columns_are_read_in_order():
+    def column_row(table_name, column_name, ordinal_position):
+        return {
+            "TABLE_NAME": table_name,
+            "COLUMN_NAME": column_name,
+            "ORDINAL_POSITION": ordinal_position,
+            "IS_NULLABLE": "YES",
+            "DATA_TYPE": "NUMBER",
+            "COMMENT": None,
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "NUMERIC_PRECISION": 38,
+            "NUMERIC_SCALE": 0,
+        }
+
+    rows = [
+        column_row(table_name, column_name, i)
+        for table_name in ["T1", "T2", "V1", "T3", "T4"]
+        for i, column_name in enumerate(["ID", "NAME"], start=1)
+    ]
+    columns = SnowflakeSchemaColumns(iter(rows))
+    columns.defer(["V1"])
+
+    t1_columns = columns.get("T1")
+    assert t1_columns is not None
+    assert [c.name for c in t1_columns] == ["ID", "NAME"]
+    assert t1_columns[0].get_precise_native_type() == "NUMBER(38,0)"
+    # tables without columns, or requested out of order, aren't found
+    assert columns.get("T1_EMPTY") is None
+    assert columns.get("T3") is not None
+    assert columns.get("T2") is None
+    # deferred tables can be requested after the tables that follow them
+    assert columns.get("V1") is not None
+    assert columns.get("T4") is not None
+    assert columns.get("T5") is None
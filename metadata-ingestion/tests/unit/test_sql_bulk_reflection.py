@@ -0,0 +1,115 @@
+from typing import Any, Dict, List
+from unittest import mock
+
+from sqlalchemy.dialects import mysql, postgresql
+
+from datahub.ingestion.source.sql.sql_bulk_reflection import (
+    MySQLBulkReflector,
+    PostgresBulkReflector,
+    get_bulk_reflector,
+)
+
+
+def _fake_connection(*results: List[Dict[str, Any]]) -> mock.MagicMock:
+    conn = mock.MagicMock()
+    conn.execute.side_effect = list(results)
+    return conn
+
+
+def test_postgres_bulk_reflection():
+    def column(table, name, data_type, **kwargs):
+        return {
+            "table_name": table,
+            "column_name": name,
+            "data_type": data_type,
+            "character_maximum_length": kwargs.get("length"),
+            "numeric_precision": kwargs.get("precision"),
+            "numeric_scale": kwargs.get("scale"),
+            "datetime_precision": None,
+            "is_nullable": kwargs.get("nullable", "YES"),
+            "column_default": None,
+            "comment": kwargs.get("comment"),
+        }
+
+    conn = _fake_connection(
+        [
+            column("orders", "id", "integer", nullable="NO"),
+            column("orders", "amount", "numeric", precision=10, scale=2),
+            column("orders", "customer_id", "integer", comment="the customer"),
+            column("orders", "created", "timestamp with time zone"),
+            column("tagged", "id", "integer"),
+            column("tagged", "tags", "ARRAY"),
+            column("customers", "id", "integer", nullable="NO"),
+            column("customers", "name", "character varying", length=255),
+        ],
+        [
+            {"table_name": "customers", "constraint_name": "pk_c", "column_name": "id"},
+            {"table_name": "orders", "constraint_name": "pk_o", "column_name": "id"},
+        ],
+        [
+            {
+                "table_name": "orders",
+                "constraint_name": "fk_customer",
+                "column_name": "customer_id",
+                "referred_schema": "public",
+                "referred_table": "customers",
+                "referred_column": "id",
+            }
+        ],
+    )
+
+    reflection = PostgresBulkReflector().reflect_schema(
+        conn, postgresql.dialect(), "public"
+    )
+
+    # Arrays aren't mapped, so that table falls back to per-table reflection.
+    assert set(reflection.columns) == {"orders", "customers"}
+    orders = reflection.columns["orders"]
+    assert [c["name"] for c in orders] == ["id", "amount", "customer_id", "created"]
+    assert repr(orders[1]["type"]) == "NUMERIC(precision=10, scale=2)"
+    assert repr(orders[3]["type"]) == "TIMESTAMP(timezone=True)"
+    assert orders[0]["nullable"] is False
+    assert orders[2]["comment"] == "the customer"
+    assert repr(reflection.columns["customers"][1]["type"]) == "VARCHAR(length=255)"
+
+    assert reflection.get_pk_constraint("orders") == {
+        "constrained_columns": ["id"],
+        "name": "pk_o",
+    }
+    assert reflection.get_pk_constraint("tagged") == {
+        "constrained_columns": [],
+        "name": None,
+    }
+    assert reflection.get_foreign_keys("orders") == [
+        {
+            "name": "fk_customer",
+            "constrained_columns": ["customer_id"],
+            "referred_schema": "public",
+            "referred_table": "customers",
+            "referred_columns": ["id"],
+            "options": {},
+        }
+    ]
+    assert reflection.get_foreign_keys("customers") == []
+
+
+def test_mysql_bulk_reflection_types():
+    reflector = MySQLBulkReflector()
+    dialect = mysql.dialect()
+
+    def make_type(column_type: str) -> str:
+        return repr(reflector._make_type(dialect, {"column_type": column_type}))
+
+    assert make_type("int(11) unsigned") == "INTEGER(display_width=11, unsigned=True)"
+    assert make_type("varchar(255)") == "VARCHAR(length=255)"
+    assert make_type("decimal(10,2)") == "DECIMAL(precision=10, scale=2)"
+    assert make_type("datetime(6)") == "DATETIME(fsp=6)"
+    assert make_type("json") == "JSON()"
+    assert make_type("enum('a','b')") == "None"
+    assert make_type("geometrycollection") == "None"
+
+
+def test_get_bulk_reflector():
+    assert isinstance(get_bulk_reflector("postgresql"), PostgresBulkReflector)
+    assert isinstance(get_bulk_reflector("mysql"), MySQLBulkReflector)
+    assert get_bulk_reflector("oracle") is None
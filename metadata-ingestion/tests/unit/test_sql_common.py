@@ -1,4 +1,8 @@
-from typing import Dict
+import contextlib
+import random
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List
 from unittest.mock import Mock
 
 import pytest
@@ -103,3 +107,49 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+class _ConcurrentTestSQLAlchemySource(SQLAlchemySource):
+    def __init__(self, config: SQLAlchemyConfig, ctx: PipelineContext):
+        super().__init__(config, ctx, "TEST")
+        self.threads: Dict[str, int] = {}
+
+    def get_inspectors(self) -> Iterable[Inspector]:
+        yield Mock()
+
+    def get_db_name(self, inspector: Inspector) -> str:
+        return "db"
+
+    def get_allowed_schemas(self, inspector: Inspector, db_name: str) -> Iterable[str]:
+        return [f"schema{i}" for i in range(20)]
+
+    def gen_database_containers(self, database, extra_properties=None):  # type: ignore
+        return []
+
+    @contextlib.contextmanager
+    def get_worker_inspector(self, inspector: Inspector) -> Iterator[Inspector]:
+        yield Mock()
+
+    def _get_schema_workunits(  # type: ignore
+        self, inspector, db_name, schema, profile_requests, include_profile_requests
+    ) -> Iterable[str]:
+        self.threads[schema] = threading.get_ident()
+        for i in range(3):
+            time.sleep(random.random() * 0.005)
+            self.report.report_entity_scanned(f"{schema}.table{i}")
+            yield f"{schema}.table{i}"
+
+
+def test_concurrent_schema_introspection_keeps_schema_order():
+    config = _TestSQLAlchemyConfig(schema_introspection_workers=4)
+    source = _ConcurrentTestSQLAlchemySource(config, PipelineContext(run_id="test"))
+
+    workunits: List[str] = list(source.get_workunits_internal())  # type: ignore
+
+    assert workunits == [f"schema{i}.table{j}" for i in range(20) for j in range(3)]
+    assert len(set(source.threads.values())) > 1
+    assert threading.get_ident() not in source.threads.values()
+    assert set(source.report.schema_introspection_sec.keys()) == {
+        f"db.schema{i}" for i in range(20)
+    }
+    assert source.report.tables_scanned == 20 * 3
@@ -1,5 +1,11 @@
+import pytest
+
 from datahub.utilities.delayed_iter import delayed_iter
-from datahub.utilities.sql_parser import MetadataSQLSQLParser, SqlLineageSQLParser
+from datahub.utilities.sql_parser import (
+    MetadataSQLSQLParser,
+    SqlLineageSQLParser,
+    _make_sub_process_exception,
+)
 
 
 def test_delayed_iter():
@@ -348,3 +354,16 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sub_process_exception():
+    exception = _make_sub_process_exception((ValueError("bad query"), "traceback"))
+    assert isinstance(exception, ValueError)
+    assert str(exception) == "Sub-process exception: traceback"
+
+    # An exception type that can't be created from just a message
+    with pytest.raises(UnicodeDecodeError) as e:
+        b"\xff".decode("utf-8")
+    exception = _make_sub_process_exception((e.value, "traceback"))
+    assert type(exception) is Exception
+    assert str(exception) == "Sub-process exception: traceback"
@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pytest
+
+from datahub.utilities.adaptive_executor import AdaptiveExecutor, AIMDConcurrencyLimiter
+
+
+def test_limiter_additive_increase_and_multiplicative_decrease():
+    limiter = AIMDConcurrencyLimiter(max_limit=8, min_limit=1)
+    assert limiter.limit == 8
+
+    limiter.signal_overload()
+    assert limiter.limit == 4
+    assert limiter.num_decreases == 1
+
+    # Requests that started before the last decrease don't lower it again.
+    start = limiter.acquire()
+    limiter.signal_overload()
+    limiter.release(start, success=False)
+    assert limiter.limit == 2
+
+    # About one full round of successful requests raises the limit by one.
+    for _ in range(3):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 3
+
+    for _ in range(100):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 8
+
+
+def test_limiter_burst_of_slow_requests_only_decreases_once():
+    limiter = AIMDConcurrencyLimiter(max_limit=8, slow_request_threshold_sec=0.01)
+    starts = [limiter.acquire() for _ in range(8)]
+    assert limiter.in_flight == 8
+
+    time.sleep(0.02)
+    for start in starts:
+        limiter.release(start)
+    assert limiter.limit == 4
+    assert limiter.num_decreases == 1
+    assert limiter.in_flight == 0
+
+
+def test_limiter_slow_requests_decrease_limit():
+    limiter = AIMDConcurrencyLimiter(
+        max_limit=4, min_limit=2, slow_request_threshold_sec=0.01
+    )
+    start = limiter.acquire()
+    time.sleep(0.02)
+    limiter.release(start)
+    assert limiter.limit == 2
+
+    start = limiter.acquire()
+    time.sleep(0.02)
+    limiter.release(start)
+    assert limiter.limit == 2
+
+
+def test_adaptive_executor_respects_limit():
+    limiter = AIMDConcurrencyLimiter(max_limit=4)
+    limiter.signal_overload()
+    assert limiter.limit == 2
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def task(i: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        return i
+
+    # Drop back to the lowered limit after every task, so that it never grows.
+    limiter.max_limit = 2
+    with AdaptiveExecutor(limiter, max_pending=5) as executor:
+        futures = [executor.submit(task, i) for i in range(20)]
+        assert [future.result() for future in futures] == list(range(20))
+
+    assert max_running <= 2
+    assert executor.in_flight == 0
+    assert executor.queue_depth == 0
+
+
+def test_adaptive_executor_propagates_exceptions():
+    def task(i: int) -> int:
+        if i == 3:
+            raise ValueError("bad task")
+        return i
+
+    limiter = AIMDConcurrencyLimiter(max_limit=2)
+    with AdaptiveExecutor(limiter, max_pending=10) as executor:
+        futures = [executor.submit(task, i) for i in range(5)]
+        with pytest.raises(ValueError):
+            futures[3].result()
+        assert futures[4].result() == 4
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_executor_blocks_when_queue_is_full():
+    release = threading.Event()
+    limiter = AIMDConcurrencyLimiter(max_limit=1)
+    executor = AdaptiveExecutor(limiter, max_pending=1)
+
+    executor.submit(release.wait)
+    # Wait for the worker to pick up the first task.
+    while executor.in_flight == 0:
+        time.sleep(0.001)
+    executor.submit(release.wait)
+
+    submitted = threading.Event()
+
+    def submit_third() -> None:
+        executor.submit(release.wait)
+        submitted.set()
+
+    thread = threading.Thread(target=submit_third)
+    thread.start()
+    assert not submitted.wait(0.05)
+    assert executor.queue_depth == 1
+
+    release.set()
+    thread.join()
+    assert submitted.is_set()
+    executor.shutdown(wait=True)
+
+
+def test_limiter_slow_threshold_scales_with_weight():
+    limiter = AIMDConcurrencyLimiter(max_limit=4, slow_request_threshold_sec=0.01)
+
+    # A request of 10 records may take up to 10 times as long.
+    start = limiter.acquire()
+    time.sleep(0.02)
+    limiter.release(start, weight=10)
+    assert limiter.num_decreases == 0
+
+    start = limiter.acquire()
+    time.sleep(0.03)
+    limiter.release(start, weight=2)
+    assert limiter.num_decreases == 1
+    assert limiter.limit == 2
@@ -2,12 +2,16 @@ import dataclasses
 import json
 import pathlib
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Counter, Dict
 
 import pytest
 
 from datahub.utilities.file_backed_collections import (
+    ConcurrentConnectionWrapper,
+    ConcurrentFileBackedDict,
+    ConcurrentFileBackedList,
     ConnectionWrapper,
     FileBackedDict,
     FileBackedList,
@@ -289,6 +293,42 @@ def test_shared_connection() -> None:
         assert list(cur)[0][0] == 3
 
 
+def test_compressed_values() -> None:
+    cache = FileBackedDict[Dict[str, str]](
+        cache_max_size=2,
+        cache_eviction_batch_size=1,
+        should_compress_value=True,
+    )
+    for i in range(10):
+        cache[f"key-{i}"] = {"value": "x" * 100 * i}
+    cache.flush()
+
+    assert cache["key-7"] == {"value": "x" * 700}
+    assert dict(cache.items_snapshot()) == {
+        f"key-{i}": {"value": "x" * 100 * i} for i in range(10)
+    }
+
+
+def test_transaction() -> None:
+    with ConnectionWrapper() as connection:
+        connection.execute("CREATE TABLE t (x INTEGER)")
+
+        with connection.transaction():
+            connection.execute("INSERT INTO t VALUES (1)")
+            with connection.transaction():
+                connection.execute("INSERT INTO t VALUES (2)")
+        assert not connection.conn.in_transaction
+
+        with pytest.raises(ValueError):
+            with connection.transaction():
+                connection.execute("INSERT INTO t VALUES (3)")
+                raise ValueError()
+        assert not connection.conn.in_transaction
+
+        rows = connection.execute("SELECT x FROM t ORDER BY x").fetchall()
+        assert [row[0] for row in rows] == [1, 2]
+
+
 def test_file_list() -> None:
     my_list = FileBackedList[int](
         serializer=lambda x: x,
@@ -339,3 +379,102 @@ def test_file_cleanup():
     assert filename.exists()
     cache.close()
     assert not filename.exists()
+
+
+def test_concurrent_file_dict() -> None:
+    cache = ConcurrentFileBackedDict[int](
+        tablename="cache",
+        extra_columns={"v": lambda v: v},
+        cache_max_size=40,
+        cache_eviction_batch_size=8,
+        num_stripes=4,
+    )
+
+    def worker(thread_id: int) -> None:
+        for i in range(200):
+            cache[f"{thread_id}-{i}"] = i
+        for i in range(200):
+            assert cache[f"{thread_id}-{i}"] == i
+            cache[f"{thread_id}-{i}"] = i * 2
+        for i in range(0, 200, 2):
+            del cache[f"{thread_id}-{i}"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(8)))
+
+    assert len(cache) == 8 * 100
+    assert sorted(cache) == sorted(
+        f"{t}-{i}" for t in range(8) for i in range(1, 200, 2)
+    )
+    assert cache["3-11"] == 22
+    with pytest.raises(KeyError):
+        cache["3-10"]
+
+    rows = cache.sql_query(f"SELECT sum(v) FROM {cache.tablename}")
+    assert rows[0][0] == 8 * sum(i * 2 for i in range(1, 200, 2))
+    cache.close()
+
+
+def test_concurrent_file_dict_queries_keep_cache() -> None:
+    cache = ConcurrentFileBackedDict[int](
+        tablename="cache", extra_columns={"v": lambda v: v}, num_stripes=2
+    )
+    for i in range(10):
+        cache[str(i)] = i
+
+    assert len(cache) == 10
+    assert dict(cache.items_snapshot()) == {str(i): i for i in range(10)}
+    rows = cache.sql_query(f"SELECT sum(v) FROM {cache.tablename}")
+    assert rows[0][0] == sum(range(10))
+    # The queries wrote the entries out, but didn't evict them.
+    assert sum(len(stripe.cache) for stripe in cache._stripes) == 10
+
+    # Entries modified after being written are written again.
+    cache["3"] = 30
+    rows = cache.sql_query(f"SELECT sum(v) FROM {cache.tablename}")
+    assert rows[0][0] == sum(range(10)) + 27
+    assert len(cache) == 10
+    cache.close()
+
+
+def test_concurrent_shared_connection() -> None:
+    with ConcurrentConnectionWrapper() as connection:
+        cache1 = ConcurrentFileBackedDict[int](
+            shared_connection=connection, tablename="cache1"
+        )
+        cache2 = ConcurrentFileBackedDict[int](
+            shared_connection=connection, tablename="cache2"
+        )
+        cache1["a"] = 1
+        cache2["a"] = 2
+
+        rows = cache1.sql_query(
+            f"SELECT c1.value = c2.value FROM {cache1.tablename} c1 "
+            f"JOIN {cache2.tablename} c2 ON c1.key = c2.key",
+            refs=[cache2],
+        )
+        assert [row[0] for row in rows] == [0]
+        cache1.close()
+        cache2.close()
+
+    with pytest.raises(AssertionError):
+        ConcurrentFileBackedDict[int](shared_connection=ConnectionWrapper())
+
+
+def test_concurrent_file_list() -> None:
+    file_list = ConcurrentFileBackedList[int](
+        cache_max_size=10, cache_eviction_batch_size=5
+    )
+
+    def worker(thread_id: int) -> None:
+        for i in range(100):
+            file_list.append(thread_id * 1000 + i)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(worker, range(4)))
+
+    assert len(file_list) == 400
+    assert sorted(file_list) == sorted(
+        t * 1000 + i for t in range(4) for i in range(100)
+    )
+    file_list.close()
@@ -0,0 +1,95 @@
+import pathlib
+
+import pytest
+
+from datahub.utilities.json_lines import (
+    JsonLinesWriter,
+    is_json_lines_file,
+    iterate_json_lines,
+    read_index_sidecar,
+    split_json_lines,
+)
+
+_FILE_NAMES = ["data.jsonl", "data.jsonl.gz", "data.jsonl.zst"]
+
+
+def _write(path: pathlib.Path, num_records: int = 100) -> list:
+    if path.name.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    records = [{"id": i, "payload": "x" * i} for i in range(num_records)]
+    with JsonLinesWriter(path, frame_size=7) as writer:
+        for record in records:
+            writer.write(record)
+    return records
+
+
+def test_is_json_lines_file() -> None:
+    assert is_json_lines_file("a/b.jsonl")
+    assert is_json_lines_file("b.ndjson.gz")
+    assert is_json_lines_file(pathlib.Path("b.jsonl.zst"))
+    assert not is_json_lines_file("b.json")
+    assert not is_json_lines_file("b.json.gz")
+
+
+@pytest.mark.parametrize("file_name", _FILE_NAMES)
+def test_round_trip(tmp_path: pathlib.Path, file_name: str) -> None:
+    path = tmp_path / file_name
+    records = _write(path)
+
+    assert [(i, obj) for i, obj, _ in iterate_json_lines(path)] == list(
+        enumerate(records)
+    )
+
+    index = read_index_sidecar(path)
+    assert index is not None
+    assert index.num_elements == len(records)
+    assert len(index.frames) == 15
+    assert index.frames[1][1] == 7
+
+
+@pytest.mark.parametrize("file_name", _FILE_NAMES)
+@pytest.mark.parametrize("num_splits", [1, 2, 3, 15, 100])
+def test_splits_cover_file(
+    tmp_path: pathlib.Path, file_name: str, num_splits: int
+) -> None:
+    path = tmp_path / file_name
+    records = _write(path)
+
+    splits = split_json_lines(path, num_splits)
+    assert splits is not None
+    assert len(splits) <= num_splits
+
+    read = []
+    for start, end, first_index in splits:
+        read.extend(
+            (i, obj) for i, obj, _ in iterate_json_lines(path, start, end, first_index)
+        )
+    assert read == list(enumerate(records))
+
+
+@pytest.mark.parametrize("file_name", _FILE_NAMES)
+def test_resume_from_frame(tmp_path: pathlib.Path, file_name: str) -> None:
+    path = tmp_path / file_name
+    records = _write(path)
+    index = read_index_sidecar(path)
+    assert index is not None
+
+    offset, first_index = index.frames[5]
+    read = [obj for _, obj, _ in iterate_json_lines(path, offset, None, first_index)]
+    assert read == records[first_index:]
+
+
+def test_plain_file_resyncs_to_next_line(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.jsonl"
+    records = _write(path)
+
+    read = [obj for _, obj, _ in iterate_json_lines(path, start=3)]
+    assert read == records[1:]
+
+
+def test_no_sidecar(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n\n{"a": 2}\n')
+
+    assert split_json_lines(path, 4) is None
+    assert [obj for _, obj, _ in iterate_json_lines(path)] == [{"a": 1}, {"a": 2}]
@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import pytest
+
+from datahub.utilities.partitioned_executor import PartitionedExecutor
+
+
+def test_partitioned_executor_preserves_per_key_order():
+    processed: Dict[str, List[int]] = defaultdict(list)
+    threads: Dict[str, set] = defaultdict(set)
+
+    def task(key: str, i: int) -> Tuple[str, int]:
+        # Sleep a bit so that tasks across keys actually interleave.
+        time.sleep(0.001 * (i % 3))
+        processed[key].append(i)
+        threads[key].add(threading.get_ident())
+        return key, i
+
+    results = []
+    with PartitionedExecutor(max_workers=4, max_pending_per_worker=2) as executor:
+        for i in range(50):
+            for key in ["a", "b", "c"]:
+                executor.submit(key, task, key, i)
+            results.extend(future.result() for future in executor.completed())
+        results.extend(future.result() for future in executor.completed(wait=True))
+
+    assert len(results) == 150
+    for key in ["a", "b", "c"]:
+        assert processed[key] == list(range(50))
+        assert len(threads[key]) == 1
+
+
+def test_partitioned_executor_propagates_exceptions():
+    def task(i: int) -> int:
+        if i == 3:
+            raise ValueError("bad task")
+        return i
+
+    with PartitionedExecutor(max_workers=2) as executor:
+        for i in range(5):
+            executor.submit(str(i), task, i)
+        futures = list(executor.completed(wait=True))
+
+    assert len(futures) == 5
+    failed = [future for future in futures if future.exception()]
+    assert len(failed) == 1
+    with pytest.raises(ValueError, match="bad task"):
+        failed[0].result()
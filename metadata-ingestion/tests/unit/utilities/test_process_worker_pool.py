@@ -0,0 +1,98 @@
+import os
+import time
+
+import pytest
+
+from datahub.utilities.process_worker_pool import (
+    ProcessWorkerPool,
+    TaskTimeoutError,
+    WorkerCrashedError,
+)
+
+_leaked = []
+
+
+def get_pid(i: int) -> int:
+    return os.getpid()
+
+
+def square(i: int) -> int:
+    if i < 0:
+        raise ValueError(f"negative: {i}")
+    return i * i
+
+
+def slow_square(i: int) -> int:
+    if i == 2:
+        time.sleep(10)
+    return i * i
+
+
+def crashing_square(i: int) -> int:
+    if i == 2:
+        os._exit(1)
+    return i * i
+
+
+def leaky_square(i: int) -> int:
+    _leaked.append(bytearray(10 * 1024 * 1024))
+    return i * i
+
+
+def test_process_worker_pool_runs_batches_in_order():
+    with ProcessWorkerPool(square, num_workers=2) as pool:
+        results = pool.run_batch([(i,) for i in range(20)])
+        assert [result.get() for result in results] == [i * i for i in range(20)]
+        assert pool.run(7) == 49
+
+
+def test_process_worker_pool_reuses_workers():
+    with ProcessWorkerPool(get_pid) as pool:
+        pids = {pool.run(i) for i in range(10)}
+        assert len(pids) == 1
+        assert os.getpid() not in pids
+
+
+def test_process_worker_pool_propagates_exceptions():
+    with ProcessWorkerPool(square) as pool:
+        results = pool.run_batch([(1,), (-1,), (3,)])
+        assert results[0].get() == 1
+        assert isinstance(results[1].error, ValueError)
+        assert results[1].traceback and "negative: -1" in results[1].traceback
+        assert results[2].get() == 9
+
+        with pytest.raises(ValueError):
+            pool.run(-2)
+
+
+def test_process_worker_pool_recycles_after_max_tasks():
+    with ProcessWorkerPool(get_pid, max_tasks_per_worker=3) as pool:
+        pids = [result.get() for result in pool.run_batch([(i,) for i in range(7)])]
+        assert len(set(pids[0:3])) == 1
+        assert len(set(pids[3:6])) == 1
+        assert len(set(pids)) == 3
+        assert pool.num_workers_recycled == 2
+
+
+def test_process_worker_pool_recycles_on_memory_ceiling():
+    with ProcessWorkerPool(leaky_square, max_worker_rss_bytes=1) as pool:
+        assert [result.get() for result in pool.run_batch([(1,), (2,)])] == [1, 4]
+        pool.run(3)
+        assert pool.num_workers_recycled == 2
+
+
+def test_process_worker_pool_times_out_tasks():
+    with ProcessWorkerPool(slow_square, task_timeout_sec=0.5) as pool:
+        results = pool.run_batch([(i,) for i in range(5)])
+        assert results[1].get() == 1
+        assert isinstance(results[2].error, TaskTimeoutError)
+        # The rest of the batch runs on a fresh worker.
+        assert [results[i].get() for i in (3, 4)] == [9, 16]
+        assert pool.num_tasks_timed_out == 1
+
+
+def test_process_worker_pool_survives_worker_crash():
+    with ProcessWorkerPool(crashing_square) as pool:
+        results = pool.run_batch([(i,) for i in range(4)])
+        assert isinstance(results[2].error, WorkerCrashedError)
+        assert results[3].get() == 9
@@ -0,0 +1,65 @@
+import pathlib
+
+from datahub.utilities.sql_parse_cache import SqlParseCache, normalize_query
+
+
+def test_normalize_query():
+    assert (
+        normalize_query("  SELECT a\n\tFROM   t ;\n")
+        == normalize_query("SELECT a FROM t")
+        == "SELECT a FROM t"
+    )
+    # Case may matter to the parsers, so it is preserved.
+    assert normalize_query("select a from T") != normalize_query("SELECT a FROM t")
+
+
+def test_sql_parse_cache_keys():
+    with SqlParseCache() as cache:
+        key = cache.make_key("parser", "tables", "SELECT a FROM t")
+        assert key == cache.make_key("parser", "tables", "SELECT a\n  FROM t;")
+        assert key != cache.make_key("parser", "columns", "SELECT a FROM t")
+        assert key != cache.make_key("other_parser", "tables", "SELECT a FROM t")
+        assert key != cache.make_key(
+            "parser", "tables", "SELECT a FROM t", use_raw_names=True
+        )
+        assert key != cache.make_key(
+            "parser", "tables", "SELECT a FROM t", library="sqlparse"
+        )
+
+
+def test_sql_parse_cache_persists_across_runs(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "cache.db"
+    with SqlParseCache(filename) as cache:
+        key = cache.make_key("parser", "tables", "SELECT a FROM t")
+        assert cache.get(key) is None
+        cache.set(key, ["t"])
+        assert cache.get(key) == ["t"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    with SqlParseCache(filename) as cache:
+        assert cache.get(key) == ["t"]
+        assert len(cache) == 1
+        # The file is written durably, unlike a temporary one.
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    with SqlParseCache() as cache:
+        assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+
+def test_sql_parse_cache_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "cache.db"
+    with SqlParseCache(filename, max_size_bytes=1000) as cache:
+        keys = [
+            cache.make_key("parser", "tables", f"SELECT * FROM t{i}") for i in range(20)
+        ]
+        for i, key in enumerate(keys):
+            cache.set(key, [f"t{i}"])
+        # Every entry takes up 64 + 6 or 7 bytes.
+        assert cache.evictions > 0
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) == ["t19"]
+        assert len(cache) * 70 <= 1000
+
+    with SqlParseCache(filename, max_size_bytes=1000) as cache:
+        assert cache._size_bytes <= 1000